@@ -0,0 +1,277 @@
+"""
+    Cross-engine query benchmark utilities.
+
+    Replays a workload file of Cypher queries against the graph backends with
+    a set number of concurrent clients, warm-up runs and measured iterations.
+    Each query's latencies go into an HDR-style histogram so the percentiles
+    hold their precision across microsecond to minute latencies without
+    keeping every sample. The results are written as JSON and Parquet so the
+    engines can be compared side by side.
+"""
+
+import os
+import json
+import math
+import time
+import asyncio
+
+import polars as pl
+
+from src.common.graph_backends import GraphBackend
+from src.common.load_jobs import LoadJob
+
+# the number of bits of precision kept for each recorded latency, 7 bits is within 1.6%
+HISTOGRAM_PRECISION_BITS: int = 7
+
+
+class LatencyHistogram:
+    """
+        A log-linear latency histogram, in the style of an HDR histogram
+    """
+    def __init__(self, precision_bits: int = HISTOGRAM_PRECISION_BITS):
+        """
+        creates the histogram
+
+        :param precision_bits: the number of significant bits kept for each value
+        """
+        # save the settings
+        self.precision_bits: int = max(precision_bits, 1)
+
+        # (shift, sub bucket) -> count
+        self.counts: dict = {}
+
+        # init the totals
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float | None = None
+        self.max: float = 0.0
+
+    def record(self, seconds: float):
+        """
+        records a latency.
+
+        :param seconds:
+        :return:
+        """
+        # bucket the value in microseconds, keeping only its top bits
+        value: int = max(int(seconds * 1_000_000), 1)
+
+        shift: int = max(value.bit_length() - self.precision_bits, 0)
+
+        key: tuple = (shift, value >> shift)
+
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """
+        gets the latency at a percentile, reported as the highest value in its bucket.
+
+        :param percent: 0 to 100
+        :return: the latency in seconds
+        """
+        if not self.count:
+            return 0.0
+
+        # get the rank of the value asked for
+        rank: int = max(math.ceil(percent / 100 * self.count), 1)
+
+        seen: int = 0
+
+        for (shift, sub_bucket), count in sorted(self.counts.items()):
+            seen += count
+
+            if seen >= rank:
+                # never report past the largest value seen
+                return min((((sub_bucket + 1) << shift) - 1) / 1_000_000, self.max)
+
+        # return to the caller
+        return self.max
+
+    def to_dict(self) -> dict:
+        """
+        gets the latency summary in milliseconds.
+
+        :return:
+        """
+        # return to the caller
+        return {'count': self.count, 'min_ms': round((self.min or 0.0) * 1000, 4),
+                'mean_ms': round(self.total / self.count * 1000, 4) if self.count else 0.0,
+                'p50_ms': round(self.percentile(50) * 1000, 4), 'p95_ms': round(self.percentile(95) * 1000, 4),
+                'p99_ms': round(self.percentile(99) * 1000, 4), 'max_ms': round(self.max * 1000, 4)}
+
+
+def load_workload(file_name: str) -> list:
+    """
+    reads a workload file.
+
+    the file is a JSON list of queries, or an object with a "queries" list. each query has a "query",
+    and optionally a "name", "parameters" and the "engines" it is limited to.
+
+    :param file_name:
+    :return: the queries with their defaults filled in
+    """
+    with open(file_name, encoding='utf-8') as file:
+        workload = json.load(file)
+
+    # accept the queries on their own or wrapped in an object
+    if isinstance(workload, dict):
+        workload = workload.get('queries', [])
+
+    # init the returned queries
+    ret_val: list = []
+
+    for i, item in enumerate(workload):
+        # a bare string is just the query
+        if isinstance(item, str):
+            item = {'query': item}
+
+        if not isinstance(item, dict) or not item.get('query'):
+            raise ValueError(f'Workload entry {i} has no query.')
+
+        ret_val.append({'name': item.get('name', f'q{i + 1}'), 'query': item['query'], 'parameters': item.get('parameters'),
+                        'engines': item.get('engines')})
+
+    # return to the caller
+    return ret_val
+
+
+async def run_query_benchmark(backend: GraphBackend, query: dict, concurrency: int, warmup: int, iterations: int, timeout: float | None) -> dict:
+    """
+    benchmarks one query on one engine.
+
+    the warm-up runs go one at a time and aren't recorded, then the measured iterations are shared
+    by the concurrent clients.
+
+    :param backend:
+    :param query:
+    :param concurrency: the number of clients running the query at once
+    :param warmup: the number of unrecorded runs first
+    :param iterations: the number of recorded runs
+    :param timeout: the per query timeout in seconds
+    :return: the latency and throughput summary
+    """
+    # init the histogram and counters
+    histogram: LatencyHistogram = LatencyHistogram()
+
+    stats: dict = {'remaining': iterations, 'errors': 0, 'last_error': None, 'rows': 0}
+
+    # warm the caches and plans
+    for _ in range(warmup):
+        try:
+            await backend.query(query['query'], query['parameters'], timeout)
+        except Exception:
+            pass
+
+    async def client():
+        """
+        runs the query until the iterations are used up
+        """
+        while stats['remaining'] > 0:
+            stats['remaining'] -= 1
+
+            # note the start
+            start: float = time.perf_counter()
+
+            try:
+                stats['rows'] = len(await backend.query(query['query'], query['parameters'], timeout))
+
+                histogram.record(time.perf_counter() - start)
+            except Exception as e:
+                stats['errors'] += 1
+                stats['last_error'] = str(e)
+
+    # note the start
+    start: float = time.perf_counter()
+
+    await asyncio.gather(*(client() for _ in range(max(min(concurrency, iterations), 1))))
+
+    # get the elapsed time
+    elapsed: float = time.perf_counter() - start
+
+    # return to the caller
+    return {'engine': backend.name, 'query': query['name'], 'concurrency': concurrency, 'warmup': warmup, 'iterations': iterations,
+            'errors': stats['errors'], 'last_error': stats['last_error'], 'rows': stats['rows'], **histogram.to_dict(),
+            'elapsed': round(elapsed, 4), 'queries_per_second': round(histogram.count / elapsed, 2) if elapsed else 0.0}
+
+
+async def run_benchmark(backends: list, workload: list, concurrency: int, warmup: int, iterations: int, timeout: float | None,
+                        job: LoadJob = None) -> list:
+    """
+    benchmarks every workload query on every engine, one query at a time so the runs don't compete.
+
+    :param backends: the engines to run against
+    :param workload:
+    :param concurrency:
+    :param warmup:
+    :param iterations:
+    :param timeout:
+    :param job: the background job to report per-query progress to, if any
+    :return: a result per engine and query
+    """
+    # init the returned results
+    ret_val: list = []
+
+    for backend in backends:
+        # get the queries for this engine
+        queries: list = [query for query in workload if not query['engines'] or backend.name in query['engines']]
+
+        try:
+            # don't time out every iteration against an engine that isn't there
+            await backend.connect()
+        except Exception as e:
+            if job is not None:
+                for query in queries:
+                    job.chunk_failed(f"{backend.name}:{query['name']}", str(e))
+
+            continue
+
+        for query in queries:
+            chunk: str = f"{backend.name}:{query['name']}"
+
+            if job is not None:
+                job.chunk_started(chunk)
+
+            result: dict = await run_query_benchmark(backend, query, concurrency, warmup, iterations, timeout)
+
+            ret_val.append(result)
+
+            if job is not None:
+                if result['count']:
+                    job.chunk_done(chunk, result['count'], result['elapsed'])
+                    job.add_rows(result['count'])
+                else:
+                    job.chunk_failed(chunk, result['last_error'])
+
+    # return to the caller
+    return ret_val
+
+
+def write_results(results: list, settings: dict, out_dir: str, run_id: str) -> list:
+    """
+    writes the benchmark results as JSON and Parquet.
+
+    :param results:
+    :param settings: the run settings saved with the JSON results
+    :param out_dir:
+    :param run_id:
+    :return: the files written
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    # get the file names
+    json_file: str = os.path.join(out_dir, f'benchmark-{run_id}.json')
+    parquet_file: str = os.path.join(out_dir, f'benchmark-{run_id}.parquet')
+
+    with open(json_file, 'w', encoding='utf-8') as file:
+        json.dump({'run_id': run_id, 'settings': settings, 'results': results}, file, indent=2)
+
+    # one row per engine and query, with the string columns typed even when every value is null
+    pl.DataFrame(results, schema_overrides={'last_error': pl.String}).write_parquet(parquet_file)
+
+    # return to the caller
+    return [json_file, parquet_file]
@@ -0,0 +1,73 @@
+"""
+    Query timeout and cancellation utilities.
+
+    Shared by the graph DB query paths so abandoned or runaway queries stop
+    using server resources.
+"""
+
+import os
+import asyncio
+
+from starlette.requests import Request
+
+
+class QueryTimeoutError(Exception):
+    """
+        Raised when a query runs past its timeout
+    """
+
+
+class ClientDisconnectedError(Exception):
+    """
+        Raised when the client went away before its query finished
+    """
+
+
+def get_query_timeout(timeout: float | None) -> float:
+    """
+    gets the query timeout in seconds, defaulting to the server-wide QUERY_TIMEOUT setting.
+
+    0 means no timeout.
+
+    :param timeout: the timeout requested by the caller
+    :return:
+    """
+    # use the server default if the caller didn't ask for one
+    if timeout is None:
+        timeout = float(os.getenv('QUERY_TIMEOUT', '300'))
+
+    # return to the caller
+    return max(timeout, 0.0)
+
+
+async def run_until_disconnect(request: Request, coro, poll_interval: float = 0.5):
+    """
+    runs the coroutine, cancelling it if the client disconnects first.
+
+    :param request:
+    :param coro:
+    :param poll_interval: the number of seconds between disconnect checks
+    :return:
+    """
+    # start the work
+    task: asyncio.Task = asyncio.ensure_future(coro)
+
+    try:
+        while True:
+            # wait a bit for the work to finish
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+
+            if done:
+                return task.result()
+
+            # stop the work if nobody is waiting for it anymore
+            if await request.is_disconnected():
+                task.cancel()
+
+                await asyncio.gather(task, return_exceptions=True)
+
+                raise ClientDisconnectedError('Client disconnected, query cancelled.')
+    finally:
+        # make sure the work never outlives the request
+        if not task.done():
+            task.cancel()
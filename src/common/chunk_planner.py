@@ -0,0 +1,232 @@
+"""
+    RK chunk planning utilities.
+
+    The load endpoints hand each chunk file to a worker however big it is, so
+    one oversized chunk can hold up the whole load. The planner sizes the
+    chunks from the data, the number of load workers, a target chunk size and
+    a memory budget, and the re-chunker rewrites the files into that many
+    balanced chunks so every worker gets about the same amount of work.
+"""
+
+import os
+import re
+import math
+import time
+
+import polars as pl
+
+from src.common.load_schema import get_chunk_file_name
+from src.common.load_jobs import LoadJob
+
+# the number of rows read to estimate the row size of a chunk
+SAMPLE_ROWS: int = 1000
+
+
+def find_chunks(data_dir: str, file_prefix: str, ext: str = 'csv') -> list:
+    """
+    finds the chunks of a prefix, e.g. rk-nodes.csv, rk-nodes-pt1.csv, ...
+
+    :param data_dir:
+    :param file_prefix:
+    :param ext:
+    :return: the chunk file names in counter order
+    """
+    # matches the names get_chunk_file_name makes
+    pattern: re.Pattern = re.compile(rf'^{re.escape(file_prefix)}(?:-pt(\d+))?\.{re.escape(ext)}$')
+
+    # init the counter -> file name map
+    found: dict = {}
+
+    for file_name in os.listdir(data_dir):
+        match: re.Match | None = pattern.match(file_name)
+
+        if match:
+            found[int(match.group(1) or 0)] = get_chunk_file_name(data_dir, file_prefix, int(match.group(1) or 0), ext)
+
+    # return to the caller
+    return [found[counter] for counter in sorted(found)]
+
+
+def get_default_memory_budget() -> int:
+    """
+    gets the memory the load may use in bytes, LOAD_MEMORY_BUDGET or half the physical memory if not set.
+
+    :return:
+    """
+    if os.getenv('LOAD_MEMORY_BUDGET'):
+        return int(os.getenv('LOAD_MEMORY_BUDGET'))
+
+    # return to the caller
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // 2
+
+
+def estimate_rows(file_name: str) -> int:
+    """
+    estimates the number of rows in a chunk from the size of a sample of its rows.
+
+    :param file_name:
+    :return:
+    """
+    # read a sample as text
+    sample: pl.DataFrame = pl.read_csv(file_name, n_rows=SAMPLE_ROWS, infer_schema=False)
+
+    if not sample.height:
+        return 0
+
+    # a small chunk is all in the sample
+    if sample.height < SAMPLE_ROWS:
+        return sample.height
+
+    # get the average row size, not counting the header
+    row_bytes: float = (len(sample.write_csv().encode()) - len(sample.head(0).write_csv().encode())) / sample.height
+
+    # return to the caller
+    return max(round((os.path.getsize(file_name) - len(sample.head(0).write_csv().encode())) / row_bytes), sample.height)
+
+
+def count_rows(file_name: str) -> int:
+    """
+    counts the rows in a chunk, this scans the whole file.
+
+    :param file_name:
+    :return:
+    """
+    # return to the caller
+    return pl.scan_csv(file_name, infer_schema=False).select(pl.len()).collect().item()
+
+
+def plan_chunks(file_names: list, workers: int, target_chunk_bytes: int | None = None, max_chunk_rows: int | None = None,
+                memory_budget: int | None = None, memory_factor: float = 4.0, exact_rows: bool = False) -> dict:
+    """
+    works out how many balanced chunks the files should be split into.
+
+    the chunk count is the largest of:
+        - one chunk per worker, so every worker has something to do
+        - the total size / target_chunk_bytes
+        - the total rows / max_chunk_rows
+        - the total size / the per-worker memory, since every worker holds a chunk at once and a chunk
+          takes about memory_factor times its CSV size once it is parsed
+
+    and is rounded up to a multiple of the workers so the last round of chunks keeps every worker busy.
+
+    :param file_names:
+    :param workers: the number of load workers
+    :param target_chunk_bytes: the CSV size to aim for per chunk, if any
+    :param max_chunk_rows: the max rows per chunk, if any
+    :param memory_budget: the bytes the workers may use between them, LOAD_MEMORY_BUDGET or half the physical memory if not set
+    :param memory_factor: the parsed size of a chunk relative to its CSV size
+    :param exact_rows: count the rows rather than estimating them from a sample
+    :return: the plan
+    """
+    # get the settings
+    workers = max(workers, 1)
+
+    if memory_budget is None:
+        memory_budget = get_default_memory_budget()
+
+    # get the size of the data
+    sizes: list = [os.path.getsize(file_name) for file_name in file_names]
+    rows: list = [count_rows(file_name) if exact_rows else estimate_rows(file_name) for file_name in file_names]
+
+    total_bytes: int = sum(sizes)
+    total_rows: int = sum(rows)
+
+    # get the chunk count each limit needs
+    limits: dict = {'workers': workers,
+                    'target_chunk_bytes': math.ceil(total_bytes / target_chunk_bytes) if target_chunk_bytes else 0,
+                    'max_chunk_rows': math.ceil(total_rows / max_chunk_rows) if max_chunk_rows else 0,
+                    'memory_budget': math.ceil(total_bytes * memory_factor / max(memory_budget // workers, 1))}
+
+    # go with the tightest limit
+    limited_by: str = max(limits, key=limits.get)
+
+    chunks: int = math.ceil(limits[limited_by] / workers) * workers
+
+    # don't make empty chunks
+    chunks = max(min(chunks, total_rows), 1)
+
+    # return to the caller
+    return {'files': len(file_names), 'total_bytes': total_bytes, 'total_rows': total_rows, 'rows_counted': exact_rows, 'workers': workers,
+            'memory_budget': memory_budget, 'chunks': chunks, 'limited_by': limited_by,
+            'rows_per_chunk': math.ceil(total_rows / chunks) if total_rows else 0, 'bytes_per_chunk': math.ceil(total_bytes / chunks),
+            'largest_file_bytes': max(sizes, default=0), 'smallest_file_bytes': min(sizes, default=0),
+            'input': [{'file': file_name, 'bytes': size, 'rows': row_count} for file_name, size, row_count in zip(file_names, sizes, rows)]}
+
+
+def rechunk_files(file_names: list, out_dir: str, out_prefix: str, rows_per_chunk: int, job: LoadJob = None) -> list:
+    """
+    rewrites the files as chunks of rows_per_chunk rows, the last one gets what is left.
+
+    the chunks are written as out_prefix-pt1.csv ... out_prefix-ptN.csv so they can be loaded by counter like
+    any other chunk. the files are streamed so only a chunk's worth of rows is held at a time, and files with
+    different columns are lined up by name.
+
+    :param file_names:
+    :param out_dir:
+    :param out_prefix: should contain rk-nodes or rk-edges so the loaders know what the chunks are
+    :param rows_per_chunk:
+    :param job: the background job to report per-chunk progress to, if any
+    :return: a list of (chunk file name, row count)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    rows_per_chunk = max(rows_per_chunk, 1)
+
+    # init the returned chunks
+    ret_val: list = []
+
+    # the rows read but not yet written
+    pending: list = []
+    pending_rows: int = 0
+
+    # note the chunk start
+    start: float = time.perf_counter()
+
+    def write_chunk(frame: pl.DataFrame):
+        """
+        writes the next chunk
+        """
+        nonlocal start
+
+        # counters start at 1
+        file_name: str = get_chunk_file_name(out_dir, out_prefix, len(ret_val) + 1)
+
+        if job is not None:
+            job.chunk_started(file_name)
+
+        frame.write_csv(file_name)
+
+        ret_val.append((file_name, frame.height))
+
+        if job is not None:
+            job.chunk_done(file_name, frame.height, time.perf_counter() - start)
+            job.add_rows(frame.height)
+
+        start = time.perf_counter()
+
+    for file_name in file_names:
+        # read everything as text so the values are written back untouched
+        reader = pl.read_csv_batched(file_name, infer_schema_length=0, batch_size=min(rows_per_chunk, 100000))
+
+        while frames := reader.next_batches(1):
+            pending.extend(frames)
+            pending_rows += sum(frame.height for frame in frames)
+
+            # write the full chunks and keep the rest
+            if pending_rows >= rows_per_chunk:
+                frame: pl.DataFrame = pl.concat(pending, how='diagonal')
+
+                full: int = frame.height - frame.height % rows_per_chunk
+
+                for chunk in frame.head(full).iter_slices(rows_per_chunk):
+                    write_chunk(chunk)
+
+                pending = [frame.slice(full)] if full < frame.height else []
+                pending_rows = frame.height - full
+
+    # write what is left
+    if pending_rows:
+        write_chunk(pl.concat(pending, how='diagonal'))
+
+    # return to the caller
+    return ret_val
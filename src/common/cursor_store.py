@@ -0,0 +1,263 @@
+"""
+    Server-side cursor utilities.
+
+    Holds partially read Kuzu query results so callers can page through them
+    with a cursor ID. Cursors that sit idle too long are closed.
+"""
+
+import os
+import json
+import time
+import uuid
+import asyncio
+
+
+class ResultTooLargeError(Exception):
+    """
+        Raised when a result is over the configured row or byte limits
+    """
+
+
+class CursorStoreFullError(Exception):
+    """
+        Raised when a new cursor is needed but every open cursor is in use
+    """
+
+
+class KuzuCursor:
+    """
+        A partially read Kuzu query result
+    """
+    def __init__(self, result):
+        """
+        creates the cursor
+
+        :param result: the Kuzu query result
+        """
+        # save the result and its columns
+        self.result = result
+        self.columns: list = result.get_column_names()
+
+        # the total rows in the result and the rows sent so far
+        self.total_rows: int = result.get_num_tuples()
+        self.rows_sent: int = 0
+
+        # when the cursor was last used
+        self.last_used: float = time.monotonic()
+
+        # only one page can be read at a time
+        self.lock: asyncio.Lock = asyncio.Lock()
+
+    def close(self):
+        """
+        closes the query result
+
+        :return:
+        """
+        self.result.close()
+
+
+class CursorStore:
+    """
+        Keeps the open cursors and expires the idle ones
+    """
+    def __init__(self, idle_timeout: float = 300.0, max_cursors: int = 100, max_rows: int = 100000, max_bytes: int = 64 * 1024 * 1024):
+        """
+        creates the store
+
+        :param idle_timeout: the number of seconds an unused cursor is kept
+        :param max_cursors: the max number of open cursors, the least recently used is closed past this
+        :param max_rows: the max number of rows a single request may return
+        :param max_bytes: the max number of bytes a single request may return
+        """
+        # save the store settings
+        self.idle_timeout: float = idle_timeout
+        self.max_cursors: int = max_cursors
+        self.max_rows: int = max_rows
+        self.max_bytes: int = max_bytes
+
+        # cursor id -> cursor
+        self.cursors: dict = {}
+
+        # init the counters
+        self.opened: int = 0
+        self.expired: int = 0
+        self.evicted: int = 0
+
+    @staticmethod
+    def from_env():
+        """
+        creates a store using the settings in the environment
+
+        :return:
+        """
+        # get the store settings
+        idle_timeout: float = float(os.getenv('KUZU_CURSOR_IDLE_TIMEOUT', '300'))
+        max_cursors: int = int(os.getenv('KUZU_MAX_CURSORS', '100'))
+        max_rows: int = int(os.getenv('KUZU_MAX_RESULT_ROWS', '100000'))
+        max_bytes: int = int(os.getenv('KUZU_MAX_RESULT_BYTES', str(64 * 1024 * 1024)))
+
+        # return to the caller
+        return CursorStore(idle_timeout, max_cursors, max_rows, max_bytes)
+
+    def open(self, result) -> str:
+        """
+        saves a query result as a new cursor, raises CursorStoreFullError if there is no room and every cursor is in use
+
+        :param result:
+        :return: the cursor id
+        """
+        # drop the stale cursors first
+        self.expire()
+
+        # close the least recently used cursors to make room, a cursor with a page being read is left alone
+        while len(self.cursors) >= self.max_cursors:
+            idle: list = [c for c, cursor in self.cursors.items() if not cursor.lock.locked()]
+
+            if not idle:
+                # the caller handed the result over, so it is closed here
+                result.close()
+
+                raise CursorStoreFullError(f'All {self.max_cursors} cursors are in use.')
+
+            oldest: str = min(idle, key=lambda c: self.cursors[c].last_used)
+            self.cursors.pop(oldest).close()
+
+            self.evicted += 1
+
+        # create the cursor
+        ret_val: str = uuid.uuid4().hex
+
+        self.cursors[ret_val] = KuzuCursor(result)
+
+        self.opened += 1
+
+        # return to the caller
+        return ret_val
+
+    def get(self, cursor_id: str) -> KuzuCursor | None:
+        """
+        gets an open cursor
+
+        :param cursor_id:
+        :return:
+        """
+        # drop the stale cursors first
+        self.expire()
+
+        # return to the caller
+        return self.cursors.get(cursor_id)
+
+    def close(self, cursor_id: str):
+        """
+        closes a cursor
+
+        :param cursor_id:
+        :return:
+        """
+        # get the cursor
+        cursor: KuzuCursor = self.cursors.pop(cursor_id, None)
+
+        if cursor is not None:
+            cursor.close()
+
+    def expire(self):
+        """
+        closes the cursors that have been idle too long
+
+        :return:
+        """
+        # get the cut-off time
+        cut_off: float = time.monotonic() - self.idle_timeout
+
+        for cursor_id in [c for c, cursor in self.cursors.items() if cursor.last_used < cut_off and not cursor.lock.locked()]:
+            self.close(cursor_id)
+
+            self.expired += 1
+
+    def close_all(self):
+        """
+        closes every cursor
+
+        :return:
+        """
+        for cursor_id in list(self.cursors):
+            self.close(cursor_id)
+
+    def fetch_page(self, cursor: KuzuCursor, limit: int) -> list:
+        """
+        pulls the next page of rows from a cursor, bounded by the row and byte limits.
+
+        this blocks so it should be run in a worker thread.
+
+        :param cursor:
+        :param limit:
+        :return:
+        """
+        # init the returned rows
+        rows: list = []
+        size: int = 0
+
+        # get rows until the page is full, the byte guard trips or the result is drained
+        while len(rows) < min(limit, self.max_rows) and size < self.max_bytes and cursor.result.has_next():
+            row: list = cursor.result.get_next()
+
+            size += len(json.dumps(row, default=str))
+
+            rows.append(row)
+
+        cursor.rows_sent += len(rows)
+        cursor.last_used = time.monotonic()
+
+        # return to the caller
+        return rows
+
+    def fetch_all(self, result) -> list:
+        """
+        pulls every row of a result, raising ResultTooLargeError as soon as the rows pass the row or byte limits.
+
+        this blocks so it should be run in a worker thread.
+
+        :param result:
+        :return:
+        """
+        # check the row count first, Kuzu knows it before any rows are pulled
+        if result.get_num_tuples() > self.max_rows:
+            raise ResultTooLargeError(f'{result.get_num_tuples()} rows is over the {self.max_rows} row limit. Use limit or a streamed format.')
+
+        # init the returned rows
+        rows: list = []
+        size: int = 0
+
+        # get the rows, stopping before a result past the byte guard is held in memory
+        while result.has_next():
+            row: list = result.get_next()
+
+            size += len(json.dumps(row, default=str))
+
+            if size > self.max_bytes:
+                raise ResultTooLargeError(f'The result is over the {self.max_bytes} byte limit. Use limit or a streamed format.')
+
+            rows.append(row)
+
+        # return to the caller
+        return rows
+
+    def get_stats(self) -> dict:
+        """
+        gets the store counters
+
+        :return:
+        """
+        # drop the stale cursors first
+        self.expire()
+
+        # return to the caller
+        return {'open': len(self.cursors),
+                'max_cursors': self.max_cursors,
+                'idle_timeout': self.idle_timeout,
+                'max_rows': self.max_rows,
+                'max_bytes': self.max_bytes,
+                'opened': self.opened,
+                'expired': self.expired,
+                'evicted': self.evicted}
@@ -0,0 +1,129 @@
+"""
+    RK edge partitioning utilities.
+
+    Reshuffles rk-edges CSV chunks into partitions keyed on a hash of the
+    subject ID. Every edge of a given subject node lands in the same
+    partition, so loading one partition per worker keeps concurrent edge
+    transactions off each other's subject nodes. Edges can still share an
+    object node across partitions, which is what the load retries are for.
+"""
+
+import os
+import time
+import random
+
+import polars as pl
+from neo4j.exceptions import TransientError
+
+from src.common.load_schema import get_chunk_file_name
+from src.common.load_jobs import LoadJob
+
+
+def partition_edge_chunks(file_names: list, out_dir: str, out_prefix: str, partitions: int, job: LoadJob = None, batch_size: int = 100000) -> list:
+    """
+    rewrites the edge chunks as partitions by subject ID hash.
+
+    the partitions are written as out_prefix-pt1.csv ... out_prefix-ptN.csv so they can be
+    loaded by counter like any other chunk. the input is read once, a batch at a time, and
+    each batch is split across all the partitions, so it is never all held in memory.
+
+    :param file_names: the edge chunks to reshuffle
+    :param out_dir:
+    :param out_prefix: should contain rk-edges so the loaders treat the partitions as edges
+    :param partitions: the number of partitions, normally the number of load workers
+    :param job: the background job to report per-partition progress to, if any
+    :param batch_size: the number of rows read at a time
+    :return: a list of (partition file name, row count)
+    """
+    # get the partition names, counters start at 1
+    part_names: list = [get_chunk_file_name(out_dir, out_prefix, i + 1) for i in range(partitions)]
+
+    # the chunks may not all have the same columns, so every partition gets all of them
+    columns: list = []
+
+    for file_name in file_names:
+        columns.extend(column for column in pl.scan_csv(file_name, infer_schema=False).collect_schema().names() if column not in columns)
+
+    # init the per-partition row counts
+    rows: list = [0] * partitions
+
+    # note the start
+    start: float = time.perf_counter()
+
+    if job is not None:
+        for part_name in part_names:
+            job.chunk_started(part_name)
+
+    # open every partition and write its header
+    files: list = [open(part_name, 'w', encoding='utf-8', newline='') for part_name in part_names]
+
+    try:
+        for file in files:
+            pl.DataFrame(schema={column: pl.String for column in columns}).write_csv(file)
+
+        for file_name in file_names:
+            # read everything as text so the values are written back untouched
+            reader = pl.read_csv_batched(file_name, infer_schema_length=0, batch_size=batch_size)
+
+            while batches := reader.next_batches(1):
+                for batch in batches:
+                    # line the batch up with the full column list and hash the subjects
+                    batch = batch.select([pl.col(column) if column in batch.columns else pl.lit(None, pl.String).alias(column) for column in columns])
+
+                    batch = batch.with_columns((pl.col('subject').hash() % partitions).alias('_partition'))
+
+                    # append each part to its partition
+                    for (i,), part in batch.partition_by('_partition', as_dict=True, include_key=False).items():
+                        part.write_csv(files[i], include_header=False)
+
+                        rows[i] += part.height
+
+                    if job is not None:
+                        job.add_rows(batch.height)
+    finally:
+        for file in files:
+            file.close()
+
+    # get the elapsed time, the partitions are written together
+    elapsed: float = time.perf_counter() - start
+
+    if job is not None:
+        for part_name, part_rows in zip(part_names, rows):
+            job.chunk_done(part_name, part_rows, elapsed)
+
+    # return to the caller
+    return list(zip(part_names, rows))
+
+
+def run_with_retry(func, *args, retries: int = None, base_delay: float = None):
+    """
+    runs the function, retrying transient DB errors (e.g. serialization conflicts) with jittered exponential backoff.
+
+    :param func:
+    :param args:
+    :param retries: the number of retries, LOAD_RETRIES or 5 if not set
+    :param base_delay: the first backoff in seconds, LOAD_RETRY_BASE_DELAY or 0.5 if not set
+    :return: the function result and the number of retries it took
+    """
+    # get the retry settings
+    if retries is None:
+        retries = int(os.getenv('LOAD_RETRIES', '5'))
+
+    if base_delay is None:
+        base_delay = float(os.getenv('LOAD_RETRY_BASE_DELAY', '0.5'))
+
+    attempt: int = 0
+
+    while True:
+        try:
+            # return to the caller
+            return func(*args), attempt
+        except TransientError as e:
+            # give up once the retries are used up or the DB says it won't help
+            if attempt >= retries or not e.is_retryable():
+                raise e
+
+            # back off, with jitter so the conflicting workers don't retry in lockstep
+            time.sleep(base_delay * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+            attempt += 1
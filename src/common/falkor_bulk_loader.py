@@ -0,0 +1,377 @@
+"""
+    FalkorDB bulk loader.
+
+    Converts rk-nodes/rk-edges CSV or Parquet chunks into the falkordb-bulk-loader
+    binary format and sends them with GRAPH.BULK, which builds the graph
+    without running any Cypher. The chunks are read in batches with polars
+    rather than through the bulk loader's CSV reader, so the column types
+    come from the same inferred schemas the other loaders use.
+
+    GRAPH.BULK can only create a new graph, and the edges refer to the nodes
+    by their position in the load, so one load sends all the nodes and then
+    all the edges.
+"""
+
+import re
+import time
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import redis
+from falkordb_bulk_loader.entity_file import Type
+
+from src.common.load_schema import infer_chunk_schema
+from src.common.mg_batch_loader import read_batches
+from src.common.load_jobs import LoadJob
+
+# the label given to every RK node, the same as the LOAD CSV loads
+NODE_LABEL: str = 'Node'
+
+# the max number of GRAPH.BULK queries sent but not yet finished
+MAX_IN_FLIGHT: int = 4
+
+
+def pack_value(value) -> bytes:
+    """
+    converts a property value to the bulk loader binary format.
+
+    :param value:
+    :return:
+    """
+    # nulls are sent as an untyped marker
+    if value is None:
+        return struct.pack('=B', 0)
+
+    # check bool before int since bools are ints
+    if isinstance(value, bool):
+        return struct.pack('=B?', Type.BOOL.value, value)
+
+    if isinstance(value, int):
+        return struct.pack('=Bq', Type.LONG.value, value)
+
+    if isinstance(value, float):
+        return struct.pack('=Bd', Type.DOUBLE.value, value)
+
+    if isinstance(value, list):
+        return struct.pack('=Bq', Type.ARRAY.value, len(value)) + b''.join(pack_value(v) for v in value)
+
+    # everything else goes as a null terminated string
+    encoded: bytes = str(value).encode()
+
+    # return to the caller
+    return struct.pack(f'=B{len(encoded) + 1}s', Type.STRING.value, encoded)
+
+
+def pack_header(name: str, prop_names: list) -> bytes:
+    """
+    gets the header of a label or relation type token.
+
+    :param name: the label or relation type
+    :param prop_names:
+    :return:
+    """
+    # init the format with the name and property count
+    encoded: list = [name.encode()] + [prop.encode() for prop in prop_names]
+
+    fmt: str = f'={len(encoded[0]) + 1}sI' + ''.join(f'{len(prop) + 1}s' for prop in encoded[1:])
+
+    # return to the caller
+    return struct.pack(fmt, encoded[0], len(prop_names), *encoded[1:])
+
+
+class FalkorBulkLoader:
+    """
+        Loads CSV or Parquet chunks into a new FalkorDB graph with GRAPH.BULK
+    """
+    def __init__(self, graph_name: str = 'RK_DB', batch_size: int = 10000, max_buffer_size: int = 64, max_token_size: int = 64,
+                 max_token_count: int = 1024):
+        """
+        creates the loader
+
+        :param graph_name:
+        :param batch_size: the number of chunk rows converted at a time
+        :param max_buffer_size: the max size of a GRAPH.BULK query in MB
+        :param max_token_size: the max size of a label or relation type token in MB, redis caps this at 512
+        :param max_token_count: the max number of tokens in a GRAPH.BULK query
+        """
+        # save the settings, the limits are the same as the falkordb-bulk-loader ones
+        self.graph_name: str = graph_name
+        self.batch_size: int = max(batch_size, 1)
+        self.max_buffer_size: int = min(max(max_buffer_size, 1), 1024) * 1_000_000
+        self.max_token_size: int = min(max(max_token_size, 1) * 1_000_000, 512 * 1_000_000, self.max_buffer_size)
+        self.max_token_count: int = min(max(max_token_count, 1), 1024 * 1023)
+
+        # node ID -> the node's position in the load, used to resolve the edge endpoints
+        self.node_ids: dict = {}
+
+        # the position of the next node packed, GRAPH.BULK numbers the nodes in the order they are sent
+        self.next_node_id: int = 0
+
+        # the tokens waiting to be sent and their counts
+        self.tokens: list = []
+        self.buffer_size: int = 0
+        self.node_count: int = 0
+        self.relation_count: int = 0
+
+        # the first query creates the graph
+        self.initial_query: bool = True
+
+        # the queries sent but not yet finished
+        self.in_flight: list = []
+
+        # init the counters
+        self.nodes_created: int = 0
+        self.relations_created: int = 0
+        self.queries: int = 0
+        self.bytes_sent: int = 0
+        self.skipped_edges: int = 0
+        self.skipped_nodes: int = 0
+
+    def send_buffer(self, conn: redis.Redis, sender: ThreadPoolExecutor):
+        """
+        sends the pending tokens as one GRAPH.BULK query.
+
+        :param conn:
+        :param sender: the single thread that sends the queries in order
+        :return:
+        """
+        if not self.tokens:
+            return
+
+        # the token counts come first, labels before relation types
+        labels: list = [token for kind, token in self.tokens if kind == 'node']
+        reltypes: list = [token for kind, token in self.tokens if kind == 'edge']
+
+        args: list = [self.node_count, self.relation_count, len(labels), len(reltypes)] + labels + reltypes
+
+        if self.initial_query:
+            args.insert(0, 'BEGIN')
+            self.initial_query = False
+
+        # wait for the oldest query if too many are out
+        if len(self.in_flight) >= MAX_IN_FLIGHT:
+            self.update_stats(self.in_flight.pop(0).result())
+
+        self.in_flight.append(sender.submit(conn.execute_command, 'GRAPH.BULK', self.graph_name, *args))
+
+        self.queries += 1
+        self.bytes_sent += self.buffer_size
+
+        # start a new buffer
+        self.tokens = []
+        self.buffer_size = 0
+        self.node_count = 0
+        self.relation_count = 0
+
+    def update_stats(self, result):
+        """
+        adds a GRAPH.BULK result to the counters.
+
+        :param result: e.g. "10 nodes created, 5 relations created"
+        :return:
+        """
+        counts: list = [int(n) for n in re.findall(r'(\d+) \w+ created', result.decode() if isinstance(result, bytes) else str(result))]
+
+        self.nodes_created += counts[0] if counts else 0
+        self.relations_created += counts[1] if len(counts) > 1 else 0
+
+    def add_entities(self, conn: redis.Redis, sender: ThreadPoolExecutor, kind: str, name: str, prop_names: list, entities: list):
+        """
+        splits the entities into tokens and queues them, sending the buffer whenever it fills up.
+
+        :param conn:
+        :param sender:
+        :param kind: node or edge
+        :param name: the label or relation type
+        :param prop_names:
+        :param entities: the binary entities
+        :return:
+        """
+        # get the token header
+        header: bytes = pack_header(name, prop_names)
+
+        # init the token being built
+        token: list = []
+        token_size: int = len(header)
+
+        def flush_token():
+            """
+            queues the token being built
+            """
+            if not token:
+                return
+
+            # send the buffer first if the token won't fit
+            if self.buffer_size + token_size >= self.max_buffer_size or len(self.tokens) + 1 >= self.max_token_count:
+                self.send_buffer(conn, sender)
+
+            self.tokens.append((kind, header + b''.join(token)))
+            self.buffer_size += token_size
+
+            if kind == 'node':
+                self.node_count += len(token)
+            else:
+                self.relation_count += len(token)
+
+        for entity in entities:
+            # start a new token when this one is full
+            if token_size + len(entity) >= self.max_token_size:
+                flush_token()
+
+                token = []
+                token_size = len(header)
+
+            token.append(entity)
+            token_size += len(entity)
+
+        flush_token()
+
+    def load_nodes(self, conn: redis.Redis, sender: ThreadPoolExecutor, file_name: str) -> int:
+        """
+        converts and queues the nodes in a chunk.
+
+        nodes whose ID was already loaded are skipped, so every ID maps to the one node GRAPH.BULK creates for it.
+
+        :param conn:
+        :param sender:
+        :param file_name:
+        :return: the number of nodes read
+        """
+        # init the row count
+        ret_val: int = 0
+
+        # get the chunk schema
+        schema: list = infer_chunk_schema(file_name, False)
+
+        prop_names: list = [column for column, _ in schema]
+
+        # get where the node ID is
+        id_index: int = prop_names.index('id')
+
+        for frame in read_batches(file_name, schema, self.batch_size):
+            # init the binary entities
+            entities: list = []
+
+            for row in frame.iter_rows():
+                # a second node with the same ID would shift the position of every node after it
+                if row[id_index] in self.node_ids:
+                    self.skipped_nodes += 1
+                    continue
+
+                # save the node's position for the edges
+                self.node_ids[row[id_index]] = self.next_node_id
+                self.next_node_id += 1
+
+                entities.append(b''.join(pack_value(value) for value in row))
+
+            self.add_entities(conn, sender, 'node', NODE_LABEL, prop_names, entities)
+
+            ret_val += frame.height
+
+        # return to the caller
+        return ret_val
+
+    def load_edges(self, conn: redis.Redis, sender: ThreadPoolExecutor, file_name: str) -> int:
+        """
+        converts and queues the edges in a chunk, one relation type per predicate.
+
+        edges whose endpoints weren't loaded are skipped.
+
+        :param conn:
+        :param sender:
+        :param file_name:
+        :return: the number of edges read
+        """
+        # init the row count
+        ret_val: int = 0
+
+        # get the chunk schema
+        schema: list = infer_chunk_schema(file_name, True)
+
+        prop_names: list = [column for column, _ in schema]
+
+        for frame in read_batches(file_name, schema, self.batch_size):
+            # the relation type can't be a property so split the batch by predicate
+            for predicate, group in frame.partition_by('predicate', as_dict=True).items():
+                # init the binary entities
+                entities: list = []
+
+                for row in group.iter_rows(named=True):
+                    try:
+                        endpoints: bytes = struct.pack('=QQ', self.node_ids[row['subject']], self.node_ids[row['object']])
+                    except KeyError:
+                        self.skipped_edges += 1
+                        continue
+
+                    entities.append(endpoints + b''.join(pack_value(row[prop]) for prop in prop_names))
+
+                self.add_entities(conn, sender, 'edge', str(predicate[0]), prop_names, entities)
+
+            ret_val += frame.height
+
+        # return to the caller
+        return ret_val
+
+    def load(self, conn: redis.Redis, node_file_names: list, edge_file_names: list, drop_first: bool = False, job: LoadJob = None) -> dict:
+        """
+        loads the chunks into a new graph.
+
+        :param conn: a connection to the Falkor server
+        :param node_file_names:
+        :param edge_file_names:
+        :param drop_first: delete the graph first if it exists
+        :param job: the background job to report per-chunk progress to, if any
+        :return: the load statistics
+        """
+        # note the start
+        start: float = time.perf_counter()
+
+        # GRAPH.BULK won't touch an existing graph
+        if conn.exists(self.graph_name):
+            if not drop_first:
+                raise RuntimeError(f'Graph {self.graph_name} already exists, set drop_first to replace it.')
+
+            conn.delete(self.graph_name)
+
+        # init the phase timings
+        phases: dict = {}
+
+        with ThreadPoolExecutor(1) as sender:
+            for phase, load_chunk, file_names in [('nodes', self.load_nodes, node_file_names), ('edges', self.load_edges, edge_file_names)]:
+                # note the phase start
+                phase_start: float = time.perf_counter()
+
+                for file_name in file_names:
+                    if job is not None:
+                        job.chunk_started(file_name)
+
+                    # note the chunk start
+                    chunk_start: float = time.perf_counter()
+
+                    rows: int = load_chunk(conn, sender, file_name)
+
+                    if job is not None:
+                        job.chunk_done(file_name, rows, time.perf_counter() - chunk_start)
+                        job.add_rows(rows)
+
+                # the edges need every node sent first
+                self.send_buffer(conn, sender)
+
+                phases[phase] = round(time.perf_counter() - phase_start, 4)
+
+                if job is not None:
+                    job.phase_done(phase, phases[phase])
+
+            # wait for the rest of the queries
+            for future in self.in_flight:
+                self.update_stats(future.result())
+
+        # get the elapsed time
+        elapsed: float = time.perf_counter() - start
+
+        # return to the caller
+        return {'graph': self.graph_name, 'nodes_created': self.nodes_created, 'relations_created': self.relations_created,
+                'skipped_nodes': self.skipped_nodes, 'skipped_edges': self.skipped_edges, 'queries': self.queries,
+                'bytes_sent': self.bytes_sent, 'phases': phases, 'elapsed': round(elapsed, 4),
+                'entities_per_second': round((self.nodes_created + self.relations_created) / elapsed, 2) if elapsed else 0.0,
+                'mb_per_second': round(self.bytes_sent / 1_000_000 / elapsed, 2) if elapsed else 0.0}
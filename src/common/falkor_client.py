@@ -0,0 +1,247 @@
+"""
+    FalkorDB client utilities.
+
+    One client per process holds a redis connection pool to the Falkor server
+    at FALKOR_URL. The server capabilities are checked once and cached, so
+    the load and query paths don't pay for a ping and a module list on every
+    request. Point FALKOR_URL at a local stand-in for testing.
+"""
+
+import os
+import threading
+
+import redis
+from falkordb import FalkorDB, Node, Edge, Path
+from falkordb.query_result import QueryResult
+
+from src.common.result_stream import convert_nested
+
+# the error the server sends when a query runs past its timeout
+FALKOR_TIMEOUT_MESSAGE: str = 'Query timed out'
+
+
+class FalkorClient:
+    """
+        A pooled FalkorDB client
+    """
+    def __init__(self, url: str, max_connections: int = 16, connect_timeout: float = 5.0, pool_timeout: float = 30.0):
+        """
+        creates the client, no connection is made until it is used
+
+        :param url: the redis URL of the Falkor server
+        :param max_connections: the max number of pooled connections
+        :param connect_timeout: the number of seconds to wait for a new connection
+        :param pool_timeout: the number of seconds to wait for a free pooled connection
+        """
+        # save the settings
+        self.url: str = url
+
+        # the pool shared by the raw redis and FalkorDB clients, FalkorDB expects decoded responses.
+        # callers wait for a free connection rather than failing when they are all in use.
+        self.pool: redis.BlockingConnectionPool = redis.BlockingConnectionPool.from_url(url, max_connections=max(max_connections, 1),
+                                                                                    timeout=pool_timeout, decode_responses=True,
+                                                                                    socket_connect_timeout=connect_timeout)
+
+        # the raw redis client for the non-graph commands
+        self.redis: redis.Redis = redis.Redis(connection_pool=self.pool)
+
+        # the FalkorDB client talks to the server when it is created, so it is made on first use
+        self.db: FalkorDB | None = None
+
+        # the cached capability check
+        self.capabilities: dict | None = None
+
+        self.lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def from_env():
+        """
+        creates a client using the settings in the environment
+
+        :return:
+        """
+        # return to the caller
+        return FalkorClient(get_falkor_url(), int(os.getenv('FALKOR_POOL_SIZE', '16')), float(os.getenv('FALKOR_CONNECT_TIMEOUT', '5')),
+                            float(os.getenv('FALKOR_POOL_TIMEOUT', '30')))
+
+    def get_db(self) -> FalkorDB:
+        """
+        gets the FalkorDB client.
+
+        :return:
+        """
+        with self.lock:
+            if self.db is None:
+                self.db = FalkorDB(connection_pool=self.pool)
+
+        # return to the caller
+        return self.db
+
+    def select_graph(self, graph_name: str):
+        """
+        gets a graph.
+
+        :param graph_name:
+        :return:
+        """
+        # return to the caller
+        return self.get_db().select_graph(graph_name)
+
+    def ro_query(self, graph_name: str, query: str, timeout_ms: int | None = None) -> QueryResult:
+        """
+        runs a read-only query.
+
+        :param graph_name:
+        :param query:
+        :param timeout_ms: the query timeout in milliseconds, None uses the server default
+        :return:
+        """
+        # return to the caller
+        return self.select_graph(graph_name).ro_query(query, timeout=timeout_ms)
+
+    def ro_query_pipeline(self, graph_name: str, queries: list, timeout_ms: int | None = None) -> list:
+        """
+        runs a batch of read-only queries pipelined over one connection.
+
+        a failed query doesn't stop the others, its exception is returned in its place.
+
+        :param graph_name:
+        :param queries:
+        :param timeout_ms: the per query timeout in milliseconds, None uses the server default
+        :return: a QueryResult or exception per query, in query order
+        """
+        # the results are parsed against the graph's schema
+        graph = self.select_graph(graph_name)
+
+        # queue the queries, the same command graph.ro_query sends
+        pipe = self.redis.pipeline(transaction=False)
+
+        for query in queries:
+            pipe.execute_command('GRAPH.RO_QUERY', graph_name, query, '--compact', *(['timeout', timeout_ms] if timeout_ms else []))
+
+        # init the returned results
+        ret_val: list = []
+
+        # send them in one round trip
+        for response in pipe.execute(raise_on_error=False):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+
+                ret_val.append(QueryResult(graph, response))
+            except Exception as e:
+                ret_val.append(e)
+
+        # return to the caller
+        return ret_val
+
+    def check_capabilities(self, refresh: bool = False) -> dict:
+        """
+        checks that the server is up and has the graph module loaded.
+
+        a successful check is cached, a failed one is retried on the next call.
+
+        :param refresh: check again even if there is a cached result
+        :return: reachable, graph_module and error
+        """
+        if self.capabilities is not None and self.capabilities['reachable'] and not refresh:
+            return self.capabilities
+
+        # init the returned capabilities
+        ret_val: dict = {'url': self.url, 'reachable': False, 'graph_module': None, 'error': None}
+
+        try:
+            # make sure the server is there
+            self.redis.ping()
+
+            ret_val['reachable'] = True
+
+            try:
+                ret_val['graph_module'] = 'graph' in [m['name'] for m in self.redis.module_list()]
+            except redis.exceptions.ResponseError:
+                # the server doesn't support MODULE LIST, assume the graph commands are there
+                ret_val['graph_module'] = True
+        except Exception as e:
+            ret_val['error'] = str(e)
+
+        self.capabilities = ret_val
+
+        # return to the caller
+        return ret_val
+
+    def get_pool_usage(self) -> dict:
+        """
+        gets the number of pooled connections in use and idle, along with the pool size.
+
+        :return:
+        """
+        # get the free slots in the pool queue, each is an idle connection or a placeholder for one not made yet
+        free: list = list(self.pool.pool.queue)
+
+        # return to the caller
+        return {'in_use': self.pool.max_connections - len(free), 'idle': sum(connection is not None for connection in free),
+                'max': self.pool.max_connections}
+
+    def close(self):
+        """
+        closes the pooled connections.
+
+        :return:
+        """
+        self.pool.disconnect()
+
+
+def get_columns(result: QueryResult) -> list:
+    """
+    gets the column names of a query result.
+
+    :param result:
+    :return:
+    """
+    # the header is a list of (column type, column name)
+    return [column[1] for column in result.header]
+
+
+def is_falkor_timeout(error: BaseException) -> bool:
+    """
+    checks if a query failed because it ran past its timeout, on the server or waiting on the socket.
+
+    :param error:
+    :return:
+    """
+    if isinstance(error, redis.exceptions.TimeoutError):
+        return True
+
+    # return to the caller
+    return isinstance(error, redis.exceptions.ResponseError) and str(error).startswith(FALKOR_TIMEOUT_MESSAGE)
+
+
+def to_json_value(value):
+    """
+    converts a Falkor result value to something JSON can hold.
+
+    :param value:
+    :return:
+    """
+    if isinstance(value, Node):
+        return {'id': value.id, 'labels': value.labels, 'properties': value.properties}
+
+    if isinstance(value, Edge):
+        return {'id': value.id, 'relation': value.relation, 'src_node': to_json_value(value.src_node), 'dest_node': to_json_value(value.dest_node),
+                 'properties': value.properties}
+
+    if isinstance(value, Path):
+        return {'nodes': [to_json_value(node) for node in value.nodes()], 'edges': [to_json_value(edge) for edge in value.edges()]}
+
+    # return to the caller
+    return convert_nested(value, to_json_value)
+
+
+def get_falkor_url() -> str:
+    """
+    gets the Falkor server URL from the environment.
+
+    :return:
+    """
+    # return to the caller
+    return os.getenv('FALKOR_URL', 'redis://localhost:6379')
@@ -0,0 +1,623 @@
+"""
+    Graph DB backend abstraction.
+
+    Each engine (Kuzu, Memgraph, FalkorDB) is wrapped in a GraphBackend with
+    the same connect, query, stream, bulk load, index and stats operations, so
+    the generic and per-engine endpoints share one query path. The backends
+    wrap the pools the server already creates, and the endpoints handle the
+    timeouts, cancellation and result caching the same way for every engine.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack
+
+import kuzu
+import redis
+from neo4j import AsyncDriver, DEFAULT_DATABASE
+from neo4j.exceptions import ServiceUnavailable, Neo4jError
+
+from src.common.kuzu_pool import KuzuConnectionPool, KuzuPoolTimeoutError
+from src.common.kuzu_loader import load_kuzu_chunks
+from src.common.result_stream import StreamResources, fetch_rows, stream_batches
+from src.common.cancellation import QueryTimeoutError, get_query_timeout
+from src.common.load_jobs import LoadJob
+from src.common.metrics import QueryMetrics
+from src.common.mg_batch_loader import MemgraphBatchLoader
+from src.common.mg_client import get_mg_pool_settings, get_mg_pool_usage, run_mg_query, get_record_batches
+from src.common.falkor_client import FalkorClient, get_columns, is_falkor_timeout, to_json_value as falkor_to_json_value
+from src.common.falkor_bulk_loader import FalkorBulkLoader, NODE_LABEL
+
+# the formats the generic query endpoint can stream for every engine
+BACKEND_FORMATS: tuple = ('ndjson', 'csv')
+
+# the queries used to count the graph for the stats
+COUNT_QUERIES: dict = {'nodes': 'MATCH (n) RETURN count(n)', 'edges': 'MATCH ()-[r]->() RETURN count(r)'}
+
+
+class BackendUnavailableError(Exception):
+    """
+        Raised when a backend can't take the request, e.g. the server is down or its pool is saturated
+    """
+
+
+class BackendResult:
+    """
+        A running query's column names and row batches, holding the backend resources until it is closed
+    """
+    def __init__(self, columns: list, batches, release=None, types: list | None = None):
+        """
+        creates the result
+
+        :param columns:
+        :param batches: an async iterator of row lists
+        :param release: an async callable that frees the query's connection, if any
+        :param types: the column types, if the engine reports them
+        """
+        self.columns: list = columns
+        self.batches = batches
+        self.release = release
+        self.types: list | None = types
+
+    async def close(self):
+        """
+        frees the query's resources.
+
+        :return:
+        """
+        if self.release is not None:
+            await self.release()
+
+            self.release = None
+
+
+class GraphBackend(ABC):
+    """
+        The operations every graph engine supports
+    """
+    # the engine name used to pick the backend
+    name: str = ''
+
+    # the chunk file formats the bulk load can read
+    load_formats: tuple = ('csv', 'parquet')
+
+    # the formats the query results can be streamed as
+    stream_formats: tuple = BACKEND_FORMATS
+
+    @abstractmethod
+    async def connect(self):
+        """
+        makes sure the backend can take requests.
+
+        :return:
+        """
+
+    @abstractmethod
+    async def execute(self, query: str, parameters: dict | None, timeout: float | None, batch_size: int) -> BackendResult:
+        """
+        starts a query, returning once the columns are known so query errors are raised here rather than mid stream.
+
+        :param query:
+        :param parameters:
+        :param timeout: the query timeout in seconds, None uses the QUERY_TIMEOUT default, 0 is no timeout
+        :param batch_size: the number of rows per batch
+        :return:
+        """
+
+    @abstractmethod
+    def bulk_load(self, job: LoadJob, node_file_names: list, edge_file_names: list, options: dict) -> dict:
+        """
+        loads the node chunks and then the edge chunks. this blocks, so it runs on a load job thread.
+
+        :param job:
+        :param node_file_names:
+        :param edge_file_names:
+        :param options: batch_size, format and drop_first
+        :return: the load statistics
+        """
+
+    @abstractmethod
+    async def create_indexes(self, drop_first: bool) -> list:
+        """
+        creates the Node(id) index the edge loads and lookups use.
+
+        :param drop_first:
+        :return: the statements run
+        """
+
+    @abstractmethod
+    def get_pool_stats(self) -> dict:
+        """
+        gets the connection pool details.
+
+        :return:
+        """
+
+    async def query(self, query: str, parameters: dict | None = None, timeout: float | None = None) -> list:
+        """
+        runs a query and gets all the rows.
+
+        :param query:
+        :param parameters:
+        :param timeout:
+        :return:
+        """
+        # init the returned rows
+        ret_val: list = []
+
+        # the rows aren't serialized here, so no bytes are recorded
+        with QueryMetrics(self.name, 'rows') as metrics:
+            result: BackendResult = await self.execute(query, parameters, timeout, 10000)
+
+            try:
+                async for rows in result.batches:
+                    metrics.add(len(rows))
+
+                    ret_val.extend(rows)
+            finally:
+                await result.close()
+
+        # return to the caller
+        return ret_val
+
+    async def stream(self, query: str, parameters: dict | None, fmt: str, batch_size: int, timeout: float | None = None) -> tuple:
+        """
+        starts a query and gets a stream of its rows serialized in one of the stream formats.
+
+        :param query:
+        :param parameters:
+        :param fmt: one of stream_formats
+        :param batch_size:
+        :param timeout:
+        :return: an async generator that closes the query when it is done, and the query's resources for a
+                 ReleasingStreamingResponse to free if the stream never starts
+        """
+        metrics: QueryMetrics = QueryMetrics(self.name, fmt)
+
+        try:
+            # start the query
+            result: BackendResult = await self.execute(query, parameters, timeout, max(batch_size, 1))
+        except BaseException as e:
+            metrics.finish(e)
+            raise
+
+        # the result is closed once, by the stream or by the response
+        resources: StreamResources = StreamResources(AsyncExitStack(), metrics)
+
+        resources.stack.push_async_callback(result.close)
+
+        # return to the caller
+        return stream_batches(resources, result.columns, result.batches, fmt, result.types), resources
+
+    async def get_stats(self, counts: bool = True) -> dict:
+        """
+        gets the pool details and optionally the node and edge counts.
+
+        :param counts:
+        :return:
+        """
+        # init the returned stats
+        ret_val: dict = {'engine': self.name, 'pool': self.get_pool_stats()}
+
+        if counts:
+            for name, query in COUNT_QUERIES.items():
+                ret_val[name] = (await self.query(query))[0][0]
+
+        # return to the caller
+        return ret_val
+
+
+class KuzuBackend(GraphBackend):
+    """
+        Kuzu on the shared connection pool
+    """
+    name: str = 'kuzu'
+
+    # Kuzu reports its column types so its results can also be sent as Arrow
+    stream_formats: tuple = ('arrow',) + BACKEND_FORMATS
+
+    def __init__(self, db: kuzu.Database, pool: KuzuConnectionPool):
+        """
+        creates the backend
+
+        :param db: the loaded DB, the bulk loads use their own connection to it
+        :param pool:
+        """
+        self.db: kuzu.Database = db
+        self.pool: KuzuConnectionPool = pool
+
+    async def connect(self):
+        """
+        makes sure the DB is loaded.
+
+        :return:
+        """
+        if self.pool is None:
+            raise BackendUnavailableError('Kuzu DB not loaded.')
+
+    async def execute(self, query: str, parameters: dict | None, timeout: float | None, batch_size: int) -> BackendResult:
+        """
+        starts a query on a pooled connection, the connection stays checked out until the result is closed.
+
+        :param query:
+        :param parameters:
+        :param timeout:
+        :param batch_size:
+        :return:
+        """
+        # the connection is held by this stack until the result is closed
+        stack = AsyncExitStack()
+
+        try:
+            # get a connection from the pool
+            conn = await stack.enter_async_context(self.pool.acquire())
+
+            # execute the query
+            result = await self.pool.execute_query(conn, query, parameters, timeout)
+        except KuzuPoolTimeoutError as e:
+            raise BackendUnavailableError(f'Server busy. {str(e)}') from e
+        except BaseException:
+            # release the connection
+            await stack.aclose()
+            raise
+
+        async def batches():
+            """
+            pulls the rows off the event loop
+            """
+            while rows := await self.pool.run_in_executor(fetch_rows, result, batch_size):
+                yield rows
+
+        async def release():
+            """
+            releases the query result and the connection
+            """
+            result.close()
+
+            await stack.aclose()
+
+        # return to the caller
+        return BackendResult(result.get_column_names(), batches(), release, result.get_column_data_types())
+
+    def bulk_load(self, job: LoadJob, node_file_names: list, edge_file_names: list, options: dict) -> dict:
+        """
+        copies the chunks in with COPY FROM on a connection of its own.
+
+        :param job:
+        :param node_file_names:
+        :param edge_file_names:
+        :param options:
+        :return:
+        """
+        # init the returned stats
+        ret_val: dict = {}
+
+        conn = kuzu.Connection(self.db)
+
+        try:
+            for phase, file_names, is_edges in [('nodes', node_file_names, False), ('edges', edge_file_names, True)]:
+                if file_names:
+                    ret_val[phase] = load_kuzu_chunks(conn, file_names, options['format'], is_edges, job)
+        finally:
+            conn.close()
+
+            # the prepared statements were made against the old schema
+            self.pool.statements.clear()
+
+        # return to the caller
+        return ret_val
+
+    async def create_indexes(self, drop_first: bool) -> list:
+        """
+        the Node(id) primary key is Kuzu's index, so there is nothing to create.
+
+        :param drop_first:
+        :return:
+        """
+        # return to the caller
+        return []
+
+    def get_pool_stats(self) -> dict:
+        """
+        gets the connection pool details.
+
+        :return:
+        """
+        # return to the caller
+        return self.pool.get_stats() if self.pool is not None else {}
+
+
+class MemgraphBackend(GraphBackend):
+    """
+        Memgraph on the shared async Bolt driver
+    """
+    name: str = 'memgraph'
+
+    def __init__(self, driver: AsyncDriver):
+        """
+        creates the backend
+
+        :param driver:
+        """
+        self.driver: AsyncDriver = driver
+
+    async def connect(self):
+        """
+        makes sure the server is reachable.
+
+        :return:
+        """
+        try:
+            await self.driver.verify_connectivity()
+        except ServiceUnavailable as e:
+            raise BackendUnavailableError(f'Memgraph unavailable. {str(e)}') from e
+
+    async def execute(self, query: str, parameters: dict | None, timeout: float | None, batch_size: int) -> BackendResult:
+        """
+        starts a query in a session of its own, the session stays open until the result is closed.
+
+        :param query:
+        :param parameters:
+        :param timeout:
+        :param batch_size:
+        :return:
+        """
+        # get a session from the shared pool
+        session = self.driver.session(database=DEFAULT_DATABASE)
+
+        try:
+            # start the query, this returns once the columns are known
+            result, columns = await run_mg_query(session, query, parameters, timeout)
+        except BaseException as e:
+            await session.close()
+
+            if isinstance(e, ServiceUnavailable):
+                raise BackendUnavailableError(f'Memgraph unavailable. {str(e)}') from e
+
+            raise
+
+        # return to the caller
+        return BackendResult(columns, get_record_batches(result, batch_size), session.close)
+
+    def bulk_load(self, job: LoadJob, node_file_names: list, edge_file_names: list, options: dict) -> dict:
+        """
+        loads the chunks with batched UNWIND writes.
+
+        :param job:
+        :param node_file_names:
+        :param edge_file_names:
+        :param options:
+        :return:
+        """
+        # init the returned stats
+        ret_val: dict = {}
+
+        for phase, file_names, is_edges in [('nodes', node_file_names, False), ('edges', edge_file_names, True)]:
+            if not file_names:
+                continue
+
+            ret_val[phase] = MemgraphBatchLoader(options['batch_size']).load(file_names, is_edges, job)
+
+            # the edges can't be matched if a node batch didn't make it
+            if ret_val[phase]['errors']:
+                raise RuntimeError(f"{len(ret_val[phase]['errors'])} {phase} load error(s), first: {ret_val[phase]['errors'][0]}")
+
+        # return to the caller
+        return ret_val
+
+    async def create_indexes(self, drop_first: bool) -> list:
+        """
+        creates the Node(id) index.
+
+        :param drop_first:
+        :return:
+        """
+        # init the statements to run
+        ret_val: list = []
+
+        if drop_first:
+            try:
+                # the index may not be there
+                await self.query(f'DROP INDEX ON :{NODE_LABEL}(id)')
+
+                ret_val.append(f'DROP INDEX ON :{NODE_LABEL}(id)')
+            except Neo4jError:
+                pass
+
+        await self.query(f'CREATE INDEX ON :{NODE_LABEL}(id)')
+
+        ret_val.append(f'CREATE INDEX ON :{NODE_LABEL}(id)')
+
+        # return to the caller
+        return ret_val
+
+    def get_pool_stats(self) -> dict:
+        """
+        gets the connection pool settings and usage.
+
+        :return:
+        """
+        # return to the caller
+        return {**get_mg_pool_settings(), **get_mg_pool_usage(self.driver)}
+
+
+class FalkorBackend(GraphBackend):
+    """
+        FalkorDB on the pooled client
+    """
+    name: str = 'falkor'
+
+    def __init__(self, client: FalkorClient, graph_name: str = 'RK_DB'):
+        """
+        creates the backend
+
+        :param client:
+        :param graph_name:
+        """
+        self.client: FalkorClient = client
+        self.graph_name: str = graph_name
+
+    async def connect(self):
+        """
+        checks the cached server capabilities, rechecking the server if it wasn't reachable.
+
+        :return:
+        """
+        capabilities: dict = await asyncio.to_thread(self.client.check_capabilities)
+
+        if not capabilities['reachable']:
+            raise BackendUnavailableError(f"Falkor server unavailable: {capabilities['error']}")
+
+        if not capabilities['graph_module']:
+            raise BackendUnavailableError('The falkordb module is not loaded on the server.')
+
+    async def execute(self, query: str, parameters: dict | None, timeout: float | None, batch_size: int) -> BackendResult:
+        """
+        runs a query, Falkor sends the whole result back at once so only the serialization is batched.
+
+        :param query:
+        :param parameters:
+        :param timeout:
+        :param batch_size:
+        :return:
+        """
+        # make sure there is a server to query
+        await self.connect()
+
+        # Falkor takes the timeout in milliseconds
+        timeout_ms: int | None = int(get_query_timeout(timeout) * 1000) or None
+
+        result = await self.run(lambda: self.client.select_graph(self.graph_name).query(query, parameters, timeout_ms))
+
+        # return to the caller
+        return get_falkor_result(result, batch_size)
+
+    async def execute_read(self, queries: list, graph_name: str | None, timeout: float | None, batch_size: int) -> list:
+        """
+        runs read-only queries with GRAPH.RO_QUERY, a batch is pipelined over one connection.
+
+        a single query's errors are raised, a failed query in a batch doesn't stop the others and is returned in its place.
+
+        :param queries:
+        :param graph_name: the graph to query, None is the backend's graph
+        :param timeout: the per query timeout in seconds, None uses the QUERY_TIMEOUT default, 0 is no timeout
+        :param batch_size: the number of rows per batch
+        :return: a BackendResult or exception per query, in query order
+        """
+        # make sure there is a server to query
+        await self.connect()
+
+        graph_name = graph_name or self.graph_name
+
+        # Falkor takes the timeout in milliseconds
+        timeout_ms: int | None = int(get_query_timeout(timeout) * 1000) or None
+
+        if len(queries) == 1:
+            results: list = [await self.run(self.client.ro_query, graph_name, queries[0], timeout_ms)]
+        else:
+            results: list = await self.run(self.client.ro_query_pipeline, graph_name, queries, timeout_ms)
+
+        # return to the caller
+        return [result if isinstance(result, Exception) else get_falkor_result(result, batch_size) for result in results]
+
+    @staticmethod
+    async def run(func, *args):
+        """
+        runs a blocking client call off the event loop, raising the backend errors for an unavailable server or a timeout.
+
+        :param func:
+        :param args:
+        :return:
+        """
+        try:
+            # return to the caller
+            return await asyncio.to_thread(func, *args)
+        except redis.exceptions.ConnectionError as e:
+            raise BackendUnavailableError(f'Falkor server unavailable: {str(e)}') from e
+        except redis.exceptions.RedisError as e:
+            if is_falkor_timeout(e):
+                raise QueryTimeoutError(str(e)) from e
+
+            raise
+
+    def bulk_load(self, job: LoadJob, node_file_names: list, edge_file_names: list, options: dict) -> dict:
+        """
+        builds the graph with GRAPH.BULK.
+
+        :param job:
+        :param node_file_names:
+        :param edge_file_names:
+        :param options:
+        :return:
+        """
+        # return to the caller
+        return FalkorBulkLoader(self.graph_name, options['batch_size']).load(self.client.redis, node_file_names, edge_file_names,
+                                                                             options['drop_first'], job)
+
+    async def create_indexes(self, drop_first: bool) -> list:
+        """
+        creates the Node(id) range index.
+
+        :param drop_first:
+        :return:
+        """
+        # init the statements to run
+        ret_val: list = []
+
+        if drop_first:
+            try:
+                # the index may not be there
+                await self.query(f'DROP INDEX FOR (n:{NODE_LABEL}) ON (n.id)')
+
+                ret_val.append(f'DROP INDEX FOR (n:{NODE_LABEL}) ON (n.id)')
+            except redis.exceptions.ResponseError:
+                pass
+
+        await self.query(f'CREATE INDEX FOR (n:{NODE_LABEL}) ON (n.id)')
+
+        ret_val.append(f'CREATE INDEX FOR (n:{NODE_LABEL}) ON (n.id)')
+
+        # return to the caller
+        return ret_val
+
+    def get_pool_stats(self) -> dict:
+        """
+        gets the cached capabilities and connection pool usage.
+
+        :return:
+        """
+        # return to the caller
+        return {**(self.client.capabilities or {}), 'max_connections': self.client.pool.max_connections, **self.client.get_pool_usage()}
+
+
+def get_falkor_result(result, batch_size: int) -> BackendResult:
+    """
+    wraps a Falkor query result, Falkor sends the whole result back at once so only the conversion is batched.
+
+    :param result: the QueryResult
+    :param batch_size:
+    :return:
+    """
+    async def batches():
+        """
+        converts the rows a batch at a time off the event loop
+        """
+        for start in range(0, len(result.result_set), batch_size):
+            yield await asyncio.to_thread(falkor_to_json_value, result.result_set[start:start + batch_size])
+
+    # return to the caller
+    return BackendResult(get_columns(result) if result.header else [], batches())
+
+
+def get_graph_backends(db: kuzu.Database, kuzu_pool: KuzuConnectionPool, mg_driver: AsyncDriver, falkor_client: FalkorClient) -> dict:
+    """
+    creates a backend for each engine over the server's shared pools.
+
+    :param db:
+    :param kuzu_pool:
+    :param mg_driver:
+    :param falkor_client:
+    :return: engine name -> backend
+    """
+    # return to the caller
+    return {backend.name: backend for backend in [KuzuBackend(db, kuzu_pool), MemgraphBackend(mg_driver), FalkorBackend(falkor_client)]}
@@ -0,0 +1,111 @@
+"""
+    Kuzu DB startup utilities.
+
+    Opens the Kuzu DB with the tunables in the environment and warms the
+    buffer pool by scanning the hot node and relationship tables so the first
+    real queries don't pay for the cold page reads.
+"""
+
+import os
+import time
+
+import kuzu
+
+from src.common.kuzu_pool import KuzuConnectionPool
+
+
+def open_kuzu_db(logger) -> kuzu.Database:
+    """
+    opens the Kuzu DB using the settings in the environment.
+
+    :param logger:
+    :return:
+    """
+    # get the path to the DB
+    db_path: str = os.getenv('KUZU_DB_PATH', 'D:/dvols/graph-eval/ctd_data/ctd-kuzu-db')
+
+    # get the DB tunables, 0 lets Kuzu pick the default
+    buffer_pool_size: int = int(os.getenv('KUZU_BUFFER_POOL_SIZE', '0'))
+    max_num_threads: int = int(os.getenv('KUZU_MAX_NUM_THREADS', '0'))
+    read_only: bool = os.getenv('KUZU_READ_ONLY', 'false').lower() in ('true', '1', 'yes')
+
+    logger.info('Now loading Kuzu DB: %s, buffer pool size: %s, max threads: %s, read only: %s', db_path, buffer_pool_size, max_num_threads,
+                read_only)
+
+    # return to the caller
+    return kuzu.Database(str(db_path), buffer_pool_size=buffer_pool_size, max_num_threads=max_num_threads, read_only=read_only)
+
+
+def get_warmup_queries(conn: kuzu.Connection) -> list:
+    """
+    gets the queries that scan every property of the hot tables.
+
+    KUZU_WARMUP_TABLES is a comma separated list of table names, all tables are used if it is not set.
+
+    :param conn:
+    :return:
+    """
+    # get the tables to warm
+    hot_tables: list = [t.strip() for t in os.getenv('KUZU_WARMUP_TABLES', '').split(',') if t.strip()]
+
+    # init the returned queries
+    ret_val: list = []
+
+    # get the tables in the DB
+    tables = conn.execute('CALL show_tables() RETURN name, type')
+
+    while tables.has_next():
+        name, table_type = tables.get_next()
+
+        # skip the tables that were not asked for
+        if hot_tables and name not in hot_tables:
+            continue
+
+        # get the property names of the table
+        props = conn.execute(f"CALL table_info('{name}') RETURN name")
+
+        prop_names: list = []
+
+        while props.has_next():
+            prop_names.append(props.get_next()[0])
+
+        # counting each property forces its column pages to be read
+        if table_type == 'NODE':
+            counts: str = ', '.join([f'count(n.`{p}`)' for p in prop_names] or ['count(n)'])
+            ret_val.append(f'MATCH (n:`{name}`) RETURN {counts}')
+        elif table_type == 'REL':
+            counts: str = ', '.join([f'count(r.`{p}`)' for p in prop_names] or ['count(r)'])
+            ret_val.append(f'MATCH ()-[r:`{name}`]->() RETURN {counts}')
+
+    # return to the caller
+    return ret_val
+
+
+async def warm_up_kuzu_db(pool: KuzuConnectionPool, logger) -> float:
+    """
+    pre-touches the hot node and relationship tables to load them into the buffer pool.
+
+    :param pool:
+    :param logger:
+    :return: the warm-up duration in seconds
+    """
+    # note the start
+    start: float = time.perf_counter()
+
+    async with pool.acquire() as conn:
+        # get the scan queries
+        queries: list = await pool.run_in_executor(get_warmup_queries, conn)
+
+        # run each scan
+        for query in queries:
+            logger.debug('Kuzu warm-up: %s', query)
+
+            await pool.execute(conn, query, timeout=0)
+
+    # get the elapsed time
+    ret_val: float = round(time.perf_counter() - start, 4)
+
+    logger.info('Kuzu warm-up complete. %s table scans in %ss', len(queries), ret_val)
+
+    # return to the caller
+    return ret_val
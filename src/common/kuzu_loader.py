@@ -0,0 +1,263 @@
+"""
+    Kuzu bulk load utilities.
+
+    Builds the Kuzu node/rel table DDL from the inferred schemas of a set of
+    rk-nodes/rk-edges chunks and loads each chunk with COPY FROM. The chunks
+    don't all have the same non-empty columns, so each one is copied through a
+    LOAD FROM subquery that casts its columns and fills the table columns it
+    doesn't have with nulls.
+"""
+
+import re
+import time
+
+import kuzu
+import polars as pl
+
+from src.common.load_schema import NODE_TYPE_HINTS, EDGE_TYPE_HINTS, infer_csv_schema, infer_parquet_schema
+from src.common.load_jobs import LoadJob
+
+# the Kuzu tables the RK graph is loaded into
+NODE_TABLE: str = 'Node'
+REL_TABLE: str = 'Edge'
+
+# the Kuzu type used for each inferred column type
+KUZU_TYPES: dict = {'string': 'STRING', 'list': 'STRING[]', 'boolean': 'BOOLEAN', 'integer': 'INT64', 'float': 'DOUBLE'}
+
+# the edge columns that become the rel table endpoints rather than properties
+EDGE_ENDPOINTS: tuple = ('subject', 'object')
+
+
+def quote(name: str) -> str:
+    """
+    quotes a Kuzu identifier.
+
+    :param name:
+    :return:
+    """
+    # return to the caller
+    return '`' + name.replace('`', '') + '`'
+
+
+def get_chunk_schema(file_name: str, fmt: str, is_edges: bool) -> list:
+    """
+    gets the schema of a CSV or Parquet chunk.
+
+    :param file_name:
+    :param fmt: csv or parquet
+    :param is_edges:
+    :return: a list of (column name, type)
+    """
+    if fmt == 'parquet':
+        return infer_parquet_schema(file_name)
+
+    # return to the caller
+    return infer_csv_schema(file_name, EDGE_TYPE_HINTS if is_edges else NODE_TYPE_HINTS)
+
+
+def merge_schemas(schemas: list) -> dict:
+    """
+    merges the chunk schemas into the table columns.
+
+    a column typed differently in different chunks is widened to float if it is only ever numeric,
+    otherwise to string.
+
+    :param schemas:
+    :return: column name -> type, in first seen order
+    """
+    # init the merged columns
+    ret_val: dict = {}
+
+    for schema in schemas:
+        for column, col_type in schema:
+            if column not in ret_val:
+                ret_val[column] = col_type
+            elif ret_val[column] != col_type:
+                ret_val[column] = 'float' if {ret_val[column], col_type} <= {'integer', 'float'} else 'string'
+
+    # return to the caller
+    return ret_val
+
+
+def get_table_columns(conn: kuzu.Connection, table: str) -> dict | None:
+    """
+    gets the property names and Kuzu types of a table.
+
+    :param conn:
+    :param table:
+    :return: property name -> Kuzu type in table order, or None if the table doesn't exist
+    """
+    # see if the table is there
+    tables = conn.execute('CALL show_tables() RETURN name')
+
+    names: list = []
+
+    while tables.has_next():
+        names.append(tables.get_next()[0])
+
+    if table not in names:
+        return None
+
+    # init the returned columns
+    ret_val: dict = {}
+
+    props = conn.execute(f"CALL table_info('{table}') RETURN name, type")
+
+    while props.has_next():
+        name, prop_type = props.get_next()
+
+        ret_val[name] = prop_type
+
+    # return to the caller
+    return ret_val
+
+
+def ensure_table(conn: kuzu.Connection, columns: dict, is_edges: bool) -> dict:
+    """
+    creates the node or rel table for the columns, or adds the columns an existing table is missing.
+
+    :param conn:
+    :param columns: column name -> type
+    :param is_edges:
+    :return: the table's property name -> Kuzu type in table order
+    """
+    # the endpoints aren't rel properties
+    if is_edges:
+        columns = {column: col_type for column, col_type in columns.items() if column not in EDGE_ENDPOINTS}
+
+    table: str = REL_TABLE if is_edges else NODE_TABLE
+
+    # get what is already there
+    existing: dict | None = get_table_columns(conn, table)
+
+    if existing is None:
+        # get the property definitions
+        props: str = ', '.join(f'{quote(column)} {KUZU_TYPES[col_type]}' for column, col_type in columns.items())
+
+        if is_edges:
+            conn.execute(f'CREATE REL TABLE {quote(table)}(FROM {quote(NODE_TABLE)} TO {quote(NODE_TABLE)}' + (f', {props})' if props else ')'))
+        else:
+            conn.execute(f"CREATE NODE TABLE {quote(table)}({props}, PRIMARY KEY ({quote('id')}))")
+    else:
+        # add the new columns
+        for column, col_type in columns.items():
+            if column not in existing:
+                conn.execute(f'ALTER TABLE {quote(table)} ADD {quote(column)} {KUZU_TYPES[col_type]}')
+
+    # return to the caller
+    return get_table_columns(conn, table)
+
+
+def get_copy_query(file_name: str, fmt: str, header: list, table_columns: dict, is_edges: bool) -> str:
+    """
+    gets the COPY FROM query for a chunk.
+
+    :param file_name:
+    :param fmt: csv or parquet
+    :param header: the chunk's column names
+    :param table_columns: the table's property name -> Kuzu type in table order
+    :param is_edges:
+    :return:
+    """
+    # init the returned values, rels start with the endpoint keys
+    values: list = [quote(column) for column in EDGE_ENDPOINTS] if is_edges else []
+
+    for column, prop_type in table_columns.items():
+        if column not in header:
+            # the table column isn't in this chunk
+            values.append(f'CAST(NULL AS {prop_type})')
+        elif fmt == 'parquet':
+            values.append(f'CAST({quote(column)} AS {prop_type})')
+        elif prop_type == 'STRING':
+            values.append(quote(column))
+        elif prop_type == 'STRING[]':
+            values.append(f"string_split({quote(column)}, ';')")
+        else:
+            values.append(f'CAST({quote(column)} AS {prop_type})')
+
+    if fmt == 'parquet':
+        source: str = f"LOAD FROM '{file_name}'"
+    else:
+        # read every CSV column as text and let the casts do the rest
+        source: str = f"LOAD WITH HEADERS ({', '.join(f'{quote(column)} STRING' for column in header)}) FROM '{file_name}' (header=true)"
+
+    # return to the caller
+    return f"COPY {quote(REL_TABLE if is_edges else NODE_TABLE)} FROM ({source} RETURN {', '.join(values)})"
+
+
+def get_chunk_header(file_name: str, fmt: str) -> list:
+    """
+    gets the column names of a chunk.
+
+    :param file_name:
+    :param fmt:
+    :return:
+    """
+    if fmt == 'parquet':
+        return list(pl.read_parquet_schema(file_name).keys())
+
+    # return to the caller
+    return pl.scan_csv(file_name, infer_schema=False).collect_schema().names()
+
+
+def load_kuzu_chunks(conn: kuzu.Connection, file_names: list, fmt: str, is_edges: bool, job: LoadJob = None) -> dict:
+    """
+    creates or extends the table for the chunks and copies them in.
+
+    Kuzu parallelizes each COPY internally, so the chunks are copied one at a time.
+
+    :param conn:
+    :param file_names:
+    :param fmt: csv or parquet
+    :param is_edges:
+    :param job: the background job to report per-chunk progress to, if any
+    :return: the load statistics
+    """
+    # note the start
+    start: float = time.perf_counter()
+
+    # get the table columns from all the chunk schemas
+    table_columns: dict = ensure_table(conn, merge_schemas([get_chunk_schema(file_name, fmt, is_edges) for file_name in file_names]), is_edges)
+
+    # note the schema time
+    schema_elapsed: float = time.perf_counter() - start
+
+    if job is not None:
+        job.phase_done('schema', schema_elapsed)
+
+    # init the row count
+    rows: int = 0
+
+    for file_name in file_names:
+        if job is not None:
+            job.chunk_started(file_name)
+
+        # note the chunk start
+        chunk_start: float = time.perf_counter()
+
+        try:
+            # copy the chunk in
+            result = conn.execute(get_copy_query(file_name, fmt, get_chunk_header(file_name, fmt), table_columns, is_edges))
+
+            # the result is a "N tuples have been copied" message
+            copied: int = int(re.match(r'\d+', result.get_next()[0]).group())
+
+            rows += copied
+
+            if job is not None:
+                job.chunk_done(file_name, copied, time.perf_counter() - chunk_start)
+                job.add_rows(copied)
+        except Exception as e:
+            if job is None:
+                raise e
+
+            job.chunk_failed(file_name, str(e))
+
+    # get the elapsed time
+    elapsed: float = time.perf_counter() - start
+
+    if job is not None:
+        job.phase_done('copy', elapsed - schema_elapsed)
+
+    # return to the caller
+    return {'files': len(file_names), 'rows': rows, 'elapsed': round(elapsed, 4), 'rows_per_second': round(rows / elapsed, 2) if elapsed else 0.0}
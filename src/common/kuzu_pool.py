@@ -0,0 +1,280 @@
+"""
+    Kuzu connection pool utilities.
+
+    A fixed set of Kuzu connections is opened once against the loaded DB and
+    shared by every Kuzu endpoint, instead of building a new AsyncConnection
+    for each request.
+"""
+
+import os
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+import kuzu
+
+from src.common.statement_cache import PreparedStatementCache
+from src.common.cancellation import QueryTimeoutError, get_query_timeout
+from src.common.metrics import POOL_WAIT, POOL_TIMEOUTS
+
+
+class KuzuPoolTimeoutError(Exception):
+    """
+        Raised when a connection could not be acquired from the pool in time
+    """
+
+
+class KuzuConnectionPool:
+    """
+        Manages a bounded pool of Kuzu connections and the threads that run queries on them
+    """
+    def __init__(self, db: kuzu.Database, pool_size: int = 8, max_concurrent_queries: int = 8, acquire_timeout: float = 30.0,
+                 max_threads_per_query: int = 0, statement_cache_size: int = 256):
+        """
+        creates the pool connections and the query thread pool
+
+        :param db: the loaded Kuzu DB
+        :param pool_size: the number of connections in the pool
+        :param max_concurrent_queries: the number of queries allowed to execute at once
+        :param acquire_timeout: the number of seconds to wait for a free connection
+        :param max_threads_per_query: the max number of threads a query may use (0 = no limit)
+        :param statement_cache_size: the max number of prepared query templates kept
+        """
+        # save the pool settings
+        self.pool_size: int = pool_size
+        self.max_concurrent_queries: int = max_concurrent_queries
+        self.acquire_timeout: float = acquire_timeout
+
+        # create the connections that will be handed out
+        self.connections: list = [kuzu.Connection(db) for _ in range(pool_size)]
+
+        # init each connection
+        for conn in self.connections:
+            conn.init_connection()
+            conn.set_max_threads_for_exec(max_threads_per_query)
+
+        # create the stack of idle connections, the most recently used connection is handed out
+        # first so its cached prepared statements get reused
+        self.idle: asyncio.LifoQueue = asyncio.LifoQueue()
+
+        for conn in self.connections:
+            self.idle.put_nowait(conn)
+
+        # limits the number of queries running at the same time
+        self.query_slots: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_queries)
+
+        # the threads that actually run the queries
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_concurrent_queries, thread_name_prefix='kuzu-query')
+
+        # the prepared statements for parameterized queries
+        self.statements: PreparedStatementCache = PreparedStatementCache(statement_cache_size)
+
+        # init the saturation counters
+        self.waiting: int = 0
+        self.peak_waiting: int = 0
+        self.acquired: int = 0
+        self.timeouts: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+
+    @staticmethod
+    def from_env(db: kuzu.Database):
+        """
+        creates a pool using the settings in the environment
+
+        :param db:
+        :return:
+        """
+        # get the pool settings
+        pool_size: int = int(os.getenv('KUZU_POOL_SIZE', '8'))
+        max_concurrent_queries: int = int(os.getenv('KUZU_MAX_CONCURRENT_QUERIES', str(pool_size)))
+        acquire_timeout: float = float(os.getenv('KUZU_POOL_ACQUIRE_TIMEOUT', '30'))
+        max_threads_per_query: int = int(os.getenv('KUZU_MAX_THREADS_PER_QUERY', '0'))
+        statement_cache_size: int = int(os.getenv('KUZU_STATEMENT_CACHE_SIZE', '256'))
+
+        # return to the caller
+        return KuzuConnectionPool(db, pool_size, max_concurrent_queries, acquire_timeout, max_threads_per_query, statement_cache_size)
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        checks out a connection for the duration of the context
+
+        :return:
+        """
+        # note the start of the wait
+        start: float = time.perf_counter()
+
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+
+        try:
+            # wait for a connection to free up
+            conn = await asyncio.wait_for(self.idle.get(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError as e:
+            self.timeouts += 1
+            POOL_TIMEOUTS.inc(engine='kuzu')
+            raise KuzuPoolTimeoutError(f'No Kuzu connection available after {self.acquire_timeout}s.') from e
+        finally:
+            self.waiting -= 1
+
+        # record the time spent waiting
+        wait: float = time.perf_counter() - start
+        self.acquired += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+        POOL_WAIT.observe(wait, engine='kuzu')
+
+        try:
+            # hand over the connection
+            yield conn
+        finally:
+            # put the connection back into the pool
+            self.idle.put_nowait(conn)
+
+    async def execute(self, conn: kuzu.Connection, query, parameters: dict = None, timeout: float = None):
+        """
+        runs a query on a pooled connection in the query thread pool
+
+        if the caller is cancelled the query is interrupted, and the connection is only
+        given back once the interrupted query has unwound.
+
+        :param conn:
+        :param query:
+        :param parameters:
+        :param timeout: the query timeout in seconds, None uses the server default, 0 is no timeout
+        :return:
+        """
+        # get the timeout to use
+        timeout = get_query_timeout(timeout)
+
+        # wait for a free query slot
+        async with self.query_slots:
+            # have Kuzu stop the query once the time is up
+            conn.set_query_timeout(int(timeout * 1000))
+
+            # run the query without blocking the event loop
+            future = asyncio.get_running_loop().run_in_executor(self.executor, conn.execute, query, parameters)
+
+            try:
+                # don't let a cancel drop the future while the query is still running
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # stop the query
+                conn.interrupt()
+
+                # wait for it to unwind before the connection can be reused
+                await asyncio.gather(future, return_exceptions=True)
+
+                raise
+            except RuntimeError as e:
+                # Kuzu reports a timeout as an interruption
+                if timeout > 0 and 'Interrupted' in str(e):
+                    raise QueryTimeoutError(f'Query exceeded the {timeout}s timeout.') from e
+
+                raise
+
+    async def prepare(self, conn: kuzu.Connection, template: str):
+        """
+        gets the prepared statement for a query template on a pooled connection, preparing it on a cache miss
+
+        :param conn:
+        :param template:
+        :return:
+        """
+        # look for a statement already prepared on this connection
+        ret_val = self.statements.get(conn, template)
+
+        if ret_val is None:
+            # parse and plan the template
+            ret_val = await self.run_in_executor(conn.prepare, template)
+
+            # don't keep statements that failed to prepare
+            if not ret_val.is_success():
+                raise RuntimeError(ret_val.get_error_message())
+
+            self.statements.put(conn, template, ret_val)
+
+        # return to the caller
+        return ret_val
+
+    async def execute_query(self, conn: kuzu.Connection, query: str, parameters: dict = None, timeout: float = None):
+        """
+        runs a query on a pooled connection, parameterized queries use a cached prepared statement
+
+        :param conn:
+        :param query:
+        :param parameters:
+        :param timeout:
+        :return:
+        """
+        # parameterized queries go through the statement cache
+        if parameters is not None:
+            return await self.execute(conn, await self.prepare(conn, query), parameters, timeout)
+
+        # return to the caller
+        return await self.execute(conn, query, None, timeout)
+
+    async def run_in_executor(self, func, *args):
+        """
+        runs a blocking call (e.g. pulling rows from a result) in the query thread pool
+
+        :param func:
+        :param args:
+        :return:
+        """
+        # return to the caller
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def run(self, query, parameters: dict = None, timeout: float = None):
+        """
+        acquires a connection, runs the query on it and releases it
+
+        :param query:
+        :param parameters:
+        :param timeout:
+        :return:
+        """
+        async with self.acquire() as conn:
+            return await self.execute_query(conn, query, parameters, timeout)
+
+    def get_stats(self) -> dict:
+        """
+        gets the pool saturation details
+
+        :return:
+        """
+        # get the number of connections checked out
+        in_use: int = self.pool_size - self.idle.qsize()
+
+        # return to the caller
+        return {'pool_size': self.pool_size,
+                'max_concurrent_queries': self.max_concurrent_queries,
+                'acquire_timeout': self.acquire_timeout,
+                'in_use': in_use,
+                'saturation': round(in_use / self.pool_size, 4) if self.pool_size else 0.0,
+                'waiting': self.waiting,
+                'peak_waiting': self.peak_waiting,
+                'acquired': self.acquired,
+                'timeouts': self.timeouts,
+                'avg_wait_ms': round(self.total_wait / self.acquired * 1000, 4) if self.acquired else 0.0,
+                'max_wait_ms': round(self.max_wait * 1000, 4),
+                'statement_cache': self.statements.get_stats()}
+
+    def close(self):
+        """
+        closes the connections and the query threads
+
+        :return:
+        """
+        # stop the query threads
+        self.executor.shutdown(wait=True)
+
+        # drop the prepared statements before their connections
+        self.statements.clear()
+
+        # close each connection
+        for conn in self.connections:
+            conn.close()
@@ -0,0 +1,272 @@
+"""
+    Background load job utilities.
+
+    Loads run in their own thread and report per-chunk progress so the load
+    endpoints can hand back a job ID right away instead of holding the request
+    (and the event loop) for the whole load.
+"""
+
+import os
+import time
+import uuid
+import threading
+from collections import OrderedDict
+
+from src.common.metrics import LOAD_CHUNK_THROUGHPUT, LOAD_CHUNK_DURATION, LOAD_CHUNKS, LOAD_ROWS
+
+
+class LoadJob:
+    """
+        The state of one background load
+    """
+    def __init__(self, kind: str, params: dict, chunks: list):
+        """
+        creates the job
+
+        :param kind: the loader used
+        :param params: the request parameters
+        :param chunks: the names of the chunks to load
+        """
+        # save the job details
+        self.job_id: str = uuid.uuid4().hex
+        self.kind: str = kind
+        self.params: dict = params
+        self.status: str = 'queued'
+        self.error: str | None = None
+
+        # what the loader returned, e.g. its throughput report
+        self.result = None
+
+        # the per-chunk progress
+        self.chunks: OrderedDict = OrderedDict((chunk, {'status': 'queued', 'rows': 0, 'elapsed': None, 'retries': 0, 'error': None})
+                                               for chunk in chunks)
+
+        # the totals
+        self.rows: int = 0
+
+        # the timings of the job phases, for loaders that run in steps
+        self.phases: OrderedDict = OrderedDict()
+
+        # the job timings
+        self.created: float = time.time()
+        self.started: float | None = None
+        self.finished: float | None = None
+
+        # guards the progress updates made from the loader threads
+        self.lock: threading.Lock = threading.Lock()
+
+        # set once the job is done
+        self.done: threading.Event = threading.Event()
+
+    def start(self):
+        """
+        marks the job as running
+
+        :return:
+        """
+        with self.lock:
+            self.status = 'running'
+            self.started = time.time()
+
+    def chunk_started(self, chunk: str):
+        """
+        marks a chunk as running, adding it if the job didn't know its chunks up front
+
+        :param chunk:
+        :return:
+        """
+        with self.lock:
+            self.chunks.setdefault(chunk, {'status': 'queued', 'rows': 0, 'elapsed': None, 'retries': 0, 'error': None})['status'] = 'running'
+
+    def chunk_done(self, chunk: str, rows: int, elapsed: float, retries: int = 0):
+        """
+        records a finished chunk. the job row total is kept separately with add_rows().
+
+        :param chunk:
+        :param rows: the rows loaded from the chunk
+        :param elapsed: the chunk load time in seconds
+        :param retries: the number of times the chunk was retried after a transient error
+        :return:
+        """
+        with self.lock:
+            self.chunks[chunk].update({'status': 'completed', 'rows': rows, 'elapsed': round(elapsed, 4), 'retries': retries})
+
+        # record the chunk throughput
+        LOAD_CHUNKS.inc(kind=self.kind, status='completed')
+        LOAD_CHUNK_DURATION.observe(elapsed, kind=self.kind)
+
+        if elapsed > 0:
+            LOAD_CHUNK_THROUGHPUT.observe(rows / elapsed, kind=self.kind)
+
+    def add_rows(self, rows: int):
+        """
+        adds to the job row total, loaders that write in batches call this as each batch lands
+
+        :param rows:
+        :return:
+        """
+        with self.lock:
+            self.rows += rows
+
+        LOAD_ROWS.inc(rows, kind=self.kind)
+
+    def chunk_failed(self, chunk: str, error: str):
+        """
+        records a failed chunk
+
+        :param chunk:
+        :param error:
+        :return:
+        """
+        with self.lock:
+            self.chunks[chunk].update({'status': 'failed', 'error': error})
+
+        LOAD_CHUNKS.inc(kind=self.kind, status='failed')
+
+    def phase_done(self, phase: str, elapsed: float):
+        """
+        records the run time of a job phase
+
+        :param phase:
+        :param elapsed:
+        :return:
+        """
+        with self.lock:
+            self.phases[phase] = round(elapsed, 4)
+
+    def finish(self, error: str = None, result=None):
+        """
+        marks the job as done
+
+        :param error: set if the job itself failed
+        :param result: what the loader returned
+        :return:
+        """
+        with self.lock:
+            self.result = result
+
+            # the job failed if it, or any of its chunks, did
+            failed: bool = error is not None or any(chunk['status'] == 'failed' for chunk in self.chunks.values())
+
+            self.status = 'failed' if failed else 'completed'
+            self.error = error
+            self.finished = time.time()
+
+        self.done.set()
+
+    def to_dict(self) -> dict:
+        """
+        gets the job progress
+
+        :return:
+        """
+        with self.lock:
+            # get the run time so far
+            elapsed: float = ((self.finished or time.time()) - self.started) if self.started else 0.0
+
+            # count the chunks in each state
+            counts: dict = {}
+
+            for chunk in self.chunks.values():
+                counts[chunk['status']] = counts.get(chunk['status'], 0) + 1
+
+            # return to the caller
+            return {'job_id': self.job_id,
+                    'kind': self.kind,
+                    'status': self.status,
+                    'params': self.params,
+                    'error': self.error,
+                    'result': self.result,
+                    'elapsed': round(elapsed, 4),
+                    'rows': self.rows,
+                    'rows_per_second': round(self.rows / elapsed, 2) if elapsed else 0.0,
+                    'phases': dict(self.phases),
+                    'chunk_counts': counts,
+                    'failures': {name: chunk['error'] for name, chunk in self.chunks.items() if chunk['status'] == 'failed'},
+                    'chunks': {name: dict(chunk) for name, chunk in self.chunks.items()}}
+
+
+class LoadJobManager:
+    """
+        Runs the load jobs in the background and keeps their history
+    """
+    def __init__(self, history: int = 100):
+        """
+        creates the manager
+
+        :param history: the number of finished jobs kept for status polling
+        """
+        # save the settings
+        self.history: int = history
+
+        # job id -> job
+        self.jobs: OrderedDict = OrderedDict()
+
+        self.lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def from_env():
+        """
+        creates a manager using the settings in the environment
+
+        :return:
+        """
+        # return to the caller
+        return LoadJobManager(int(os.getenv('LOAD_JOB_HISTORY', '100')))
+
+    def submit(self, job: LoadJob, target, *args) -> LoadJob:
+        """
+        starts a job in its own thread.
+
+        the target is called as target(job, *args) and should record its chunk progress on the job.
+        the job is finished when the target returns or raises, a returned value is kept as the job result.
+
+        :param job:
+        :param target:
+        :param args:
+        :return:
+        """
+        def run():
+            """
+            runs the job
+            """
+            job.start()
+
+            try:
+                result = target(job, *args)
+            except Exception as e:
+                job.finish(str(e))
+            else:
+                job.finish(result=result)
+
+        with self.lock:
+            # drop the oldest finished jobs
+            for job_id in [j for j, old in self.jobs.items() if old.done.is_set()][:max(len(self.jobs) - self.history + 1, 0)]:
+                del self.jobs[job_id]
+
+            self.jobs[job.job_id] = job
+
+        # start the job
+        threading.Thread(target=run, name=f'load-job-{job.job_id}', daemon=True).start()
+
+        # return to the caller
+        return job
+
+    def get(self, job_id: str) -> LoadJob | None:
+        """
+        gets a job
+
+        :param job_id:
+        :return:
+        """
+        # return to the caller
+        return self.jobs.get(job_id)
+
+    def list(self) -> list:
+        """
+        gets the progress of every job
+
+        :return:
+        """
+        # return to the caller
+        return [job.to_dict() for job in list(self.jobs.values())]
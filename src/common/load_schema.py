@@ -0,0 +1,271 @@
+"""
+    RK CSV schema utilities.
+
+    Infers the column types of an rk-nodes/rk-edges CSV chunk from its header
+    and a sampled scan, then generates the LOAD CSV Cypher for it. Columns that
+    are empty across the whole chunk are left out of the Cypher so the DB
+    doesn't cast hundreds of null properties per row.
+
+    The attribute types originally came from the graph-db-parsers/MemGraph/mg_build_graph_csv.py file.
+"""
+
+import os
+
+import polars as pl
+
+# the columns whose type can't be reliably inferred from a sample, e.g. multivalued columns where a chunk may
+# only hold single values, or text/ID columns whose values happen to look numeric. everything else is inferred.
+NODE_TYPE_HINTS: dict = {
+    'id': 'string', 'name': 'string', 'description': 'string', 'robokop_variant_id': 'string', 'cd_formula': 'string', 'mrdef': 'string',
+    'smiles': 'string', 'status': 'string', 'definition': 'string', 'url': 'string', 'locus_group': 'string', 'symbol': 'string',
+    'location': 'string', 'taxon': 'string', 'NCBITaxon': 'string',
+    'category': 'list', 'equivalent_identifiers': 'list', 'hgvs': 'list',
+    'information_content': 'float', 'cd_molweight': 'float', 'clogp': 'float', 'alogs': 'float', 'tpsa': 'float',
+    'lipinski': 'integer', 'arom_c': 'integer', 'sp3_c': 'integer', 'sp2_c': 'integer', 'sp_c': 'integer', 'halogen': 'integer',
+    'hetero_sp2_c': 'integer', 'rotb': 'integer', 'o_n': 'integer', 'oh_nh': 'integer', 'rgb': 'integer', 'fda_labels': 'integer'
+}
+
+EDGE_TYPE_HINTS: dict = {
+    'id': 'string', 'subject': 'string', 'predicate': 'string', 'object': 'string', 'primary_knowledge_source': 'string',
+    'knowledge_level': 'string', 'agent_type': 'string', 'snpeff_effect': 'string', 'ligand': 'string', 'protein': 'string',
+    'affinity_parameter': 'string', 'object_aspect_qualifier': 'string', 'object_direction_qualifier': 'string',
+    'qualified_predicate': 'string', 'Coexpression': 'string', 'Coexpression_transferred': 'string', 'Experiments': 'string',
+    'Experiments_transferred': 'string', 'Database': 'string', 'Database_transferred': 'string', 'Textmining': 'string',
+    'Textmining_transferred': 'string', 'Cooccurance': 'string', 'Combined_score': 'string', 'species_context_qualifier': 'string',
+    'sentences': 'string', 'detection_method': 'string', 'Homology': 'string', 'original_subject': 'string',
+    'disease_context_qualifier': 'string', 'frequency_qualifier': 'string', 'negated': 'string', 'original_object': 'string',
+    'NCBITaxon': 'string', 'Fusion': 'string', 'has_count': 'string', 'has_percentage': 'string', 'has_quotient': 'string',
+    'has_total': 'string', 'stage_qualifier': 'string', 'anatomical_context_qualifier': 'string', 'onset_qualifier': 'string',
+    'object_specialization_qualifier': 'string', 'sex_qualifier': 'string', 'object_part_qualifier': 'string',
+    'subject_part_qualifier': 'string',
+    'publications': 'list', 'p_value': 'list', 'supporting_affinities': 'list', 'hetio_source': 'list', 'tmkp_ids': 'list',
+    'expressed_in': 'list', 'slope': 'list', 'pubchem_assay_ids': 'list', 'patent_ids': 'list', 'aggregator_knowledge_source': 'list',
+    'category': 'list', 'provided_by': 'list', 'has_evidence': 'list', 'description': 'list', 'qualifiers': 'list',
+    'phosphorylation_sites': 'list', 'drugmechdb_path_id': 'list', 'complex_context': 'list',
+    'affinity': 'float', 'tmkp_confidence_score': 'float', 'score': 'float', 'FAERS_llr': 'float',
+    'distance_to_feature': 'integer',
+    'primaryTarget': 'boolean', 'endogenous': 'boolean'
+}
+
+# the polars type groups of a Parquet chunk and the column type they map to
+PARQUET_TYPES: list = [(pl.List, 'list'), (pl.Boolean, 'boolean'), (pl.Float32, 'float'), (pl.Float64, 'float')]
+
+# the Cypher used to cast a CSV value to each type
+TYPE_CASTS: dict = {'string': '{}', 'list': "split({}, ';')", 'boolean': 'toBoolean({})', 'integer': 'toInteger({})', 'float': 'toFloat({})'}
+
+
+def get_chunk_file_name(data_dir: str, file_prefix: str, file_counter: int, ext: str = 'csv') -> str:
+    """
+    gets the name of a chunk, e.g. rk-nodes.csv, rk-nodes-pt1.csv, ...
+
+    :param data_dir:
+    :param file_prefix:
+    :param file_counter:
+    :param ext: the file extension, csv or parquet
+    :return:
+    """
+    if file_counter == 0:
+        file_name = f'{data_dir}/{file_prefix}.{ext}'
+    else:
+        file_name = f'{data_dir}/{file_prefix}-pt' + str(file_counter) + f'.{ext}'
+
+    # return to the caller
+    return file_name
+
+
+def infer_csv_schema(file_name: str, type_hints: dict, sample_size: int = None) -> list:
+    """
+    infers the type of each non-empty column in a CSV chunk.
+
+    the whole chunk is scanned to find the empty columns, and the first sample_size values
+    of each column are checked to get its type. the scan is a single vectorized polars query.
+
+    :param file_name:
+    :param type_hints: column types that override the inferred ones
+    :param sample_size: the number of values per column used to infer its type
+    :return: a list of (column name, type) in header order, empty columns are left out
+    """
+    # get the sample size
+    if sample_size is None:
+        sample_size = int(os.getenv('LOAD_SCHEMA_SAMPLE_SIZE', '10000'))
+
+    # read everything as text, empty values come back as nulls
+    frame: pl.LazyFrame = pl.scan_csv(file_name, infer_schema=False)
+
+    # get the header
+    columns: list = frame.collect_schema().names()
+
+    # init the per column checks
+    checks: list = []
+
+    for i, column in enumerate(columns):
+        # get a sample of the values in this column
+        sample: pl.Expr = pl.col(column).drop_nulls().head(sample_size)
+
+        checks.extend([pl.col(column).is_not_null().any().alias(f'{i}_present'),
+                       sample.str.to_lowercase().is_in(['true', 'false']).all().alias(f'{i}_boolean'),
+                       sample.str.contains(r'^[+-]?\d+$').all().alias(f'{i}_integer'),
+                       sample.cast(pl.Float64, strict=False).is_not_null().all().alias(f'{i}_float')])
+
+    # run all the checks in one pass
+    results: dict = frame.select(checks).collect().row(0, named=True)
+
+    # init the returned schema
+    ret_val: list = []
+
+    for i, column in enumerate(columns):
+        # leave out the columns with nothing in them
+        if not results[f'{i}_present']:
+            continue
+
+        # use the hint if there is one, otherwise go with the narrowest type that fits the sample
+        if column in type_hints:
+            col_type: str = type_hints[column]
+        elif results[f'{i}_boolean']:
+            col_type: str = 'boolean'
+        elif results[f'{i}_integer']:
+            col_type: str = 'integer'
+        elif results[f'{i}_float']:
+            col_type: str = 'float'
+        else:
+            col_type: str = 'string'
+
+        ret_val.append((column, col_type))
+
+    # return to the caller
+    return ret_val
+
+
+def infer_parquet_schema(file_name: str) -> list:
+    """
+    gets the type of each non-empty column in a Parquet chunk.
+
+    :param file_name:
+    :return: a list of (column name, type) in column order, empty columns are left out
+    """
+    # find the columns with something in them
+    present: dict = pl.scan_parquet(file_name).select(pl.all().is_not_null().any()).collect().row(0, named=True)
+
+    # init the returned schema
+    ret_val: list = []
+
+    for column, dtype in pl.read_parquet_schema(file_name).items():
+        # leave out the columns with nothing in them
+        if not present[column]:
+            continue
+
+        # get the narrowest type that fits the column
+        if dtype.is_integer():
+            col_type: str = 'integer'
+        else:
+            col_type: str = next((t for group, t in PARQUET_TYPES if dtype == group or isinstance(dtype, group)), 'string')
+
+        ret_val.append((column, col_type))
+
+    # return to the caller
+    return ret_val
+
+
+def infer_chunk_schema(file_name: str, is_edges: bool) -> list:
+    """
+    gets the schema of a CSV or Parquet chunk, going by its file extension.
+
+    :param file_name:
+    :param is_edges:
+    :return: a list of (column name, type)
+    """
+    # a Parquet chunk carries its own types
+    if file_name.endswith('.parquet'):
+        return infer_parquet_schema(file_name)
+
+    # return to the caller
+    return infer_csv_schema(file_name, EDGE_TYPE_HINTS if is_edges else NODE_TYPE_HINTS)
+
+
+def get_property_map(schema: list, indent: str) -> str:
+    """
+    gets the Cypher property map entries for the schema.
+
+    :param schema:
+    :param indent:
+    :return:
+    """
+    # init the entries
+    entries: list = []
+
+    for column, col_type in schema:
+        # quote anything that isn't a plain identifier
+        name: str = column if column.isidentifier() else f'`{column}`'
+
+        entries.append(f'{indent}{name}: ' + TYPE_CASTS[col_type].format(f'row.{name}'))
+
+    # return to the caller
+    return ',\n'.join(entries)
+
+
+def get_node_load_query(file_name: str, schema: list) -> str:
+    """
+    gets the LOAD CSV Cypher for an rk-nodes chunk.
+
+    :param file_name:
+    :param schema:
+    :return:
+    """
+    # return to the caller
+    return f"""
+        LOAD CSV WITH HEADERS FROM "{file_name}" AS row
+        CREATE (n: Node
+        {{
+{get_property_map(schema, ' ' * 12)}
+        }}
+        )
+        """
+
+
+def get_edge_load_query(file_name: str, schema: list) -> str:
+    """
+    gets the LOAD CSV Cypher for an rk-edges chunk.
+
+    :param file_name:
+    :param schema:
+    :return:
+    """
+    # return to the caller
+    return f"""
+        load csv from "{file_name}" with header as row
+          with row
+            match (a: Node {{id: row.subject}}), (b: Node {{id: row.object}})
+            create (a)-
+              [e: row.predicate
+                {{
+{get_property_map(schema, ' ' * 20)}
+                }}
+              ]->(b);
+        """
+
+
+def cast_frame(frame: pl.DataFrame, schema: list) -> pl.DataFrame:
+    """
+    casts the text columns of a chunk batch to their schema types, the same way the LOAD CSV casts do.
+
+    :param frame: a batch read with every column as text
+    :param schema: a list of (column name, type)
+    :return:
+    """
+    # init the cast expressions
+    casts: list = []
+
+    for column, col_type in schema:
+        if col_type == 'list':
+            casts.append(pl.col(column).str.split(';'))
+        elif col_type == 'boolean':
+            casts.append(pl.col(column).str.to_lowercase() == 'true')
+        elif col_type == 'integer':
+            casts.append(pl.col(column).cast(pl.Int64, strict=False))
+        elif col_type == 'float':
+            casts.append(pl.col(column).cast(pl.Float64, strict=False))
+        else:
+            casts.append(pl.col(column))
+
+    # return to the caller
+    return frame.select(casts)
@@ -0,0 +1,114 @@
+"""
+    Load worker pool utilities.
+
+    A bounded process pool is created once at startup and shared by the load
+    endpoints. Each worker process opens its DB connections the first time it
+    needs them and keeps them for the rest of its life.
+"""
+
+import os
+import multiprocessing
+
+from neo4j import GraphDatabase
+
+from src.common.falkor_client import FalkorClient
+from src.common.mg_batch_loader import get_memgraph_url
+
+# the shared worker pool and its number of processes
+load_pool = None
+load_pool_size: int = 0
+
+# the connections held by this worker process
+worker_connections: dict = {}
+
+
+def start_load_pool(workers: int = None):
+    """
+    creates the shared load worker pool.
+
+    this should be called before anything starts threads in this process since the workers are forked.
+
+    :param workers: the number of worker processes, LOAD_WORKERS or the CPU count if not set
+    :return:
+    """
+    # grab the pool variables above
+    global load_pool, load_pool_size
+
+    if load_pool is None:
+        # get the pool size
+        if workers is None:
+            workers = int(os.getenv('LOAD_WORKERS', str(multiprocessing.cpu_count())))
+
+        load_pool_size = max(workers, 1)
+
+        # create the pool
+        load_pool = multiprocessing.Pool(load_pool_size)
+
+    # return to the caller
+    return load_pool
+
+
+def get_load_pool():
+    """
+    gets the shared load worker pool, creating it if needed.
+
+    :return:
+    """
+    # return to the caller
+    return start_load_pool()
+
+
+def get_load_pool_size() -> int:
+    """
+    gets the number of processes in the shared load worker pool, creating it if needed.
+
+    :return:
+    """
+    # make sure the pool exists
+    start_load_pool()
+
+    # return to the caller
+    return load_pool_size
+
+
+def stop_load_pool():
+    """
+    shuts down the shared load worker pool.
+
+    :return:
+    """
+    # grab the pool variable above
+    global load_pool
+
+    if load_pool is not None:
+        load_pool.close()
+        load_pool.join()
+
+        load_pool = None
+
+
+def get_worker_mg_driver():
+    """
+    gets this worker's Memgraph driver.
+
+    :return:
+    """
+    if 'memgraph' not in worker_connections:
+        # connect to the DB, there is no auth
+        worker_connections['memgraph'] = GraphDatabase.driver(get_memgraph_url(), auth=("", ""))
+
+    # return to the caller
+    return worker_connections['memgraph']
+
+
+def get_worker_falkor_client() -> FalkorClient:
+    """
+    gets this worker's pooled FalkorDB client.
+
+    :return:
+    """
+    if 'falkor' not in worker_connections:
+        worker_connections['falkor'] = FalkorClient.from_env()
+
+    # return to the caller
+    return worker_connections['falkor']
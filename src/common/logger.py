@@ -5,14 +5,102 @@
 """
 
 import os
+import copy
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+from src.common.metrics import LOG_DROPPED, LOG_TRUNCATED
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+        Hands records to the log writer thread without ever blocking the caller
+    """
+    def __init__(self, log_queue: queue.Queue, max_message_length: int = 4096):
+        """
+        creates the handler
+
+        :param log_queue: the bounded queue the listener drains
+        :param max_message_length: the max length of a message, longer ones are cut short (0 = no limit)
+        """
+        super().__init__(log_queue)
+
+        # save the settings
+        self.max_message_length: int = max_message_length
+
+    def truncate(self, value):
+        """
+        cuts a long string short, anything else is passed through.
+
+        :param value:
+        :return:
+        """
+        if isinstance(value, str) and len(value) > self.max_message_length:
+            return f'{value[:self.max_message_length]}... [{len(value) - self.max_message_length} chars truncated]'
+
+        # return to the caller
+        return value
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        cuts a long message short once it is formatted, whatever its arguments are (objects, bytes, long lists).
+        the exception details are kept.
+
+        :param record:
+        :return:
+        """
+        if self.max_message_length > 0:
+            # get the message with its arguments filled in
+            message: str = record.getMessage()
+
+            if len(message) > self.max_message_length:
+                # don't change the record the other handlers see
+                record = copy.copy(record)
+
+                # the arguments are already in the message
+                record.msg = self.truncate(message)
+                record.args = None
+
+                LOG_TRUNCATED.inc()
+
+        # return to the caller
+        return super().prepare(record)
+
+    def enqueue(self, record: logging.LogRecord):
+        """
+        queues the record, dropping it if the queue is full rather than waiting on the writer.
+
+        :param record:
+        :return:
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_DROPPED.inc(level=record.levelname)
+
+
+class BlockingStopQueueListener(QueueListener):
+    """
+        A queue listener that can still be stopped when the queue is full
+    """
+    def enqueue_sentinel(self):
+        """
+        waits for room for the stop marker, the writer thread is still draining the queue.
+
+        :return:
+        """
+        self.queue.put(self._sentinel)
 
 
 class LoggingUtil:
     """
         Creates and configures a logger
     """
+    # the thread that writes the queued records to the file and console
+    listener: QueueListener | None = None
+
     @staticmethod
     def get_log_path() -> str:
         """
@@ -29,6 +117,10 @@ class LoggingUtil:
     def init_logging(name, level=logging.INFO, line_format='short', log_file_path=None):
         """
             Logging utility controlling format and setting initial logging level
+
+            the file and console writes are made on a listener thread. the callers only put the record on a
+            bounded queue (LOG_QUEUE_SIZE), records are dropped and counted if it is full, and messages over
+            LOG_MAX_MESSAGE_LENGTH characters are cut short so large results don't become large writes.
         """
         # get a new logger
         logger = logging.getLogger(__name__)
@@ -59,6 +151,9 @@ class LoggingUtil:
         # dont allow message propagation
         logger.propagate = False
 
+        # init the handlers the listener writes to
+        handlers: list = []
+
         # if there was a file path passed in use it
         if log_file_path is not None:
             # create a rotating file handler, 1mb max per file with a max number of 10 files
@@ -70,15 +165,72 @@ class LoggingUtil:
             # set the log level
             file_handler.setLevel(level)
 
-            # add the handler to the logger
-            logger.addHandler(file_handler)
+            # add the handler to the list
+            handlers.append(file_handler)
+
+        # add the console handler to the list
+        handlers.append(stream_handler)
+
+        # create the bounded queue between the callers and the writer thread
+        log_queue: queue.Queue = queue.Queue(maxsize=max(int(os.getenv('LOG_QUEUE_SIZE', '10000')), 1))
+
+        queue_handler: BoundedQueueHandler = BoundedQueueHandler(log_queue, int(os.getenv('LOG_MAX_MESSAGE_LENGTH', '4096')))
+
+        logger.addHandler(queue_handler)
 
-        # add the console handler to the logger
-        logger.addHandler(stream_handler)
+        # start the writer thread, honoring each handler's own level
+        listener: QueueListener = BlockingStopQueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+
+        LoggingUtil.listener = listener
+
+        # the load workers are forked, so there can't be a writer thread running when that happens
+        def before_fork():
+            """
+            stops the writer thread, this also flushes the queue
+            """
+            # it is already stopped once the server shuts down
+            if LoggingUtil.listener is listener:
+                listener.stop()
+
+        def after_fork_in_parent():
+            """
+            restarts the writer thread
+            """
+            if LoggingUtil.listener is listener:
+                listener.start()
+
+        def after_fork_in_child():
+            """
+            a forked worker has no writer thread so it writes to the handlers directly
+            """
+            LoggingUtil.listener = None
+
+            logger.removeHandler(queue_handler)
+
+            for handler in handlers:
+                logger.addHandler(handler)
+
+        os.register_at_fork(before=before_fork, after_in_parent=after_fork_in_parent, after_in_child=after_fork_in_child)
+
+        # write what is still queued on the way out
+        atexit.register(LoggingUtil.stop_logging)
 
         # return to the caller
         return logger
 
+    @staticmethod
+    def stop_logging():
+        """
+        stops the writer thread once the queued records are written.
+
+        :return:
+        """
+        if LoggingUtil.listener is not None:
+            LoggingUtil.listener.stop()
+
+            LoggingUtil.listener = None
+
     @staticmethod
     def prep_for_logging() -> (int, str):
         """
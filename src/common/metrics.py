@@ -0,0 +1,443 @@
+"""
+    Prometheus metrics utilities.
+
+    A small thread-safe metrics registry rendered in the Prometheus text
+    format by the /metrics endpoint. The query paths record per-engine
+    latency, rows and serialized bytes, the Kuzu pool records its connection
+    waits and the load jobs record per-chunk throughput, so saturation and
+    regressions can be watched on a dashboard instead of in the log files.
+    The logger also counts the records it drops or truncates.
+"""
+
+import math
+import time
+import bisect
+import asyncio
+import threading
+
+from src.common.cancellation import QueryTimeoutError, ClientDisconnectedError
+
+# the media type of the Prometheus text format
+METRICS_MEDIA_TYPE: str = 'text/plain; version=0.0.4; charset=utf-8'
+
+# latency buckets in seconds, from a cached lookup to a long analytical query
+LATENCY_BUCKETS: tuple = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# connection wait buckets in seconds, most waits should land in the first few
+WAIT_BUCKETS: tuple = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+# load throughput buckets in rows per second
+THROUGHPUT_BUCKETS: tuple = (100, 500, 1000, 5000, 10000, 25000, 50000, 100000, 250000, 500000, 1000000, 2500000, 5000000)
+
+
+def format_value(value: float) -> str:
+    """
+    formats a sample value the way Prometheus expects.
+
+    :param value:
+    :return:
+    """
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+
+    if math.isnan(value):
+        return 'NaN'
+
+    # keep the counts as whole numbers
+    if isinstance(value, int):
+        return str(value)
+
+    # return to the caller
+    return repr(float(value))
+
+
+def escape_label_value(value: str) -> str:
+    """
+    escapes a label value for the text format.
+
+    :param value:
+    :return:
+    """
+    # return to the caller
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(names: tuple, values: tuple) -> str:
+    """
+    formats a label set, escaping the values.
+
+    :param names:
+    :param values:
+    :return:
+    """
+    if not names:
+        return ''
+
+    # escape the backslashes, quotes and new lines in the values
+    pairs: list = [f'{name}="{escape_label_value(str(value))}"' for name, value in zip(names, values)]
+
+    # return to the caller
+    return '{' + ','.join(pairs) + '}'
+
+
+class Metric:
+    """
+        A named metric with a value per label set
+    """
+    # the Prometheus metric type
+    kind: str = 'untyped'
+
+    def __init__(self, name: str, documentation: str, label_names: tuple = ()):
+        """
+        creates the metric
+
+        :param name:
+        :param documentation: the HELP text
+        :param label_names:
+        """
+        # save the metric details
+        self.name: str = name
+        self.documentation: str = documentation
+        self.label_names: tuple = tuple(label_names)
+
+        # label values -> value
+        self.values: dict = {}
+
+        # guards the updates made from the loader and query threads
+        self.lock: threading.Lock = threading.Lock()
+
+    def get_key(self, labels: dict) -> tuple:
+        """
+        gets the label values in label name order.
+
+        :param labels:
+        :return:
+        """
+        if set(labels) != set(self.label_names):
+            raise ValueError(f'{self.name} takes the labels {self.label_names}, got {tuple(labels)}.')
+
+        # return to the caller
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def get_samples(self) -> list:
+        """
+        gets the (suffix, label names, label values, value) samples to render.
+
+        :return:
+        """
+        with self.lock:
+            # return to the caller
+            return [('', self.label_names, key, value) for key, value in sorted(self.values.items())]
+
+    def render(self) -> str:
+        """
+        renders the metric in the Prometheus text format.
+
+        :return:
+        """
+        # init the returned lines
+        ret_val: list = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+
+        for suffix, names, values, value in self.get_samples():
+            ret_val.append(f'{self.name}{suffix}{format_labels(names, values)} {format_value(value)}')
+
+        # return to the caller
+        return '\n'.join(ret_val)
+
+
+class Counter(Metric):
+    """
+        A total that only goes up
+    """
+    kind: str = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        """
+        adds to the total.
+
+        :param amount:
+        :param labels:
+        :return:
+        """
+        key: tuple = self.get_key(labels)
+
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """
+        A value that goes up and down
+    """
+    kind: str = 'gauge'
+
+    def set(self, value: float, **labels):
+        """
+        sets the value.
+
+        :param value:
+        :param labels:
+        :return:
+        """
+        key: tuple = self.get_key(labels)
+
+        with self.lock:
+            self.values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        """
+        adds to the value.
+
+        :param amount:
+        :param labels:
+        :return:
+        """
+        key: tuple = self.get_key(labels)
+
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        """
+        takes from the value.
+
+        :param amount:
+        :param labels:
+        :return:
+        """
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """
+        Counts of observed values in fixed buckets, with their sum
+    """
+    kind: str = 'histogram'
+
+    def __init__(self, name: str, documentation: str, label_names: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        """
+        creates the histogram
+
+        :param name:
+        :param documentation:
+        :param label_names:
+        :param buckets: the bucket upper bounds, +Inf is added
+        """
+        super().__init__(name, documentation, label_names)
+
+        self.buckets: tuple = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        """
+        records a value.
+
+        :param value:
+        :param labels:
+        :return:
+        """
+        key: tuple = self.get_key(labels)
+
+        # get the first bucket the value fits in
+        bucket: int = bisect.bisect_left(self.buckets, value)
+
+        with self.lock:
+            # the per-bucket counts, the sum and the count
+            counts, total, count = self.values.get(key, ([0] * len(self.buckets), 0.0, 0))
+
+            counts[bucket] += 1
+
+            self.values[key] = (counts, total + value, count + 1)
+
+    def get_samples(self) -> list:
+        """
+        gets the cumulative bucket, sum and count samples.
+
+        :return:
+        """
+        # init the returned samples
+        ret_val: list = []
+
+        with self.lock:
+            for key, (counts, total, count) in sorted(self.values.items()):
+                # the buckets are cumulative
+                cumulative: int = 0
+
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+
+                    ret_val.append(('_bucket', self.label_names + ('le',), key + (format_value(bound),), cumulative))
+
+                ret_val.append(('_sum', self.label_names, key, total))
+                ret_val.append(('_count', self.label_names, key, count))
+
+        # return to the caller
+        return ret_val
+
+
+class MetricsRegistry:
+    """
+        The metrics rendered by the /metrics endpoint
+    """
+    def __init__(self):
+        """
+        creates the registry
+        """
+        # name -> metric, in registration order
+        self.metrics: dict = {}
+
+        self.lock: threading.Lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        adds a metric.
+
+        :param metric:
+        :return: the metric
+        """
+        with self.lock:
+            if metric.name in self.metrics:
+                raise ValueError(f'Metric {metric.name} is already registered.')
+
+            self.metrics[metric.name] = metric
+
+        # return to the caller
+        return metric
+
+    def render(self) -> str:
+        """
+        renders every metric in the Prometheus text format.
+
+        :return:
+        """
+        with self.lock:
+            metrics: list = list(self.metrics.values())
+
+        # return to the caller
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+# the registry the server exposes
+METRICS: MetricsRegistry = MetricsRegistry()
+
+# the query metrics
+QUERY_DURATION: Histogram = METRICS.register(Histogram('graphdb_query_duration_seconds',
+                                                       'Query time from start to the last row sent, by engine and outcome.', ('engine', 'outcome')))
+QUERY_ROWS: Counter = METRICS.register(Counter('graphdb_query_rows_total', 'Rows returned by queries, by engine.', ('engine',)))
+QUERY_BYTES: Counter = METRICS.register(Counter('graphdb_query_bytes_total', 'Bytes of query results serialized, by engine and format.',
+                                                ('engine', 'format')))
+QUERIES_ACTIVE: Gauge = METRICS.register(Gauge('graphdb_queries_active', 'Queries running or streaming, each holds a connection, by engine.',
+                                               ('engine',)))
+
+# the connection pool metrics
+POOL_WAIT: Histogram = METRICS.register(Histogram('graphdb_pool_wait_seconds', 'Time spent waiting for a pooled connection, by engine.', ('engine',),
+                                                  WAIT_BUCKETS))
+POOL_TIMEOUTS: Counter = METRICS.register(Counter('graphdb_pool_timeouts_total', 'Pooled connection waits that timed out, by engine.', ('engine',)))
+POOL_CONNECTIONS: Gauge = METRICS.register(Gauge('graphdb_pool_connections', 'Pooled connections by engine and state (in_use, idle, max).',
+                                                 ('engine', 'state')))
+POOL_WAITING: Gauge = METRICS.register(Gauge('graphdb_pool_waiting', 'Requests waiting for a pooled connection, by engine.', ('engine',)))
+
+# the load metrics
+LOAD_CHUNK_THROUGHPUT: Histogram = METRICS.register(Histogram('graphdb_load_chunk_rows_per_second',
+                                                              'Rows per second of each loaded chunk, by job kind.', ('kind',), THROUGHPUT_BUCKETS))
+LOAD_CHUNK_DURATION: Histogram = METRICS.register(Histogram('graphdb_load_chunk_duration_seconds', 'Load time of each chunk, by job kind.',
+                                                            ('kind',)))
+LOAD_CHUNKS: Counter = METRICS.register(Counter('graphdb_load_chunks_total', 'Chunks finished, by job kind and status.', ('kind', 'status')))
+LOAD_ROWS: Counter = METRICS.register(Counter('graphdb_load_rows_total', 'Rows loaded, by job kind.', ('kind',)))
+LOAD_JOBS: Gauge = METRICS.register(Gauge('graphdb_load_jobs', 'Load jobs kept in the job history, by status.', ('status',)))
+
+# the logging metrics
+LOG_DROPPED: Counter = METRICS.register(Counter('graphdb_log_records_dropped_total', 'Log records dropped because the log queue was full, by level.',
+                                                ('level',)))
+LOG_TRUNCATED: Counter = METRICS.register(Counter('graphdb_log_records_truncated_total', 'Log messages cut short to LOG_MAX_MESSAGE_LENGTH.'))
+LOG_QUEUE_DEPTH: Gauge = METRICS.register(Gauge('graphdb_log_queue_depth', 'Log records waiting to be written.'))
+
+
+def get_outcome(error: BaseException | None) -> str:
+    """
+    gets the outcome label for how a query ended.
+
+    :param error: the exception that ended the query, if any
+    :return:
+    """
+    if error is None:
+        return 'ok'
+
+    if isinstance(error, QueryTimeoutError):
+        return 'timeout'
+
+    if isinstance(error, (ClientDisconnectedError, asyncio.CancelledError, GeneratorExit)):
+        return 'cancelled'
+
+    # return to the caller
+    return 'error'
+
+
+class QueryMetrics:
+    """
+        Records the metrics of one query, from its start to the last row sent
+    """
+    def __init__(self, engine: str, fmt: str):
+        """
+        starts tracking the query
+
+        :param engine:
+        :param fmt: the format the rows are serialized as
+        """
+        # save the query details
+        self.engine: str = engine
+        self.fmt: str = fmt
+
+        # note the start
+        self.start: float = time.perf_counter()
+        self.finished: bool = False
+
+        QUERIES_ACTIVE.inc(engine=engine)
+
+    def add(self, rows: int, data=None):
+        """
+        records a batch of rows sent.
+
+        :param rows:
+        :param data: the serialized batch, if the rows were serialized
+        :return:
+        """
+        QUERY_ROWS.inc(rows, engine=self.engine)
+
+        if data is not None:
+            QUERY_BYTES.inc(len(data.encode() if isinstance(data, str) else data), engine=self.engine, format=self.fmt)
+
+        # return the data so it can be passed straight through
+        return data
+
+    def finish(self, error: BaseException | None = None, outcome: str | None = None):
+        """
+        records the query time, only the first call counts.
+
+        :param error: the exception that ended the query, if any
+        :param outcome: the outcome label, if it can't be told from the error
+        :return:
+        """
+        if self.finished:
+            return
+
+        self.finished = True
+
+        QUERIES_ACTIVE.dec(engine=self.engine)
+        QUERY_DURATION.observe(time.perf_counter() - self.start, engine=self.engine, outcome=outcome or get_outcome(error))
+
+    def __enter__(self):
+        """
+        tracks the query for the duration of the context.
+
+        :return:
+        """
+        # return to the caller
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        records the query time, with the outcome taken from the exception, if any.
+
+        :return:
+        """
+        self.finish(exc_value)
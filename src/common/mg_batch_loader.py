@@ -0,0 +1,383 @@
+"""
+    Batched Memgraph loader.
+
+    Streams rk-nodes/rk-edges CSV or Parquet chunks with polars and sends them to Memgraph
+    as UNWIND $rows batches of a set size over Bolt. Readers and writers run as
+    a producer/consumer pipeline joined by a bounded queue, so only a few
+    batches are ever held in memory.
+"""
+
+import os
+import time
+import queue
+import threading
+
+import polars as pl
+import pyarrow.parquet as pq
+from neo4j import GraphDatabase
+
+from src.common.load_schema import infer_chunk_schema, cast_frame
+from src.common.load_jobs import LoadJob
+
+# the query used to create a batch of nodes
+NODE_BATCH_QUERY: str = 'UNWIND $rows AS row CREATE (n:Node) SET n = row'
+
+# the query used to create a batch of edges of one predicate
+EDGE_BATCH_QUERY: str = 'UNWIND $rows AS row MATCH (a:Node {{id: row.subject}}), (b:Node {{id: row.object}}) CREATE (a)-[e:`{}`]->(b) SET e = row'
+
+# marks the end of the work in the queue
+END_OF_WORK = None
+
+
+def get_memgraph_url() -> str:
+    """
+    gets the Memgraph Bolt URL from the environment.
+
+    :return:
+    """
+    # return to the caller
+    return f"bolt://{os.getenv('MEMGRAPH_DB_HOST', 'localhost')}:{os.getenv('MEMGRAPH_DB_PORT', '7687')}"
+
+
+def read_batches(file_name: str, schema: list, batch_size: int):
+    """
+    generator that reads a CSV or Parquet chunk in batches of batch_size rows, cast to the schema types.
+
+    only the non-empty columns of the chunk are read.
+
+    :param file_name:
+    :param schema:
+    :param batch_size:
+    :return:
+    """
+    # a Parquet chunk is already typed
+    if file_name.endswith('.parquet'):
+        yield from read_parquet_batches(file_name, schema, batch_size)
+        return
+
+    # open the chunk, reading every column as text
+    reader = pl.read_csv_batched(file_name, columns=[column for column, _ in schema], infer_schema_length=0, batch_size=batch_size)
+
+    # the rows read but not yet handed back
+    pending: list = []
+    pending_rows: int = 0
+
+    while True:
+        # get the next set of rows, the reader picks its own block size
+        frames: list = reader.next_batches(1) or []
+
+        pending.extend(frames)
+        pending_rows += sum(frame.height for frame in frames)
+
+        # hand back full batches, or whatever is left at the end of the chunk
+        if pending_rows >= batch_size or (not frames and pending_rows):
+            frame: pl.DataFrame = pl.concat(pending)
+
+            full: int = frame.height - frame.height % batch_size if frames else frame.height
+
+            for batch in frame.head(full).iter_slices(batch_size):
+                yield cast_frame(batch, schema)
+
+            # keep the remainder for the next batch
+            pending = [frame.slice(full)] if full < frame.height else []
+            pending_rows = frame.height - full
+
+        if not frames:
+            break
+
+
+def read_parquet_batches(file_name: str, schema: list, batch_size: int):
+    """
+    generator that reads a typed Parquet chunk in batches of batch_size rows.
+
+    the Arrow record batches are wrapped by polars without copying, so nothing is parsed or cast.
+
+    :param file_name:
+    :param schema:
+    :param batch_size:
+    :return:
+    """
+    for batch in pq.ParquetFile(file_name).iter_batches(batch_size, columns=[column for column, _ in schema]):
+        yield pl.from_arrow(batch)
+
+
+def get_batch_work(frame: pl.DataFrame, is_edges: bool) -> list:
+    """
+    gets the (query, rows) pairs to send for a batch.
+
+    edges are split by predicate since the relationship type can't be a parameter.
+
+    :param frame:
+    :param is_edges:
+    :return:
+    """
+    # drop the columns with nothing in them in this batch so the DB doesn't set null properties
+    frame = frame.select([column for column in frame.columns if frame[column].null_count() < frame.height])
+
+    if not is_edges:
+        return [(NODE_BATCH_QUERY, frame.to_dicts())]
+
+    # return to the caller
+    return [(EDGE_BATCH_QUERY.format(str(predicate[0]).replace('`', '')), group.to_dicts())
+            for predicate, group in frame.partition_by('predicate', as_dict=True).items()]
+
+
+class MemgraphBatchLoader:
+    """
+        Loads CSV or Parquet chunks into Memgraph with batched UNWIND queries
+    """
+    def __init__(self, batch_size: int = 10000, readers: int = 2, writers: int = 4, queue_depth: int = 8):
+        """
+        creates the loader
+
+        :param batch_size: the number of rows per UNWIND transaction
+        :param readers: the number of threads reading and converting chunks
+        :param writers: the number of threads sending batches to Memgraph
+        :param queue_depth: the max number of batches waiting to be written
+        """
+        # save the pipeline settings
+        self.batch_size: int = max(batch_size, 1)
+        self.readers: int = max(readers, 1)
+        self.writers: int = max(writers, 1)
+        self.queue_depth: int = max(queue_depth, 1)
+
+        # init the counters
+        self.lock: threading.Lock = threading.Lock()
+        self.rows: int = 0
+        self.batches: int = 0
+        self.errors: list = []
+
+        # chunk name -> the chunk's progress, a chunk is only reported once its last batch has been written
+        self.chunks: dict = {}
+
+    def chunk_started(self, file_name: str):
+        """
+        starts tracking a chunk's batches.
+
+        :param file_name:
+        :return:
+        """
+        with self.lock:
+            self.chunks[file_name] = {'start': time.perf_counter(), 'pending': 0, 'read': False, 'rows': 0, 'errors': []}
+
+    def batch_done(self, file_name: str, rows: int = 0, error: str = None):
+        """
+        records a batch of a chunk that was written, or failed.
+
+        :param file_name:
+        :param rows: the rows written
+        :param error: why the batch failed, if it did
+        :return:
+        """
+        with self.lock:
+            chunk: dict = self.chunks[file_name]
+
+            chunk['pending'] -= 1
+            chunk['rows'] += rows
+
+            if error is not None:
+                chunk['errors'].append(error)
+
+    def finish_chunk(self, file_name: str, job: LoadJob = None):
+        """
+        reports a chunk to the job once it has been read and all of its batches have been written.
+
+        both the reader and the writers call this, whichever gets there last does the reporting.
+
+        :param file_name:
+        :param job:
+        :return:
+        """
+        with self.lock:
+            chunk: dict | None = self.chunks.get(file_name)
+
+            # the chunk was already reported, is still being read, or has batches still to be written
+            if chunk is None or not chunk['read'] or chunk['pending'] > 0:
+                return
+
+            del self.chunks[file_name]
+
+        if job is None:
+            return
+
+        if chunk['errors']:
+            job.chunk_failed(file_name, '; '.join(chunk['errors']))
+        else:
+            job.chunk_done(file_name, chunk['rows'], time.perf_counter() - chunk['start'])
+
+    def read_file(self, file_name: str, is_edges: bool, work: queue.Queue) -> int:
+        """
+        reads a chunk and puts its batches on the work queue.
+
+        :param file_name:
+        :param is_edges:
+        :param work:
+        :return: the number of rows read
+        """
+        # init the row count
+        ret_val: int = 0
+
+        # get the chunk schema
+        schema: list = infer_chunk_schema(file_name, is_edges)
+
+        for frame in read_batches(file_name, schema, self.batch_size):
+            for query, rows in get_batch_work(frame, is_edges):
+                # count the batch before a writer can finish it
+                with self.lock:
+                    self.chunks[file_name]['pending'] += 1
+
+                # this blocks once the queue is full, which keeps memory bounded
+                work.put((file_name, query, rows))
+
+            ret_val += frame.height
+
+        # return to the caller
+        return ret_val
+
+    def write_batches(self, driver, work: queue.Queue, job: LoadJob = None):
+        """
+        sends the batches on the work queue to Memgraph until the end marker shows up.
+
+        :param driver:
+        :param work:
+        :param job: the background job to report progress to, if any
+        :return:
+        """
+        # init the end of work flag
+        done: bool = False
+
+        try:
+            with driver.session() as session:
+                while not done:
+                    # get the next batch
+                    item = work.get()
+
+                    if item is END_OF_WORK:
+                        done = True
+                        continue
+
+                    file_name, query, rows = item
+
+                    try:
+                        # write the batch, transient failures are retried by the driver
+                        session.execute_write(lambda tx, q=query, r=rows: tx.run(q, rows=r).consume())
+
+                        with self.lock:
+                            self.rows += len(rows)
+                            self.batches += 1
+
+                        self.batch_done(file_name, len(rows))
+
+                        if job is not None:
+                            job.add_rows(len(rows))
+                    except Exception as e:
+                        with self.lock:
+                            self.errors.append(str(e))
+
+                        self.batch_done(file_name, error=str(e))
+
+                    # report the chunk if that was its last batch
+                    self.finish_chunk(file_name, job)
+        except Exception as e:
+            with self.lock:
+                self.errors.append(str(e))
+
+            # keep taking work so the readers never block on a full queue, the batches left can't be written
+            while not done:
+                item = work.get()
+
+                if item is END_OF_WORK:
+                    done = True
+                    continue
+
+                self.batch_done(item[0], error=str(e))
+
+                self.finish_chunk(item[0], job)
+
+    def load(self, file_names: list, is_edges: bool, job: LoadJob = None) -> dict:
+        """
+        loads the CSV or Parquet chunks into Memgraph.
+
+        :param file_names:
+        :param is_edges:
+        :param job: the background job to report per-chunk progress to, if any
+        :return: the load statistics
+        """
+        # note the start
+        start: float = time.perf_counter()
+
+        # save the number of chunks asked for
+        files_requested: int = len(file_names)
+
+        # the bounded hand-off between the readers and writers
+        work: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+
+        # the chunks still to be read
+        files: queue.Queue = queue.Queue()
+
+        def reader():
+            """
+            reads chunks until there are none left
+            """
+            while True:
+                try:
+                    file_name: str = files.get_nowait()
+                except queue.Empty:
+                    return
+
+                if job is not None:
+                    job.chunk_started(file_name)
+
+                self.chunk_started(file_name)
+
+                try:
+                    self.read_file(file_name, is_edges, work)
+                except Exception as e:
+                    with self.lock:
+                        self.errors.append(f'{file_name}: {str(e)}')
+                        self.chunks[file_name]['errors'].append(str(e))
+                finally:
+                    with self.lock:
+                        self.chunks[file_name]['read'] = True
+
+                # the chunk is reported here if the writers already have all of its batches done
+                self.finish_chunk(file_name, job)
+
+        with GraphDatabase.driver(get_memgraph_url(), auth=("", ""), max_connection_pool_size=self.writers) as driver:
+            try:
+                # fail fast rather than retrying every batch against a DB that isn't there
+                driver.verify_connectivity()
+            except Exception as e:
+                self.errors.append(str(e))
+
+                file_names = []
+
+            for file_name in file_names:
+                files.put(file_name)
+
+            # start the writers
+            writer_threads: list = [threading.Thread(target=self.write_batches, args=(driver, work, job), daemon=True) for _ in range(self.writers)]
+
+            # start the readers
+            reader_threads: list = [threading.Thread(target=reader, daemon=True) for _ in range(min(self.readers, len(file_names)))]
+
+            for thread in writer_threads + reader_threads:
+                thread.start()
+
+            # wait for the reading to finish
+            for thread in reader_threads:
+                thread.join()
+
+            # tell each writer there is nothing left
+            for _ in writer_threads:
+                work.put(END_OF_WORK)
+
+            for thread in writer_threads:
+                thread.join()
+
+        # get the elapsed time
+        elapsed: float = time.perf_counter() - start
+
+        # return to the caller
+        return {'files': files_requested, 'rows': self.rows, 'batches': self.batches, 'batch_size': self.batch_size, 'elapsed': round(elapsed, 4),
+                'rows_per_second': round(self.rows / elapsed, 2) if elapsed else 0.0, 'errors': self.errors}
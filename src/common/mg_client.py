@@ -0,0 +1,155 @@
+"""
+    Memgraph query client utilities.
+
+    One async Bolt driver is shared by the Memgraph query endpoints, so
+    concurrent reads share a connection pool on the event loop instead of
+    each blocking a thread, and records are streamed out as they arrive.
+"""
+
+import os
+
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession, Query as BoltQuery
+from neo4j.exceptions import Neo4jError
+from neo4j.graph import Node, Relationship, Path
+
+from src.common.mg_batch_loader import get_memgraph_url
+from src.common.cancellation import QueryTimeoutError, get_query_timeout
+from src.common.result_stream import convert_nested
+
+# the status code a Bolt server sends for a transaction that ran past its timeout, Neo4j adds a suffix for client set timeouts
+TIMEOUT_CODE: str = 'Neo.ClientError.Transaction.TransactionTimedOut'
+
+# Memgraph sends its generic error codes for a timeout, with the reason in the message
+MG_TIMEOUT_MESSAGE: str = 'because of transaction timeout'
+
+
+def get_mg_pool_settings() -> dict:
+    """
+    gets the Memgraph driver pool settings from the environment.
+
+    :return:
+    """
+    # return to the caller
+    return {'max_connection_pool_size': int(os.getenv('MEMGRAPH_POOL_SIZE', '100')),
+            'connection_acquisition_timeout': float(os.getenv('MEMGRAPH_POOL_ACQUIRE_TIMEOUT', '30'))}
+
+
+def get_mg_pool_usage(driver: AsyncDriver | None) -> dict:
+    """
+    gets the number of pooled connections in use and idle, along with the pool size.
+
+    :param driver:
+    :return:
+    """
+    # init the counts, nothing is pooled until the first query
+    ret_val: dict = {'in_use': 0, 'idle': 0, 'max': get_mg_pool_settings()['max_connection_pool_size']}
+
+    # the driver doesn't report its usage so it is read from its pool
+    pool = getattr(driver, '_pool', None)
+
+    if pool is not None:
+        for address, connections in list(pool.connections.items()):
+            in_use: int = pool.in_use_connection_count(address)
+
+            ret_val['in_use'] += in_use
+            ret_val['idle'] += len(connections) - in_use
+
+    # return to the caller
+    return ret_val
+
+
+def create_mg_driver() -> AsyncDriver:
+    """
+    creates the shared async Memgraph driver using the settings in the environment.
+
+    no connection is made until the first query.
+
+    :return:
+    """
+    # return to the caller
+    return AsyncGraphDatabase.driver(get_memgraph_url(), auth=("", ""), **get_mg_pool_settings())
+
+
+def is_mg_timeout(error: BaseException) -> bool:
+    """
+    checks if a query failed because it ran past its transaction timeout.
+
+    :param error:
+    :return:
+    """
+    # only the server knows a query timed out
+    if not isinstance(error, Neo4jError) or error.code is None:
+        return False
+
+    if error.code.startswith(TIMEOUT_CODE):
+        return True
+
+    # return to the caller
+    return error.code.startswith('Memgraph.') and MG_TIMEOUT_MESSAGE in (error.message or '')
+
+
+def to_json_value(value):
+    """
+    converts a Bolt record value to something JSON can hold.
+
+    :param value:
+    :return:
+    """
+    if isinstance(value, Node):
+        return {'id': value.element_id, 'labels': sorted(value.labels), 'properties': to_json_value(dict(value))}
+
+    if isinstance(value, Relationship):
+        return {'id': value.element_id, 'type': value.type, 'start_node': value.start_node.element_id if value.start_node else None,
+                'end_node': value.end_node.element_id if value.end_node else None, 'properties': to_json_value(dict(value))}
+
+    if isinstance(value, Path):
+        return {'nodes': [to_json_value(node) for node in value.nodes], 'relationships': [to_json_value(rel) for rel in value.relationships]}
+
+    # return to the caller
+    return convert_nested(value, to_json_value)
+
+
+async def run_mg_query(session: AsyncSession, query: str, parameters: dict | None, timeout: float | None) -> tuple:
+    """
+    starts a query, returning once the columns are known so query errors are raised here rather than mid stream.
+
+    :param session:
+    :param query:
+    :param parameters:
+    :param timeout: the transaction timeout in seconds, None uses the QUERY_TIMEOUT default, 0 is no timeout
+    :return: the result and its column names
+    """
+    try:
+        result = await session.run(BoltQuery(query, timeout=get_query_timeout(timeout) or None), parameters)
+
+        # return to the caller
+        return result, list(await result.keys())
+    except Neo4jError as e:
+        if is_mg_timeout(e):
+            raise QueryTimeoutError(str(e)) from e
+
+        raise
+
+
+async def get_record_batches(result, batch_size: int):
+    """
+    async generator that gathers a Bolt result's records into batches of JSON ready rows as they arrive.
+
+    :param result:
+    :param batch_size:
+    :return:
+    """
+    # init the batch
+    rows: list = []
+
+    async for record in result:
+        rows.append([to_json_value(value) for value in record.values()])
+
+        if len(rows) >= batch_size:
+            yield rows
+
+            rows = []
+
+    # send what is left
+    if rows:
+        yield rows
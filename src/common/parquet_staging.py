@@ -0,0 +1,102 @@
+"""
+    Parquet staging utilities.
+
+    Converts rk-nodes/rk-edges CSV chunks into typed Parquet chunks, once, so
+    the loaders don't re-parse the text on every load. The list columns are
+    stored as real lists and the booleans and numbers as real types, using the
+    same inferred schema the CSV loads cast to, and the columns that are
+    empty across the chunk are dropped. The Kuzu, Memgraph batch and Falkor
+    bulk loaders all read the Parquet chunks directly.
+"""
+
+import os
+import time
+
+import pyarrow.parquet as pq
+
+from src.common.load_schema import infer_csv_schema, NODE_TYPE_HINTS, EDGE_TYPE_HINTS
+from src.common.mg_batch_loader import read_batches
+from src.common.load_jobs import LoadJob
+
+
+def convert_chunk(csv_file_name: str, parquet_file_name: str, is_edges: bool, batch_size: int = 100000) -> dict:
+    """
+    converts a CSV chunk to a typed Parquet chunk, a row group per batch so the chunk is never all in memory.
+
+    :param csv_file_name:
+    :param parquet_file_name:
+    :param is_edges:
+    :param batch_size: the number of rows per row group
+    :return: the row count and file sizes
+    """
+    # note the start
+    start: float = time.perf_counter()
+
+    # get the types the CSV loads cast to
+    schema: list = infer_csv_schema(csv_file_name, EDGE_TYPE_HINTS if is_edges else NODE_TYPE_HINTS)
+
+    # init the row count
+    rows: int = 0
+
+    writer: pq.ParquetWriter | None = None
+
+    try:
+        for frame in read_batches(csv_file_name, schema, batch_size):
+            table = frame.to_arrow()
+
+            # the first batch sets the file schema, the casts keep it the same for every batch
+            if writer is None:
+                writer = pq.ParquetWriter(parquet_file_name, table.schema, compression='zstd')
+
+            writer.write_table(table)
+
+            rows += frame.height
+    finally:
+        if writer is not None:
+            writer.close()
+
+    # return to the caller
+    return {'file': parquet_file_name, 'rows': rows, 'csv_bytes': os.path.getsize(csv_file_name),
+            'parquet_bytes': os.path.getsize(parquet_file_name) if writer is not None else 0, 'elapsed': round(time.perf_counter() - start, 4)}
+
+
+def convert_chunks(file_pairs: list, is_edges: bool, job: LoadJob = None) -> dict:
+    """
+    converts a set of CSV chunks to Parquet.
+
+    polars and pyarrow use every core for each chunk, so the chunks are converted one at a time.
+
+    :param file_pairs: a list of (CSV file name, Parquet file name)
+    :param is_edges:
+    :param job: the background job to report per-chunk progress to, if any
+    :return: the totals and the per-chunk results
+    """
+    # init the per-chunk results
+    chunks: list = []
+
+    for csv_file_name, parquet_file_name in file_pairs:
+        if job is not None:
+            job.chunk_started(parquet_file_name)
+
+        try:
+            result: dict = convert_chunk(csv_file_name, parquet_file_name, is_edges)
+        except Exception as e:
+            if job is None:
+                raise e
+
+            job.chunk_failed(parquet_file_name, str(e))
+            continue
+
+        chunks.append(result)
+
+        if job is not None:
+            job.chunk_done(parquet_file_name, result['rows'], result['elapsed'])
+            job.add_rows(result['rows'])
+
+    # get the totals
+    csv_bytes: int = sum(chunk['csv_bytes'] for chunk in chunks)
+    parquet_bytes: int = sum(chunk['parquet_bytes'] for chunk in chunks)
+
+    # return to the caller
+    return {'files': len(chunks), 'rows': sum(chunk['rows'] for chunk in chunks), 'csv_bytes': csv_bytes, 'parquet_bytes': parquet_bytes,
+            'size_ratio': round(parquet_bytes / csv_bytes, 4) if csv_bytes else 0.0, 'chunks': chunks}
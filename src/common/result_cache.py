@@ -0,0 +1,276 @@
+"""
+    Query result cache utilities.
+
+    Keeps the serialized output of read-only queries in memory, bounded by
+    total bytes with LRU eviction and a TTL. The cache is cleared whenever the
+    DB is reopened or a load runs.
+"""
+
+import os
+import re
+import json
+import time
+from collections import OrderedDict
+
+# the quoted string literals and backtick identifiers, their text is never normalized or read as a clause
+QUOTED = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)""", re.DOTALL)
+
+# the clauses that write data wherever they are in a query, not counting property names (n.set) or map keys ({set: 1})
+WRITE_CLAUSES = re.compile(r'(?<![.\w$])(CREATE|MERGE|SET|DELETE|REMOVE|LOAD\s+(?:CSV|FROM|EXTENSION|WITH))\b(?!\s*:)', re.IGNORECASE)
+
+# the statements that change the DB or its settings, these only count at the start of a statement
+WRITE_STATEMENTS = re.compile(r'^\s*(DROP|ALTER|COPY|IMPORT|EXPORT|INSTALL|ATTACH|DETACH|USE|BEGIN|COMMIT|ROLLBACK|CHECKPOINT)\b', re.IGNORECASE)
+
+
+class ResultCache:
+    """
+        Byte-bounded LRU cache of query results with a TTL
+    """
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: float = 300.0, max_entry_bytes: int = 16 * 1024 * 1024):
+        """
+        creates the cache
+
+        :param max_bytes: the max total size of the cached results, 0 disables the cache
+        :param ttl: the number of seconds a result stays valid
+        :param max_entry_bytes: results larger than this are not cached
+        """
+        # save the cache settings
+        self.max_bytes: int = max_bytes
+        self.ttl: float = ttl
+        self.max_entry_bytes: int = min(max_entry_bytes, max_bytes)
+
+        # key -> (result, size, expiry time)
+        self.entries: OrderedDict = OrderedDict()
+
+        # the current total size of the cached results
+        self.size: int = 0
+
+        # bumped on each invalidation so results started before it are not saved
+        self.generation: int = 0
+
+        # init the counters
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self.invalidations: int = 0
+
+    @staticmethod
+    def from_env():
+        """
+        creates a cache using the settings in the environment
+
+        :return:
+        """
+        # get the cache settings
+        max_bytes: int = int(os.getenv('KUZU_RESULT_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+        ttl: float = float(os.getenv('KUZU_RESULT_CACHE_TTL', '300'))
+        max_entry_bytes: int = int(os.getenv('KUZU_RESULT_CACHE_MAX_ENTRY_BYTES', str(16 * 1024 * 1024)))
+
+        # return to the caller
+        return ResultCache(max_bytes, ttl, max_entry_bytes)
+
+    @staticmethod
+    def is_cacheable(query: str) -> bool:
+        """
+        checks if the query only reads data
+
+        :param query:
+        :return:
+        """
+        # don't read the clause names inside the string literals
+        unquoted: str = QUOTED.sub("''", query)
+
+        # return to the caller
+        return WRITE_CLAUSES.search(unquoted) is None and not any(WRITE_STATEMENTS.match(statement) for statement in unquoted.split(';'))
+
+    @staticmethod
+    def make_key(query: str, parameters: dict | None, fmt: str) -> str:
+        """
+        creates the cache key from the normalized query text, parameters and output format
+
+        :param query:
+        :param parameters:
+        :param fmt:
+        :return:
+        """
+        # collapse the whitespace outside the quoted literals, the split keeps the literals at the odd positions
+        parts: list = QUOTED.split(query)
+
+        normalized: str = ''.join(part if i % 2 else re.sub(r'\s+', ' ', part) for i, part in enumerate(parts))
+
+        # drop any trailing semicolon
+        normalized = normalized.strip().rstrip(';').strip()
+
+        # return to the caller
+        return f'{fmt}|{normalized}|{json.dumps(parameters, sort_keys=True, default=str)}'
+
+    def get(self, key: str):
+        """
+        gets a cached result
+
+        :param key:
+        :return: the cached result or None
+        """
+        # get the entry
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            # drop the entry if it is past its TTL
+            if entry[2] < time.monotonic():
+                self.remove(key)
+
+                self.expirations += 1
+            else:
+                # mark the entry as recently used
+                self.entries.move_to_end(key)
+
+                self.hits += 1
+
+                # return to the caller
+                return entry[0]
+
+        self.misses += 1
+
+        # return to the caller
+        return None
+
+    def put(self, key: str, result, size: int, generation: int):
+        """
+        saves a result
+
+        :param key:
+        :param result:
+        :param size: the size of the result in bytes
+        :param generation: the cache generation when the query started
+        :return:
+        """
+        # don't save results that are too big or that may predate an invalidation
+        if size > self.max_entry_bytes or generation != self.generation:
+            return
+
+        # replace any existing entry
+        self.remove(key)
+
+        self.entries[key] = (result, size, time.monotonic() + self.ttl)
+        self.size += size
+
+        # drop the least recently used results until we fit
+        while self.size > self.max_bytes:
+            _, (_, evicted_size, _) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+
+            self.evictions += 1
+
+    def remove(self, key: str):
+        """
+        removes a result
+
+        :param key:
+        :return:
+        """
+        # get the entry
+        entry = self.entries.pop(key, None)
+
+        if entry is not None:
+            self.size -= entry[1]
+
+    def invalidate(self):
+        """
+        drops every cached result
+
+        :return:
+        """
+        self.entries.clear()
+        self.size = 0
+        self.generation += 1
+
+        self.invalidations += 1
+
+    @property
+    def enabled(self) -> bool:
+        """
+        checks if the cache can hold anything
+
+        :return:
+        """
+        # return to the caller
+        return self.max_entry_bytes > 0 and self.ttl > 0
+
+    def get_stats(self) -> dict:
+        """
+        gets the cache counters
+
+        :return:
+        """
+        # get the total number of lookups
+        lookups: int = self.hits + self.misses
+
+        # return to the caller
+        return {'enabled': self.enabled,
+                'max_bytes': self.max_bytes,
+                'max_entry_bytes': self.max_entry_bytes,
+                'ttl': self.ttl,
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0}
+
+
+async def cache_stream(cache: ResultCache, key: str, generation: int, stream):
+    """
+    async generator that passes a result stream through and caches it once it completes, as long as it fits.
+
+    :param cache:
+    :param key:
+    :param generation:
+    :param stream:
+    :return:
+    """
+    # init the captured chunks
+    chunks: list = []
+    size: int = 0
+
+    try:
+        async for chunk in stream:
+            # keep capturing until the result gets too big to cache
+            if chunks is not None:
+                size += len(chunk)
+
+                if size > cache.max_entry_bytes:
+                    chunks = None
+                else:
+                    chunks.append(chunk)
+
+            yield chunk
+    finally:
+        # a stream cut off part way is closed now rather than whenever it is collected
+        await stream.aclose()
+
+    # the stream completed, save it
+    if chunks is not None:
+        cache.put(key, chunks, size, generation)
+
+
+async def invalidate_after_stream(cache: ResultCache, stream):
+    """
+    async generator that passes a write query's stream through and clears the cache once it is done.
+
+    clearing it at the end, rather than when the stream starts, also drops any results saved while the write ran.
+
+    :param cache:
+    :param stream:
+    :return:
+    """
+    try:
+        async for chunk in stream:
+            yield chunk
+    finally:
+        await stream.aclose()
+
+        # this also runs when the client goes away mid stream
+        cache.invalidate()
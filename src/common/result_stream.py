@@ -0,0 +1,282 @@
+"""
+    Streaming serializers for graph query results.
+
+    Rows are pulled from the query result in batches and written out as
+    they arrive so the full result never has to sit in server memory.
+"""
+
+import io
+import csv
+import json
+import asyncio
+from contextlib import AsyncExitStack
+
+import pyarrow as pa
+from fastapi.responses import StreamingResponse
+
+from src.common.metrics import QueryMetrics
+
+# the supported output formats and their media types
+STREAM_MEDIA_TYPES: dict = {'arrow': 'application/vnd.apache.arrow.stream', 'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+
+# the Kuzu column types that have a direct Arrow equivalent
+KUZU_ARROW_TYPES: dict = {'BOOL': pa.bool_(), 'INT64': pa.int64(), 'INT32': pa.int32(), 'INT16': pa.int16(), 'INT8': pa.int8(),
+                          'UINT64': pa.uint64(), 'UINT32': pa.uint32(), 'UINT16': pa.uint16(), 'UINT8': pa.uint8(),
+                          'DOUBLE': pa.float64(), 'FLOAT': pa.float32(), 'STRING': pa.string(), 'DATE': pa.date32(),
+                          'TIMESTAMP': pa.timestamp('us'), 'STRING[]': pa.list_(pa.string())}
+
+
+class StreamResources:
+    """
+        What a streamed result holds (the query result, its connection, its metrics), freed once whether the stream finished, failed or never started
+    """
+    def __init__(self, stack: AsyncExitStack, metrics: QueryMetrics):
+        """
+        creates the resources
+
+        :param stack: releases the result and its connection when closed
+        :param metrics: records the rows and bytes sent and the query time
+        """
+        self.stack: AsyncExitStack = stack
+        self.metrics: QueryMetrics = metrics
+        self.released: bool = False
+
+    async def release(self, error: BaseException | None = None):
+        """
+        frees the resources, only the first call does anything.
+
+        :param error: the exception that ended the stream, if any
+        :return:
+        """
+        if self.released:
+            return
+
+        self.released = True
+
+        try:
+            await self.stack.aclose()
+        finally:
+            # the query is no longer active, whichever way it ended
+            self.metrics.finish(error)
+
+
+class ReleasingStreamingResponse(StreamingResponse):
+    """
+        A streaming response that frees its result once the response is done, even if the client left before the stream started
+    """
+    def __init__(self, content, resources: StreamResources, **kwargs):
+        """
+        creates the response
+
+        :param content: the stream
+        :param resources: what the stream holds
+        :param kwargs: the StreamingResponse settings
+        """
+        super().__init__(content, **kwargs)
+
+        self.resources: StreamResources = resources
+
+    async def __call__(self, scope, receive, send):
+        """
+        sends the response, then makes sure the stream's resources were freed.
+
+        :param scope:
+        :param receive:
+        :param send:
+        :return:
+        """
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # let a stream that was cut off run its own clean up
+            if hasattr(self.body_iterator, 'aclose'):
+                await self.body_iterator.aclose()
+
+            # a stream that never started never ran its clean up
+            await self.resources.release(asyncio.CancelledError())
+
+
+def fetch_rows(result, batch_size: int) -> list:
+    """
+    pulls the next batch of rows from a Kuzu query result.
+
+    :param result:
+    :param batch_size:
+    :return:
+    """
+    # init the returned rows
+    rows: list = []
+
+    # get the rows until the batch is full or the result is drained
+    while len(rows) < batch_size and result.has_next():
+        rows.append(result.get_next())
+
+    # return to the caller
+    return rows
+
+
+def get_arrow_schema(names: list, types: list | None, first_rows: list) -> pa.Schema:
+    """
+    gets an Arrow schema for the result using the Kuzu column types when possible,
+    otherwise the types are inferred from the first batch of rows.
+
+    :param names: the column names
+    :param types: the Kuzu column types, if known
+    :param first_rows:
+    :return:
+    """
+    # the other engines don't report their column types
+    types = types or [None] * len(names)
+
+    # infer a schema from the sample
+    inferred: pa.Schema = pa.RecordBatch.from_pylist([dict(zip(names, row)) for row in first_rows]).schema if first_rows else None
+
+    # init the fields list
+    fields: list = []
+
+    for i, (name, kuzu_type) in enumerate(zip(names, types)):
+        if kuzu_type in KUZU_ARROW_TYPES:
+            fields.append(pa.field(name, KUZU_ARROW_TYPES[kuzu_type]))
+        elif inferred is not None and not pa.types.is_null(inferred.field(i).type):
+            fields.append(inferred.field(i))
+        else:
+            # fall back to text for anything we can't type
+            fields.append(pa.field(name, pa.string()))
+
+    # return to the caller
+    return pa.schema(fields)
+
+
+def convert_nested(value, convert):
+    """
+    converts the values in a list or dict with an engine's value converter, anything else is sent as is.
+
+    :param value:
+    :param convert: the engine's converter, it handles the graph types and calls back here for the rest
+    :return:
+    """
+    if isinstance(value, list):
+        return [convert(v) for v in value]
+
+    if isinstance(value, dict):
+        return {k: convert(v) for k, v in value.items()}
+
+    # return to the caller
+    return value
+
+
+def serialize_batch(fmt: str, names: list, rows: list) -> bytes:
+    """
+    serializes a batch of rows into NDJSON or CSV.
+
+    :param fmt:
+    :param names:
+    :param rows:
+    :return:
+    """
+    if fmt == 'ndjson':
+        ret_val: bytes = ''.join(json.dumps(dict(zip(names, row)), default=str) + '\n' for row in rows).encode()
+    else:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        ret_val: bytes = buffer.getvalue().encode()
+
+    # return to the caller
+    return ret_val
+
+
+def to_record_batch(schema: pa.Schema, rows: list) -> pa.RecordBatch:
+    """
+    converts a batch of rows into an Arrow record batch.
+
+    :param schema:
+    :param rows:
+    :return:
+    """
+    # get the columns that fell back to text
+    text_cols: list = [pa.types.is_string(field.type) for field in schema]
+
+    # make sure the text columns really are text
+    rows = [{field.name: str(v) if is_text and v is not None and not isinstance(v, str) else v
+             for v, field, is_text in zip(row, schema, text_cols)} for row in rows]
+
+    # return to the caller
+    return pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+def drain(sink: io.BytesIO) -> bytes:
+    """
+    gets whatever has been written to the sink and empties it.
+
+    :param sink:
+    :return:
+    """
+    # get the written bytes
+    ret_val: bytes = sink.getvalue()
+
+    # reset the sink
+    sink.seek(0)
+    sink.truncate(0)
+
+    # return to the caller
+    return ret_val
+
+
+async def stream_batches(resources: StreamResources, names: list, batches, fmt: str, types: list | None = None):
+    """
+    async generator that sends a query's rows a batch at a time as they arrive.
+
+    the result and its connection are released, and the query metrics finished, once the stream is done.
+
+    :param resources: the result, its connection and the query metrics
+    :param names: the column names
+    :param batches: an async iterator of row lists
+    :param fmt: arrow, ndjson or csv
+    :param types: the Kuzu column types used to type the Arrow columns, if known
+    :return:
+    """
+    # get the query metrics
+    metrics: QueryMetrics = resources.metrics
+
+    # init the error that ended the stream, if any
+    error: BaseException | None = None
+
+    try:
+        if fmt == 'arrow':
+            # the Arrow IPC stream is started once the first batch is there to type the columns with
+            sink = io.BytesIO()
+            schema: pa.Schema | None = None
+            writer = None
+
+            # send each batch as it arrives
+            async for rows in batches:
+                if writer is None:
+                    schema = get_arrow_schema(names, types, rows)
+                    writer = pa.ipc.new_stream(sink, schema)
+
+                writer.write_batch(to_record_batch(schema, rows))
+
+                yield metrics.add(len(rows), drain(sink))
+
+            # an empty result still gets its schema message
+            if writer is None:
+                writer = pa.ipc.new_stream(sink, get_arrow_schema(names, types, []))
+
+            # close out the stream
+            writer.close()
+
+            yield drain(sink)
+        else:
+            # send the CSV header
+            if fmt == 'csv':
+                yield serialize_batch(fmt, names, [names])
+
+            # send each batch as it arrives
+            async for rows in batches:
+                yield metrics.add(len(rows), serialize_batch(fmt, names, rows))
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        # release the query result and the connection, this also runs when the client goes away mid stream
+        await resources.release(error)
@@ -0,0 +1,300 @@
+"""
+    Synthetic RK graph generator.
+
+    Writes rk-nodes/rk-edges CSV chunks shaped like the RK dump, named the way
+    the loaders expect (rk-nodes.csv, rk-nodes-pt1.csv, ...), so the loaders
+    and queries can be tested at any scale. The nodes get the biolink category
+    mix and the sparse CHEBI_ROLE_ and MONDO_SUPERCLASS_ boolean columns of the
+    real data, and the edge endpoints follow a power-law degree distribution.
+
+    Every column is built with numpy and polars a chunk at a time, faker is
+    only used to make the word pools the names and descriptions are drawn
+    from, so large graphs take minutes rather than hours.
+"""
+
+import os
+import time
+
+import numpy as np
+import polars as pl
+from faker import Faker
+
+from src.common.load_schema import get_chunk_file_name
+from src.common.load_jobs import LoadJob
+
+# the node types: (relative weight, ID prefix, biolink categories), roughly the RK mix
+NODE_TYPES: list = [
+    (30, 'NCBIGene', ['biolink:Gene', 'biolink:GeneOrGeneProduct', 'biolink:GenomicEntity', 'biolink:ChemicalEntityOrGeneOrGeneProduct',
+                      'biolink:PhysicalEssence', 'biolink:OntologyClass', 'biolink:BiologicalEntity', 'biolink:ThingWithTaxon',
+                      'biolink:NamedThing', 'biolink:Entity', 'biolink:PhysicalEssenceOrOccurrent', 'biolink:MacromolecularMachineMixin']),
+    (25, 'CAID', ['biolink:SequenceVariant', 'biolink:GenomicEntity', 'biolink:BiologicalEntity', 'biolink:PhysicalEssence',
+                  'biolink:OntologyClass', 'biolink:ThingWithTaxon', 'biolink:NamedThing', 'biolink:Entity', 'biolink:PhysicalEssenceOrOccurrent']),
+    (15, 'CHEBI', ['biolink:SmallMolecule', 'biolink:MolecularEntity', 'biolink:ChemicalEntity', 'biolink:PhysicalEssence',
+                   'biolink:ChemicalOrDrugOrTreatment', 'biolink:ChemicalEntityOrGeneOrGeneProduct', 'biolink:ChemicalEntityOrProteinOrPolypeptide',
+                   'biolink:NamedThing', 'biolink:Entity', 'biolink:PhysicalEssenceOrOccurrent']),
+    (8, 'UniProtKB', ['biolink:Protein', 'biolink:GeneProductMixin', 'biolink:Polypeptide', 'biolink:ChemicalEntityOrGeneOrGeneProduct',
+                      'biolink:ChemicalEntityOrProteinOrPolypeptide', 'biolink:GeneOrGeneProduct', 'biolink:BiologicalEntity',
+                      'biolink:ThingWithTaxon', 'biolink:NamedThing', 'biolink:Entity', 'biolink:MacromolecularMachineMixin']),
+    (6, 'NCBITaxon', ['biolink:OrganismTaxon', 'biolink:NamedThing', 'biolink:Entity', 'biolink:OntologyClass']),
+    (5, 'HP', ['biolink:PhenotypicFeature', 'biolink:DiseaseOrPhenotypicFeature', 'biolink:BiologicalEntity', 'biolink:ThingWithTaxon',
+               'biolink:NamedThing', 'biolink:Entity']),
+    (4, 'MONDO', ['biolink:Disease', 'biolink:DiseaseOrPhenotypicFeature', 'biolink:BiologicalEntity', 'biolink:ThingWithTaxon',
+                  'biolink:NamedThing', 'biolink:Entity']),
+    (3, 'GO', ['biolink:BiologicalProcess', 'biolink:BiologicalProcessOrActivity', 'biolink:Occurrent', 'biolink:OntologyClass',
+               'biolink:BiologicalEntity', 'biolink:ThingWithTaxon', 'biolink:NamedThing', 'biolink:Entity',
+               'biolink:PhysicalEssenceOrOccurrent']),
+    (1, 'UBERON', ['biolink:AnatomicalEntity', 'biolink:OrganismalEntity', 'biolink:SubjectOfInvestigation', 'biolink:PhysicalEssence',
+                   'biolink:BiologicalEntity', 'biolink:ThingWithTaxon', 'biolink:NamedThing', 'biolink:Entity',
+                   'biolink:PhysicalEssenceOrOccurrent']),
+    (1, 'CL', ['biolink:Cell', 'biolink:AnatomicalEntity', 'biolink:OrganismalEntity', 'biolink:SubjectOfInvestigation', 'biolink:PhysicalEssence',
+               'biolink:BiologicalEntity', 'biolink:ThingWithTaxon', 'biolink:NamedThing', 'biolink:Entity', 'biolink:PhysicalEssenceOrOccurrent']),
+    (1, 'REACT', ['biolink:Pathway', 'biolink:BiologicalProcess', 'biolink:BiologicalProcessOrActivity', 'biolink:Occurrent',
+                  'biolink:OntologyClass', 'biolink:BiologicalEntity', 'biolink:ThingWithTaxon', 'biolink:NamedThing', 'biolink:Entity',
+                  'biolink:PhysicalEssenceOrOccurrent']),
+    (1, 'PANTHER.FAMILY', ['biolink:GeneFamily', 'biolink:GeneGroupingMixin', 'biolink:ChemicalEntityOrGeneOrGeneProduct', 'biolink:NamedThing',
+                           'biolink:Entity'])
+]
+
+# the edge predicates and their relative weights
+PREDICATES: list = [('biolink:related_to_at_instance_level', 20), ('biolink:has_phenotype', 10), ('biolink:interacts_with', 15),
+                    ('biolink:directly_physically_interacts_with', 10), ('biolink:affects', 10), ('biolink:is_sequence_variant_of', 15),
+                    ('biolink:subclass_of', 8), ('biolink:treats_or_applied_or_studied_to_treat', 4), ('biolink:genetically_associated_with', 5),
+                    ('biolink:in_taxon', 3)]
+
+# the knowledge sources and levels the edges are spread over
+KNOWLEDGE_SOURCES: list = ['infores:ctd', 'infores:gtopdb', 'infores:hetio', 'infores:string', 'infores:biolink', 'infores:monarchinitiative',
+                           'infores:ubergraph', 'infores:textminingkp', 'infores:panther', 'infores:reactome']
+KNOWLEDGE_LEVELS: list = ['knowledge_assertion', 'prediction', 'statistical_association', 'not_provided']
+AGENT_TYPES: list = ['manual_agent', 'automated_agent', 'text_mining_agent', 'not_provided']
+
+
+def get_chunk_count(rows: int, chunk_rows: int) -> int:
+    """
+    gets the number of chunks the rows are split into.
+
+    :param rows:
+    :param chunk_rows:
+    :return:
+    """
+    # return to the caller
+    return max(-(-rows // max(chunk_rows, 1)), 1)
+
+
+def get_power_law_cdf(count: int, alpha: float) -> np.ndarray:
+    """
+    gets the cumulative distribution of a rank ^ -alpha power law over count items.
+
+    :param count:
+    :param alpha: the exponent, 0 is uniform
+    :return:
+    """
+    # weight each rank
+    weights: np.ndarray = np.arange(1, count + 1, dtype=np.float64) ** -alpha
+
+    ret_val: np.ndarray = np.cumsum(weights)
+
+    # return to the caller
+    return ret_val / ret_val[-1]
+
+
+class RKGraphGenerator:
+    """
+        Generates an RK-shaped graph as CSV chunks
+    """
+    def __init__(self, nodes: int, edges: int, seed: int = 0, alpha: float = 1.0, chebi_columns: int = 200, mondo_columns: int = 100,
+                 sparse_density: float = 0.02):
+        """
+        creates the generator
+
+        :param nodes: the number of nodes
+        :param edges: the number of edges
+        :param seed: the random seed, the same seed and settings always give the same graph
+        :param alpha: the power-law exponent of the node degrees, 0 is uniform
+        :param chebi_columns: the number of CHEBI_ROLE_ columns, only set on chemical nodes
+        :param mondo_columns: the number of MONDO_SUPERCLASS_ columns, only set on disease nodes
+        :param sparse_density: the share of the eligible nodes that have each sparse column set
+        """
+        # save the settings
+        self.nodes: int = max(nodes, 1)
+        self.edges: int = max(edges, 0)
+        self.seed: int = seed
+        self.alpha: float = max(alpha, 0.0)
+        self.sparse_density: float = min(max(sparse_density, 0.0), 1.0)
+
+        rng: np.random.Generator = np.random.default_rng(seed)
+
+        # get each node's type, these also give the node IDs
+        weights: np.ndarray = np.array([weight for weight, _, _ in NODE_TYPES], dtype=np.float64)
+
+        self.node_types: np.ndarray = rng.choice(len(NODE_TYPES), size=self.nodes, p=weights / weights.sum()).astype(np.int8)
+
+        # the ID prefix and category list of each type
+        self.id_prefixes: pl.Series = pl.Series([f'{prefix}:' for _, prefix, _ in NODE_TYPES])
+        self.categories: pl.Series = pl.Series([';'.join(categories) for _, _, categories in NODE_TYPES])
+
+        # the sparse columns and the node type each one belongs to
+        chebi: int = [prefix for _, prefix, _ in NODE_TYPES].index('CHEBI')
+        mondo: int = [prefix for _, prefix, _ in NODE_TYPES].index('MONDO')
+
+        self.sparse_columns: list = [(f'CHEBI_ROLE_role_{i}', chebi) for i in range(max(chebi_columns, 0))] + \
+                                    [(f'MONDO_SUPERCLASS_class_{i}', mondo) for i in range(max(mondo_columns, 0))]
+
+        # the hubs are spread over random nodes rather than the first IDs
+        self.subject_ranks: np.ndarray = rng.permutation(self.nodes)
+        self.object_ranks: np.ndarray = rng.permutation(self.nodes)
+
+        self.degree_cdf: np.ndarray = get_power_law_cdf(self.nodes, self.alpha)
+
+        # the word pools the text columns are drawn from
+        fake: Faker = Faker()
+        fake.seed_instance(seed)
+
+        self.words: pl.Series = pl.Series(fake.words(nb=1000, unique=False))
+        self.sentences: pl.Series = pl.Series([fake.sentence(nb_words=12) for _ in range(1000)])
+
+    def get_node_ids(self, indexes: np.ndarray) -> pl.Series:
+        """
+        gets the IDs of the nodes, e.g. CHEBI:1234.
+
+        :param indexes:
+        :return:
+        """
+        # return to the caller
+        return pl.select(self.id_prefixes.gather(self.node_types[indexes]) + pl.Series(indexes).cast(pl.String)).to_series().alias('id')
+
+    def make_node_chunk(self, start: int, rows: int) -> pl.DataFrame:
+        """
+        makes a chunk of nodes.
+
+        :param start: the index of the first node
+        :param rows:
+        :return:
+        """
+        # each chunk has its own stream so any chunk can be made on its own
+        rng: np.random.Generator = np.random.default_rng([self.seed, 0, start])
+
+        indexes: np.ndarray = np.arange(start, start + rows)
+
+        types: np.ndarray = self.node_types[indexes]
+
+        # describe about a third of the nodes
+        described: np.ndarray = rng.random(rows) < 0.3
+
+        columns: list = [self.get_node_ids(indexes),
+                         pl.select(self.words.gather(rng.integers(0, len(self.words), rows)) + ' ' +
+                                   self.words.gather(rng.integers(0, len(self.words), rows))).to_series().alias('name'),
+                         self.categories.gather(types).alias('category'),
+                         pl.Series('information_content', np.round(rng.uniform(10, 100, rows), 1)),
+                         self.sentences.gather(rng.integers(0, len(self.sentences), rows)).scatter(np.flatnonzero(~described), None)
+                         .alias('description')]
+
+        for name, node_type in self.sparse_columns:
+            # set the column on a few of the nodes of its type, the rest are left empty
+            eligible: np.ndarray = np.flatnonzero(types == node_type)
+
+            chosen: np.ndarray = eligible[rng.random(len(eligible)) < self.sparse_density]
+
+            columns.append(pl.repeat(None, rows, dtype=pl.Boolean, eager=True).scatter(chosen, True).alias(name))
+
+        # return to the caller
+        return pl.DataFrame(columns)
+
+    def make_edge_chunk(self, start: int, rows: int) -> pl.DataFrame:
+        """
+        makes a chunk of edges.
+
+        :param start: the index of the first edge
+        :param rows:
+        :return:
+        """
+        # each chunk has its own stream so any chunk can be made on its own
+        rng: np.random.Generator = np.random.default_rng([self.seed, 1, start])
+
+        # draw the endpoints from the power law
+        subjects: np.ndarray = self.subject_ranks[np.searchsorted(self.degree_cdf, rng.random(rows), side='right').clip(0, self.nodes - 1)]
+        objects: np.ndarray = self.object_ranks[np.searchsorted(self.degree_cdf, rng.random(rows), side='right').clip(0, self.nodes - 1)]
+
+        # no self loops
+        objects = np.where(objects == subjects, (objects + 1) % self.nodes, objects)
+
+        # get the predicates
+        weights: np.ndarray = np.array([weight for _, weight in PREDICATES], dtype=np.float64)
+
+        predicates: np.ndarray = rng.choice(len(PREDICATES), size=rows, p=weights / weights.sum())
+
+        # cite publications on about half of the edges
+        cited: np.ndarray = rng.random(rows) < 0.5
+
+        publications: pl.Series = pl.select(pl.lit('PMID:') + pl.Series(rng.integers(1, 40_000_000, rows)).cast(pl.String) + ';PMID:' +
+                                            pl.Series(rng.integers(1, 40_000_000, rows)).cast(pl.String)).to_series()
+
+        # score about a fifth of them
+        scored: np.ndarray = rng.random(rows) < 0.2
+
+        # return to the caller
+        return pl.DataFrame([self.get_node_ids(subjects).alias('subject'),
+                             pl.Series([name for name, _ in PREDICATES]).gather(predicates).alias('predicate'),
+                             self.get_node_ids(objects).alias('object'),
+                             pl.Series(KNOWLEDGE_SOURCES).gather(rng.integers(0, len(KNOWLEDGE_SOURCES), rows)).alias('primary_knowledge_source'),
+                             pl.Series(KNOWLEDGE_LEVELS).gather(rng.integers(0, len(KNOWLEDGE_LEVELS), rows)).alias('knowledge_level'),
+                             pl.Series(AGENT_TYPES).gather(rng.integers(0, len(AGENT_TYPES), rows)).alias('agent_type'),
+                             publications.scatter(np.flatnonzero(~cited), None).alias('publications'),
+                             pl.Series('score', np.round(rng.random(rows), 4)).scatter(np.flatnonzero(~scored), None)])
+
+    def write(self, out_dir: str, node_prefix: str = 'rk-nodes', edge_prefix: str = 'rk-edges', node_chunk_rows: int = 1_000_000,
+              edge_chunk_rows: int = 1_000_000, job: LoadJob = None) -> dict:
+        """
+        writes the nodes and then the edges as chunks numbered from 0, i.e. prefix.csv, prefix-pt1.csv, ...
+
+        :param out_dir:
+        :param node_prefix:
+        :param edge_prefix:
+        :param node_chunk_rows: the max number of rows per node chunk
+        :param edge_chunk_rows: the max number of rows per edge chunk
+        :param job: the background job to report per-chunk progress to, if any
+        :return: the chunk counter ranges and timings
+        """
+        os.makedirs(out_dir, exist_ok=True)
+
+        # note the start
+        start: float = time.perf_counter()
+
+        # init the returned details
+        ret_val: dict = {'out_dir': out_dir, 'nodes': self.nodes, 'edges': self.edges}
+
+        for phase, prefix, total, chunk_rows, make_chunk in [('nodes', node_prefix, self.nodes, node_chunk_rows, self.make_node_chunk),
+                                                             ('edges', edge_prefix, self.edges, edge_chunk_rows, self.make_edge_chunk)]:
+            # note the phase start
+            phase_start: float = time.perf_counter()
+
+            chunks: int = get_chunk_count(total, chunk_rows) if total else 0
+
+            for i in range(chunks):
+                file_name: str = get_chunk_file_name(out_dir, prefix, i)
+
+                if job is not None:
+                    job.chunk_started(file_name)
+
+                # note the chunk start
+                chunk_start: float = time.perf_counter()
+
+                # get the rows in this chunk
+                rows: int = min(max(chunk_rows, 1), total - i * max(chunk_rows, 1))
+
+                make_chunk(i * max(chunk_rows, 1), rows).write_csv(file_name)
+
+                if job is not None:
+                    job.chunk_done(file_name, rows, time.perf_counter() - chunk_start)
+                    job.add_rows(rows)
+
+            ret_val[f'{phase[:-1]}_file_prefix'] = prefix
+            ret_val[f'{phase[:-1]}_file_counter_start'] = 0
+            ret_val[f'{phase[:-1]}_file_counter_end'] = chunks - 1
+
+            if job is not None:
+                job.phase_done(phase, time.perf_counter() - phase_start)
+
+        ret_val['elapsed'] = round(time.perf_counter() - start, 4)
+
+        # return to the caller
+        return ret_val
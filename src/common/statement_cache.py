@@ -0,0 +1,99 @@
+"""
+    Prepared statement cache utilities.
+
+    Kuzu prepared statements belong to the connection that prepared them, so
+    each cached query template keeps one statement per pooled connection.
+"""
+
+from collections import OrderedDict
+
+
+class PreparedStatementCache:
+    """
+        LRU cache of Kuzu prepared statements keyed by the query template text
+    """
+    def __init__(self, max_size: int = 256):
+        """
+        creates the cache
+
+        :param max_size: the max number of query templates kept
+        """
+        # save the cache size
+        self.max_size: int = max_size
+
+        # template text -> {connection id: prepared statement}
+        self.statements: OrderedDict = OrderedDict()
+
+        # init the counters
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def get(self, conn, template: str):
+        """
+        gets the prepared statement for the template on this connection
+
+        :param conn:
+        :param template:
+        :return: the prepared statement or None on a miss
+        """
+        # get the statements for this template
+        by_conn: dict = self.statements.get(template)
+
+        if by_conn is not None and id(conn) in by_conn:
+            # mark the template as recently used
+            self.statements.move_to_end(template)
+
+            self.hits += 1
+
+            # return to the caller
+            return by_conn[id(conn)]
+
+        self.misses += 1
+
+        # return to the caller
+        return None
+
+    def put(self, conn, template: str, statement):
+        """
+        saves a prepared statement for the template on this connection
+
+        :param conn:
+        :param template:
+        :param statement:
+        :return:
+        """
+        # save the statement
+        self.statements.setdefault(template, {})[id(conn)] = statement
+        self.statements.move_to_end(template)
+
+        # drop the least recently used templates
+        while len(self.statements) > self.max_size:
+            self.statements.popitem(last=False)
+
+            self.evictions += 1
+
+    def clear(self):
+        """
+        drops every cached statement
+
+        :return:
+        """
+        self.statements.clear()
+
+    def get_stats(self) -> dict:
+        """
+        gets the cache counters
+
+        :return:
+        """
+        # get the total number of lookups
+        lookups: int = self.hits + self.misses
+
+        # return to the caller
+        return {'max_size': self.max_size,
+                'templates': len(self.statements),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0}
@@ -3,23 +3,44 @@
 
     powen@renci.org, 2025-25-04
 """
-import multiprocessing
+import asyncio
+import json
 import os
+import time
 from typing import LiteralString
 
 import kuzu
-from neo4j import GraphDatabase, DEFAULT_DATABASE
+from neo4j import GraphDatabase, AsyncDriver, DEFAULT_DATABASE
 import pandas as pd
 
 from codetiming import Timer
-from fastapi import FastAPI
+from fastapi import FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse
-from kuzu import Database
+from fastapi.responses import PlainTextResponse, JSONResponse, StreamingResponse, Response
 from contextlib import asynccontextmanager
 from src.common.logger import LoggingUtil
-from falkordb import FalkorDB
-import redis
+from src.common.kuzu_pool import KuzuConnectionPool, KuzuPoolTimeoutError
+from src.common.kuzu_db import open_kuzu_db, warm_up_kuzu_db
+from src.common.result_stream import STREAM_MEDIA_TYPES, ReleasingStreamingResponse, serialize_batch
+from src.common.result_cache import ResultCache, cache_stream, invalidate_after_stream
+from src.common.cursor_store import CursorStore, CursorStoreFullError, ResultTooLargeError
+from src.common.load_schema import NODE_TYPE_HINTS, EDGE_TYPE_HINTS, get_chunk_file_name, infer_csv_schema, get_node_load_query, \
+    get_edge_load_query
+from src.common.mg_batch_loader import MemgraphBatchLoader, get_memgraph_url
+from src.common.load_workers import start_load_pool, stop_load_pool, get_load_pool, get_load_pool_size, get_worker_mg_driver, get_worker_falkor_client
+from src.common.load_jobs import LoadJob, LoadJobManager
+from src.common.edge_partitioner import partition_edge_chunks, run_with_retry
+from src.common.kuzu_loader import load_kuzu_chunks
+from src.common.falkor_bulk_loader import FalkorBulkLoader
+from src.common.falkor_client import FalkorClient
+from src.common.mg_client import create_mg_driver, get_mg_pool_usage
+from src.common.graph_backends import GraphBackend, BackendUnavailableError, BACKEND_FORMATS, get_graph_backends
+from src.common.benchmark import load_workload, run_benchmark, write_results
+from src.common.rk_generator import RKGraphGenerator, get_chunk_count
+from src.common.parquet_staging import convert_chunks
+from src.common.chunk_planner import find_chunks, plan_chunks, rechunk_files
+from src.common.metrics import METRICS, METRICS_MEDIA_TYPE, QueryMetrics, POOL_CONNECTIONS, POOL_WAITING, LOAD_JOBS, LOG_QUEUE_DEPTH
+from src.common.cancellation import QueryTimeoutError, ClientDisconnectedError, run_until_disconnect
 
 # set the app version
 app_version = os.getenv('APP_VERSION', 'Experimental')
@@ -31,7 +52,76 @@ log_level, log_path = LoggingUtil.prep_for_logging()
 logger = LoggingUtil.init_logging("graph-db-eval-fastapi", level=log_level, line_format='medium', log_file_path=log_path)
 
 # # create a placeholder for the DB load
-db: kuzu.database.Database = Database()
+db: kuzu.Database | None = None
+
+# create a placeholder for the shared Kuzu connection pool
+kuzu_pool: KuzuConnectionPool | None = None
+
+# create the Kuzu query result cache
+kuzu_result_cache: ResultCache = ResultCache.from_env()
+
+# create the store for paged Kuzu results
+kuzu_cursors: CursorStore = CursorStore.from_env()
+
+# create a placeholder for the shared async Memgraph driver
+mg_driver: AsyncDriver | None = None
+
+# create the pooled Falkor client, its capabilities are checked at startup
+falkor_client: FalkorClient = FalkorClient.from_env()
+
+# the engine name -> backend map used by the generic endpoints, filled in at startup
+graph_backends: dict = {}
+
+# create the manager for the background load jobs
+load_jobs: LoadJobManager = LoadJobManager.from_env()
+
+# the Kuzu startup state reported by the readiness endpoint
+kuzu_status: dict = {'ready': False, 'db_loaded': False, 'warmup_seconds': None, 'error': None}
+
+
+async def warm_up_kuzu():
+    """
+    warms the Kuzu buffer pool in the background and flips readiness once it is done.
+
+    :return:
+    """
+    try:
+        # pre-touch the hot tables
+        kuzu_status['warmup_seconds'] = await warm_up_kuzu_db(kuzu_pool, logger)
+    except Exception as e:
+        # the DB is still usable, just not warm
+        kuzu_status['error'] = f'Warm-up failed: {str(e)}'
+
+        logger.exception('Error: Kuzu warm-up failed.')
+    finally:
+        kuzu_status['ready'] = True
+
+
+async def expire_kuzu_cursors():
+    """
+    periodically closes the Kuzu cursors that have been idle too long.
+
+    :return:
+    """
+    while True:
+        await asyncio.sleep(max(kuzu_cursors.idle_timeout / 4, 1))
+
+        kuzu_cursors.expire()
+
+
+async def check_falkor():
+    """
+    checks the Falkor server capabilities in the background so the load paths can use the cached result.
+
+    :return:
+    """
+    # check the server
+    capabilities: dict = await asyncio.to_thread(falkor_client.check_capabilities)
+
+    if capabilities['reachable'] and capabilities['graph_module']:
+        logger.info('Falkor server available: %s', capabilities)
+    else:
+        logger.warning('Falkor server not available: %s', capabilities)
 
 
 @asynccontextmanager
@@ -42,40 +132,163 @@ async def lifespan(APP: FastAPI):
     :param APP:
     :return:
     """
+    # grab the db, pool and driver variables created above
+    global db, kuzu_pool, mg_driver
+
+    # init the warm-up task
+    warmup_task = None
+
+    # create the load workers before anything else starts threads, they are forked from this process
+    start_load_pool()
 
     try:
-        # get the path to the DB
-        db_path: str = os.getenv('KUZU_DB_PATH', 'D:/dvols/graph-eval/ctd_data/ctd-kuzu-db')  # os.path.dirname(__file__)
+        # load the DB
+        db = open_kuzu_db(logger)
 
-        logger.info(f'Now loading Kuzu DB: {db_path}')
+        # create the connection pool shared by the Kuzu endpoints
+        kuzu_pool = KuzuConnectionPool.from_env(db)
 
-        # grab the db variable created above
-        global db
+        # anything cached came from a previous DB load
+        kuzu_result_cache.invalidate()
+    except Exception as e:
+        # don't come up half-initialized
+        logger.exception('Error: failed to attach to the DB')
 
-        # load the DB
-        db = kuzu.Database(str(db_path))
+        raise e
+
+    kuzu_status['db_loaded'] = True
 
-        logger.info("Kuzu DB loaded.")
+    logger.info("Kuzu DB loaded. Connection pool: %s", kuzu_pool.get_stats())
 
+    # close abandoned cursors in the background
+    cursor_task = asyncio.create_task(expire_kuzu_cursors())
+
+    # check the Falkor server once, Falkor isn't needed for the server to start
+    falkor_task = asyncio.create_task(check_falkor())
+
+    # create the Memgraph driver shared by the Memgraph query endpoint, it connects on first use
+    mg_driver = create_mg_driver()
+
+    # wrap each engine's shared pool for the generic endpoints
+    graph_backends.update(get_graph_backends(db, kuzu_pool, mg_driver, falkor_client))
+
+    # warm the buffer pool without holding up startup
+    if os.getenv('KUZU_WARMUP', 'true').lower() in ('true', '1', 'yes'):
+        warmup_task = asyncio.create_task(warm_up_kuzu())
+    else:
+        kuzu_status['ready'] = True
+
+    try:
         # wait for shutdown
         yield
-    except Exception as e:
-        logger.exception('Error: failed to attach to the DB', e)
     finally:
+        # stop any warm-up still in progress
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
+
+            await asyncio.gather(warmup_task, return_exceptions=True)
+
+        # stop the cursor expiry and close the open cursors
+        cursor_task.cancel()
+
+        await asyncio.gather(cursor_task, return_exceptions=True)
+
+        kuzu_cursors.close_all()
+
+        graph_backends.clear()
+
+        # make sure the Falkor check is done before closing its connections
+        await asyncio.gather(falkor_task, return_exceptions=True)
+
+        falkor_client.close()
+
+        await mg_driver.close()
+
+        mg_driver = None
+
         # release resources
+        kuzu_pool.close()
+
+        stop_load_pool()
+
+        kuzu_result_cache.invalidate()
+
+        kuzu_status.update({'ready': False, 'db_loaded': False})
+
+        kuzu_pool = None
         db = None
 
 # declare the FastAPI details
-APP = FastAPI(title='Graph DB evaluation', version=app_version)  #, lifespan=lifespan
+APP = FastAPI(title='Graph DB evaluation', version=app_version, lifespan=lifespan)
 
 # declare app access details
 APP.add_middleware(CORSMiddleware, allow_origins=['*'], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 
 
 @APP.get('/run_kuzu_cypher_query', status_code=200, response_model=None)
-async def run_kuzu_cypher_query(query: str) -> PlainTextResponse:
+async def run_kuzu_cypher_query(request: Request, query: str | None = None, fmt: str = Query('text', alias='format'), batch_size: int = 10000,
+                                limit: int | None = None, cursor: str | None = None,
+                                timeout: float | None = None) -> PlainTextResponse | StreamingResponse | Response:
     """
     Executes a CYPHER command on a Kuzu DB and returns the result.
+
+    format=text returns the legacy text table. format=arrow|ndjson|csv streams the
+    result back in batches of batch_size rows as they are pulled from Kuzu.
+
+    limit=N returns the first N rows as a JSON page with a cursor for the rest of the result.
+    Pass cursor (and optionally limit) without a query to get the next page.
+
+    timeout is the query timeout in seconds (0 = none), the QUERY_TIMEOUT setting is used if not passed.
+    The query is cancelled if the client disconnects before it finishes.
+    """
+    # continue paging through an open cursor
+    if cursor is not None:
+        return await get_kuzu_cursor_page(cursor, limit)
+
+    # a query is needed for anything else
+    if query is None:
+        return PlainTextResponse(content='Exception: A query or a cursor is required.', status_code=400, media_type="text/plain")
+
+    # return to the caller
+    return await run_kuzu_request(request, query, None, fmt, batch_size, limit, timeout)
+
+
+@APP.get('/run_kuzu_parameterized_query', status_code=200, response_model=None)
+async def run_kuzu_parameterized_query(request: Request, query_template: str, parameters: str = '{}', fmt: str = Query('text', alias='format'),
+                                       batch_size: int = 10000, limit: int | None = None,
+                                       timeout: float | None = None) -> PlainTextResponse | StreamingResponse | Response:
+    """
+    Executes a parameterized CYPHER template on a Kuzu DB and returns the result.
+
+    parameters is a JSON object of the $ parameter values, e.g. query_template=MATCH (n:Node {id: $id}) RETURN n
+    and parameters={"id": "CHEBI:1234"}. The prepared template is cached so repeat calls skip parsing and planning.
+    """
+    try:
+        # get the parameter map
+        params: dict = json.loads(parameters)
+
+        if not isinstance(params, dict):
+            raise ValueError('parameters must be a JSON object.')
+    except ValueError as e:
+        return PlainTextResponse(content=f'Exception: Invalid parameters. {str(e)}', status_code=400, media_type="text/plain")
+
+    # return to the caller
+    return await run_kuzu_request(request, query_template, params, fmt, batch_size, limit, timeout)
+
+
+async def run_kuzu_request(request: Request, query: str, parameters: dict | None, fmt: str, batch_size: int,
+                           limit: int | None = None, timeout: float | None = None) -> PlainTextResponse | StreamingResponse | Response:
+    """
+    runs a Kuzu query for the query endpoints and builds the response.
+
+    :param request:
+    :param query:
+    :param parameters:
+    :param fmt:
+    :param batch_size:
+    :param limit: page size, returns a JSON page and cursor when set
+    :param timeout:
+    :return:
     """
     # init the returned HTML status code
     status_code = 200
@@ -83,25 +296,140 @@ async def run_kuzu_cypher_query(query: str) -> PlainTextResponse:
     # init the returned data
     ret_val: str = ""
 
+    # make sure this is a format we can produce
+    if fmt != 'text' and fmt not in STREAM_MEDIA_TYPES:
+        return PlainTextResponse(content=f'Exception: Invalid format: {fmt}. Use one of text, {", ".join(STREAM_MEDIA_TYPES)}.',
+                                 status_code=400, media_type="text/plain")
+
+    # only queries that just read data can be cached
+    cacheable: bool = ResultCache.is_cacheable(query)
+
+    # init the result cache key
+    cache_key: str | None = None
+
+    # results are only saved if nothing invalidated the cache while the query ran
+    cache_generation: int = kuzu_result_cache.generation
+
+    # pages are tied to a cursor so they are never cached
+    if kuzu_result_cache.enabled and cacheable and limit is None:
+        cache_key = ResultCache.make_key(query, parameters, fmt)
+
+        # look for the result in the cache
+        cached = kuzu_result_cache.get(cache_key)
+
+        if cached is not None:
+            logger.info("Result cache hit: %s", query)
+
+            return PlainTextResponse(content=cached, status_code=status_code, media_type="text/plain", headers={'X-Cache': 'HIT'}) if fmt == 'text' \
+                else StreamingResponse(iter(cached), media_type=STREAM_MEDIA_TYPES[fmt], headers={'X-Cache': 'HIT'})
+
+    # send back a streamed response if requested, this goes through the Kuzu backend like the generic endpoint
+    if limit is None and fmt != 'text':
+        return await stream_backend_query(request, get_backend('kuzu'), query, parameters, fmt, batch_size, timeout, cache_key, cache_generation)
+
     # # start collecting data
     try:
-        # grab the global variable above
-        global db
+        # send back the first page and a cursor if requested
+        if limit is not None:
+            response = await run_until_disconnect(request, open_kuzu_cursor(kuzu_pool, query, parameters, limit, timeout))
+
+            # the query may have changed the DB
+            if not cacheable:
+                kuzu_result_cache.invalidate()
 
-        # create a DB and a connection to it
-        db_conn = kuzu.AsyncConnection(db)
+            return response
 
-        # submit the query and get some data
-        ret_val: str = await get_kuzu_data(db_conn, query)
+        # submit the query to the shared pool and get some data
+        ret_val: str = await run_until_disconnect(request, get_kuzu_data(kuzu_pool, query, parameters, timeout))
 
-        # log the result
+        # log the result, the logger cuts it short past LOG_MAX_MESSAGE_LENGTH
         logger.info("Result: %s", ret_val)
 
+        # save the result for next time
+        if cache_key is not None:
+            kuzu_result_cache.put(cache_key, ret_val, len(ret_val.encode()), cache_generation)
+
+        # the query may have changed the DB
+        if not cacheable:
+            kuzu_result_cache.invalidate()
+
     except Exception as e:
+        return get_query_error_response('kuzu', query, e)
+
+    # return to the caller
+    return PlainTextResponse(content=ret_val, status_code=status_code, media_type="text/plain")
+
+
+def get_backend(engine: str) -> GraphBackend | None:
+    """
+    gets the backend of an engine.
+
+    :param engine: kuzu, memgraph or falkor
+    :return: the backend, or None if there is no such engine
+    """
+    # return to the caller
+    return graph_backends.get(engine)
+
+
+def get_query_error_response(engine: str, query, error: Exception) -> PlainTextResponse:
+    """
+    gets the error response of a query that failed before any rows were sent. call this from the except block.
+
+    :param engine:
+    :param query: the query or queries, for the log
+    :param error:
+    :return:
+    """
+    if isinstance(error, QueryTimeoutError):
+        # return a timed out message
+        ret_val: str = f'Exception: Query timed out. {str(error)}'
+
+        logger.warning('%s query timed out: %s', engine, query)
+
+        # set the status to a gateway timeout
+        status_code = 504
+
+    elif isinstance(error, ClientDisconnectedError):
+        # nobody is listening, but note it
+        ret_val: str = f'Exception: {str(error)}'
+
+        logger.info('%s query cancelled, client disconnected: %s', engine, query)
+
+        # client closed request
+        status_code = 499
+
+    elif isinstance(error, ResultTooLargeError):
+        # return a too big message
+        ret_val: str = f'Exception: Result too large. {str(error)}'
+
+        logger.warning('%s result too large: %s', engine, query)
+
+        # let the caller know to page or stream instead
+        status_code = 413
+
+    elif isinstance(error, (KuzuPoolTimeoutError, CursorStoreFullError)):
+        # return a busy message
+        ret_val: str = f'Exception: Server busy. {str(error)}'
+
+        logger.warning('%s saturated: %s', engine, str(error))
+
+        # let the caller know to try again later
+        status_code = 503
+
+    elif isinstance(error, BackendUnavailableError):
+        # return an unavailable message
+        ret_val: str = f'Exception: Request failure. {str(error)}'
+
+        logger.warning('%s unavailable: %s', engine, str(error))
+
+        # let the caller know to try again later
+        status_code = 503
+
+    else:
         # return a failure message
-        ret_val: str = f'Exception: Request failure. {str(e)}'
+        ret_val: str = f'Exception: Request failure. {str(error)}'
 
-        logger.exception('Exception: Request failure.', e)
+        logger.exception('Exception: Request failure.')
 
         # set the status to a server error
         status_code = 500
@@ -110,29 +438,266 @@ async def run_kuzu_cypher_query(query: str) -> PlainTextResponse:
     return PlainTextResponse(content=ret_val, status_code=status_code, media_type="text/plain")
 
 
-async def get_kuzu_data(conn, query: str) -> str:
+async def stream_backend_query(request: Request, backend: GraphBackend, query: str, parameters: dict | None, fmt: str, batch_size: int,
+                               timeout: float | None, cache_key: str | None = None, cache_generation: int = 0) -> Response:
+    """
+    starts a query on a backend and streams the rows back, the same way for every engine.
+
+    errors before the first row get an error status. Kuzu reads are saved in the result cache as they are sent
+    when there is a cache key, and Kuzu writes clear the cache once they are done.
+
+    :param request:
+    :param backend:
+    :param query:
+    :param parameters:
+    :param fmt: one of the backend's stream formats
+    :param batch_size: the number of rows serialized per chunk of the stream
+    :param timeout: the query timeout in seconds, 0 is no timeout, the QUERY_TIMEOUT default is used if not set
+    :param cache_key: the result cache key, if the result can be cached
+    :param cache_generation: the cache generation when the query was received
+    :return:
+    """
+    try:
+        # create a timer for the time to the first row
+        t = Timer(name="results", logger=None)
+
+        with t:
+            # start the query, errors before the first row still get an error status
+            stream, resources = await run_until_disconnect(request, backend.stream(query, parameters, fmt, batch_size, timeout))
+
+        logger.info("%s query (%s) started in %ss: %s", backend.name, fmt, round(t.last, 4), query)
+
+        # capture the stream into the cache as it is sent
+        if cache_key is not None:
+            stream = cache_stream(kuzu_result_cache, cache_key, cache_generation, stream)
+        elif backend.name == 'kuzu' and not ResultCache.is_cacheable(query):
+            # the query may have changed the data, clear the cache once it is done
+            stream = invalidate_after_stream(kuzu_result_cache, stream)
+
+        # return to the caller
+        # the response releases the connection and finishes the metrics even if the client leaves before the stream starts
+        return ReleasingStreamingResponse(stream, resources, media_type=STREAM_MEDIA_TYPES[fmt])
+
+    except Exception as e:
+        return get_query_error_response(backend.name, query, e)
+
+
+@APP.get('/ready', status_code=200, response_model=None)
+async def ready() -> JSONResponse:
+    """
+    Readiness check. Returns 200 only once the Kuzu DB is loaded and warmed up.
+    """
+    # return to the caller
+    return JSONResponse(content=kuzu_status, status_code=200 if kuzu_status['ready'] else 503)
+
+
+async def open_kuzu_cursor(pool: KuzuConnectionPool, query: str, parameters: dict | None, limit: int, timeout: float = None) -> Response:
+    """
+    runs the Kuzu query and returns the first page of rows, the rest of the result is kept under a cursor.
+
+    :param pool:
+    :param query:
+    :param parameters:
+    :param limit:
+    :param timeout:
+    :return:
+    """
+    logger.info("Paged query (limit %s): %s, parameters: %s", limit, query, parameters)
+
+    # make the call to execute the query on a pooled connection
+    result = await pool.run(query, parameters, timeout)
+
+    # the result survives its connection going back to the pool, so save it as a cursor
+    cursor_id: str = kuzu_cursors.open(result)
+
+    # return to the caller
+    return await get_kuzu_cursor_page(cursor_id, limit)
+
+
+async def get_kuzu_cursor_page(cursor_id: str, limit: int | None) -> Response | PlainTextResponse:
+    """
+    gets the next page of rows from an open Kuzu cursor.
+
+    :param cursor_id:
+    :param limit:
+    :return:
+    """
+    # get the cursor
+    cursor = kuzu_cursors.get(cursor_id)
+
+    if cursor is None:
+        return PlainTextResponse(content=f'Exception: Cursor {cursor_id} not found or expired.', status_code=404, media_type="text/plain")
+
+    # default the page size to the row limit
+    limit = kuzu_cursors.max_rows if limit is None else max(limit, 1)
+
+    # only one request can read the cursor at a time
+    async with cursor.lock:
+        # pull the page in a worker thread
+        rows: list = await kuzu_pool.run_in_executor(kuzu_cursors.fetch_page, cursor, limit)
+
+        # check if there is anything left
+        has_more: bool = await kuzu_pool.run_in_executor(cursor.result.has_next)
+
+    # release the result once it is drained
+    if not has_more:
+        kuzu_cursors.close(cursor_id)
+
+    # build the page
+    page: dict = {'cursor': cursor_id if has_more else None, 'columns': cursor.columns, 'rows': rows, 'row_count': len(rows),
+                  'rows_sent': cursor.rows_sent, 'total_rows': cursor.total_rows, 'has_more': has_more}
+
+    # return to the caller
+    return Response(content=json.dumps(page, default=str), status_code=200, media_type="application/json")
+
+
+@APP.get('/kuzu_cursor_status', status_code=200, response_model=None)
+async def kuzu_cursor_status() -> JSONResponse:
+    """
+    Returns the open Kuzu cursor details.
+    """
+    # return to the caller
+    return JSONResponse(content=kuzu_cursors.get_stats(), status_code=200)
+
+
+@APP.get('/kuzu_result_cache_status', status_code=200, response_model=None)
+async def kuzu_result_cache_status(clear: bool = False) -> JSONResponse:
+    """
+    Returns the Kuzu result cache details. clear=true drops every cached result first.
+    """
+    # clear the cache if requested
+    if clear:
+        kuzu_result_cache.invalidate()
+
+    # return to the caller
+    return JSONResponse(content=kuzu_result_cache.get_stats(), status_code=200)
+
+
+@APP.get('/kuzu_pool_status', status_code=200, response_model=None)
+async def kuzu_pool_status() -> JSONResponse:
+    """
+    Returns the Kuzu connection pool saturation details.
+    """
+    # no pool means the DB was never loaded
+    if kuzu_pool is None:
+        return JSONResponse(content={'error': 'Kuzu connection pool not initialized.'}, status_code=503)
+
+    # return to the caller
+    return JSONResponse(content=kuzu_pool.get_stats(), status_code=200)
+
+
+@APP.get('/metrics', status_code=200, response_model=None)
+async def get_metrics() -> Response:
+    """
+    Returns the server metrics in the Prometheus text format.
+
+    These are the per-engine query latency histograms, rows returned, bytes serialized and active queries, the
+    connection pool usage and waits, the per-chunk load throughput and the dropped and truncated log records.
+    """
+    # get the current pool usage
+    if kuzu_pool is not None:
+        stats: dict = kuzu_pool.get_stats()
+
+        POOL_CONNECTIONS.set(stats['in_use'], engine='kuzu', state='in_use')
+        POOL_CONNECTIONS.set(stats['pool_size'] - stats['in_use'], engine='kuzu', state='idle')
+        POOL_CONNECTIONS.set(stats['pool_size'], engine='kuzu', state='max')
+        POOL_WAITING.set(stats['waiting'], engine='kuzu')
+
+    for engine, usage in (('memgraph', get_mg_pool_usage(mg_driver)), ('falkor', falkor_client.get_pool_usage())):
+        for state, count in usage.items():
+            POOL_CONNECTIONS.set(count, engine=engine, state=state)
+
+    # get the number of load jobs in each state
+    statuses: list = [job.status for job in list(load_jobs.jobs.values())]
+
+    for status in ('queued', 'running', 'completed', 'failed'):
+        LOAD_JOBS.set(statuses.count(status), status=status)
+
+    # get the log records waiting to be written
+    if LoggingUtil.listener is not None:
+        LOG_QUEUE_DEPTH.set(LoggingUtil.listener.queue.qsize())
+
+    # return to the caller
+    return Response(content=METRICS.render(), status_code=200, media_type=METRICS_MEDIA_TYPE)
+
+
+async def get_kuzu_data(pool: KuzuConnectionPool, query: str, parameters: dict = None, timeout: float = None) -> str:
     """
     gets the Kuzu data results using the CYPHER query passed.
 
-    :param conn:
+    :param pool:
     :param query:
+    :param parameters:
+    :param timeout:
     :return:
     """
-    logger.info("Query: %s", query)
+    logger.info("Query: %s, parameters: %s", query, parameters)
 
     # create a timer for query duration
-    t = Timer(name="results", text="Results gathered in {:.4f}s")
+    t = Timer(name="results", logger=None)
+
+    with QueryMetrics('kuzu', 'text') as metrics:
+        # use the timer
+        with t:
+            # make the call to execute the query on a pooled connection
+            response = await pool.run(query, parameters, timeout)
+
+        # build the table off the event loop, the job is shielded so it always gets to close the result
+        num_rows, table = await asyncio.shield(pool.run_in_executor(get_kuzu_table, response))
 
-    # use the timer
-    with t:
-        # make the call to execute the query
-        response = await conn.execute(query)
+        # get the result text
+        ret_val: str = "Elapsed time: " + str(round(t.last, 4)) + "s" + table
 
-    # get the query result
-    result = response.get_as_df()
+        # don't send a result past the byte guard
+        if len(ret_val) > kuzu_cursors.max_bytes:
+            raise ResultTooLargeError(f'{len(ret_val)} bytes is over the {kuzu_cursors.max_bytes} byte limit. Use limit or a streamed format.')
+
+        metrics.add(num_rows, ret_val)
 
     # return the result
-    return "Elapsed time: " + str(round(t.last, 4)) + "s" + result.to_string()
+    return ret_val
+
+
+def get_kuzu_table(result) -> tuple:
+    """
+    pulls a Kuzu result into a text table and closes it. this blocks, so it runs in the pool's executor.
+
+    :param result:
+    :return: the number of rows and the table
+    """
+    try:
+        # get the rows, this stops as soon as the row or byte guard trips
+        rows: list = kuzu_cursors.fetch_all(result)
+
+        # return to the caller
+        return len(rows), pd.DataFrame(rows, columns=result.get_column_names()).to_string()
+    finally:
+        # release the query result
+        result.close()
+
+
+@APP.get('/run_mg_cypher_query', status_code=200, response_model=None)
+async def run_mg_cypher_query(request: Request, query: str, fmt: str = Query('ndjson', alias='format'), batch_size: int = 10000,
+                              timeout: float | None = None) -> PlainTextResponse | StreamingResponse:
+    """
+    Runs Cypher against Memgraph on the shared async Bolt driver, streaming the records in batches as they arrive.
+
+    :param request:
+    :param query:
+    :param fmt: ndjson or csv
+    :param batch_size: the number of records serialized per chunk of the stream
+    :param timeout: the transaction timeout in seconds, 0 is no timeout, the QUERY_TIMEOUT default is used if not set
+    :return:
+    """
+    # get the engine
+    backend: GraphBackend = get_backend('memgraph')
+
+    # check the format
+    if fmt not in backend.stream_formats:
+        return PlainTextResponse(content=f'Exception: Request failure. Unsupported format: {fmt}', status_code=400, media_type="text/plain")
+
+    # return to the caller
+    return await stream_backend_query(request, backend, query, None, fmt, batch_size, timeout)
 
 
 @APP.get('/make_mg_indexes', status_code=200, response_model=None)
@@ -299,7 +864,7 @@ async def make_mg_indexes(drop_first: bool) -> PlainTextResponse:
         # return a failure message
         ret_val: str = f'Exception: Request failure. {str(e)}'
 
-        logger.exception('Exception: Request failure.', e)
+        logger.exception('Exception: Request failure.')
 
         # set the status to a server error
         status_code = 500
@@ -308,10 +873,12 @@ async def make_mg_indexes(drop_first: bool) -> PlainTextResponse:
     return PlainTextResponse(content=ret_val, status_code=status_code, media_type="text/plain")
 
 
-@APP.get('/run_mg_data_load_query', status_code=200, response_model=None)
-async def run_mg_data_load_query(data_dir: str, file_prefix: str, file_counter_start: int, file_counter_end: int) -> PlainTextResponse:
+@APP.get('/run_mg_data_load_query', status_code=202, response_model=None)
+async def run_mg_data_load_query(data_dir: str, file_prefix: str, file_counter_start: int, file_counter_end: int) -> JSONResponse:
     """
-    Executes a commands to load a MemGraph DB.
+    Starts a background job that loads a MemGraph DB with one LOAD CSV query per chunk.
+
+    Poll /load_job_status with the returned job ID for progress.
 
     :param data_dir:
     :param file_prefix:
@@ -319,2265 +886,1289 @@ async def run_mg_data_load_query(data_dir: str, file_prefix: str, file_counter_s
     :param file_counter_end:
     :return:
     """
-    # init the returned HTML status code
-    status_code = 200
-
-    # init the intermediate and return values
-    ret_val: str = ""
+    # return to the caller
+    return submit_csv_load_job('memgraph', execute_csv_import_chunk_memgraph, data_dir, file_prefix, file_counter_start, file_counter_end)
 
-    # init a list for the queries
-    queries: list = []
 
-    # create a timer for query duration
-    t = Timer(name="results", text="Records inserted in {:.4f}s")
+@APP.get('/run_mg_analytical_load', status_code=202, response_model=None)
+async def run_mg_analytical_load(data_dir: str, node_file_counter_start: int, node_file_counter_end: int, edge_file_counter_start: int,
+                                 edge_file_counter_end: int, node_file_prefix: str = 'rk-nodes', edge_file_prefix: str = 'rk-edges') -> JSONResponse:
+    """
+    Starts a background job that bulk loads a MemGraph DB in IN_MEMORY_ANALYTICAL storage mode.
 
-    with t:
-        # this is a non-inclusive range so add 1 to the ending count
-        file_counter_end += 1
+    The job switches the storage mode, creates the Node(id) index the edge matches use, loads the node
+    chunks and then the edge chunks in parallel, and switches back to IN_MEMORY_TRANSACTIONAL. The
+    analytical mode skips the MVCC bookkeeping, so nothing else should be writing during the load.
 
-        # get the number of threads needed
-        num_threads: int = file_counter_end - file_counter_start
+    Poll /load_job_status with the returned job ID for progress and the per-phase timings.
 
-        # get the range of LOAD_CSV queries
-        for i in range(file_counter_start, file_counter_end):
-            queries.append(get_load_query(data_dir, file_prefix, i))
+    :param data_dir:
+    :param node_file_counter_start:
+    :param node_file_counter_end:
+    :param edge_file_counter_start:
+    :param edge_file_counter_end:
+    :param node_file_prefix:
+    :param edge_file_prefix:
+    :return:
+    """
+    # the loaded data makes any cached query results stale
+    kuzu_result_cache.invalidate()
 
-        # start a thread pool
-        with multiprocessing.Pool(num_threads) as pool:
-            # launch each query specified
-            pool.starmap(execute_csv_import_chunk_memgraph, [(q,) for q in queries])
+    # get the chunk counters, these are inclusive ranges
+    node_counters: list = list(range(node_file_counter_start, node_file_counter_end + 1))
+    edge_counters: list = list(range(edge_file_counter_start, edge_file_counter_end + 1))
 
-    msg: str = file_prefix + " import elapsed time: " + str(round(t.last, 4)) + "s"
+    # create the job
+    job = LoadJob('memgraph_analytical', {'data_dir': data_dir, 'node_file_prefix': node_file_prefix,
+                                          'node_file_counter_start': node_file_counter_start, 'node_file_counter_end': node_file_counter_end,
+                                          'edge_file_prefix': edge_file_prefix,
+                                          'edge_file_counter_start': edge_file_counter_start, 'edge_file_counter_end': edge_file_counter_end},
+                  [get_chunk_file_name(data_dir, node_file_prefix, i) for i in node_counters] +
+                  [get_chunk_file_name(data_dir, edge_file_prefix, i) for i in edge_counters])
 
-    logger.info("MemGraph loading results: %s", msg)
+    # start the load
+    load_jobs.submit(job, run_mg_analytical_load_job, data_dir, node_file_prefix, node_counters, edge_file_prefix, edge_counters)
 
     # return to the caller
-    return PlainTextResponse(content=ret_val, status_code=status_code, media_type="text/plain")
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
 
 
-@APP.get('/run_falkor_data_load_query', status_code=200, response_model=None)
-async def run_falkor_data_load_query(data_dir: str, file_prefix: str, file_counter_start: int, file_counter_end: int) -> PlainTextResponse:
+@APP.get('/run_mg_batch_load', status_code=202, response_model=None)
+async def run_mg_batch_load(data_dir: str, file_prefix: str, file_counter_start: int, file_counter_end: int, batch_size: int = 10000,
+                            readers: int = 2, writers: int = 4, queue_depth: int = 8,
+                            fmt: str = Query('csv', alias='format')) -> JSONResponse | PlainTextResponse:
     """
-    Executes a commands to load a MemGraph DB.
+    Starts a background job that loads a MemGraph DB with batched UNWIND queries instead of one LOAD CSV per file.
+
+    The chunks are read by this server, so data_dir must be visible here. readers threads parse the
+    chunks into batch_size row batches and writers threads send them over Bolt, with at most
+    queue_depth batches waiting in between. format is csv, or parquet for chunks staged by /run_parquet_staging.
+
+    Poll /load_job_status with the returned job ID for progress.
 
     :param data_dir:
     :param file_prefix:
     :param file_counter_start:
     :param file_counter_end:
+    :param batch_size:
+    :param readers:
+    :param writers:
+    :param queue_depth:
+    :param fmt:
     :return:
     """
-    # init the returned HTML status code
-    status_code = 200
+    # check the file format
+    if fmt not in ('csv', 'parquet'):
+        return PlainTextResponse(content=f'Exception: Request failure. Unsupported format: {fmt}', status_code=400, media_type="text/plain")
 
-    # init the intermediate and return values
-    ret_val: str = ""
+    # the loaded data makes any cached query results stale
+    kuzu_result_cache.invalidate()
 
-    # init a list for the queries
-    queries: list = []
+    # get the chunks to load, this is an inclusive range
+    file_names: list = [get_chunk_file_name(data_dir, file_prefix, i, fmt) for i in range(file_counter_start, file_counter_end + 1)]
 
-    # create a timer for query duration
-    t = Timer(name="results", text="Records inserted in {:.4f}s")
+    # create the job
+    job = LoadJob('memgraph_batch', {'data_dir': data_dir, 'file_prefix': file_prefix, 'file_counter_start': file_counter_start,
+                                     'file_counter_end': file_counter_end, 'batch_size': batch_size, 'readers': readers, 'writers': writers,
+                                     'queue_depth': queue_depth, 'format': fmt}, file_names)
+
+    # start the load
+    load_jobs.submit(job, run_mg_batch_load_job, MemgraphBatchLoader(batch_size, readers, writers, queue_depth), file_names,
+                     'rk-edges' in file_prefix)
 
-    with t:
-        # this is a non-inclusive range so add 1 to the ending count
-        file_counter_end += 1
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
 
-        # get the number of threads needed
-        num_threads: int = file_counter_end - file_counter_start
 
-        # get the range of LOAD_CSV queries
-        for i in range(file_counter_start, file_counter_end):
-            queries.append(get_load_query(data_dir, file_prefix, i))
+@APP.get('/run_falkor_data_load_query', status_code=202, response_model=None)
+async def run_falkor_data_load_query(data_dir: str, file_prefix: str, file_counter_start: int,
+                                     file_counter_end: int) -> JSONResponse | PlainTextResponse:
+    """
+    Starts a background job that loads a Falkor DB with one LOAD CSV query per chunk.
 
-        # start a thread pool
-        with multiprocessing.Pool(num_threads) as pool:
-            # launch each query specified
-            pool.starmap(execute_csv_import_chunk_falkor, [(q,) for q in queries])
+    Poll /load_job_status with the returned job ID for progress.
 
-    msg: str = file_prefix + " import elapsed time: " + str(round(t.last, 4)) + "s"
+    :param data_dir:
+    :param file_prefix:
+    :param file_counter_start:
+    :param file_counter_end:
+    :return:
+    """
+    # make sure there is a server to load
+    unavailable: PlainTextResponse | None = await get_falkor_unavailable()
 
-    logger.info("Falkor loading results: %s", msg)
+    if unavailable is not None:
+        return unavailable
 
     # return to the caller
-    return PlainTextResponse(content=ret_val, status_code=status_code, media_type="text/plain")
+    return submit_csv_load_job('falkor', execute_csv_import_chunk_falkor, data_dir, file_prefix, file_counter_start, file_counter_end)
 
 
-def execute_csv_import_chunk_memgraph(query):
+@APP.get('/run_falkor_bulk_load', status_code=202, response_model=None)
+async def run_falkor_bulk_load(data_dir: str, node_file_counter_start: int, node_file_counter_end: int, edge_file_counter_start: int,
+                               edge_file_counter_end: int, node_file_prefix: str = 'rk-nodes', edge_file_prefix: str = 'rk-edges',
+                               graph_name: str = 'RK_DB', drop_first: bool = False, batch_size: int = 10000, max_buffer_size: int = 64,
+                               max_token_size: int = 64, max_token_count: int = 1024,
+                               fmt: str = Query('csv', alias='format')) -> JSONResponse | PlainTextResponse:
     """
-    method that executes a query thread
+    Starts a background job that builds a Falkor graph with GRAPH.BULK instead of LOAD CSV queries.
+
+    The chunks are converted to the falkordb-bulk-loader binary format by this server, so data_dir must be
+    visible here. GRAPH.BULK only creates new graphs, set drop_first to replace an existing one.
+    max_buffer_size and max_token_size are in MB. format is csv, or parquet for chunks staged by /run_parquet_staging.
+
+    Poll /load_job_status with the returned job ID for progress, the throughput report is in its result.
+
+    :param data_dir:
+    :param node_file_counter_start:
+    :param node_file_counter_end:
+    :param edge_file_counter_start:
+    :param edge_file_counter_end:
+    :param node_file_prefix:
+    :param edge_file_prefix:
+    :param graph_name:
+    :param drop_first:
+    :param batch_size:
+    :param max_buffer_size:
+    :param max_token_size:
+    :param max_token_count:
+    :param fmt:
+    :return:
+    """
+    # check the file format
+    if fmt not in ('csv', 'parquet'):
+        return PlainTextResponse(content=f'Exception: Request failure. Unsupported format: {fmt}', status_code=400, media_type="text/plain")
+
+    # make sure there is a server to load
+    unavailable: PlainTextResponse | None = await get_falkor_unavailable()
+
+    if unavailable is not None:
+        return unavailable
+
+    # get the chunks to load, these are inclusive ranges
+    node_file_names: list = [get_chunk_file_name(data_dir, node_file_prefix, i, fmt)
+                             for i in range(node_file_counter_start, node_file_counter_end + 1)]
+    edge_file_names: list = [get_chunk_file_name(data_dir, edge_file_prefix, i, fmt)
+                             for i in range(edge_file_counter_start, edge_file_counter_end + 1)]
+
+    # create the job
+    job = LoadJob('falkor_bulk', {'data_dir': data_dir, 'node_file_prefix': node_file_prefix, 'node_file_counter_start': node_file_counter_start,
+                                  'node_file_counter_end': node_file_counter_end, 'edge_file_prefix': edge_file_prefix,
+                                  'edge_file_counter_start': edge_file_counter_start, 'edge_file_counter_end': edge_file_counter_end,
+                                  'graph_name': graph_name, 'drop_first': drop_first, 'batch_size': batch_size, 'max_buffer_size': max_buffer_size,
+                                  'max_token_size': max_token_size, 'max_token_count': max_token_count, 'format': fmt},
+                  node_file_names + edge_file_names)
+
+    # start the load
+    load_jobs.submit(job, run_falkor_bulk_load_job, FalkorBulkLoader(graph_name, batch_size, max_buffer_size, max_token_size, max_token_count),
+                     node_file_names, edge_file_names, drop_first)
+
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
+
+
+@APP.get('/run_kuzu_data_load', status_code=202, response_model=None)
+async def run_kuzu_data_load(data_dir: str, file_prefix: str, file_counter_start: int, file_counter_end: int,
+                             fmt: str = Query('csv', alias='format')) -> JSONResponse | PlainTextResponse:
+    """
+    Starts a background job that loads rk-nodes/rk-edges chunks into the Kuzu DB with COPY FROM.
+
+    The Node/Edge table DDL is generated from the chunk schemas, existing tables get any new columns
+    added. The chunks are read by this server, so data_dir must be visible here and the DB must not be
+    opened read only. format is csv or parquet.
+
+    Poll /load_job_status with the returned job ID for progress.
+
+    :param data_dir:
+    :param file_prefix:
+    :param file_counter_start:
+    :param file_counter_end:
+    :param fmt:
+    :return:
+    """
+    # check the file format
+    if fmt not in ('csv', 'parquet'):
+        return PlainTextResponse(content=f'Exception: Request failure. Unsupported format: {fmt}', status_code=400, media_type="text/plain")
+
+    # get the chunks to load, this is an inclusive range
+    file_names: list = [get_chunk_file_name(data_dir, file_prefix, i, fmt) for i in range(file_counter_start, file_counter_end + 1)]
+
+    # create the job
+    job = LoadJob('kuzu', {'data_dir': data_dir, 'file_prefix': file_prefix, 'file_counter_start': file_counter_start,
+                           'file_counter_end': file_counter_end, 'format': fmt}, file_names)
+
+    # start the load
+    load_jobs.submit(job, run_kuzu_load_job, file_names, fmt, 'rk-edges' in file_prefix)
+
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
+
+
+@APP.get('/load_job_status', status_code=200, response_model=None)
+async def load_job_status(job_id: str | None = None) -> JSONResponse | PlainTextResponse:
+    """
+    Returns the progress of a background load job, or of every known job if no ID is given.
+
+    :param job_id:
+    :return:
+    """
+    # list everything if no job was asked for
+    if job_id is None:
+        return JSONResponse(content=load_jobs.list(), status_code=200)
+
+    # get the job
+    job = load_jobs.get(job_id)
+
+    if job is None:
+        return PlainTextResponse(content=f'Exception: Request failure. Unknown or expired load job: {job_id}', status_code=404,
+                                 media_type="text/plain")
+
+    # return to the caller
+    return JSONResponse(content=job.to_dict(), status_code=200)
+
+
+@APP.get('/run_edge_partition', status_code=202, response_model=None)
+async def run_edge_partition(data_dir: str, file_prefix: str, file_counter_start: int, file_counter_end: int, partitions: int | None = None,
+                             out_prefix: str = 'rk-edges-partitioned') -> JSONResponse:
+    """
+    Starts a background job that reshuffles rk-edges chunks into partitions by subject ID hash.
+
+    The partitions are written next to the chunks as out_prefix-pt1.csv ... out_prefix-ptN.csv. Load them
+    with file_prefix=out_prefix, file_counter_start=1 and file_counter_end=partitions so that each worker
+    gets its own set of subject nodes. partitions defaults to the number of load workers.
+
+    Poll /load_job_status with the returned job ID for progress.
+
+    :param data_dir:
+    :param file_prefix:
+    :param file_counter_start:
+    :param file_counter_end:
+    :param partitions:
+    :param out_prefix:
+    :return:
+    """
+    # one partition per load worker keeps every worker busy
+    if partitions is None:
+        partitions = get_load_pool_size()
+
+    # the partitioner reads and writes the chunks locally
+    local_dir: str = os.getenv('LOAD_DATA_LOCAL_DIR', data_dir)
+
+    # get the chunks to reshuffle, this is an inclusive range
+    file_names: list = [get_chunk_file_name(local_dir, file_prefix, i) for i in range(file_counter_start, file_counter_end + 1)]
+
+    # create the job
+    job = LoadJob('edge_partition', {'data_dir': data_dir, 'file_prefix': file_prefix, 'file_counter_start': file_counter_start,
+                                     'file_counter_end': file_counter_end, 'partitions': partitions, 'out_prefix': out_prefix},
+                  [get_chunk_file_name(local_dir, out_prefix, i + 1) for i in range(max(partitions, 1))])
+
+    # start the reshuffle
+    load_jobs.submit(job, run_edge_partition_job, file_names, local_dir, out_prefix, max(partitions, 1))
+
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
+
+
+@APP.get('/run_falkor_cypher_query', status_code=200, response_model=None)
+async def run_falkor_cypher_query(request: Request, query: list[str] = Query(...), graph_name: str = 'RK_DB',
+                                  fmt: str = Query('ndjson', alias='format'), batch_size: int = 10000,
+                                  timeout: float | None = None) -> PlainTextResponse | StreamingResponse:
+    """
+    Runs read-only Cypher against a Falkor graph with GRAPH.RO_QUERY on the pooled client.
+
+    Repeat the query parameter to send a batch, the batch is pipelined over one connection. ndjson streams
+    one row per line, a batch tags each line with its query index and reports failed queries inline.
+    text returns a table per query.
+
+    :param request:
+    :param query:
+    :param graph_name:
+    :param fmt: ndjson or text
+    :param batch_size: the number of rows serialized per chunk of the stream
+    :param timeout: the per query timeout in seconds, 0 is no timeout, the QUERY_TIMEOUT default is used if not set
+    :return:
+    """
+    # check the format
+    if fmt not in ('ndjson', 'text'):
+        return PlainTextResponse(content=f'Exception: Request failure. Unsupported format: {fmt}', status_code=400, media_type="text/plain")
 
-    :param query:
-    :return:
-    """
     try:
-        # get the host name:port and auth (none)
-        host_name = f"bolt://{os.getenv('MEMGRAPH_DB_HOST', 'localhost')}:{os.getenv('MEMGRAPH_DB_PORT', '7687')}"
-        auth = ("", "")
+        # create a timer for query duration
+        t = Timer(name="results", logger=None)
 
-        # connect to the DB
-        driver = GraphDatabase.driver(host_name, auth=auth)
+        with t:
+            # a single query's errors fail the request, a batch reports them inline
+            results: list = await run_until_disconnect(request, get_backend('falkor').execute_read(query, graph_name, timeout, max(batch_size, 1)))
 
-        # get a session to the DB
-        with driver.session() as session:
-            # execute the LOAD_CSV query
-            session.run(query)
+        logger.info("Falkor queries: %s, elapsed time: %ss", len(query), round(t.last, 4))
+
+        if fmt == 'ndjson':
+            return StreamingResponse(stream_falkor_results(results, len(query) > 1), media_type=STREAM_MEDIA_TYPES['ndjson'])
+
+        # init the table per query
+        tables: list = []
+
+        for result in results:
+            if isinstance(result, Exception):
+                tables.append(f'Exception: {str(result)}')
+            else:
+                tables.append(pd.DataFrame([row async for rows in result.batches for row in rows], columns=result.columns).to_string())
+
+        # return to the caller
+        return PlainTextResponse(content="Elapsed time: " + str(round(t.last, 4)) + "s\n" + '\n\n'.join(tables), status_code=200,
+                                 media_type="text/plain")
 
     except Exception as e:
-        logger.exception("Failed to execute transaction")
-        raise e
+        return get_query_error_response('falkor', query, e)
+
+
+async def stream_falkor_results(results: list, is_batch: bool):
+    """
+    streams Falkor query results as NDJSON a batch at a time, serializing off the event loop.
+
+    :param results: a BackendResult or exception per query
+    :param is_batch: tag each line with its query index
+    :return:
+    """
+    def serialize(index: int, columns: list, rows: list) -> bytes:
+        """
+        serializes a set of rows
+        """
+        if is_batch:
+            return ''.join(json.dumps({'query': index, 'row': dict(zip(columns, row))}, default=str) + '\n' for row in rows).encode()
+
+        return serialize_batch('ndjson', columns, rows)
+
+    for index, result in enumerate(results):
+        # report a failed batch query in its place
+        if isinstance(result, Exception):
+            yield (json.dumps({'query': index, 'error': str(result)}) + '\n').encode()
+            continue
+
+        async for rows in result.batches:
+            yield await asyncio.to_thread(serialize, index, result.columns, rows)
+
+
+@APP.get('/falkor_status', status_code=200, response_model=None)
+async def falkor_status(refresh: bool = False) -> JSONResponse:
+    """
+    Returns the cached Falkor server capabilities and connection pool settings.
+
+    :param refresh: check the server again
+    :return:
+    """
+    # get the capabilities, checking the server if it hasn't been yet
+    capabilities: dict = falkor_client.capabilities if falkor_client.capabilities is not None and not refresh else \
+        await asyncio.to_thread(falkor_client.check_capabilities, refresh)
 
+    # return to the caller
+    return JSONResponse(content={**capabilities, 'max_connections': falkor_client.pool.max_connections}, status_code=200)
+
+
+async def get_falkor_unavailable() -> PlainTextResponse | None:
+    """
+    checks the cached Falkor capabilities, rechecking the server if it wasn't reachable.
 
-def execute_csv_import_chunk_falkor(query):
+    :return: a failure response if Falkor can't be used, otherwise None
     """
-    method that executes a query thread
+    # get the capabilities, this only goes to the server if the last check failed
+    capabilities: dict = await asyncio.to_thread(falkor_client.check_capabilities)
 
+    if not capabilities['reachable']:
+        return PlainTextResponse(content=f"Exception: Request failure. Falkor server unavailable: {capabilities['error']}", status_code=503,
+                                 media_type="text/plain")
+
+    if not capabilities['graph_module']:
+        return PlainTextResponse(content='Exception: Request failure. The falkordb module is not loaded on the server.', status_code=503,
+                                 media_type="text/plain")
+
+    # return to the caller
+    return None
+
+
+@APP.get('/run_cypher_query', status_code=200, response_model=None)
+async def run_cypher_query(request: Request, engine: str, query: str, parameters: str = '{}', fmt: str = Query('ndjson', alias='format'),
+                           batch_size: int = 10000, timeout: float | None = None) -> PlainTextResponse | StreamingResponse:
+    """
+    Runs Cypher on any engine (kuzu, memgraph or falkor) and streams the rows back as ndjson or csv.
+
+    The timeout and client disconnect cancellation are the same for every engine, so the engines can be
+    compared like for like. parameters is a JSON object of the $ parameter values. Only Kuzu results are
+    cached, it is the only engine whose writes all go through this server.
+
+    :param request:
+    :param engine:
     :param query:
+    :param parameters:
+    :param fmt: ndjson or csv
+    :param batch_size: the number of rows serialized per chunk of the stream
+    :param timeout: the query timeout in seconds, 0 is no timeout, the QUERY_TIMEOUT default is used if not set
+    :return:
+    """
+    # get the engine
+    backend: GraphBackend | None = get_backend(engine)
+
+    if backend is None:
+        return PlainTextResponse(content=f'Exception: Request failure. Unknown engine: {engine}. Use one of {", ".join(graph_backends)}.',
+                                 status_code=400, media_type="text/plain")
+
+    # check the format
+    if fmt not in BACKEND_FORMATS:
+        return PlainTextResponse(content=f'Exception: Request failure. Unsupported format: {fmt}', status_code=400, media_type="text/plain")
+
+    try:
+        # get the parameter map
+        params: dict = json.loads(parameters)
+
+        if not isinstance(params, dict):
+            raise ValueError('parameters must be a JSON object.')
+    except ValueError as e:
+        return PlainTextResponse(content=f'Exception: Invalid parameters. {str(e)}', status_code=400, media_type="text/plain")
+
+    # only reads can be cached, and only from Kuzu, the other servers can be written to by anything
+    cacheable: bool = engine == 'kuzu' and ResultCache.is_cacheable(query)
+
+    # the engine is part of the key
+    cache_key: str | None = ResultCache.make_key(query, params, f'{engine}/{fmt}') if kuzu_result_cache.enabled and cacheable else None
+
+    # results are only saved if nothing invalidated the cache while the query ran
+    cache_generation: int = kuzu_result_cache.generation
+
+    if cache_key is not None:
+        # look for the result in the cache
+        cached = kuzu_result_cache.get(cache_key)
+
+        if cached is not None:
+            logger.info("Result cache hit (%s): %s", engine, query)
+
+            return StreamingResponse(iter(cached), media_type=STREAM_MEDIA_TYPES[fmt], headers={'X-Cache': 'HIT'})
+
+    # return to the caller
+    return await stream_backend_query(request, backend, query, params or None, fmt, batch_size, timeout, cache_key, cache_generation)
+
+
+@APP.get('/run_bulk_load', status_code=202, response_model=None)
+async def run_bulk_load(engine: str, data_dir: str, node_file_counter_start: int, node_file_counter_end: int, edge_file_counter_start: int,
+                        edge_file_counter_end: int, node_file_prefix: str = 'rk-nodes', edge_file_prefix: str = 'rk-edges',
+                        fmt: str = Query('csv', alias='format'), batch_size: int = 10000,
+                        drop_first: bool = False) -> JSONResponse | PlainTextResponse:
+    """
+    Starts a background job that bulk loads the node chunks and then the edge chunks into any engine.
+
+    Each engine uses its fastest load path: COPY FROM for kuzu, batched UNWIND writes for memgraph and
+    GRAPH.BULK for falkor. The chunks are read by this server, so data_dir must be visible here. format is
+    csv, or parquet for chunks staged by /run_parquet_staging. drop_first replaces an existing falkor graph.
+
+    Poll /load_job_status with the returned job ID for progress.
+
+    :param engine:
+    :param data_dir:
+    :param node_file_counter_start:
+    :param node_file_counter_end:
+    :param edge_file_counter_start:
+    :param edge_file_counter_end:
+    :param node_file_prefix:
+    :param edge_file_prefix:
+    :param fmt:
+    :param batch_size:
+    :param drop_first:
+    :return:
+    """
+    # get the engine
+    backend: GraphBackend | None = get_backend(engine)
+
+    if backend is None:
+        return PlainTextResponse(content=f'Exception: Request failure. Unknown engine: {engine}. Use one of {", ".join(graph_backends)}.',
+                                 status_code=400, media_type="text/plain")
+
+    # check the file format
+    if fmt not in backend.load_formats:
+        return PlainTextResponse(content=f'Exception: Request failure. Unsupported format for {engine}: {fmt}', status_code=400,
+                                 media_type="text/plain")
+
+    try:
+        # make sure there is something to load into
+        await backend.connect()
+    except BackendUnavailableError as e:
+        return PlainTextResponse(content=f'Exception: Request failure. {str(e)}', status_code=503, media_type="text/plain")
+
+    # get the chunks to load, these are inclusive ranges
+    node_file_names: list = [get_chunk_file_name(data_dir, node_file_prefix, i, fmt)
+                             for i in range(node_file_counter_start, node_file_counter_end + 1)]
+    edge_file_names: list = [get_chunk_file_name(data_dir, edge_file_prefix, i, fmt)
+                             for i in range(edge_file_counter_start, edge_file_counter_end + 1)]
+
+    # get the load options
+    options: dict = {'format': fmt, 'batch_size': max(batch_size, 1), 'drop_first': drop_first}
+
+    # create the job
+    job = LoadJob(f'{engine}_bulk', {'engine': engine, 'data_dir': data_dir, 'node_file_prefix': node_file_prefix,
+                                     'node_file_counter_start': node_file_counter_start, 'node_file_counter_end': node_file_counter_end,
+                                     'edge_file_prefix': edge_file_prefix, 'edge_file_counter_start': edge_file_counter_start,
+                                     'edge_file_counter_end': edge_file_counter_end, **options}, node_file_names + edge_file_names)
+
+    # start the load
+    load_jobs.submit(job, run_backend_load_job, backend, node_file_names, edge_file_names, options)
+
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
+
+
+@APP.get('/make_indexes', status_code=200, response_model=None)
+async def make_indexes(engine: str, drop_first: bool = False) -> JSONResponse | PlainTextResponse:
+    """
+    Creates the Node(id) index on any engine. Kuzu indexes the id primary key already.
+
+    :param engine:
+    :param drop_first:
     :return:
     """
+    # get the engine
+    backend: GraphBackend | None = get_backend(engine)
+
+    if backend is None:
+        return PlainTextResponse(content=f'Exception: Request failure. Unknown engine: {engine}. Use one of {", ".join(graph_backends)}.',
+                                 status_code=400, media_type="text/plain")
+
     try:
-        # get a connection to the DB
-        redis_conn = redis.from_url('redis://192.168.50.142:6379')
+        # create the indexes
+        statements: list = await backend.create_indexes(drop_first)
+    except BackendUnavailableError as e:
+        return PlainTextResponse(content=f'Exception: Request failure. {str(e)}', status_code=503, media_type="text/plain")
+    except Exception as e:
+        logger.exception('Exception: Request failure.')
+
+        return PlainTextResponse(content=f'Exception: Request failure. {str(e)}', status_code=500, media_type="text/plain")
+
+    # return to the caller
+    return JSONResponse(content={'engine': engine, 'statements': statements}, status_code=200)
+
+
+@APP.get('/backend_status', status_code=200, response_model=None)
+async def backend_status(engine: str | None = None, counts: bool = True) -> JSONResponse | PlainTextResponse:
+    """
+    Returns the pool details and node/edge counts of an engine, or of every engine if none is given.
+
+    :param engine:
+    :param counts: count the nodes and edges
+    :return:
+    """
+    # get the engines to report on
+    if engine is None:
+        backends: list = list(graph_backends.values())
+    elif engine in graph_backends:
+        backends: list = [graph_backends[engine]]
+    else:
+        return PlainTextResponse(content=f'Exception: Request failure. Unknown engine: {engine}. Use one of {", ".join(graph_backends)}.',
+                                 status_code=400, media_type="text/plain")
 
-        # Attempt to connect to the server
+    # init the returned stats
+    ret_val: dict = {}
+
+    for backend in backends:
         try:
-            redis_conn.ping()
-        except redis.exceptions.ConnectionError as e:
-            print("Could not connect to FalkorDB server.")
-            raise e
+            ret_val[backend.name] = await backend.get_stats(counts)
+        except Exception as e:
+            # one engine being down shouldn't hide the others
+            ret_val[backend.name] = {'engine': backend.name, 'error': str(e)}
 
-        # get the host name:port and auth (none)
-        client = FalkorDB.from_url('redis://192.168.50.142:6379')
+    # return to the caller
+    return JSONResponse(content=ret_val if engine is None else ret_val[engine], status_code=200)
+
+
+@APP.get('/run_benchmark', status_code=202, response_model=None)
+async def run_benchmark_workload(workload_file: str, engine: list[str] = Query(None), concurrency: int = 1, warmup: int = 5, iterations: int = 100,
+                                 timeout: float | None = None, out_dir: str | None = None) -> JSONResponse | PlainTextResponse:
+    """
+    Starts a background job that replays a query workload file against the graph engines.
+
+    Each query is run warmup times unrecorded and then iterations times by concurrency clients on each
+    engine, straight through the engine backends so the result cache isn't measured. The latency
+    percentiles and throughput per engine and query are written to out_dir (BENCHMARK_RESULTS_DIR or
+    the workload file's directory by default) as benchmark-<job ID>.json and .parquet.
+
+    Repeat engine to pick the engines, all of them are run if none are given. Poll /load_job_status
+    with the returned job ID for progress, the results are in its result.
+
+    :param workload_file: a JSON list of {"name", "query", "parameters", "engines"}
+    :param engine:
+    :param concurrency:
+    :param warmup:
+    :param iterations:
+    :param timeout: the per query timeout in seconds, 0 is no timeout, the QUERY_TIMEOUT default is used if not set
+    :param out_dir:
+    :return:
+    """
+    # get the engines
+    engines: list = engine or list(graph_backends)
+
+    unknown: list = [name for name in engines if name not in graph_backends]
+
+    if unknown:
+        return PlainTextResponse(content=f'Exception: Request failure. Unknown engine: {", ".join(unknown)}. Use one of {", ".join(graph_backends)}.',
+                                 status_code=400, media_type="text/plain")
+
+    try:
+        # get the queries
+        workload: list = load_workload(workload_file)
+    except Exception as e:
+        return PlainTextResponse(content=f'Exception: Request failure. Invalid workload file. {str(e)}', status_code=400, media_type="text/plain")
+
+    # get the run settings
+    settings: dict = {'workload_file': workload_file, 'engines': engines, 'concurrency': max(concurrency, 1), 'warmup': max(warmup, 0),
+                      'iterations': max(iterations, 1), 'timeout': timeout,
+                      'out_dir': out_dir or os.getenv('BENCHMARK_RESULTS_DIR', os.path.dirname(os.path.abspath(workload_file)))}
+
+    # create the job
+    job = LoadJob('benchmark', settings, [f"{name}:{query['name']}" for name in engines for query in workload
+                                          if not query['engines'] or name in query['engines']])
+
+    # start the run, the queries go through the backends on this event loop
+    load_jobs.submit(job, run_benchmark_job, asyncio.get_running_loop(), [graph_backends[name] for name in engines], workload, settings)
+
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
+
+
+@APP.get('/run_rk_generate', status_code=202, response_model=None)
+async def run_rk_generate(out_dir: str, nodes: int, edges: int, node_prefix: str = 'rk-nodes', edge_prefix: str = 'rk-edges',
+                          node_chunk_rows: int = 1000000, edge_chunk_rows: int = 1000000, seed: int = 0, alpha: float = 1.0,
+                          chebi_columns: int = 200, mondo_columns: int = 100, sparse_density: float = 0.02) -> JSONResponse:
+    """
+    Starts a background job that writes a synthetic RK-shaped graph as rk-nodes/rk-edges CSV chunks.
+
+    The chunks are numbered from 0 (prefix.csv, prefix-pt1.csv, ...) so they can be loaded by counter like
+    the real ones, the counter ranges are in the job result. The node degrees follow a rank ^ -alpha power law,
+    and the CHEBI_ROLE_ and MONDO_SUPERCLASS_ columns are set on sparse_density of the chemical and disease
+    nodes. The same seed and settings always give the same graph.
+
+    Poll /load_job_status with the returned job ID for progress.
+
+    :param out_dir:
+    :param nodes:
+    :param edges:
+    :param node_prefix:
+    :param edge_prefix:
+    :param node_chunk_rows:
+    :param edge_chunk_rows:
+    :param seed:
+    :param alpha:
+    :param chebi_columns:
+    :param mondo_columns:
+    :param sparse_density:
+    :return:
+    """
+    # get the chunks that will be written
+    chunks: list = [get_chunk_file_name(out_dir, node_prefix, i) for i in range(get_chunk_count(nodes, node_chunk_rows))] + \
+                   ([get_chunk_file_name(out_dir, edge_prefix, i) for i in range(get_chunk_count(edges, edge_chunk_rows))] if edges > 0 else [])
+
+    # create the job
+    job = LoadJob('rk_generate', {'out_dir': out_dir, 'nodes': nodes, 'edges': edges, 'node_prefix': node_prefix, 'edge_prefix': edge_prefix,
+                                  'node_chunk_rows': node_chunk_rows, 'edge_chunk_rows': edge_chunk_rows, 'seed': seed, 'alpha': alpha,
+                                  'chebi_columns': chebi_columns, 'mondo_columns': mondo_columns, 'sparse_density': sparse_density}, chunks)
+
+    # start the generation
+    load_jobs.submit(job, run_rk_generate_job, out_dir, nodes, edges, node_prefix, edge_prefix, node_chunk_rows, edge_chunk_rows,
+                     {'seed': seed, 'alpha': alpha, 'chebi_columns': chebi_columns, 'mondo_columns': mondo_columns, 'sparse_density': sparse_density})
+
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
+
+
+@APP.get('/run_parquet_staging', status_code=202, response_model=None)
+async def run_parquet_staging(data_dir: str, file_prefix: str, file_counter_start: int, file_counter_end: int,
+                              out_dir: str | None = None) -> JSONResponse:
+    """
+    Starts a background job that converts rk-nodes/rk-edges CSV chunks into typed Parquet chunks.
+
+    The Parquet chunks keep the CSV chunk names with a .parquet extension and are written to out_dir,
+    data_dir by default. List columns become real lists and the boolean and numeric columns real types,
+    and the empty columns are dropped. Load them with format=parquet on /run_kuzu_data_load,
+    /run_mg_batch_load, /run_falkor_bulk_load or /run_bulk_load.
+
+    Poll /load_job_status with the returned job ID for progress, the size savings are in its result.
+
+    :param data_dir:
+    :param file_prefix:
+    :param file_counter_start:
+    :param file_counter_end:
+    :param out_dir:
+    :return:
+    """
+    # get the CSV chunks and the Parquet chunks they become, this is an inclusive range
+    file_pairs: list = [(get_chunk_file_name(data_dir, file_prefix, i), get_chunk_file_name(out_dir or data_dir, file_prefix, i, 'parquet'))
+                        for i in range(file_counter_start, file_counter_end + 1)]
+
+    # create the job
+    job = LoadJob('parquet_staging', {'data_dir': data_dir, 'file_prefix': file_prefix, 'file_counter_start': file_counter_start,
+                                      'file_counter_end': file_counter_end, 'out_dir': out_dir or data_dir},
+                  [parquet_file_name for _, parquet_file_name in file_pairs])
+
+    # start the conversion
+    load_jobs.submit(job, run_parquet_staging_job, out_dir or data_dir, file_pairs, 'rk-edges' in file_prefix)
+
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
+
+
+@APP.get('/plan_chunks', status_code=200, response_model=None)
+async def plan_load_chunks(data_dir: str, file_prefix: str, workers: int | None = None, target_chunk_mb: int | None = None,
+                           max_chunk_rows: int | None = None, memory_budget_mb: int | None = None) -> JSONResponse | PlainTextResponse:
+    """
+    Works out how many balanced chunks the file_prefix chunks in data_dir should be rewritten as, without writing anything.
+
+    The chunk count is the largest one needed for the workers (the number of load workers by default), the
+    target chunk size, the max rows per chunk and the memory budget (LOAD_MEMORY_BUDGET or half the physical
+    memory by default), rounded up to a multiple of the workers. The rows are estimated from a sample.
+
+    :param data_dir:
+    :param file_prefix:
+    :param workers:
+    :param target_chunk_mb:
+    :param max_chunk_rows:
+    :param memory_budget_mb:
+    :return:
+    """
+    # get the chunks there are now
+    file_names: list = find_chunks(data_dir, file_prefix) if os.path.isdir(data_dir) else []
+
+    if not file_names:
+        return PlainTextResponse(content=f'Exception: Request failure. No {file_prefix} chunks found in {data_dir}', status_code=404,
+                                 media_type="text/plain")
+
+    # plan the chunks off the event loop, this reads a sample of each file
+    plan: dict = await asyncio.to_thread(plan_chunks, file_names, workers or get_load_pool_size(),
+                                         target_chunk_mb * 1_000_000 if target_chunk_mb else None, max_chunk_rows,
+                                         memory_budget_mb * 1_000_000 if memory_budget_mb else None)
+
+    # return to the caller
+    return JSONResponse(content=plan, status_code=200)
+
+
+@APP.get('/run_rechunk', status_code=202, response_model=None)
+async def run_rechunk(data_dir: str, file_prefix: str, workers: int | None = None, target_chunk_mb: int | None = None,
+                      max_chunk_rows: int | None = None, memory_budget_mb: int | None = None, out_dir: str | None = None,
+                      out_prefix: str | None = None) -> JSONResponse | PlainTextResponse:
+    """
+    Starts a background job that rewrites the file_prefix chunks in data_dir as balanced chunks sized by /plan_chunks.
+
+    The rows are counted exactly before planning. The chunks are written as out_prefix-pt1.csv ... out_prefix-ptN.csv,
+    in out_dir (data_dir by default) with out_prefix defaulting to file_prefix-rechunked. Load them with
+    file_prefix=out_prefix, file_counter_start=1 and file_counter_end=N from the job result.
+
+    Poll /load_job_status with the returned job ID for progress, the plan is in its result.
+
+    :param data_dir:
+    :param file_prefix:
+    :param workers:
+    :param target_chunk_mb:
+    :param max_chunk_rows:
+    :param memory_budget_mb:
+    :param out_dir:
+    :param out_prefix:
+    :return:
+    """
+    # get the output location
+    out_dir = out_dir or data_dir
+    out_prefix = out_prefix or f'{file_prefix}-rechunked'
+
+    # don't write over the chunks being read
+    if os.path.abspath(out_dir) == os.path.abspath(data_dir) and out_prefix == file_prefix:
+        return PlainTextResponse(content='Exception: Request failure. The rechunked files would overwrite the originals, '
+                                         'use another out_prefix or out_dir.', status_code=400, media_type="text/plain")
+
+    # get the chunks there are now
+    file_names: list = find_chunks(data_dir, file_prefix) if os.path.isdir(data_dir) else []
+
+    if not file_names:
+        return PlainTextResponse(content=f'Exception: Request failure. No {file_prefix} chunks found in {data_dir}', status_code=404,
+                                 media_type="text/plain")
+
+    # get the planning settings
+    settings: dict = {'workers': workers or get_load_pool_size(), 'target_chunk_bytes': target_chunk_mb * 1_000_000 if target_chunk_mb else None,
+                      'max_chunk_rows': max_chunk_rows, 'memory_budget': memory_budget_mb * 1_000_000 if memory_budget_mb else None}
+
+    # create the job, the chunks are only known once the rows are counted
+    job = LoadJob('rechunk', {'data_dir': data_dir, 'file_prefix': file_prefix, 'out_dir': out_dir, 'out_prefix': out_prefix, **settings}, [])
+
+    # start the rewrite
+    load_jobs.submit(job, run_rechunk_job, file_names, out_dir, out_prefix, settings)
+
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
+
+
+def submit_csv_load_job(kind: str, chunk_loader, data_dir: str, file_prefix: str, file_counter_start: int, file_counter_end: int) -> JSONResponse:
+    """
+    starts a background LOAD CSV job over a range of chunks.
+
+    :param kind: the DB being loaded
+    :param chunk_loader: the worker function that runs a chunk's LOAD CSV query
+    :param data_dir:
+    :param file_prefix:
+    :param file_counter_start:
+    :param file_counter_end:
+    :return:
+    """
+    # the loaded data makes any cached query results stale
+    kuzu_result_cache.invalidate()
+
+    # get the chunk counters, this is an inclusive range
+    counters: list = list(range(file_counter_start, file_counter_end + 1))
+
+    # create the job
+    job = LoadJob(kind, {'data_dir': data_dir, 'file_prefix': file_prefix, 'file_counter_start': file_counter_start,
+                         'file_counter_end': file_counter_end},
+                  [get_chunk_file_name(data_dir, file_prefix, i) for i in counters])
+
+    # start the load
+    load_jobs.submit(job, run_csv_load_job, chunk_loader, data_dir, file_prefix, counters)
+
+    # return to the caller
+    return JSONResponse(content={'job_id': job.job_id, 'status_url': f'/load_job_status?job_id={job.job_id}'}, status_code=202)
+
+
+def run_csv_load_job(job: LoadJob, chunk_loader, data_dir: str, file_prefix: str, counters: list):
+    """
+    runs a LOAD CSV job.
+
+    this runs on the job's own thread so the schema scans and the waiting stay off the event loop.
+
+    :param job:
+    :param chunk_loader:
+    :param data_dir:
+    :param file_prefix:
+    :param counters:
+    :return:
+    """
+    # load the chunks
+    load_csv_chunks(job, chunk_loader, data_dir, file_prefix, counters)
+
+    logger.info("%s loading results: %s", job.kind, {k: v for k, v in job.to_dict().items() if k != 'chunks'})
+
+
+def load_csv_chunks(job: LoadJob, chunk_loader, data_dir: str, file_prefix: str, counters: list) -> bool:
+    """
+    hands each chunk's LOAD CSV query to the shared worker pool, records its progress and waits for them all.
+
+    :param job:
+    :param chunk_loader: the worker function that runs a chunk's LOAD CSV query
+    :param data_dir:
+    :param file_prefix:
+    :param counters:
+    :return: True if every chunk loaded
+    """
+    # init the pending chunk results and failure flag
+    results: list = []
+    failed: list = []
+
+    for i in counters:
+        chunk: str = get_chunk_file_name(data_dir, file_prefix, i)
+
+        def on_done(result, chunk=chunk):
+            """
+            records a loaded chunk
+            """
+            rows, elapsed, retries = result
+
+            job.chunk_done(chunk, rows, elapsed, retries)
+            job.add_rows(rows)
+
+        def on_error(e, chunk=chunk):
+            """
+            records a failed chunk
+            """
+            job.chunk_failed(chunk, str(e))
+
+            failed.append(chunk)
+
+        try:
+            # get the chunk's LOAD_CSV query
+            query: str = get_load_query(data_dir, file_prefix, i)
+        except Exception as e:
+            on_error(e)
+            continue
+
+        # hand the chunk to the shared worker pool
+        job.chunk_started(chunk)
+
+        results.append(get_load_pool().apply_async(chunk_loader, (query,), callback=on_done, error_callback=on_error))
+
+    # wait for the chunks to finish
+    for result in results:
+        result.wait()
+
+    # return to the caller
+    return not failed
+
+
+def run_mg_analytical_load_job(job: LoadJob, data_dir: str, node_file_prefix: str, node_counters: list, edge_file_prefix: str, edge_counters: list):
+    """
+    runs a MemGraph analytical mode bulk load, timing each phase.
+
+    :param job:
+    :param data_dir:
+    :param node_file_prefix:
+    :param node_counters:
+    :param edge_file_prefix:
+    :param edge_counters:
+    :return:
+    """
+    def run_phase(phase: str, func, *args):
+        """
+        runs a load phase and records its timing
+        """
+        # note the start
+        start: float = time.perf_counter()
 
-        # Attempt to verify that falkordb module is loaded
         try:
-            module_list = [m[b"name"] for m in redis_conn.module_list()]
-            if b"graph" not in module_list:
-                logger.debug("falkordb module not loaded on connected server.")
+            return func(*args)
+        finally:
+            job.phase_done(phase, time.perf_counter() - start)
+
+    def run_statement(session, query: str):
+        """
+        runs a storage mode or index statement
+        """
+        logger.debug('%s: %s', query, session.run(query).consume().summary_notifications)
 
-        except redis.exceptions.ResponseError:
-            # Ignore check if the connected server does not support the "MODULE LIST" command
-            pass
+    with GraphDatabase.driver(get_memgraph_url(), auth=("", "")) as client:
+        with client.session(database=DEFAULT_DATABASE) as session:
+            # drop the MVCC overhead for the load
+            run_phase('analytical_mode', run_statement, session, 'STORAGE MODE IN_MEMORY_ANALYTICAL')
 
-        key_exists = redis_conn.exists('RK_DB')
-        if key_exists:
-            # logger.debug(query)
+            try:
+                # the edge loads match their endpoints on the node ID
+                run_phase('node_id_index', run_statement, session, 'CREATE INDEX ON :Node(id)')
 
-            # get a client connection to the DB
-            graph = client.select_graph('RK_DB')
+                # load the nodes, the edges can't be matched until they are all there
+                if not run_phase('nodes', load_csv_chunks, job, execute_csv_import_chunk_memgraph, data_dir, node_file_prefix, node_counters):
+                    raise RuntimeError('Node load failed, the edges were not loaded.')
+
+                # load the edges
+                run_phase('edges', load_csv_chunks, job, execute_csv_import_chunk_memgraph, data_dir, edge_file_prefix, edge_counters)
+            finally:
+                # always go back to the transactional mode
+                run_phase('transactional_mode', run_statement, session, 'STORAGE MODE IN_MEMORY_TRANSACTIONAL')
+
+    logger.info("MemGraph analytical loading results: %s", {k: v for k, v in job.to_dict().items() if k != 'chunks'})
+
+
+def run_kuzu_load_job(job: LoadJob, file_names: list, fmt: str, is_edges: bool) -> dict:
+    """
+    runs a Kuzu COPY FROM load job on its own connection.
+
+    :param job:
+    :param file_names:
+    :param fmt:
+    :param is_edges:
+    :return:
+    """
+    # get the load's own connection
+    conn = kuzu.Connection(db)
+
+    try:
+        # load the chunks
+        ret_val: dict = load_kuzu_chunks(conn, file_names, fmt, is_edges, job)
+    finally:
+        conn.close()
+
+        # the cached results and prepared statements were made against the old data and schema
+        kuzu_result_cache.invalidate()
+
+        kuzu_pool.statements.clear()
+
+    logger.info("Kuzu loading results: %s", ret_val)
+
+    # return to the caller
+    return ret_val
+
+
+def run_falkor_bulk_load_job(job: LoadJob, loader: FalkorBulkLoader, node_file_names: list, edge_file_names: list, drop_first: bool) -> dict:
+    """
+    runs a Falkor GRAPH.BULK load job.
+
+    :param job:
+    :param loader:
+    :param node_file_names:
+    :param edge_file_names:
+    :param drop_first:
+    :return:
+    """
+    # run the load
+    ret_val: dict = loader.load(falkor_client.redis, node_file_names, edge_file_names, drop_first, job)
+
+    logger.info("Falkor bulk loading results: %s", ret_val)
+
+    # return to the caller
+    return ret_val
 
+
+def run_mg_batch_load_job(job: LoadJob, loader: MemgraphBatchLoader, file_names: list, is_edges: bool) -> dict:
+    """
+    runs a batched MemGraph load job.
+
+    :param job:
+    :param loader:
+    :param file_names:
+    :param is_edges:
+    :return:
+    """
+    # run the load
+    ret_val: dict = loader.load(file_names, is_edges, job)
+
+    logger.info("MemGraph batch loading results: %s", ret_val)
+
+    # fail the job if any batch didn't make it
+    if ret_val['errors']:
+        raise RuntimeError(f"{len(ret_val['errors'])} load error(s), first: {ret_val['errors'][0]}")
+
+    # return to the caller
+    return ret_val
+
+
+def run_edge_partition_job(job: LoadJob, file_names: list, out_dir: str, out_prefix: str, partitions: int) -> list:
+    """
+    runs an edge partitioning job.
+
+    :param job:
+    :param file_names:
+    :param out_dir:
+    :param out_prefix:
+    :param partitions:
+    :return:
+    """
+    # reshuffle the edges
+    ret_val: list = partition_edge_chunks(file_names, out_dir, out_prefix, partitions, job)
+
+    logger.info("Edge partitioning results: %s", ret_val)
+
+    # return to the caller
+    return ret_val
+
+
+def run_backend_load_job(job: LoadJob, backend: GraphBackend, node_file_names: list, edge_file_names: list, options: dict) -> dict:
+    """
+    runs a bulk load job on any engine.
+
+    :param job:
+    :param backend:
+    :param node_file_names:
+    :param edge_file_names:
+    :param options:
+    :return:
+    """
+    try:
+        # run the load
+        ret_val: dict = backend.bulk_load(job, node_file_names, edge_file_names, options)
+    finally:
+        # the cached query results were made against the old data
+        kuzu_result_cache.invalidate()
+
+    logger.info("%s bulk loading results: %s", backend.name, ret_val)
+
+    # return to the caller
+    return ret_val
+
+
+def run_benchmark_job(job: LoadJob, loop: asyncio.AbstractEventLoop, backends: list, workload: list, settings: dict) -> dict:
+    """
+    runs a benchmark job.
+
+    the backend pools belong to the server's event loop, so the job thread hands the run to it and waits.
+
+    :param job:
+    :param loop:
+    :param backends:
+    :param workload:
+    :param settings:
+    :return:
+    """
+    # run the workload
+    results: list = asyncio.run_coroutine_threadsafe(run_benchmark(backends, workload, settings['concurrency'], settings['warmup'],
+                                                                   settings['iterations'], settings['timeout'], job), loop).result()
+
+    # save the results for comparison
+    files: list = write_results(results, settings, settings['out_dir'], job.job_id)
+
+    logger.info("Benchmark results written to: %s", files)
+
+    # return to the caller
+    return {'files': files, 'results': results}
+
+
+def run_rk_generate_job(job: LoadJob, out_dir: str, nodes: int, edges: int, node_prefix: str, edge_prefix: str, node_chunk_rows: int,
+                        edge_chunk_rows: int, settings: dict) -> dict:
+    """
+    runs a synthetic RK graph generation job.
+
+    :param job:
+    :param out_dir:
+    :param nodes:
+    :param edges:
+    :param node_prefix:
+    :param edge_prefix:
+    :param node_chunk_rows:
+    :param edge_chunk_rows:
+    :param settings: the RKGraphGenerator shape settings
+    :return:
+    """
+    # write the chunks
+    ret_val: dict = RKGraphGenerator(nodes, edges, **settings).write(out_dir, node_prefix, edge_prefix, node_chunk_rows, edge_chunk_rows, job)
+
+    logger.info("RK generation results: %s", ret_val)
+
+    # return to the caller
+    return ret_val
+
+
+def run_parquet_staging_job(job: LoadJob, out_dir: str, file_pairs: list, is_edges: bool) -> dict:
+    """
+    runs a Parquet staging job.
+
+    :param job:
+    :param out_dir:
+    :param file_pairs:
+    :param is_edges:
+    :return:
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    # convert the chunks
+    ret_val: dict = convert_chunks(file_pairs, is_edges, job)
+
+    logger.info("Parquet staging results: %s", {k: v for k, v in ret_val.items() if k != 'chunks'})
+
+    # return to the caller
+    return ret_val
+
+
+def run_rechunk_job(job: LoadJob, file_names: list, out_dir: str, out_prefix: str, settings: dict) -> dict:
+    """
+    runs a re-chunking job, counting the rows, planning the chunks and rewriting the files.
+
+    :param job:
+    :param file_names:
+    :param out_dir:
+    :param out_prefix:
+    :param settings: the plan_chunks settings
+    :return:
+    """
+    # note the start
+    start: float = time.perf_counter()
+
+    # plan the chunks
+    plan: dict = plan_chunks(file_names, exact_rows=True, **settings)
+
+    job.phase_done('plan', time.perf_counter() - start)
+
+    # note the rewrite start
+    start = time.perf_counter()
+
+    # rewrite the files
+    chunks: list = rechunk_files(file_names, out_dir, out_prefix, plan['rows_per_chunk'], job)
+
+    job.phase_done('rechunk', time.perf_counter() - start)
+
+    # get the result without the per-file details
+    ret_val: dict = {**{k: v for k, v in plan.items() if k != 'input'}, 'file_prefix': out_prefix, 'file_counter_start': 1,
+                     'file_counter_end': len(chunks), 'output': [{'file': file_name, 'rows': rows} for file_name, rows in chunks]}
+
+    logger.info("Re-chunking results: %s", {k: v for k, v in ret_val.items() if k != 'output'})
+
+    # return to the caller
+    return ret_val
+
+
+def execute_csv_import_chunk_memgraph(query) -> tuple:
+    """
+    method that executes a query thread.
+
+    a LOAD CSV query is a single transaction, so when it loses a conflict with another chunk
+    it is rolled back and can safely be run again.
+
+    :param query:
+    :return: the number of nodes and relationships created, the elapsed time and the number of retries
+    """
+    def run_chunk():
+        """
+        runs the chunk in its own session
+        """
+        # get a session to the DB
+        with driver.session() as session:
             # execute the LOAD_CSV query
-            graph.query(query)
+            return session.run(query).consume().counters
+
+    try:
+        # note the start
+        start: float = time.perf_counter()
+
+        # get this worker's connection to the DB
+        driver = get_worker_mg_driver()
+
+        # run the chunk, retrying serialization conflicts
+        counters, retries = run_with_retry(run_chunk)
+
+        # return to the caller
+        return counters.nodes_created + counters.relationships_created, time.perf_counter() - start, retries
 
     except Exception as e:
         logger.exception("Failed to execute transaction")
         raise e
 
 
-async def get_mg_data(client, query: str) -> str:
+def execute_csv_import_chunk_falkor(query) -> tuple:
     """
-    gets the Memgraph data results using the CYPHER query passed.
+    method that executes a query thread.
+
+    the server capabilities were checked once before the load started, so the chunk only runs its query.
 
-    :param client:
     :param query:
-    :return:
+    :return: the number of nodes and relationships created, the elapsed time and the number of retries
     """
-    logger.info("MemGraph query: %s", query)
-
-    # create a timer for query duration
-    t = Timer(name="results", text="Results gathered in {:.4f}s")
-
-    # use the timer
-    with t:
-        # make the call do get data
-        records, summary, keys = client.execute_query(query)
+    try:
+        # note the start
+        start: float = time.perf_counter()
 
-        if records is not None:
-            # get the query result into a dataframe
-            result = pd.DataFrame.from_records(records, columns=keys)
-        else:
-            result = summary
+        # get this worker's pooled client and the graph
+        graph = get_worker_falkor_client().select_graph('RK_DB')
 
-        msg: str = "Elapsed time: " + str(round(t.last, 4)) + "s" + result.to_string()
+        # execute the LOAD_CSV query
+        result = graph.query(query)
 
-        logger.info("MemGraph query results: %s", msg)
+        # return to the caller
+        return result.nodes_created + result.relationships_created, time.perf_counter() - start, 0
 
-    # return the result
-    return msg
+    except Exception as e:
+        logger.exception("Failed to execute transaction")
+        raise e
 
 
 def get_load_query(data_dir, file_prefix, file_counter) -> str:
     """
-    the attributes listed in the CYPHER below come from the graph-db-parsers/MemGraph/mg_build_graph_csv.py file
+    generates the LOAD CSV Cypher for a rk-nodes/rk-edges chunk from the chunk's inferred schema.
+
+    data_dir is the path as seen by the graph DB. if this server sees the files somewhere else
+    set LOAD_DATA_LOCAL_DIR to that path so the chunk can be scanned.
 
     :param data_dir:
     :param file_prefix:
     :param file_counter:
     :return:
     """
+    # get the chunk name the DB will load
+    file_name: str = get_chunk_file_name(data_dir, file_prefix, file_counter)
 
-    if file_counter == 0:
-        file_name = f'{data_dir}/{file_prefix}.csv'
-    else:
-        file_name = f'{data_dir}/{file_prefix}-pt' + str(file_counter) + '.csv'
+    # get the chunk name this server can scan
+    local_file_name: str = get_chunk_file_name(os.getenv('LOAD_DATA_LOCAL_DIR', data_dir), file_prefix, file_counter)
 
     logger.debug('creating query for file: %s', file_name)
 
     cypher = """"""
 
     if 'rk-nodes' in file_prefix:
-        cypher = """
-        LOAD CSV WITH HEADERS FROM "$$$" AS row
-        CREATE (n: Node 
-        {
-            id: row.id,
-            name: row.name,
-            category: split(row.category, ';'),
-            equivalent_identifiers: split(row.equivalent_identifiers, ';'),
-            hgvs: split(row.hgvs, ';'),
-            robokop_variant_id: row.robokop_variant_id,
-            information_content: toFloat(row.information_content),
-            CHEBI_ROLE_plant_metabolite: toBoolean(row.CHEBI_ROLE_plant_metabolite),
-            CHEBI_ROLE_eukaryotic_metabolite: toBoolean(row.CHEBI_ROLE_eukaryotic_metabolite),
-            CHEBI_ROLE_biochemical_role: toBoolean(row.CHEBI_ROLE_biochemical_role),
-            CHEBI_ROLE_metabolite: toBoolean(row.CHEBI_ROLE_metabolite),
-            description: row.description,
-            CHEBI_ROLE_poison: toBoolean(row.CHEBI_ROLE_poison),
-            CHEBI_ROLE_toxin: toBoolean(row.CHEBI_ROLE_toxin),
-            CHEBI_ROLE_enzyme_inhibitor: toBoolean(row.CHEBI_ROLE_enzyme_inhibitor),
-            CHEBI_ROLE_inhibitor: toBoolean(row.CHEBI_ROLE_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_oxidoreductase_acting_on_donor_CH_OH_group__NAD___or_NADP___acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_oxidoreductase_acting_on_donor_CH_OH_group__NAD___or_NADP___acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_37_malate_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_37_malate_dehydrogenase_inhibitor),
-            CHEBI_ROLE_phytotoxin: toBoolean(row.CHEBI_ROLE_phytotoxin),
-            CHEBI_ROLE_EC_1_1_oxidoreductase_acting_on_donor_CH_OH_group_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_oxidoreductase_acting_on_donor_CH_OH_group_inhibitor),
-            CHEBI_ROLE_anti_inflammatory_agent: toBoolean(row.CHEBI_ROLE_anti_inflammatory_agent),
-            CHEBI_ROLE_drug: toBoolean(row.CHEBI_ROLE_drug),
-            CHEBI_ROLE_antihypertensive_agent: toBoolean(row.CHEBI_ROLE_antihypertensive_agent),
-            CHEBI_ROLE_vasodilator_agent: toBoolean(row.CHEBI_ROLE_vasodilator_agent),
-            CHEBI_ROLE_cardiovascular_drug: toBoolean(row.CHEBI_ROLE_cardiovascular_drug),
-            CHEBI_ROLE_EC_1_oxidoreductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_oxidoreductase_inhibitor),
-            CHEBI_ROLE_pharmaceutical: toBoolean(row.CHEBI_ROLE_pharmaceutical),
-            CHEBI_ROLE_antimicrobial_drug: toBoolean(row.CHEBI_ROLE_antimicrobial_drug),
-            CHEBI_ROLE_antiinfective_agent: toBoolean(row.CHEBI_ROLE_antiinfective_agent),
-            CHEBI_ROLE_antibacterial_agent: toBoolean(row.CHEBI_ROLE_antibacterial_agent),
-            CHEBI_ROLE_antibacterial_drug: toBoolean(row.CHEBI_ROLE_antibacterial_drug),
-            CHEBI_ROLE_antimicrobial_agent: toBoolean(row.CHEBI_ROLE_antimicrobial_agent),
-            CHEBI_ROLE_pathway_inhibitor: toBoolean(row.CHEBI_ROLE_pathway_inhibitor),
-            CHEBI_ROLE_DNA_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_DNA_synthesis_inhibitor),
-            cd_formula: row.cd_formula,
-            cd_molweight: toFloat(row.cd_molweight),
-            clogp: toFloat(row.clogp),
-            alogs: toFloat(row.alogs),
-            tpsa: toFloat(row.tpsa),
-            lipinski: toInteger(row.lipinski),
-            mrdef: row.mrdef,
-            arom_c: toInteger(row.arom_c),
-            sp3_c: toInteger(row.sp3_c),
-            sp2_c: toInteger(row.sp2_c),
-            sp_c: toInteger(row.sp_c),
-            halogen: toInteger(row.halogen),
-            hetero_sp2_c: toInteger(row.hetero_sp2_c),
-            rotb: toInteger(row.rotb),
-            o_n: toInteger(row.o_n),
-            oh_nh: toInteger(row.oh_nh),
-            smiles: row.smiles,
-            rgb: toInteger(row.rgb),
-            status: row.status,
-            CHEBI_ROLE_antiviral_agent: toBoolean(row.CHEBI_ROLE_antiviral_agent),
-            CHEBI_ROLE_fungal_metabolite: toBoolean(row.CHEBI_ROLE_fungal_metabolite),
-            CHEBI_ROLE_mycotoxin: toBoolean(row.CHEBI_ROLE_mycotoxin),
-            CHEBI_ROLE_EC_1_14_14_oxidoreductase_acting_on_paired_donors__incorporating_of_1_atom_of_oxygen__with_reduced_flavin_or_flavoprotein_as_one_donor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_14_oxidoreductase_acting_on_paired_donors__incorporating_of_1_atom_of_oxygen__with_reduced_flavin_or_flavoprotein_as_one_donor_inhibitor),
-            CHEBI_ROLE_EC_1_14_oxidoreductase_acting_on_paired_donors__with_incorporation_or_reduction_of_molecular_oxygen_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_oxidoreductase_acting_on_paired_donors__with_incorporation_or_reduction_of_molecular_oxygen_inhibitor),
-            CHEBI_ROLE_EC_1_14_14_1_unspecific_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_14_1_unspecific_monooxygenase_inhibitor),
-            CHEBI_ROLE_P450_inhibitor: toBoolean(row.CHEBI_ROLE_P450_inhibitor),
-            fda_labels: toInteger(row.fda_labels),
-            CHEBI_ROLE_environmental_contaminant: toBoolean(row.CHEBI_ROLE_environmental_contaminant),
-            CHEBI_ROLE_xenobiotic: toBoolean(row.CHEBI_ROLE_xenobiotic),
-            CHEBI_ROLE_anticoagulant: toBoolean(row.CHEBI_ROLE_anticoagulant),
-            CHEBI_ROLE_EC_1_6_oxidoreductase_acting_on_NADH_or_NADPH_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_6_oxidoreductase_acting_on_NADH_or_NADPH_inhibitor),
-            CHEBI_ROLE_EC_1_6_5_2__NAD_P_H_dehydrogenase_quinone___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_6_5_2__NAD_P_H_dehydrogenase_quinone___inhibitor),
-            CHEBI_ROLE_hematologic_agent: toBoolean(row.CHEBI_ROLE_hematologic_agent),
-            CHEBI_ROLE_rodenticide: toBoolean(row.CHEBI_ROLE_rodenticide),
-            CHEBI_ROLE_EC_1_6_5_oxidoreductase_acting_on_NADH_or_NADPH_with_a_quinone_or_similar_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_6_5_oxidoreductase_acting_on_NADH_or_NADPH_with_a_quinone_or_similar_as_acceptor_inhibitor),
-            CHEBI_ROLE_pesticide: toBoolean(row.CHEBI_ROLE_pesticide),
-            CHEBI_ROLE_antagonist: toBoolean(row.CHEBI_ROLE_antagonist),
-            CHEBI_ROLE_pharmacological_role: toBoolean(row.CHEBI_ROLE_pharmacological_role),
-            CHEBI_ROLE_vitamin_K_antagonist: toBoolean(row.CHEBI_ROLE_vitamin_K_antagonist),
-            CHEBI_ROLE_EC_5_isomerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_isomerase_inhibitor),
-            CHEBI_ROLE_apoptosis_inducer: toBoolean(row.CHEBI_ROLE_apoptosis_inducer),
-            CHEBI_ROLE_EC_5_99_1_3__DNA_topoisomerase_ATP_hydrolysing___inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_99_1_3__DNA_topoisomerase_ATP_hydrolysing___inhibitor),
-            CHEBI_ROLE_hepatoprotective_agent: toBoolean(row.CHEBI_ROLE_hepatoprotective_agent),
-            CHEBI_ROLE_protective_agent: toBoolean(row.CHEBI_ROLE_protective_agent),
-            CHEBI_ROLE_EC_5_99_1_miscellaneous_isomerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_99_1_miscellaneous_isomerase_inhibitor),
-            CHEBI_ROLE_topoisomerase_inhibitor: toBoolean(row.CHEBI_ROLE_topoisomerase_inhibitor),
-            CHEBI_ROLE_antineoplastic_agent: toBoolean(row.CHEBI_ROLE_antineoplastic_agent),
-            CHEBI_ROLE_EC_5_99_other_isomerases_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_99_other_isomerases_inhibitor),
-            CHEBI_ROLE_antifungal_agent: toBoolean(row.CHEBI_ROLE_antifungal_agent),
-            CHEBI_ROLE_angiogenesis_inhibitor: toBoolean(row.CHEBI_ROLE_angiogenesis_inhibitor),
-            CHEBI_ROLE_EC_1_14_99_1_prostaglandin_endoperoxide_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_99_1_prostaglandin_endoperoxide_synthase_inhibitor),
-            CHEBI_ROLE_EC_1_14_99_miscellaneous_oxidoreductase_acting_on_paired_donors__with_incorporation_or_reduction_of_molecular_oxygen_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_99_miscellaneous_oxidoreductase_acting_on_paired_donors__with_incorporation_or_reduction_of_molecular_oxygen_inhibitor),
-            CHEBI_ROLE_cyclooxygenase_2_inhibitor: toBoolean(row.CHEBI_ROLE_cyclooxygenase_2_inhibitor),
-            CHEBI_ROLE_central_nervous_system_depressant: toBoolean(row.CHEBI_ROLE_central_nervous_system_depressant),
-            CHEBI_ROLE_central_nervous_system_drug: toBoolean(row.CHEBI_ROLE_central_nervous_system_drug),
-            CHEBI_ROLE_anticonvulsant: toBoolean(row.CHEBI_ROLE_anticonvulsant),
-            CHEBI_ROLE_prokaryotic_metabolite: toBoolean(row.CHEBI_ROLE_prokaryotic_metabolite),
-            CHEBI_ROLE_Escherichia_coli_metabolite: toBoolean(row.CHEBI_ROLE_Escherichia_coli_metabolite),
-            CHEBI_ROLE_bacterial_metabolite: toBoolean(row.CHEBI_ROLE_bacterial_metabolite),
-            CHEBI_ROLE_animal_metabolite: toBoolean(row.CHEBI_ROLE_animal_metabolite),
-            CHEBI_ROLE_mammalian_metabolite: toBoolean(row.CHEBI_ROLE_mammalian_metabolite),
-            CHEBI_ROLE_mouse_metabolite: toBoolean(row.CHEBI_ROLE_mouse_metabolite),
-            CHEBI_ROLE_HIV_protease_inhibitor: toBoolean(row.CHEBI_ROLE_HIV_protease_inhibitor),
-            CHEBI_ROLE_EC_3_4_hydrolases_acting_on_peptide_bond_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_hydrolases_acting_on_peptide_bond_inhibitor),
-            CHEBI_ROLE_protease_inhibitor: toBoolean(row.CHEBI_ROLE_protease_inhibitor),
-            CHEBI_ROLE_anti_HIV_agent: toBoolean(row.CHEBI_ROLE_anti_HIV_agent),
-            CHEBI_ROLE_EC_3_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_hydrolase_inhibitor),
-            CHEBI_ROLE_cholinergic_drug: toBoolean(row.CHEBI_ROLE_cholinergic_drug),
-            CHEBI_ROLE_cholinergic_agonist: toBoolean(row.CHEBI_ROLE_cholinergic_agonist),
-            CHEBI_ROLE_serotonergic_drug: toBoolean(row.CHEBI_ROLE_serotonergic_drug),
-            CHEBI_ROLE_serotonergic_agonist: toBoolean(row.CHEBI_ROLE_serotonergic_agonist),
-            CHEBI_ROLE_neurotransmitter_agent: toBoolean(row.CHEBI_ROLE_neurotransmitter_agent),
-            CHEBI_ROLE_muscarinic_agonist: toBoolean(row.CHEBI_ROLE_muscarinic_agonist),
-            CHEBI_ROLE_iron_chelator: toBoolean(row.CHEBI_ROLE_iron_chelator),
-            CHEBI_ROLE_chelator: toBoolean(row.CHEBI_ROLE_chelator),
-            CHEBI_ROLE_vesicular_glutamate_transport_inhibitor: toBoolean(row.CHEBI_ROLE_vesicular_glutamate_transport_inhibitor),
-            CHEBI_ROLE_ligand: toBoolean(row.CHEBI_ROLE_ligand),
-            CHEBI_ROLE_metabotropic_glutamate_receptor_agonist: toBoolean(row.CHEBI_ROLE_metabotropic_glutamate_receptor_agonist),
-            CHEBI_ROLE_agonist: toBoolean(row.CHEBI_ROLE_agonist),
-            CHEBI_ROLE_TGFbeta_receptor_antagonist: toBoolean(row.CHEBI_ROLE_TGFbeta_receptor_antagonist),
-            CHEBI_ROLE_EC_2_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_transferase_inhibitor),
-            CHEBI_ROLE_protein_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_protein_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_7_P_containing_group_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_P_containing_group_transferase_inhibitor),
-            CHEBI_ROLE_EC_2_7_11_30_receptor_protein_serine_threonine_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_30_receptor_protein_serine_threonine_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_7_11_protein_serine_threonine_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_protein_serine_threonine_kinase_inhibitor),
-            CHEBI_ROLE_dopamine_receptor_D2_antagonist: toBoolean(row.CHEBI_ROLE_dopamine_receptor_D2_antagonist),
-            CHEBI_ROLE_serotonergic_antagonist: toBoolean(row.CHEBI_ROLE_serotonergic_antagonist),
-            CHEBI_ROLE_adrenergic_antagonist: toBoolean(row.CHEBI_ROLE_adrenergic_antagonist),
-            CHEBI_ROLE_adrenergic_agent: toBoolean(row.CHEBI_ROLE_adrenergic_agent),
-            CHEBI_ROLE_alpha_adrenergic_antagonist: toBoolean(row.CHEBI_ROLE_alpha_adrenergic_antagonist),
-            CHEBI_ROLE_alpha_adrenergic_drug: toBoolean(row.CHEBI_ROLE_alpha_adrenergic_drug),
-            CHEBI_ROLE_cysteine_protease_inhibitor: toBoolean(row.CHEBI_ROLE_cysteine_protease_inhibitor),
-            CHEBI_ROLE_cathepsin_L_EC_3_4_22_15_inhibitor: toBoolean(row.CHEBI_ROLE_cathepsin_L_EC_3_4_22_15_inhibitor),
-            CHEBI_ROLE_EC_3_4_22_cysteine_endopeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_22_cysteine_endopeptidase_inhibitor),
-            CHEBI_ROLE_EC_3_4_24_metalloendopeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_24_metalloendopeptidase_inhibitor),
-            CHEBI_ROLE_anti_asthmatic_agent: toBoolean(row.CHEBI_ROLE_anti_asthmatic_agent),
-            CHEBI_ROLE_hormone_antagonist: toBoolean(row.CHEBI_ROLE_hormone_antagonist),
-            CHEBI_ROLE_hormone_receptor_modulator: toBoolean(row.CHEBI_ROLE_hormone_receptor_modulator),
-            CHEBI_ROLE_leukotriene_antagonist: toBoolean(row.CHEBI_ROLE_leukotriene_antagonist),
-            CHEBI_ROLE_receptor_modulator: toBoolean(row.CHEBI_ROLE_receptor_modulator),
-            CHEBI_ROLE_antiviral_drug: toBoolean(row.CHEBI_ROLE_antiviral_drug),
-            CHEBI_ROLE_EC_3_1_26_13_retroviral_ribonuclease_H_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_26_13_retroviral_ribonuclease_H_inhibitor),
-            CHEBI_ROLE_HIV_1_reverse_transcriptase_inhibitor: toBoolean(row.CHEBI_ROLE_HIV_1_reverse_transcriptase_inhibitor),
-            CHEBI_ROLE_antimetabolite: toBoolean(row.CHEBI_ROLE_antimetabolite),
-            CHEBI_ROLE_EC_3_1_26_endoribonucleases_producing_5__phosphomonoesters_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_26_endoribonucleases_producing_5__phosphomonoesters_inhibitor),
-            CHEBI_ROLE_anti_HIV_1_agent: toBoolean(row.CHEBI_ROLE_anti_HIV_1_agent),
-            CHEBI_ROLE_EC_3_1_ester_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_ester_hydrolase_inhibitor),
-            CHEBI_ROLE_psychotropic_drug: toBoolean(row.CHEBI_ROLE_psychotropic_drug),
-            CHEBI_ROLE_anxiolytic_drug: toBoolean(row.CHEBI_ROLE_anxiolytic_drug),
-            CHEBI_ROLE_sedative: toBoolean(row.CHEBI_ROLE_sedative),
-            CHEBI_ROLE_tranquilizing_drug: toBoolean(row.CHEBI_ROLE_tranquilizing_drug),
-            CHEBI_ROLE_EC_1_14_13_39_nitric_oxide_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_13_39_nitric_oxide_synthase_inhibitor),
-            CHEBI_ROLE_EC_1_14_13_oxidoreductase_acting_on_paired_donors__incorporating_1_atom_of_oxygen__with_NADH_or_NADPH_as_one_donor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_13_oxidoreductase_acting_on_paired_donors__incorporating_1_atom_of_oxygen__with_NADH_or_NADPH_as_one_donor_inhibitor),
-            CHEBI_ROLE_estrogen: toBoolean(row.CHEBI_ROLE_estrogen),
-            CHEBI_ROLE_molecular_messenger: toBoolean(row.CHEBI_ROLE_molecular_messenger),
-            CHEBI_ROLE_hormone: toBoolean(row.CHEBI_ROLE_hormone),
-            CHEBI_ROLE_mycoestrogen: toBoolean(row.CHEBI_ROLE_mycoestrogen),
-            CHEBI_ROLE_sex_hormone: toBoolean(row.CHEBI_ROLE_sex_hormone),
-            CHEBI_ROLE_EC_5_4_intramolecular_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_4_intramolecular_transferase_inhibitor),
-            CHEBI_ROLE_EC_5_4_99_intramolecular_transferase_transferring_other_groups_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_4_99_intramolecular_transferase_transferring_other_groups_inhibitor),
-            CHEBI_ROLE_EC_5_4_99_7_lanosterol_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_4_99_7_lanosterol_synthase_inhibitor),
-            CHEBI_ROLE_ophthalmology_drug: toBoolean(row.CHEBI_ROLE_ophthalmology_drug),
-            CHEBI_ROLE_EC_4_2_1_hydro_lyases_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_2_1_hydro_lyases_inhibitor),
-            CHEBI_ROLE_EC_4_2_C_O_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_2_C_O_lyase_inhibitor),
-            CHEBI_ROLE_EC_4_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_lyase_inhibitor),
-            CHEBI_ROLE_EC_4_2_1_1_carbonic_anhydrase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_2_1_1_carbonic_anhydrase_inhibitor),
-            CHEBI_ROLE_antiglaucoma_drug: toBoolean(row.CHEBI_ROLE_antiglaucoma_drug),
-            CHEBI_ROLE_diuretic: toBoolean(row.CHEBI_ROLE_diuretic),
-            CHEBI_ROLE_EC_1_13__oxidoreductase_acting_on_single_donors_with_incorporation_of_molecular_oxygen_oxygenases___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_13__oxidoreductase_acting_on_single_donors_with_incorporation_of_molecular_oxygen_oxygenases___inhibitor),
-            CHEBI_ROLE_anti_asthmatic_drug: toBoolean(row.CHEBI_ROLE_anti_asthmatic_drug),
-            CHEBI_ROLE_anti_inflammatory_drug: toBoolean(row.CHEBI_ROLE_anti_inflammatory_drug),
-            CHEBI_ROLE_non_steroidal_anti_inflammatory_drug: toBoolean(row.CHEBI_ROLE_non_steroidal_anti_inflammatory_drug),
-            CHEBI_ROLE_EC_1_13_11_34_arachidonate_5_lipoxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_13_11_34_arachidonate_5_lipoxygenase_inhibitor),
-            CHEBI_ROLE_lipoxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_lipoxygenase_inhibitor),
-            CHEBI_ROLE_antirheumatic_drug: toBoolean(row.CHEBI_ROLE_antirheumatic_drug),
-            CHEBI_ROLE_ferroptosis_inhibitor: toBoolean(row.CHEBI_ROLE_ferroptosis_inhibitor),
-            CHEBI_ROLE_EC_1_13_11_oxidoreductase_acting_on_single_donors_and_incorporating_2_O_atoms_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_13_11_oxidoreductase_acting_on_single_donors_and_incorporating_2_O_atoms_inhibitor),
-            CHEBI_ROLE_histaminergic_drug: toBoolean(row.CHEBI_ROLE_histaminergic_drug),
-            CHEBI_ROLE_antipsychotic_agent: toBoolean(row.CHEBI_ROLE_antipsychotic_agent),
-            CHEBI_ROLE_dopaminergic_antagonist: toBoolean(row.CHEBI_ROLE_dopaminergic_antagonist),
-            CHEBI_ROLE_muscarinic_antagonist: toBoolean(row.CHEBI_ROLE_muscarinic_antagonist),
-            CHEBI_ROLE_dopaminergic_agent: toBoolean(row.CHEBI_ROLE_dopaminergic_agent),
-            CHEBI_ROLE_cholinergic_antagonist: toBoolean(row.CHEBI_ROLE_cholinergic_antagonist),
-            CHEBI_ROLE_histamine_antagonist: toBoolean(row.CHEBI_ROLE_histamine_antagonist),
-            CHEBI_ROLE_vasoconstrictor_agent: toBoolean(row.CHEBI_ROLE_vasoconstrictor_agent),
-            CHEBI_ROLE_GABA_agonist: toBoolean(row.CHEBI_ROLE_GABA_agonist),
-            CHEBI_ROLE_GABA_agent: toBoolean(row.CHEBI_ROLE_GABA_agent),
-            CHEBI_ROLE_EC_2_5_1_non_methyl_alkyl_or_aryl_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_non_methyl_alkyl_or_aryl_transferase_inhibitor),
-            CHEBI_ROLE_EC_2_5_1_59_protein_geranylgeranyltransferase_type_I_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_59_protein_geranylgeranyltransferase_type_I_inhibitor),
-            CHEBI_ROLE_EC_2_5_non_methyl_alkyl_or_aryl_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_non_methyl_alkyl_or_aryl_transferase_inhibitor),
-            CHEBI_ROLE_membrane_transport_modulator: toBoolean(row.CHEBI_ROLE_membrane_transport_modulator),
-            CHEBI_ROLE_antioxidant: toBoolean(row.CHEBI_ROLE_antioxidant),
-            CHEBI_ROLE_biophysical_role: toBoolean(row.CHEBI_ROLE_biophysical_role),
-            CHEBI_ROLE_calcium_channel_blocker: toBoolean(row.CHEBI_ROLE_calcium_channel_blocker),
-            CHEBI_ROLE_calcium_channel_modulator: toBoolean(row.CHEBI_ROLE_calcium_channel_modulator),
-            CHEBI_ROLE_T_type_calcium_channel_blocker: toBoolean(row.CHEBI_ROLE_T_type_calcium_channel_blocker),
-            CHEBI_ROLE_EC_2_7_11_1_non_specific_serine_threonine_protein_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_1_non_specific_serine_threonine_protein_kinase_inhibitor),
-            CHEBI_ROLE_anticoronaviral_agent: toBoolean(row.CHEBI_ROLE_anticoronaviral_agent),
-            CHEBI_ROLE_cathepsin_B_inhibitor: toBoolean(row.CHEBI_ROLE_cathepsin_B_inhibitor),
-            CHEBI_ROLE_EC_3_4_23_aspartic_endopeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_23_aspartic_endopeptidase_inhibitor),
-            CHEBI_ROLE_EC_3_4_23_46_memapsin_2_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_23_46_memapsin_2_inhibitor),
-            CHEBI_ROLE_keratolytic_drug: toBoolean(row.CHEBI_ROLE_keratolytic_drug),
-            CHEBI_ROLE_dermatologic_drug: toBoolean(row.CHEBI_ROLE_dermatologic_drug),
-            CHEBI_ROLE_EC_1_1_1_21_aldehyde_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_21_aldehyde_reductase_inhibitor),
-            CHEBI_ROLE_drug_allergen: toBoolean(row.CHEBI_ROLE_drug_allergen),
-            CHEBI_ROLE_allergen: toBoolean(row.CHEBI_ROLE_allergen),
-            CHEBI_ROLE_aetiopathogenetic_role: toBoolean(row.CHEBI_ROLE_aetiopathogenetic_role),
-            CHEBI_ROLE_human_urinary_metabolite: toBoolean(row.CHEBI_ROLE_human_urinary_metabolite),
-            CHEBI_ROLE_human_metabolite: toBoolean(row.CHEBI_ROLE_human_metabolite),
-            CHEBI_ROLE_volatile_oil_component: toBoolean(row.CHEBI_ROLE_volatile_oil_component),
-            CHEBI_ROLE_intravenous_anaesthetic: toBoolean(row.CHEBI_ROLE_intravenous_anaesthetic),
-            CHEBI_ROLE_anaesthetic: toBoolean(row.CHEBI_ROLE_anaesthetic),
-            CHEBI_ROLE_general_anaesthetic: toBoolean(row.CHEBI_ROLE_general_anaesthetic),
-            CHEBI_ROLE_EC_1_14_11_oxidoreductase_acting_on_paired_donors__2_oxoglutarate_as_one_donor__incorporating_1_atom_each_of_oxygen_into_both_donors_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_11_oxidoreductase_acting_on_paired_donors__2_oxoglutarate_as_one_donor__incorporating_1_atom_each_of_oxygen_into_both_donors_inhibitor),
-            CHEBI_ROLE_EC_1_14_11_29_hypoxia_inducible_factor_proline_dioxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_11_29_hypoxia_inducible_factor_proline_dioxygenase_inhibitor),
-            CHEBI_ROLE_neuroprotective_agent: toBoolean(row.CHEBI_ROLE_neuroprotective_agent),
-            CHEBI_ROLE_Mycoplasma_genitalium_metabolite: toBoolean(row.CHEBI_ROLE_Mycoplasma_genitalium_metabolite),
-            CHEBI_ROLE_carcinogenic_agent: toBoolean(row.CHEBI_ROLE_carcinogenic_agent),
-            CHEBI_ROLE_EC_2_5_1_15_dihydropteroate_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_15_dihydropteroate_synthase_inhibitor),
-            CHEBI_ROLE_EC_2_6_1_transaminase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_6_1_transaminase_inhibitor),
-            CHEBI_ROLE_EC_2_6_nitrogenous_group_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_6_nitrogenous_group_transferase_inhibitor),
-            CHEBI_ROLE_EC_2_6_1_40___R_3_amino_2_methylpropionate_pyruvate_transaminase__inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_6_1_40___R_3_amino_2_methylpropionate_pyruvate_transaminase__inhibitor),
-            CHEBI_ROLE_drug_metabolite: toBoolean(row.CHEBI_ROLE_drug_metabolite),
-            CHEBI_ROLE_human_xenobiotic_metabolite: toBoolean(row.CHEBI_ROLE_human_xenobiotic_metabolite),
-            CHEBI_ROLE_xenobiotic_metabolite: toBoolean(row.CHEBI_ROLE_xenobiotic_metabolite),
-            CHEBI_ROLE_analgesic: toBoolean(row.CHEBI_ROLE_analgesic),
-            CHEBI_ROLE_adrenergic_agonist: toBoolean(row.CHEBI_ROLE_adrenergic_agonist),
-            CHEBI_ROLE_nasal_decongestant: toBoolean(row.CHEBI_ROLE_nasal_decongestant),
-            CHEBI_ROLE_alpha_adrenergic_agonist: toBoolean(row.CHEBI_ROLE_alpha_adrenergic_agonist),
-            CHEBI_ROLE_genotoxin: toBoolean(row.CHEBI_ROLE_genotoxin),
-            CHEBI_ROLE_Aspergillus_metabolite: toBoolean(row.CHEBI_ROLE_Aspergillus_metabolite),
-            CHEBI_ROLE_GABA_modulator: toBoolean(row.CHEBI_ROLE_GABA_modulator),
-            CHEBI_ROLE_indicator: toBoolean(row.CHEBI_ROLE_indicator),
-            CHEBI_ROLE_provitamin: toBoolean(row.CHEBI_ROLE_provitamin),
-            CHEBI_ROLE_biomarker: toBoolean(row.CHEBI_ROLE_biomarker),
-            CHEBI_ROLE_provitamin_A: toBoolean(row.CHEBI_ROLE_provitamin_A),
-            CHEBI_ROLE_Daphnia_magna_metabolite: toBoolean(row.CHEBI_ROLE_Daphnia_magna_metabolite),
-            CHEBI_ROLE_Daphnia_metabolite: toBoolean(row.CHEBI_ROLE_Daphnia_metabolite),
-            CHEBI_ROLE_crustacean_metabolite: toBoolean(row.CHEBI_ROLE_crustacean_metabolite),
-            CHEBI_ROLE_anti_ulcer_drug: toBoolean(row.CHEBI_ROLE_anti_ulcer_drug),
-            CHEBI_ROLE_gastrointestinal_drug: toBoolean(row.CHEBI_ROLE_gastrointestinal_drug),
-            CHEBI_ROLE_neurotransmitter: toBoolean(row.CHEBI_ROLE_neurotransmitter),
-            CHEBI_ROLE_alarm_pheromone: toBoolean(row.CHEBI_ROLE_alarm_pheromone),
-            CHEBI_ROLE_pheromone: toBoolean(row.CHEBI_ROLE_pheromone),
-            CHEBI_ROLE_semiochemical: toBoolean(row.CHEBI_ROLE_semiochemical),
-            CHEBI_ROLE_anthelminthic_drug: toBoolean(row.CHEBI_ROLE_anthelminthic_drug),
-            CHEBI_ROLE_nematicide: toBoolean(row.CHEBI_ROLE_nematicide),
-            CHEBI_ROLE_antinematodal_drug: toBoolean(row.CHEBI_ROLE_antinematodal_drug),
-            CHEBI_ROLE_antiparasitic_agent: toBoolean(row.CHEBI_ROLE_antiparasitic_agent),
-            CHEBI_ROLE_radical_scavenger: toBoolean(row.CHEBI_ROLE_radical_scavenger),
-            CHEBI_ROLE_antiplasmodial_drug: toBoolean(row.CHEBI_ROLE_antiplasmodial_drug),
-            CHEBI_ROLE_antiprotozoal_drug: toBoolean(row.CHEBI_ROLE_antiprotozoal_drug),
-            CHEBI_ROLE_antidepressant: toBoolean(row.CHEBI_ROLE_antidepressant),
-            CHEBI_ROLE_EC_3_1_4_phosphoric_diester_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_4_phosphoric_diester_hydrolase_inhibitor),
-            CHEBI_ROLE_EC_3_5_hydrolases_acting_on_non_peptide_C_N_bonds_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_hydrolases_acting_on_non_peptide_C_N_bonds_inhibitor),
-            CHEBI_ROLE_EC_3_5_2_6_beta_lactamase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_2_6_beta_lactamase_inhibitor),
-            CHEBI_ROLE_EC_3_5_2_non_peptide_cyclic_amide_C_N_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_2_non_peptide_cyclic_amide_C_N_hydrolase_inhibitor),
-            CHEBI_ROLE_mitochondrial_respiratory_chain_inhibitor: toBoolean(row.CHEBI_ROLE_mitochondrial_respiratory_chain_inhibitor),
-            CHEBI_ROLE_fungicide: toBoolean(row.CHEBI_ROLE_fungicide),
-            CHEBI_ROLE_quinone_outside_inhibitor: toBoolean(row.CHEBI_ROLE_quinone_outside_inhibitor),
-            CHEBI_ROLE_agrochemical: toBoolean(row.CHEBI_ROLE_agrochemical),
-            CHEBI_ROLE_mitochondrial_cytochrome_bc1_complex_inhibitor: toBoolean(row.CHEBI_ROLE_mitochondrial_cytochrome_bc1_complex_inhibitor),
-            CHEBI_ROLE_cytochrome_bc1_complex_inhibitor: toBoolean(row.CHEBI_ROLE_cytochrome_bc1_complex_inhibitor),
-            CHEBI_ROLE_respiratory_chain_inhibitor: toBoolean(row.CHEBI_ROLE_respiratory_chain_inhibitor),
-            CHEBI_ROLE_electron_transport_chain_inhibitor: toBoolean(row.CHEBI_ROLE_electron_transport_chain_inhibitor),
-            CHEBI_ROLE_vulnerary: toBoolean(row.CHEBI_ROLE_vulnerary),
-            CHEBI_ROLE_EC_1_14_14_91_trans_cinnamate_4_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_14_91_trans_cinnamate_4_monooxygenase_inhibitor),
-            CHEBI_ROLE_human_blood_serum_metabolite: toBoolean(row.CHEBI_ROLE_human_blood_serum_metabolite),
-            CHEBI_ROLE_serine_protease_inhibitor: toBoolean(row.CHEBI_ROLE_serine_protease_inhibitor),
-            CHEBI_ROLE_geroprotector: toBoolean(row.CHEBI_ROLE_geroprotector),
-            CHEBI_ROLE_marine_metabolite: toBoolean(row.CHEBI_ROLE_marine_metabolite),
-            CHEBI_ROLE_androgen: toBoolean(row.CHEBI_ROLE_androgen),
-            CHEBI_ROLE_Saccharomyces_cerevisiae_metabolite: toBoolean(row.CHEBI_ROLE_Saccharomyces_cerevisiae_metabolite),
-            CHEBI_ROLE_fatty_acid_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_fatty_acid_synthesis_inhibitor),
-            CHEBI_ROLE_bacterial_xenobiotic_metabolite: toBoolean(row.CHEBI_ROLE_bacterial_xenobiotic_metabolite),
-            CHEBI_ROLE_algal_metabolite: toBoolean(row.CHEBI_ROLE_algal_metabolite),
-            CHEBI_ROLE_cardioprotective_agent: toBoolean(row.CHEBI_ROLE_cardioprotective_agent),
-            CHEBI_ROLE_adjuvant: toBoolean(row.CHEBI_ROLE_adjuvant),
-            CHEBI_ROLE_food_additive: toBoolean(row.CHEBI_ROLE_food_additive),
-            CHEBI_ROLE_food_preservative: toBoolean(row.CHEBI_ROLE_food_preservative),
-            CHEBI_ROLE_food_component: toBoolean(row.CHEBI_ROLE_food_component),
-            CHEBI_ROLE_food_antioxidant: toBoolean(row.CHEBI_ROLE_food_antioxidant),
-            CHEBI_ROLE_physiological_role: toBoolean(row.CHEBI_ROLE_physiological_role),
-            CHEBI_ROLE_MALDI_matrix_material: toBoolean(row.CHEBI_ROLE_MALDI_matrix_material),
-            CHEBI_ROLE_apoptosis_inhibitor: toBoolean(row.CHEBI_ROLE_apoptosis_inhibitor),
-            CHEBI_ROLE_food_acidity_regulator: toBoolean(row.CHEBI_ROLE_food_acidity_regulator),
-            CHEBI_ROLE_astringent: toBoolean(row.CHEBI_ROLE_astringent),
-            CHEBI_ROLE_EC_1_13_11_33_arachidonate_15_lipoxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_13_11_33_arachidonate_15_lipoxygenase_inhibitor),
-            CHEBI_ROLE_dopamine_uptake_inhibitor: toBoolean(row.CHEBI_ROLE_dopamine_uptake_inhibitor),
-            CHEBI_ROLE_photosensitizing_agent: toBoolean(row.CHEBI_ROLE_photosensitizing_agent),
-            CHEBI_ROLE_antitubercular_agent: toBoolean(row.CHEBI_ROLE_antitubercular_agent),
-            CHEBI_ROLE_antimycobacterial_drug: toBoolean(row.CHEBI_ROLE_antimycobacterial_drug),
-            CHEBI_ROLE_photosynthetic_electron_transport_chain_inhibitor: toBoolean(row.CHEBI_ROLE_photosynthetic_electron_transport_chain_inhibitor),
-            CHEBI_ROLE_urea_herbicide: toBoolean(row.CHEBI_ROLE_urea_herbicide),
-            CHEBI_ROLE_photosystem_II_inhibitor: toBoolean(row.CHEBI_ROLE_photosystem_II_inhibitor),
-            CHEBI_ROLE_herbicide: toBoolean(row.CHEBI_ROLE_herbicide),
-            CHEBI_ROLE_topical_anaesthetic: toBoolean(row.CHEBI_ROLE_topical_anaesthetic),
-            CHEBI_ROLE_local_anaesthetic: toBoolean(row.CHEBI_ROLE_local_anaesthetic),
-            CHEBI_ROLE_antipruritic_drug: toBoolean(row.CHEBI_ROLE_antipruritic_drug),
-            CHEBI_ROLE_sensitiser: toBoolean(row.CHEBI_ROLE_sensitiser),
-            CHEBI_ROLE_nematode_metabolite: toBoolean(row.CHEBI_ROLE_nematode_metabolite),
-            CHEBI_ROLE_Caenorhabditis_elegans_metabolite: toBoolean(row.CHEBI_ROLE_Caenorhabditis_elegans_metabolite),
-            CHEBI_ROLE_EC_3_4_15_1_peptidyl_dipeptidase_A_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_15_1_peptidyl_dipeptidase_A_inhibitor),
-            CHEBI_ROLE_EC_3_4_15_peptidyl_dipeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_15_peptidyl_dipeptidase_inhibitor),
-            CHEBI_ROLE_aryl_hydrocarbon_receptor_agonist: toBoolean(row.CHEBI_ROLE_aryl_hydrocarbon_receptor_agonist),
-            CHEBI_ROLE_EC_1_13_11_27_4_hydroxyphenylpyruvate_dioxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_13_11_27_4_hydroxyphenylpyruvate_dioxygenase_inhibitor),
-            CHEBI_ROLE_mutagen: toBoolean(row.CHEBI_ROLE_mutagen),
-            CHEBI_ROLE_EC_1_14_14_14_aromatase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_14_14_aromatase_inhibitor),
-            CHEBI_ROLE_epitope: toBoolean(row.CHEBI_ROLE_epitope),
-            CHEBI_ROLE_carbohydrate_allergen: toBoolean(row.CHEBI_ROLE_carbohydrate_allergen),
-            CHEBI_ROLE_EC_2_1_1_43_enhancer_of_zeste_homolog_2_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_43_enhancer_of_zeste_homolog_2_inhibitor),
-            CHEBI_ROLE_anti_obesity_agent: toBoolean(row.CHEBI_ROLE_anti_obesity_agent),
-            CHEBI_ROLE_EC_2_1_C1_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_C1_transferase_inhibitor),
-            CHEBI_ROLE_EC_2_1_1_methyltransferases_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_methyltransferases_inhibitor),
-            CHEBI_ROLE_antiatherosclerotic_agent: toBoolean(row.CHEBI_ROLE_antiatherosclerotic_agent),
-            CHEBI_ROLE_EC_3_5_1_non_peptide_linear_amide_C_N_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_1_non_peptide_linear_amide_C_N_hydrolase_inhibitor),
-            CHEBI_ROLE_EC_3_5_1_98_histone_deacetylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_1_98_histone_deacetylase_inhibitor),
-            CHEBI_ROLE_C_X_C_chemokine_receptor_type_4_antagonist: toBoolean(row.CHEBI_ROLE_C_X_C_chemokine_receptor_type_4_antagonist),
-            CHEBI_ROLE_immunomodulator: toBoolean(row.CHEBI_ROLE_immunomodulator),
-            CHEBI_ROLE_immunological_adjuvant: toBoolean(row.CHEBI_ROLE_immunological_adjuvant),
-            CHEBI_ROLE_quorum_sensing_inhibitor: toBoolean(row.CHEBI_ROLE_quorum_sensing_inhibitor),
-            CHEBI_ROLE_autophagy_inducer: toBoolean(row.CHEBI_ROLE_autophagy_inducer),
-            CHEBI_ROLE_Aurora_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_Aurora_kinase_inhibitor),
-            CHEBI_ROLE_Wnt_signalling_inhibitor: toBoolean(row.CHEBI_ROLE_Wnt_signalling_inhibitor),
-            CHEBI_ROLE_bronchodilator_agent: toBoolean(row.CHEBI_ROLE_bronchodilator_agent),
-            CHEBI_ROLE_anti_arrhythmia_drug: toBoolean(row.CHEBI_ROLE_anti_arrhythmia_drug),
-            CHEBI_ROLE_adrenergic_uptake_inhibitor: toBoolean(row.CHEBI_ROLE_adrenergic_uptake_inhibitor),
-            CHEBI_ROLE_nutrient: toBoolean(row.CHEBI_ROLE_nutrient),
-            CHEBI_ROLE_vitamin_role_: toBoolean(row.CHEBI_ROLE_vitamin_role_),
-            CHEBI_ROLE_micronutrient: toBoolean(row.CHEBI_ROLE_micronutrient),
-            CHEBI_ROLE_fat_soluble_vitamin_role_: toBoolean(row.CHEBI_ROLE_fat_soluble_vitamin_role_),
-            CHEBI_ROLE_antigen: toBoolean(row.CHEBI_ROLE_antigen),
-            CHEBI_ROLE_phosphoantigen: toBoolean(row.CHEBI_ROLE_phosphoantigen),
-            CHEBI_ROLE_calpain_inhibitor: toBoolean(row.CHEBI_ROLE_calpain_inhibitor),
-            CHEBI_ROLE_EC_3_6_3_acid_anhydride_hydrolase_catalysing_transmembrane_movement_of_substances_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_3_acid_anhydride_hydrolase_catalysing_transmembrane_movement_of_substances_inhibitor),
-            CHEBI_ROLE_EC_3_6_hydrolases_acting_on_acid_anhydrides_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_hydrolases_acting_on_acid_anhydrides_inhibitor),
-            CHEBI_ROLE_EC_3_6_3_9_Na____K___transporting_ATPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_3_9_Na____K___transporting_ATPase_inhibitor),
-            CHEBI_ROLE_radiosensitizing_agent: toBoolean(row.CHEBI_ROLE_radiosensitizing_agent),
-            CHEBI_ROLE_B_cell_lymphoma_2_inhibitor: toBoolean(row.CHEBI_ROLE_B_cell_lymphoma_2_inhibitor),
-            CHEBI_ROLE_IP3_receptor_antagonist: toBoolean(row.CHEBI_ROLE_IP3_receptor_antagonist),
-            CHEBI_ROLE_potassium_channel_opener: toBoolean(row.CHEBI_ROLE_potassium_channel_opener),
-            CHEBI_ROLE_potassium_channel_modulator: toBoolean(row.CHEBI_ROLE_potassium_channel_modulator),
-            CHEBI_ROLE_thyroid_hormone: toBoolean(row.CHEBI_ROLE_thyroid_hormone),
-            CHEBI_ROLE_NF_kappaB_inhibitor: toBoolean(row.CHEBI_ROLE_NF_kappaB_inhibitor),
-            CHEBI_ROLE_calcium_channel_agonist: toBoolean(row.CHEBI_ROLE_calcium_channel_agonist),
-            CHEBI_ROLE_adenosine_receptor_antagonist: toBoolean(row.CHEBI_ROLE_adenosine_receptor_antagonist),
-            CHEBI_ROLE_central_nervous_system_stimulant: toBoolean(row.CHEBI_ROLE_central_nervous_system_stimulant),
-            CHEBI_ROLE_adenosine_A1_receptor_antagonist: toBoolean(row.CHEBI_ROLE_adenosine_A1_receptor_antagonist),
-            CHEBI_ROLE_adenosine_A2A_receptor_antagonist: toBoolean(row.CHEBI_ROLE_adenosine_A2A_receptor_antagonist),
-            CHEBI_ROLE_adenosine_A2B_receptor_agonist: toBoolean(row.CHEBI_ROLE_adenosine_A2B_receptor_agonist),
-            CHEBI_ROLE_adenosine_receptor_agonist: toBoolean(row.CHEBI_ROLE_adenosine_receptor_agonist),
-            CHEBI_ROLE_nutraceutical: toBoolean(row.CHEBI_ROLE_nutraceutical),
-            CHEBI_ROLE_buffer: toBoolean(row.CHEBI_ROLE_buffer),
-            CHEBI_ROLE_catalyst: toBoolean(row.CHEBI_ROLE_catalyst),
-            CHEBI_ROLE_mordant: toBoolean(row.CHEBI_ROLE_mordant),
-            CHEBI_ROLE_laxative: toBoolean(row.CHEBI_ROLE_laxative),
-            CHEBI_ROLE_rat_metabolite: toBoolean(row.CHEBI_ROLE_rat_metabolite),
-            CHEBI_ROLE_diagnostic_agent: toBoolean(row.CHEBI_ROLE_diagnostic_agent),
-            CHEBI_ROLE_diagnostic_imaging_agent: toBoolean(row.CHEBI_ROLE_diagnostic_imaging_agent),
-            CHEBI_ROLE_MRI_contrast_agent: toBoolean(row.CHEBI_ROLE_MRI_contrast_agent),
-            CHEBI_ROLE_potassium_channel_blocker: toBoolean(row.CHEBI_ROLE_potassium_channel_blocker),
-            CHEBI_ROLE_flavouring_agent: toBoolean(row.CHEBI_ROLE_flavouring_agent),
-            CHEBI_ROLE_alkylating_agent: toBoolean(row.CHEBI_ROLE_alkylating_agent),
-            CHEBI_ROLE_EC_2_7_11_11_cAMP_dependent_protein_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_11_cAMP_dependent_protein_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_7_11_26_tau_protein_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_26_tau_protein_kinase_inhibitor),
-            CHEBI_ROLE_activator: toBoolean(row.CHEBI_ROLE_activator),
-            CHEBI_ROLE_Wnt_signalling_activator: toBoolean(row.CHEBI_ROLE_Wnt_signalling_activator),
-            CHEBI_ROLE_formyl_peptide_receptor_agonist: toBoolean(row.CHEBI_ROLE_formyl_peptide_receptor_agonist),
-            CHEBI_ROLE_prostaglandin_receptor_agonist: toBoolean(row.CHEBI_ROLE_prostaglandin_receptor_agonist),
-            CHEBI_ROLE_insecticide: toBoolean(row.CHEBI_ROLE_insecticide),
-            CHEBI_ROLE_epidermal_growth_factor_receptor_antagonist: toBoolean(row.CHEBI_ROLE_epidermal_growth_factor_receptor_antagonist),
-            CHEBI_ROLE_EC_1_4_3_oxidoreductase_acting_on_donor_CH_NH2_group__oxygen_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_3_oxidoreductase_acting_on_donor_CH_NH2_group__oxygen_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_4_3_4_monoamine_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_3_4_monoamine_oxidase_inhibitor),
-            CHEBI_ROLE_EC_1_4_oxidoreductase_acting_on_donor_CH_NH2_group_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_oxidoreductase_acting_on_donor_CH_NH2_group_inhibitor),
-            CHEBI_ROLE_EC_1_14_99_66_lysine_specific_histone_demethylase_1A_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_99_66_lysine_specific_histone_demethylase_1A_inhibitor),
-            CHEBI_ROLE_fertilizer: toBoolean(row.CHEBI_ROLE_fertilizer),
-            CHEBI_ROLE_flame_retardant: toBoolean(row.CHEBI_ROLE_flame_retardant),
-            CHEBI_ROLE_cofactor: toBoolean(row.CHEBI_ROLE_cofactor),
-            CHEBI_ROLE_nephroprotective_agent: toBoolean(row.CHEBI_ROLE_nephroprotective_agent),
-            CHEBI_ROLE_GABA_antagonist: toBoolean(row.CHEBI_ROLE_GABA_antagonist),
-            CHEBI_ROLE_antifungal_agrochemical: toBoolean(row.CHEBI_ROLE_antifungal_agrochemical),
-            CHEBI_ROLE_teichoic_acid_biosynthesis_inhibitor: toBoolean(row.CHEBI_ROLE_teichoic_acid_biosynthesis_inhibitor),
-            CHEBI_ROLE_EC_3_6_3_49_channel_conductance_controlling_ATPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_3_49_channel_conductance_controlling_ATPase_inhibitor),
-            CHEBI_ROLE_photochemical_role: toBoolean(row.CHEBI_ROLE_photochemical_role),
-            CHEBI_ROLE_ultraviolet_filter: toBoolean(row.CHEBI_ROLE_ultraviolet_filter),
-            CHEBI_ROLE_antipyretic: toBoolean(row.CHEBI_ROLE_antipyretic),
-            CHEBI_ROLE_EC_1_5_1_oxidoreductase_acting_on_donor_CH_NH_group__NAD___or_NADP___as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_5_1_oxidoreductase_acting_on_donor_CH_NH_group__NAD___or_NADP___as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_5_1_3_dihydrofolate_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_5_1_3_dihydrofolate_reductase_inhibitor),
-            CHEBI_ROLE_antifolate: toBoolean(row.CHEBI_ROLE_antifolate),
-            CHEBI_ROLE_EC_1_5_oxidoreductase_acting_on_donor_CH_NH_group_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_5_oxidoreductase_acting_on_donor_CH_NH_group_inhibitor),
-            CHEBI_ROLE_EC_2_7_11_20_elongation_factor_2_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_20_elongation_factor_2_kinase_inhibitor),
-            CHEBI_ROLE_pro_agent: toBoolean(row.CHEBI_ROLE_pro_agent),
-            CHEBI_ROLE_prodrug: toBoolean(row.CHEBI_ROLE_prodrug),
-            CHEBI_ROLE_surfactant: toBoolean(row.CHEBI_ROLE_surfactant),
-            CHEBI_ROLE_emulsifier: toBoolean(row.CHEBI_ROLE_emulsifier),
-            CHEBI_ROLE_detergent: toBoolean(row.CHEBI_ROLE_detergent),
-            CHEBI_ROLE_plant_growth_retardant: toBoolean(row.CHEBI_ROLE_plant_growth_retardant),
-            CHEBI_ROLE_growth_regulator: toBoolean(row.CHEBI_ROLE_growth_regulator),
-            CHEBI_ROLE_plant_growth_regulator: toBoolean(row.CHEBI_ROLE_plant_growth_regulator),
-            CHEBI_ROLE_tyrosine_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_tyrosine_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_7_10_1_receptor_protein_tyrosine_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_10_1_receptor_protein_tyrosine_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_7_10_protein_tyrosine_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_10_protein_tyrosine_kinase_inhibitor),
-            CHEBI_ROLE_RUNX1_inhibitor: toBoolean(row.CHEBI_ROLE_RUNX1_inhibitor),
-            CHEBI_ROLE_HIV_1_Tat_inhibitor: toBoolean(row.CHEBI_ROLE_HIV_1_Tat_inhibitor),
-            CHEBI_ROLE_melatonin_receptor_antagonist: toBoolean(row.CHEBI_ROLE_melatonin_receptor_antagonist),
-            CHEBI_ROLE_dopamine_receptor_D1_agonist: toBoolean(row.CHEBI_ROLE_dopamine_receptor_D1_agonist),
-            CHEBI_ROLE_dopamine_agonist: toBoolean(row.CHEBI_ROLE_dopamine_agonist),
-            CHEBI_ROLE_hypoglycemic_agent: toBoolean(row.CHEBI_ROLE_hypoglycemic_agent),
-            CHEBI_ROLE_EC_1_14_11_1_gamma_butyrobetaine_dioxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_11_1_gamma_butyrobetaine_dioxygenase_inhibitor),
-            CHEBI_ROLE_EC_1_13_11_11_tryptophan_2_3_dioxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_13_11_11_tryptophan_2_3_dioxygenase_inhibitor),
-            CHEBI_ROLE_B_Raf_inhibitor: toBoolean(row.CHEBI_ROLE_B_Raf_inhibitor),
-            CHEBI_ROLE_EC_3_4_22_53_calpain_2_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_22_53_calpain_2_inhibitor),
-            CHEBI_ROLE_EC_3_4_22_52_calpain_1_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_22_52_calpain_1_inhibitor),
-            CHEBI_ROLE_bronchoconstrictor_agent: toBoolean(row.CHEBI_ROLE_bronchoconstrictor_agent),
-            CHEBI_ROLE_antibiotic_insecticide: toBoolean(row.CHEBI_ROLE_antibiotic_insecticide),
-            CHEBI_ROLE_EC_2_4_glycosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_glycosyltransferase_inhibitor),
-            CHEBI_ROLE_antibiotic_pesticide: toBoolean(row.CHEBI_ROLE_antibiotic_pesticide),
-            CHEBI_ROLE_EC_3_2_1_28_alpha_alpha_trehalase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_28_alpha_alpha_trehalase_inhibitor),
-            CHEBI_ROLE_EC_2_4_1_hexosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_hexosyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_7_10_2_non_specific_protein_tyrosine_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_10_2_non_specific_protein_tyrosine_kinase_inhibitor),
-            CHEBI_ROLE_STAT3_inhibitor: toBoolean(row.CHEBI_ROLE_STAT3_inhibitor),
-            CHEBI_ROLE_carotenoid_biosynthesis_inhibitor: toBoolean(row.CHEBI_ROLE_carotenoid_biosynthesis_inhibitor),
-            CHEBI_ROLE_EC_3_6_3_44_xenobiotic_transporting_ATPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_3_44_xenobiotic_transporting_ATPase_inhibitor),
-            CHEBI_ROLE_EC_1_2_oxidoreductase_acting_on_donor_aldehyde_oxo_group_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_2_oxidoreductase_acting_on_donor_aldehyde_oxo_group_inhibitor),
-            CHEBI_ROLE_EC_3_4_24_18_meprin_A_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_24_18_meprin_A_inhibitor),
-            CHEBI_ROLE_EC_3_4_24_83_anthrax_lethal_factor_endopeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_24_83_anthrax_lethal_factor_endopeptidase_inhibitor),
-            CHEBI_ROLE_EC_1_2_3_1_aldehyde_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_2_3_1_aldehyde_oxidase_inhibitor),
-            CHEBI_ROLE_EC_1_2_3_oxidoreductase_acting_on_donor_aldehyde_oxo_group_with_oxygen_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_2_3_oxidoreductase_acting_on_donor_aldehyde_oxo_group_with_oxygen_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_3_6_3_1_phospholipid_translocating_ATPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_3_1_phospholipid_translocating_ATPase_inhibitor),
-            CHEBI_ROLE_EC_1_3_3_4_protoporphyrinogen_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_3_4_protoporphyrinogen_oxidase_inhibitor),
-            CHEBI_ROLE_EC_1_3_3_oxidoreductase_acting_on_donor_CH_CH_group__oxygen_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_3_oxidoreductase_acting_on_donor_CH_CH_group__oxygen_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_3_oxidoreductase_acting_on_donor_CH_CH_group_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_oxidoreductase_acting_on_donor_CH_CH_group_inhibitor),
-            CHEBI_ROLE_EC_3_1_4_12_sphingomyelin_phosphodiesterase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_4_12_sphingomyelin_phosphodiesterase_inhibitor),
-            CHEBI_ROLE_retinoic_acid_receptor_modulator: toBoolean(row.CHEBI_ROLE_retinoic_acid_receptor_modulator),
-            CHEBI_ROLE_retinoic_acid_receptor_antagonist: toBoolean(row.CHEBI_ROLE_retinoic_acid_receptor_antagonist),
-            CHEBI_ROLE_nuclear_receptor_modulator: toBoolean(row.CHEBI_ROLE_nuclear_receptor_modulator),
-            CHEBI_ROLE_antifungal_drug: toBoolean(row.CHEBI_ROLE_antifungal_drug),
-            CHEBI_ROLE_specialised_pro_resolving_mediator: toBoolean(row.CHEBI_ROLE_specialised_pro_resolving_mediator),
-            CHEBI_ROLE_signalling_molecule: toBoolean(row.CHEBI_ROLE_signalling_molecule),
-            CHEBI_ROLE_PPARalpha_agonist: toBoolean(row.CHEBI_ROLE_PPARalpha_agonist),
-            CHEBI_ROLE_mitogen: toBoolean(row.CHEBI_ROLE_mitogen),
-            CHEBI_ROLE_PPAR_modulator: toBoolean(row.CHEBI_ROLE_PPAR_modulator),
-            CHEBI_ROLE_phytogenic_insecticide: toBoolean(row.CHEBI_ROLE_phytogenic_insecticide),
-            CHEBI_ROLE_marine_xenobiotic_metabolite: toBoolean(row.CHEBI_ROLE_marine_xenobiotic_metabolite),
-            CHEBI_ROLE_plant_hormone: toBoolean(row.CHEBI_ROLE_plant_hormone),
-            CHEBI_ROLE_auxin: toBoolean(row.CHEBI_ROLE_auxin),
-            CHEBI_ROLE_synthetic_auxin: toBoolean(row.CHEBI_ROLE_synthetic_auxin),
-            CHEBI_ROLE_fluorescent_dye: toBoolean(row.CHEBI_ROLE_fluorescent_dye),
-            CHEBI_ROLE_fluorochrome: toBoolean(row.CHEBI_ROLE_fluorochrome),
-            CHEBI_ROLE_dye: toBoolean(row.CHEBI_ROLE_dye),
-            CHEBI_ROLE_excitatory_amino_acid_agonist: toBoolean(row.CHEBI_ROLE_excitatory_amino_acid_agonist),
-            CHEBI_ROLE_NMDA_receptor_agonist: toBoolean(row.CHEBI_ROLE_NMDA_receptor_agonist),
-            CHEBI_ROLE_EC_2_7_11_22_cyclin_dependent_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_22_cyclin_dependent_kinase_inhibitor),
-            CHEBI_ROLE_EC_3_5_1_99_fatty_acid_amide_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_1_99_fatty_acid_amide_hydrolase_inhibitor),
-            CHEBI_ROLE_capsaicin_receptor_antagonist: toBoolean(row.CHEBI_ROLE_capsaicin_receptor_antagonist),
-            CHEBI_ROLE_immunosuppressive_agent: toBoolean(row.CHEBI_ROLE_immunosuppressive_agent),
-            CHEBI_ROLE_herbicide_safener: toBoolean(row.CHEBI_ROLE_herbicide_safener),
-            CHEBI_ROLE_ryanodine_receptor_modulator: toBoolean(row.CHEBI_ROLE_ryanodine_receptor_modulator),
-            CHEBI_ROLE_ryanodine_receptor_agonist: toBoolean(row.CHEBI_ROLE_ryanodine_receptor_agonist),
-            CHEBI_ROLE_EC_2_4_1_17_glucuronosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_17_glucuronosyltransferase_inhibitor),
-            CHEBI_ROLE_EC_1_14_11_2_procollagen_proline_dioxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_11_2_procollagen_proline_dioxygenase_inhibitor),
-            CHEBI_ROLE_EC_3_2_glycosylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_glycosylase_inhibitor),
-            CHEBI_ROLE_EC_3_2_1_glycosidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_glycosidase_inhibitor),
-            CHEBI_ROLE_EC_3_2_1_10_oligo_1_6_glucosidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_10_oligo_1_6_glucosidase_inhibitor),
-            CHEBI_ROLE_EC_3_2_1_23_beta_galactosidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_23_beta_galactosidase_inhibitor),
-            CHEBI_ROLE_platelet_aggregation_inhibitor: toBoolean(row.CHEBI_ROLE_platelet_aggregation_inhibitor),
-            CHEBI_ROLE_endocrine_disruptor: toBoolean(row.CHEBI_ROLE_endocrine_disruptor),
-            CHEBI_ROLE_xenoestrogen: toBoolean(row.CHEBI_ROLE_xenoestrogen),
-            CHEBI_ROLE_antilipemic_drug: toBoolean(row.CHEBI_ROLE_antilipemic_drug),
-            CHEBI_ROLE_pyrethroid_ester_insecticide: toBoolean(row.CHEBI_ROLE_pyrethroid_ester_insecticide),
-            CHEBI_ROLE_sodium_channel_modulator: toBoolean(row.CHEBI_ROLE_sodium_channel_modulator),
-            CHEBI_ROLE_pyrethroid_insecticide: toBoolean(row.CHEBI_ROLE_pyrethroid_insecticide),
-            CHEBI_ROLE_insect_repellent: toBoolean(row.CHEBI_ROLE_insect_repellent),
-            CHEBI_ROLE_retinoic_acid_receptor_alpha_antagonist: toBoolean(row.CHEBI_ROLE_retinoic_acid_receptor_alpha_antagonist),
-            CHEBI_ROLE_anti_estrogen: toBoolean(row.CHEBI_ROLE_anti_estrogen),
-            CHEBI_ROLE_antifeedant: toBoolean(row.CHEBI_ROLE_antifeedant),
-            CHEBI_ROLE_bone_density_conservation_agent: toBoolean(row.CHEBI_ROLE_bone_density_conservation_agent),
-            CHEBI_ROLE_trypanocidal_drug: toBoolean(row.CHEBI_ROLE_trypanocidal_drug),
-            CHEBI_ROLE_platelet_activating_factor_receptor_antagonist: toBoolean(row.CHEBI_ROLE_platelet_activating_factor_receptor_antagonist),
-            CHEBI_ROLE_EC_3_2_1_20_alpha_glucosidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_20_alpha_glucosidase_inhibitor),
-            CHEBI_ROLE_sodium_channel_blocker: toBoolean(row.CHEBI_ROLE_sodium_channel_blocker),
-            CHEBI_ROLE_anti_allergic_agent: toBoolean(row.CHEBI_ROLE_anti_allergic_agent),
-            CHEBI_ROLE_EC_3_1_1_7_acetylcholinesterase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_1_7_acetylcholinesterase_inhibitor),
-            CHEBI_ROLE_EC_3_1_1_carboxylic_ester_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_1_carboxylic_ester_hydrolase_inhibitor),
-            CHEBI_ROLE_solvent: toBoolean(row.CHEBI_ROLE_solvent),
-            CHEBI_ROLE_polar_solvent: toBoolean(row.CHEBI_ROLE_polar_solvent),
-            CHEBI_ROLE_donor: toBoolean(row.CHEBI_ROLE_donor),
-            CHEBI_ROLE_acid: toBoolean(row.CHEBI_ROLE_acid),
-            CHEBI_ROLE_Bronsted_acid: toBoolean(row.CHEBI_ROLE_Bronsted_acid),
-            CHEBI_ROLE_protic_solvent: toBoolean(row.CHEBI_ROLE_protic_solvent),
-            CHEBI_ROLE_fragrance: toBoolean(row.CHEBI_ROLE_fragrance),
-            CHEBI_ROLE_EC_3_6_5_hydrolases_acting_on_GTP__involved_in_cellular_and_subcellular_movement_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_5_hydrolases_acting_on_GTP__involved_in_cellular_and_subcellular_movement_inhibitor),
-            CHEBI_ROLE_EC_3_6_5_5_dynamin_GTPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_5_5_dynamin_GTPase_inhibitor),
-            CHEBI_ROLE_reducing_agent: toBoolean(row.CHEBI_ROLE_reducing_agent),
-            CHEBI_ROLE_nephrotoxic_agent: toBoolean(row.CHEBI_ROLE_nephrotoxic_agent),
-            CHEBI_ROLE_neuromuscular_agent: toBoolean(row.CHEBI_ROLE_neuromuscular_agent),
-            CHEBI_ROLE_EC_1_14_18_oxidoreductase_acting_on_paired_donors__miscellaneous_compound_as_one_donor__incorporating_1_atom_of_oxygen_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_18_oxidoreductase_acting_on_paired_donors__miscellaneous_compound_as_one_donor__incorporating_1_atom_of_oxygen_inhibitor),
-            CHEBI_ROLE_EC_1_14_18_1_tyrosinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_18_1_tyrosinase_inhibitor),
-            CHEBI_ROLE_androgen_antagonist: toBoolean(row.CHEBI_ROLE_androgen_antagonist),
-            CHEBI_ROLE_EC_6_4_1_2_acetyl_CoA_carboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_4_1_2_acetyl_CoA_carboxylase_inhibitor),
-            CHEBI_ROLE_phenoxy_herbicide: toBoolean(row.CHEBI_ROLE_phenoxy_herbicide),
-            CHEBI_ROLE_EC_6_4_C_C_bond_forming_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_4_C_C_bond_forming_ligase_inhibitor),
-            CHEBI_ROLE_EC_6_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_ligase_inhibitor),
-            CHEBI_ROLE_EC_6_4_1_carboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_4_1_carboxylase_inhibitor),
-            CHEBI_ROLE_antileishmanial_agent: toBoolean(row.CHEBI_ROLE_antileishmanial_agent),
-            CHEBI_ROLE_EC_2_2_1_6_acetolactate_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_2_1_6_acetolactate_synthase_inhibitor),
-            CHEBI_ROLE_EC_2_2_1_transketolase_transaldolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_2_1_transketolase_transaldolase_inhibitor),
-            CHEBI_ROLE_EC_2_2_aldehyde_or_ketone_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_2_aldehyde_or_ketone_transferase_inhibitor),
-            CHEBI_ROLE_propesticide: toBoolean(row.CHEBI_ROLE_propesticide),
-            CHEBI_ROLE_proherbicide: toBoolean(row.CHEBI_ROLE_proherbicide),
-            CHEBI_ROLE_beta_adrenergic_drug: toBoolean(row.CHEBI_ROLE_beta_adrenergic_drug),
-            CHEBI_ROLE_angiotensin_receptor_antagonist: toBoolean(row.CHEBI_ROLE_angiotensin_receptor_antagonist),
-            CHEBI_ROLE_beta_adrenergic_antagonist: toBoolean(row.CHEBI_ROLE_beta_adrenergic_antagonist),
-            CHEBI_ROLE_angiogenesis_modulating_agent: toBoolean(row.CHEBI_ROLE_angiogenesis_modulating_agent),
-            CHEBI_ROLE_hepatitis_C_virus_nonstructural_protein_5A_inhibitor: toBoolean(row.CHEBI_ROLE_hepatitis_C_virus_nonstructural_protein_5A_inhibitor),
-            CHEBI_ROLE_EC_2_3_1_48_histone_acetyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_48_histone_acetyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_3_acyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_acyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_3_1_acyltransferase_transferring_other_than_amino_acyl_group_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_acyltransferase_transferring_other_than_amino_acyl_group_inhibitor),
-            CHEBI_ROLE_hepatitis_C_protease_inhibitor: toBoolean(row.CHEBI_ROLE_hepatitis_C_protease_inhibitor),
-            CHEBI_ROLE_antimitotic: toBoolean(row.CHEBI_ROLE_antimitotic),
-            CHEBI_ROLE_EC_2_7_11_24_mitogen_activated_protein_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_24_mitogen_activated_protein_kinase_inhibitor),
-            CHEBI_ROLE_hapten: toBoolean(row.CHEBI_ROLE_hapten),
-            CHEBI_ROLE_protein_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_protein_synthesis_inhibitor),
-            CHEBI_ROLE_inverse_agonist: toBoolean(row.CHEBI_ROLE_inverse_agonist),
-            CHEBI_ROLE_5_hydroxytryptamine_2A_receptor_inverse_agonist: toBoolean(row.CHEBI_ROLE_5_hydroxytryptamine_2A_receptor_inverse_agonist),
-            CHEBI_ROLE_lymphocyte_function_associated_antigen_1_antagonist: toBoolean(row.CHEBI_ROLE_lymphocyte_function_associated_antigen_1_antagonist),
-            CHEBI_ROLE_bradykinin_receptor_agonist: toBoolean(row.CHEBI_ROLE_bradykinin_receptor_agonist),
-            CHEBI_ROLE_bradykinin_receptor_B2_agonist: toBoolean(row.CHEBI_ROLE_bradykinin_receptor_B2_agonist),
-            CHEBI_ROLE_chemical_hybridisation_agent: toBoolean(row.CHEBI_ROLE_chemical_hybridisation_agent),
-            CHEBI_ROLE_fatty_acid_oxidation_inhibitor: toBoolean(row.CHEBI_ROLE_fatty_acid_oxidation_inhibitor),
-            CHEBI_ROLE_jasmonates: toBoolean(row.CHEBI_ROLE_jasmonates),
-            CHEBI_ROLE_EC_1_8_1_12_trypanothione_disulfide_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_8_1_12_trypanothione_disulfide_reductase_inhibitor),
-            CHEBI_ROLE_EC_1_8_1_4_dihydrolipoyl_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_8_1_4_dihydrolipoyl_dehydrogenase_inhibitor),
-            CHEBI_ROLE_EC_1_8_oxidoreductase_acting_on_sulfur_group_of_donors_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_8_oxidoreductase_acting_on_sulfur_group_of_donors_inhibitor),
-            CHEBI_ROLE_EC_1_8_1_oxidoreductase_acting_on_sulfur_group_of_donors__NAD___or_NADP___as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_8_1_oxidoreductase_acting_on_sulfur_group_of_donors__NAD___or_NADP___as_acceptor_inhibitor),
-            CHEBI_ROLE_cellulose_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_cellulose_synthesis_inhibitor),
-            CHEBI_ROLE_nicotinic_acetylcholine_receptor_agonist: toBoolean(row.CHEBI_ROLE_nicotinic_acetylcholine_receptor_agonist),
-            CHEBI_ROLE_GABA_gated_chloride_channel_antagonist: toBoolean(row.CHEBI_ROLE_GABA_gated_chloride_channel_antagonist),
-            CHEBI_ROLE_acaricide: toBoolean(row.CHEBI_ROLE_acaricide),
-            CHEBI_ROLE_radioopaque_medium: toBoolean(row.CHEBI_ROLE_radioopaque_medium),
-            CHEBI_ROLE_EC_2_5_1_46_deoxyhypusine_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_46_deoxyhypusine_synthase_inhibitor),
-            CHEBI_ROLE_EC_2_5_1_18_glutathione_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_18_glutathione_transferase_inhibitor),
-            CHEBI_ROLE_fumigant: toBoolean(row.CHEBI_ROLE_fumigant),
-            CHEBI_ROLE_fungal_xenobiotic_metabolite: toBoolean(row.CHEBI_ROLE_fungal_xenobiotic_metabolite),
-            CHEBI_ROLE_Arabidopsis_thaliana_metabolite: toBoolean(row.CHEBI_ROLE_Arabidopsis_thaliana_metabolite),
-            CHEBI_ROLE_probe: toBoolean(row.CHEBI_ROLE_probe),
-            CHEBI_ROLE_antidote: toBoolean(row.CHEBI_ROLE_antidote),
-            CHEBI_ROLE_insect_attractant: toBoolean(row.CHEBI_ROLE_insect_attractant),
-            CHEBI_ROLE_ergosterol_biosynthesis_inhibitor: toBoolean(row.CHEBI_ROLE_ergosterol_biosynthesis_inhibitor),
-            CHEBI_ROLE_sterol_biosynthesis_inhibitor: toBoolean(row.CHEBI_ROLE_sterol_biosynthesis_inhibitor),
-            CHEBI_ROLE_gut_flora_metabolite: toBoolean(row.CHEBI_ROLE_gut_flora_metabolite),
-            CHEBI_ROLE_uremic_toxin: toBoolean(row.CHEBI_ROLE_uremic_toxin),
-            CHEBI_ROLE_Maillard_reaction_product: toBoolean(row.CHEBI_ROLE_Maillard_reaction_product),
-            CHEBI_ROLE_thermal_degradation_product: toBoolean(row.CHEBI_ROLE_thermal_degradation_product),
-            CHEBI_ROLE_EC_2_3_1_85_fatty_acid_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_85_fatty_acid_synthase_inhibitor),
-            CHEBI_ROLE_antimalarial: toBoolean(row.CHEBI_ROLE_antimalarial),
-            CHEBI_ROLE_prosafener: toBoolean(row.CHEBI_ROLE_prosafener),
-            CHEBI_ROLE_neuropeptide_Y_receptor_antagonist: toBoolean(row.CHEBI_ROLE_neuropeptide_Y_receptor_antagonist),
-            CHEBI_ROLE_neurokinin_1_receptor_antagonist: toBoolean(row.CHEBI_ROLE_neurokinin_1_receptor_antagonist),
-            CHEBI_ROLE_Penicillium_metabolite: toBoolean(row.CHEBI_ROLE_Penicillium_metabolite),
-            CHEBI_ROLE_EC_2_3_1_26_sterol_O_acyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_26_sterol_O_acyltransferase_inhibitor),
-            CHEBI_ROLE_acyl_CoA_cholesterol_acyltransferase_2_inhibitor: toBoolean(row.CHEBI_ROLE_acyl_CoA_cholesterol_acyltransferase_2_inhibitor),
-            CHEBI_ROLE_cardiotoxic_agent: toBoolean(row.CHEBI_ROLE_cardiotoxic_agent),
-            CHEBI_ROLE_salt_inducible_kinase_2_inhibitor: toBoolean(row.CHEBI_ROLE_salt_inducible_kinase_2_inhibitor),
-            CHEBI_ROLE_proteasome_inhibitor: toBoolean(row.CHEBI_ROLE_proteasome_inhibitor),
-            CHEBI_ROLE_TRPV_channel_modulator: toBoolean(row.CHEBI_ROLE_TRPV_channel_modulator),
-            CHEBI_ROLE_TRP_channel_modulator: toBoolean(row.CHEBI_ROLE_TRP_channel_modulator),
-            CHEBI_ROLE_iron_ionophore: toBoolean(row.CHEBI_ROLE_iron_ionophore),
-            CHEBI_ROLE_siderophore: toBoolean(row.CHEBI_ROLE_siderophore),
-            CHEBI_ROLE_iron_3__chelator: toBoolean(row.CHEBI_ROLE_iron_3__chelator),
-            CHEBI_ROLE_ionophore: toBoolean(row.CHEBI_ROLE_ionophore),
-            CHEBI_ROLE_coenzyme: toBoolean(row.CHEBI_ROLE_coenzyme),
-            CHEBI_ROLE_anti_HSV_1_agent: toBoolean(row.CHEBI_ROLE_anti_HSV_1_agent),
-            CHEBI_ROLE_anti_HSV_agent: toBoolean(row.CHEBI_ROLE_anti_HSV_agent),
-            CHEBI_ROLE_fundamental_metabolite: toBoolean(row.CHEBI_ROLE_fundamental_metabolite),
-            CHEBI_ROLE_oxidising_agent: toBoolean(row.CHEBI_ROLE_oxidising_agent),
-            CHEBI_ROLE_neurotoxin: toBoolean(row.CHEBI_ROLE_neurotoxin),
-            CHEBI_ROLE_greenhouse_gas: toBoolean(row.CHEBI_ROLE_greenhouse_gas),
-            CHEBI_ROLE_persistent_organic_pollutant: toBoolean(row.CHEBI_ROLE_persistent_organic_pollutant),
-            CHEBI_ROLE_prosthetic_group: toBoolean(row.CHEBI_ROLE_prosthetic_group),
-            CHEBI_ROLE_EC_3_5_1_108_UDP_3_O_acyl_N_acetylglucosamine_deacetylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_1_108_UDP_3_O_acyl_N_acetylglucosamine_deacetylase_inhibitor),
-            CHEBI_ROLE_lipopolysaccharide_biosynthesis_inhibitor: toBoolean(row.CHEBI_ROLE_lipopolysaccharide_biosynthesis_inhibitor),
-            CHEBI_ROLE_antidote_to_barbiturate_poisoning: toBoolean(row.CHEBI_ROLE_antidote_to_barbiturate_poisoning),
-            CHEBI_ROLE_eukaryotic_initiation_factor_4F_inhibitor: toBoolean(row.CHEBI_ROLE_eukaryotic_initiation_factor_4F_inhibitor),
-            CHEBI_ROLE_capsaicin_receptor_agonist: toBoolean(row.CHEBI_ROLE_capsaicin_receptor_agonist),
-            CHEBI_ROLE_photobiochemical_role: toBoolean(row.CHEBI_ROLE_photobiochemical_role),
-            CHEBI_ROLE_luciferin: toBoolean(row.CHEBI_ROLE_luciferin),
-            CHEBI_ROLE_LRH_1_antagonist: toBoolean(row.CHEBI_ROLE_LRH_1_antagonist),
-            CHEBI_ROLE_EC_2_5_1_48_cystathionine_gamma_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_48_cystathionine_gamma_synthase_inhibitor),
-            CHEBI_ROLE_osteogenesis_regulator: toBoolean(row.CHEBI_ROLE_osteogenesis_regulator),
-            CHEBI_ROLE_autophagy_inhibitor: toBoolean(row.CHEBI_ROLE_autophagy_inhibitor),
-            CHEBI_ROLE_effector: toBoolean(row.CHEBI_ROLE_effector),
-            CHEBI_ROLE_matrix_metalloproteinase_inhibitor: toBoolean(row.CHEBI_ROLE_matrix_metalloproteinase_inhibitor),
-            CHEBI_ROLE_gamma_secretase_modulator: toBoolean(row.CHEBI_ROLE_gamma_secretase_modulator),
-            CHEBI_ROLE_Toll_like_receptor_2_agonist: toBoolean(row.CHEBI_ROLE_Toll_like_receptor_2_agonist),
-            CHEBI_ROLE_Papio_hamadryas_metabolite: toBoolean(row.CHEBI_ROLE_Papio_hamadryas_metabolite),
-            CHEBI_ROLE_phosphodiesterase_IV_inhibitor: toBoolean(row.CHEBI_ROLE_phosphodiesterase_IV_inhibitor),
-            CHEBI_ROLE_antipsoriatic: toBoolean(row.CHEBI_ROLE_antipsoriatic),
-            CHEBI_ROLE_EC_3_1_4_53_3__5__cyclic_AMP_phosphodiesterase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_4_53_3__5__cyclic_AMP_phosphodiesterase_inhibitor),
-            CHEBI_ROLE_opioid_analgesic: toBoolean(row.CHEBI_ROLE_opioid_analgesic),
-            CHEBI_ROLE_EC_2_4_2_30_NAD___ADP_ribosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_2_30_NAD___ADP_ribosyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_4_2_pentosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_2_pentosyltransferase_inhibitor),
-            CHEBI_ROLE_radioactive_imaging_agent: toBoolean(row.CHEBI_ROLE_radioactive_imaging_agent),
-            CHEBI_ROLE_PPARgamma_agonist: toBoolean(row.CHEBI_ROLE_PPARgamma_agonist),
-            CHEBI_ROLE_DNA_polymerase_inhibitor: toBoolean(row.CHEBI_ROLE_DNA_polymerase_inhibitor),
-            CHEBI_ROLE_EC_2_7_7_nucleotidyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_7_nucleotidyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_7_7_48_RNA_directed_RNA_polymerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_7_48_RNA_directed_RNA_polymerase_inhibitor),
-            CHEBI_ROLE_radiopharmaceutical: toBoolean(row.CHEBI_ROLE_radiopharmaceutical),
-            CHEBI_ROLE_tissue_adhesive: toBoolean(row.CHEBI_ROLE_tissue_adhesive),
-            CHEBI_ROLE_beta_adrenergic_agonist: toBoolean(row.CHEBI_ROLE_beta_adrenergic_agonist),
-            CHEBI_ROLE_sympathomimetic_agent: toBoolean(row.CHEBI_ROLE_sympathomimetic_agent),
-            CHEBI_ROLE_bile_therapy_drug: toBoolean(row.CHEBI_ROLE_bile_therapy_drug),
-            CHEBI_ROLE_ultrasound_contrast_agent: toBoolean(row.CHEBI_ROLE_ultrasound_contrast_agent),
-            CHEBI_ROLE_antiseptic_drug: toBoolean(row.CHEBI_ROLE_antiseptic_drug),
-            CHEBI_ROLE_EC_1_14_13_70_sterol_14alpha_demethylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_13_70_sterol_14alpha_demethylase_inhibitor),
-            CHEBI_ROLE_sterol_demethylation_inhibitor: toBoolean(row.CHEBI_ROLE_sterol_demethylation_inhibitor),
-            CHEBI_ROLE_antiparkinson_drug: toBoolean(row.CHEBI_ROLE_antiparkinson_drug),
-            CHEBI_ROLE_antidyskinesia_agent: toBoolean(row.CHEBI_ROLE_antidyskinesia_agent),
-            CHEBI_ROLE_muscle_relaxant: toBoolean(row.CHEBI_ROLE_muscle_relaxant),
-            CHEBI_ROLE_antispasmodic_drug: toBoolean(row.CHEBI_ROLE_antispasmodic_drug),
-            CHEBI_ROLE_peripheral_nervous_system_drug: toBoolean(row.CHEBI_ROLE_peripheral_nervous_system_drug),
-            CHEBI_ROLE_non_narcotic_analgesic: toBoolean(row.CHEBI_ROLE_non_narcotic_analgesic),
-            CHEBI_ROLE_disinfectant: toBoolean(row.CHEBI_ROLE_disinfectant),
-            CHEBI_ROLE_antifibrinolytic_drug: toBoolean(row.CHEBI_ROLE_antifibrinolytic_drug),
-            CHEBI_ROLE_fibrin_modulating_drug: toBoolean(row.CHEBI_ROLE_fibrin_modulating_drug),
-            CHEBI_ROLE_nootropic_agent: toBoolean(row.CHEBI_ROLE_nootropic_agent),
-            CHEBI_ROLE_aquaretic: toBoolean(row.CHEBI_ROLE_aquaretic),
-            CHEBI_ROLE_second_generation_antipsychotic: toBoolean(row.CHEBI_ROLE_second_generation_antipsychotic),
-            CHEBI_ROLE_topoisomerase_II_inhibitor: toBoolean(row.CHEBI_ROLE_topoisomerase_II_inhibitor),
-            CHEBI_ROLE_glucocorticoid_receptor_agonist: toBoolean(row.CHEBI_ROLE_glucocorticoid_receptor_agonist),
-            CHEBI_ROLE_oxytocic: toBoolean(row.CHEBI_ROLE_oxytocic),
-            CHEBI_ROLE_estrogen_receptor_agonist: toBoolean(row.CHEBI_ROLE_estrogen_receptor_agonist),
-            CHEBI_ROLE_estrogen_receptor_antagonist: toBoolean(row.CHEBI_ROLE_estrogen_receptor_antagonist),
-            CHEBI_ROLE_NMDA_receptor_antagonist: toBoolean(row.CHEBI_ROLE_NMDA_receptor_antagonist),
-            CHEBI_ROLE_mu_opioid_receptor_agonist: toBoolean(row.CHEBI_ROLE_mu_opioid_receptor_agonist),
-            CHEBI_ROLE_antitussive: toBoolean(row.CHEBI_ROLE_antitussive),
-            CHEBI_ROLE_opioid_receptor_agonist: toBoolean(row.CHEBI_ROLE_opioid_receptor_agonist),
-            CHEBI_ROLE_opioid_agent: toBoolean(row.CHEBI_ROLE_opioid_agent),
-            CHEBI_ROLE_mu_opioid_agent: toBoolean(row.CHEBI_ROLE_mu_opioid_agent),
-            CHEBI_ROLE_excitatory_amino_acid_antagonist: toBoolean(row.CHEBI_ROLE_excitatory_amino_acid_antagonist),
-            CHEBI_ROLE_EC_3_1_4_35_3__5__cyclic_GMP_phosphodiesterase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_4_35_3__5__cyclic_GMP_phosphodiesterase_inhibitor),
-            CHEBI_ROLE_Jacobaea_metabolite: toBoolean(row.CHEBI_ROLE_Jacobaea_metabolite),
-            CHEBI_ROLE_EC_2_4_2_8_hypoxanthine_phosphoribosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_2_8_hypoxanthine_phosphoribosyltransferase_inhibitor),
-            CHEBI_ROLE_Camellia_sinensis_metabolite: toBoolean(row.CHEBI_ROLE_Camellia_sinensis_metabolite),
-            CHEBI_ROLE_radiation_protective_agent: toBoolean(row.CHEBI_ROLE_radiation_protective_agent),
-            CHEBI_ROLE_Brassica_napus_metabolite: toBoolean(row.CHEBI_ROLE_Brassica_napus_metabolite),
-            CHEBI_ROLE_EC_3_4_21_5_thrombin_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_5_thrombin_inhibitor),
-            CHEBI_ROLE_EC_3_4_21_serine_endopeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_serine_endopeptidase_inhibitor),
-            CHEBI_ROLE_bile_acid_metabolite: toBoolean(row.CHEBI_ROLE_bile_acid_metabolite),
-            CHEBI_ROLE_sterol_methyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_sterol_methyltransferase_inhibitor),
-            CHEBI_ROLE_EC_4_1_C_C_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_C_C_lyase_inhibitor),
-            CHEBI_ROLE_EC_4_1_1_carboxy_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_1_carboxy_lyase_inhibitor),
-            CHEBI_ROLE_EC_4_1_1_19_arginine_decarboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_1_19_arginine_decarboxylase_inhibitor),
-            CHEBI_ROLE_EC_2_3_3_1__citrate_Si_synthase__inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_3_1__citrate_Si_synthase__inhibitor),
-            CHEBI_ROLE_EC_2_3_3_acyltransferase_converting_acyl_to_alkyl_group_on_transfer_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_3_acyltransferase_converting_acyl_to_alkyl_group_on_transfer_inhibitor),
-            CHEBI_ROLE_excipient: toBoolean(row.CHEBI_ROLE_excipient),
-            CHEBI_ROLE_proacaricide: toBoolean(row.CHEBI_ROLE_proacaricide),
-            CHEBI_ROLE_protecting_group: toBoolean(row.CHEBI_ROLE_protecting_group),
-            CHEBI_ROLE_carboxylic_acid_protecting_group: toBoolean(row.CHEBI_ROLE_carboxylic_acid_protecting_group),
-            CHEBI_ROLE_EC_4_1_1_17_ornithine_decarboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_1_17_ornithine_decarboxylase_inhibitor),
-            CHEBI_ROLE_EC_1_11_2_2_myeloperoxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_11_2_2_myeloperoxidase_inhibitor),
-            CHEBI_ROLE_EC_1_11_oxidoreductase_acting_on_peroxide_as_donors_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_11_oxidoreductase_acting_on_peroxide_as_donors_inhibitor),
-            CHEBI_ROLE_EC_1_11_2_oxidoreductase_with_H2O2_as_acceptor__incorporating_1_O_atom_into_product_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_11_2_oxidoreductase_with_H2O2_as_acceptor__incorporating_1_O_atom_into_product_inhibitor),
-            CHEBI_ROLE_ferroptosis_inducer: toBoolean(row.CHEBI_ROLE_ferroptosis_inducer),
-            CHEBI_ROLE_BET_bromodomain_inhibitor: toBoolean(row.CHEBI_ROLE_BET_bromodomain_inhibitor),
-            CHEBI_ROLE_bromodomain_containing_protein_4_inhibitor: toBoolean(row.CHEBI_ROLE_bromodomain_containing_protein_4_inhibitor),
-            CHEBI_ROLE_EC_3_4_24_24_gelatinase_A_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_24_24_gelatinase_A_inhibitor),
-            CHEBI_ROLE_reagent: toBoolean(row.CHEBI_ROLE_reagent),
-            CHEBI_ROLE_colorimetric_reagent: toBoolean(row.CHEBI_ROLE_colorimetric_reagent),
-            CHEBI_ROLE_gibberellin_biosynthesis_inhibitor: toBoolean(row.CHEBI_ROLE_gibberellin_biosynthesis_inhibitor),
-            CHEBI_ROLE_plasticiser: toBoolean(row.CHEBI_ROLE_plasticiser),
-            CHEBI_ROLE_TRPA1_channel_agonist: toBoolean(row.CHEBI_ROLE_TRPA1_channel_agonist),
-            CHEBI_ROLE_fluorescent_probe: toBoolean(row.CHEBI_ROLE_fluorescent_probe),
-            CHEBI_ROLE_RhoC_inhibitor: toBoolean(row.CHEBI_ROLE_RhoC_inhibitor),
-            CHEBI_ROLE_RhoA_inhibitor: toBoolean(row.CHEBI_ROLE_RhoA_inhibitor),
-            CHEBI_ROLE_anxiogenic: toBoolean(row.CHEBI_ROLE_anxiogenic),
-            CHEBI_ROLE_ATPase_motor_cytoplasmic_dynein_inhibitor: toBoolean(row.CHEBI_ROLE_ATPase_motor_cytoplasmic_dynein_inhibitor),
-            CHEBI_ROLE_chromophore: toBoolean(row.CHEBI_ROLE_chromophore),
-            CHEBI_ROLE_cannabinoid_receptor_agonist: toBoolean(row.CHEBI_ROLE_cannabinoid_receptor_agonist),
-            CHEBI_ROLE_teratogenic_agent: toBoolean(row.CHEBI_ROLE_teratogenic_agent),
-            CHEBI_ROLE_EC_3_4_22_56_caspase_3_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_22_56_caspase_3_inhibitor),
-            CHEBI_ROLE_oxidized_luciferins: toBoolean(row.CHEBI_ROLE_oxidized_luciferins),
-            CHEBI_ROLE_antidote_to_cyanide_poisoning: toBoolean(row.CHEBI_ROLE_antidote_to_cyanide_poisoning),
-            CHEBI_ROLE_hormone_agonist: toBoolean(row.CHEBI_ROLE_hormone_agonist),
-            CHEBI_ROLE_angiotensin_receptor_agonist: toBoolean(row.CHEBI_ROLE_angiotensin_receptor_agonist),
-            CHEBI_ROLE_SMO_receptor_agonist: toBoolean(row.CHEBI_ROLE_SMO_receptor_agonist),
-            CHEBI_ROLE_tracer: toBoolean(row.CHEBI_ROLE_tracer),
-            CHEBI_ROLE_enzyme_activator: toBoolean(row.CHEBI_ROLE_enzyme_activator),
-            CHEBI_ROLE_alpha_secretase_activator: toBoolean(row.CHEBI_ROLE_alpha_secretase_activator),
-            CHEBI_ROLE_EC_1_6_5_3__NADH_ubiquinone_reductase_H___translocating___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_6_5_3__NADH_ubiquinone_reductase_H___translocating___inhibitor),
-            CHEBI_ROLE_nicotinic_acid_adenine_dinucleotide_phosphate_receptor_antagonist: toBoolean(row.CHEBI_ROLE_nicotinic_acid_adenine_dinucleotide_phosphate_receptor_antagonist),
-            CHEBI_ROLE_IP3_receptor_agonist: toBoolean(row.CHEBI_ROLE_IP3_receptor_agonist),
-            CHEBI_ROLE_coral_metabolite: toBoolean(row.CHEBI_ROLE_coral_metabolite),
-            CHEBI_ROLE_p53_activator: toBoolean(row.CHEBI_ROLE_p53_activator),
-            CHEBI_ROLE_LIM_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_LIM_kinase_inhibitor),
-            CHEBI_ROLE_prostaglandin_receptor_antagonist: toBoolean(row.CHEBI_ROLE_prostaglandin_receptor_antagonist),
-            CHEBI_ROLE_EC_1_1_1_141__15_hydroxyprostaglandin_dehydrogenase_NAD_____inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_141__15_hydroxyprostaglandin_dehydrogenase_NAD_____inhibitor),
-            CHEBI_ROLE_EC_3_4_24_35_gelatinase_B_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_24_35_gelatinase_B_inhibitor),
-            CHEBI_ROLE_EC_3_5_1_2_glutaminase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_1_2_glutaminase_inhibitor),
-            CHEBI_ROLE_EC_6_3_C_N_bond_forming_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_C_N_bond_forming_ligase_inhibitor),
-            CHEBI_ROLE_EC_6_3_5_carbon_nitrogen_ligases_with_glutamine_as_amido_N_donor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_5_carbon_nitrogen_ligases_with_glutamine_as_amido_N_donor_inhibitor),
-            CHEBI_ROLE_EC_6_3_5_2__GMP_synthase_glutamine_hydrolysing___inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_5_2__GMP_synthase_glutamine_hydrolysing___inhibitor),
-            CHEBI_ROLE_EC_6_3_5_4__asparagine_synthase_glutamine_hydrolysing___inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_5_4__asparagine_synthase_glutamine_hydrolysing___inhibitor),
-            CHEBI_ROLE_EC_6_3_5_1__NAD___synthase_glutamine_hydrolysing___inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_5_1__NAD___synthase_glutamine_hydrolysing___inhibitor),
-            CHEBI_ROLE_EC_6_3_4_2__CTP_synthase_glutamine_hydrolyzing___inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_4_2__CTP_synthase_glutamine_hydrolyzing___inhibitor),
-            CHEBI_ROLE_EC_6_3_4_other_carbon_nitrogen_ligases_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_4_other_carbon_nitrogen_ligases_inhibitor),
-            CHEBI_ROLE_EC_2_4_2_14_amidophosphoribosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_2_14_amidophosphoribosyltransferase_inhibitor),
-            CHEBI_ROLE_glutamine_antagonist: toBoolean(row.CHEBI_ROLE_glutamine_antagonist),
-            CHEBI_ROLE_EC_6_3_5_5__carbamoyl_phosphate_synthase_glutamine_hydrolysing___inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_5_5__carbamoyl_phosphate_synthase_glutamine_hydrolysing___inhibitor),
-            CHEBI_ROLE_EC_6_3_5_3_phosphoribosylformylglycinamidine_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_5_3_phosphoribosylformylglycinamidine_synthase_inhibitor),
-            CHEBI_ROLE_EC_4_1_1_39_ribulose_bisphosphate_carboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_1_39_ribulose_bisphosphate_carboxylase_inhibitor),
-            CHEBI_ROLE_EC_3_1_1_8_cholinesterase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_1_8_cholinesterase_inhibitor),
-            CHEBI_ROLE_melanin_concentrating_hormone_receptor_antagonist: toBoolean(row.CHEBI_ROLE_melanin_concentrating_hormone_receptor_antagonist),
-            CHEBI_ROLE_vitamin_D_receptor_agonist: toBoolean(row.CHEBI_ROLE_vitamin_D_receptor_agonist),
-            CHEBI_ROLE_EC_3_2_1_48_sucrose_alpha_glucosidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_48_sucrose_alpha_glucosidase_inhibitor),
-            CHEBI_ROLE_cis_Golgi_ArfGEF_GBF_inhibitor: toBoolean(row.CHEBI_ROLE_cis_Golgi_ArfGEF_GBF_inhibitor),
-            CHEBI_ROLE_thromboxane_A2_agonist: toBoolean(row.CHEBI_ROLE_thromboxane_A2_agonist),
-            CHEBI_ROLE_EC_3_1_3_48_protein_tyrosine_phosphatase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_3_48_protein_tyrosine_phosphatase_inhibitor),
-            CHEBI_ROLE_EC_3_1_3_phosphoric_monoester_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_3_phosphoric_monoester_hydrolase_inhibitor),
-            CHEBI_ROLE_PERK_inhibitor: toBoolean(row.CHEBI_ROLE_PERK_inhibitor),
-            CHEBI_ROLE_hallucinogen: toBoolean(row.CHEBI_ROLE_hallucinogen),
-            CHEBI_ROLE_EC_2_4_1_255_protein_O_GlcNAc_transferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_255_protein_O_GlcNAc_transferase_inhibitor),
-            CHEBI_ROLE_mTOR_inhibitor: toBoolean(row.CHEBI_ROLE_mTOR_inhibitor),
-            CHEBI_ROLE_protein_kinase_agonist: toBoolean(row.CHEBI_ROLE_protein_kinase_agonist),
-            CHEBI_ROLE_protein_kinase_C_agonist: toBoolean(row.CHEBI_ROLE_protein_kinase_C_agonist),
-            CHEBI_ROLE_lysophosphatidic_acid_receptor_3_agonist: toBoolean(row.CHEBI_ROLE_lysophosphatidic_acid_receptor_3_agonist),
-            CHEBI_ROLE_G_protein_coupled_receptor_agonist: toBoolean(row.CHEBI_ROLE_G_protein_coupled_receptor_agonist),
-            CHEBI_ROLE_peptide_allergen: toBoolean(row.CHEBI_ROLE_peptide_allergen),
-            CHEBI_ROLE_peptide_probe: toBoolean(row.CHEBI_ROLE_peptide_probe),
-            CHEBI_ROLE_TRPV4_agonist: toBoolean(row.CHEBI_ROLE_TRPV4_agonist),
-            CHEBI_ROLE_EC_1_14_17_oxidoreductase_acting_on_paired_donors__with_incorporation_or_reduction_of_molecular_oxygen_and_with_reduced_ascorbate_as_one_donor__and_incorporation_of_one_atom_of_oxygen_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_17_oxidoreductase_acting_on_paired_donors__with_incorporation_or_reduction_of_molecular_oxygen_and_with_reduced_ascorbate_as_one_donor__and_incorporation_of_one_atom_of_oxygen_inhibitor),
-            CHEBI_ROLE_EC_1_14_17_1_dopamine_beta_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_17_1_dopamine_beta_monooxygenase_inhibitor),
-            CHEBI_ROLE_EC_3_1_1_4_phospholipase_A2_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_1_4_phospholipase_A2_inhibitor),
-            CHEBI_ROLE_TRP_channel_blocker: toBoolean(row.CHEBI_ROLE_TRP_channel_blocker),
-            CHEBI_ROLE_isotopic_tracer: toBoolean(row.CHEBI_ROLE_isotopic_tracer),
-            CHEBI_ROLE_phytoalexin: toBoolean(row.CHEBI_ROLE_phytoalexin),
-            CHEBI_ROLE_electron_donor: toBoolean(row.CHEBI_ROLE_electron_donor),
-            CHEBI_ROLE_corticotropin_releasing_factor_receptor_antagonist: toBoolean(row.CHEBI_ROLE_corticotropin_releasing_factor_receptor_antagonist),
-            CHEBI_ROLE_survivin_suppressant: toBoolean(row.CHEBI_ROLE_survivin_suppressant),
-            CHEBI_ROLE_calcium_dependent_antibiotics: toBoolean(row.CHEBI_ROLE_calcium_dependent_antibiotics),
-            CHEBI_ROLE_EC_3_4_21_6_coagulation_factor_Xa_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_6_coagulation_factor_Xa_inhibitor),
-            CHEBI_ROLE_tropomyosin_related_kinase_B_receptor_agonist: toBoolean(row.CHEBI_ROLE_tropomyosin_related_kinase_B_receptor_agonist),
-            CHEBI_ROLE_tropomyosin_related_kinase_B_receptor_antagonist: toBoolean(row.CHEBI_ROLE_tropomyosin_related_kinase_B_receptor_antagonist),
-            CHEBI_ROLE_neurokinin_3_receptor_antagonist: toBoolean(row.CHEBI_ROLE_neurokinin_3_receptor_antagonist),
-            CHEBI_ROLE_antidiarrhoeal_drug: toBoolean(row.CHEBI_ROLE_antidiarrhoeal_drug),
-            CHEBI_ROLE_Hsp90_inhibitor: toBoolean(row.CHEBI_ROLE_Hsp90_inhibitor),
-            CHEBI_ROLE_EC_3_6_4_10_non_chaperonin_molecular_chaperone_ATPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_4_10_non_chaperonin_molecular_chaperone_ATPase_inhibitor),
-            CHEBI_ROLE_EC_3_6_4_hydrolases_acting_on_ATP__involved_in_cellular_and_subcellular_movement_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_4_hydrolases_acting_on_ATP__involved_in_cellular_and_subcellular_movement_inhibitor),
-            CHEBI_ROLE_cathartic: toBoolean(row.CHEBI_ROLE_cathartic),
-            CHEBI_ROLE_tumour_antigen: toBoolean(row.CHEBI_ROLE_tumour_antigen),
-            CHEBI_ROLE_secreted_frizzled_related_protein_1_inhibitor: toBoolean(row.CHEBI_ROLE_secreted_frizzled_related_protein_1_inhibitor),
-            CHEBI_ROLE_5_hydroxytryptamine_2A_receptor_agonist: toBoolean(row.CHEBI_ROLE_5_hydroxytryptamine_2A_receptor_agonist),
-            CHEBI_ROLE_glioma_associated_oncogene_inhibitor: toBoolean(row.CHEBI_ROLE_glioma_associated_oncogene_inhibitor),
-            CHEBI_ROLE_Hedgehog_signaling_pathway_inhibitor: toBoolean(row.CHEBI_ROLE_Hedgehog_signaling_pathway_inhibitor),
-            CHEBI_ROLE_neuropeptide_FF_receptor_antagonist: toBoolean(row.CHEBI_ROLE_neuropeptide_FF_receptor_antagonist),
-            CHEBI_ROLE_neuropeptide_FF_receptor_agonist: toBoolean(row.CHEBI_ROLE_neuropeptide_FF_receptor_agonist),
-            CHEBI_ROLE_kisspeptin_receptor_agonist: toBoolean(row.CHEBI_ROLE_kisspeptin_receptor_agonist),
-            CHEBI_ROLE_oxidative_phosphorylation_inhibitor: toBoolean(row.CHEBI_ROLE_oxidative_phosphorylation_inhibitor),
-            CHEBI_ROLE_proinsecticide: toBoolean(row.CHEBI_ROLE_proinsecticide),
-            CHEBI_ROLE_profungicide: toBoolean(row.CHEBI_ROLE_profungicide),
-            CHEBI_ROLE_pronematicide: toBoolean(row.CHEBI_ROLE_pronematicide),
-            CHEBI_ROLE_animal_growth_promotant: toBoolean(row.CHEBI_ROLE_animal_growth_promotant),
-            CHEBI_ROLE_EC_4_1_1_15_glutamate_decarboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_1_15_glutamate_decarboxylase_inhibitor),
-            CHEBI_ROLE_phospholipid_biosynthesis_inhibitor: toBoolean(row.CHEBI_ROLE_phospholipid_biosynthesis_inhibitor),
-            CHEBI_ROLE_plant_activator: toBoolean(row.CHEBI_ROLE_plant_activator),
-            CHEBI_ROLE_pediculicide: toBoolean(row.CHEBI_ROLE_pediculicide),
-            CHEBI_ROLE_scabicide: toBoolean(row.CHEBI_ROLE_scabicide),
-            CHEBI_ROLE_antifouling_biocide: toBoolean(row.CHEBI_ROLE_antifouling_biocide),
-            CHEBI_ROLE_Hsp70_inducer: toBoolean(row.CHEBI_ROLE_Hsp70_inducer),
-            CHEBI_ROLE_fuel_additive: toBoolean(row.CHEBI_ROLE_fuel_additive),
-            CHEBI_ROLE_polar_aprotic_solvent: toBoolean(row.CHEBI_ROLE_polar_aprotic_solvent),
-            CHEBI_ROLE_aprotic_solvent: toBoolean(row.CHEBI_ROLE_aprotic_solvent),
-            CHEBI_ROLE_EC_2_7_1_91_sphingosine_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_91_sphingosine_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_7_1_phosphotransferases_with_an_alcohol_group_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_phosphotransferases_with_an_alcohol_group_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_2_5_1_58_protein_farnesyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_58_protein_farnesyltransferase_inhibitor),
-            CHEBI_ROLE_HIV_1_integrase_inhibitor: toBoolean(row.CHEBI_ROLE_HIV_1_integrase_inhibitor),
-            CHEBI_ROLE_5_hydroxytryptamine_2B_receptor_agonist: toBoolean(row.CHEBI_ROLE_5_hydroxytryptamine_2B_receptor_agonist),
-            CHEBI_ROLE_5_hydroxytryptamine_2C_receptor_agonist: toBoolean(row.CHEBI_ROLE_5_hydroxytryptamine_2C_receptor_agonist),
-            CHEBI_ROLE_explosive: toBoolean(row.CHEBI_ROLE_explosive),
-            CHEBI_ROLE_soluble_guanylate_cyclase_activator: toBoolean(row.CHEBI_ROLE_soluble_guanylate_cyclase_activator),
-            CHEBI_ROLE_EC_1_14_15_oxidoreductase_acting_on_paired_donors__with_reduced_Fe_S_protein_as_one_donor__incorporating_1_O_atom_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_15_oxidoreductase_acting_on_paired_donors__with_reduced_Fe_S_protein_as_one_donor__incorporating_1_O_atom_inhibitor),
-            CHEBI_ROLE_EC_1_14_15_3_alkane_1_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_15_3_alkane_1_monooxygenase_inhibitor),
-            CHEBI_ROLE_EC_1_14_14_94_leukotriene_B4_20_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_14_94_leukotriene_B4_20_monooxygenase_inhibitor),
-            CHEBI_ROLE_fumigant_insecticide: toBoolean(row.CHEBI_ROLE_fumigant_insecticide),
-            CHEBI_ROLE_food_emulsifier: toBoolean(row.CHEBI_ROLE_food_emulsifier),
-            CHEBI_ROLE_cosmetic: toBoolean(row.CHEBI_ROLE_cosmetic),
-            CHEBI_ROLE_female_contraceptive_drug: toBoolean(row.CHEBI_ROLE_female_contraceptive_drug),
-            CHEBI_ROLE_reproductive_control_drug: toBoolean(row.CHEBI_ROLE_reproductive_control_drug),
-            CHEBI_ROLE_oral_contraceptive: toBoolean(row.CHEBI_ROLE_oral_contraceptive),
-            CHEBI_ROLE_contraceptive_drug: toBoolean(row.CHEBI_ROLE_contraceptive_drug),
-            CHEBI_ROLE_EC_2_5_1_117_homogentisate_solanesyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_117_homogentisate_solanesyltransferase_inhibitor),
-            CHEBI_ROLE_EC_3_3_ether_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_3_ether_hydrolase_inhibitor),
-            CHEBI_ROLE_EC_3_3_2_10_soluble_epoxide_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_3_2_10_soluble_epoxide_hydrolase_inhibitor),
-            CHEBI_ROLE_EC_6_3_1_acid_ammonia_amine_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_1_acid_ammonia_amine_ligase_inhibitor),
-            CHEBI_ROLE_EC_6_3_1_2_glutamate_ammonia_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_1_2_glutamate_ammonia_ligase_inhibitor),
-            CHEBI_ROLE_EC_1_3_5_oxidoreductase_acting_on_CH_CH_of_donor_with_a_quinone_or_related_compound_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_5_oxidoreductase_acting_on_CH_CH_of_donor_with_a_quinone_or_related_compound_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_3_5_1__succinate_dehydrogenase_quinone___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_5_1__succinate_dehydrogenase_quinone___inhibitor),
-            CHEBI_ROLE_GABAB_receptor_agonist: toBoolean(row.CHEBI_ROLE_GABAB_receptor_agonist),
-            CHEBI_ROLE_EC_2_7_12__dual_specificity_kinases_those_acting_on_Ser_Thr_and_Tyr_residues___inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_12__dual_specificity_kinases_those_acting_on_Ser_Thr_and_Tyr_residues___inhibitor),
-            CHEBI_ROLE_EC_2_7_11_13_protein_kinase_C_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_13_protein_kinase_C_inhibitor),
-            CHEBI_ROLE_EC_3_1_3_16_phosphoprotein_phosphatase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_3_16_phosphoprotein_phosphatase_inhibitor),
-            CHEBI_ROLE_virulence_factor: toBoolean(row.CHEBI_ROLE_virulence_factor),
-            CHEBI_ROLE_EC_1_14_15_6_cholesterol_monooxygenase_side_chain_cleaving_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_15_6_cholesterol_monooxygenase_side_chain_cleaving_inhibitor),
-            CHEBI_ROLE_H1_receptor_antagonist: toBoolean(row.CHEBI_ROLE_H1_receptor_antagonist),
-            CHEBI_ROLE_GABAA_receptor_agonist: toBoolean(row.CHEBI_ROLE_GABAA_receptor_agonist),
-            CHEBI_ROLE_pro_angiogenic_agent: toBoolean(row.CHEBI_ROLE_pro_angiogenic_agent),
-            CHEBI_ROLE_food_gelling_agent: toBoolean(row.CHEBI_ROLE_food_gelling_agent),
-            CHEBI_ROLE_food_stabiliser: toBoolean(row.CHEBI_ROLE_food_stabiliser),
-            CHEBI_ROLE_food_thickening_agent: toBoolean(row.CHEBI_ROLE_food_thickening_agent),
-            CHEBI_ROLE_EC_1_3_1_70_Delta_14_sterol_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_1_70_Delta_14_sterol_reductase_inhibitor),
-            CHEBI_ROLE_EC_1_3_1_oxidoreductase_acting_on_donor_CH_CH_group__NAD___or_NADP___as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_1_oxidoreductase_acting_on_donor_CH_CH_group__NAD___or_NADP___as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_14_14_154_sterol_14alpha_demethylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_14_154_sterol_14alpha_demethylase_inhibitor),
-            CHEBI_ROLE_EC_5_1_1_racemases_acting_on_amino_acids_and_derivatives_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_1_1_racemases_acting_on_amino_acids_and_derivatives_inhibitor),
-            CHEBI_ROLE_EC_5_1_racemase_epimerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_1_racemase_epimerase_inhibitor),
-            CHEBI_ROLE_EC_2_7_1_40_pyruvate_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_40_pyruvate_kinase_inhibitor),
-            CHEBI_ROLE_EC_5_99_1_2_DNA_topoisomerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_99_1_2_DNA_topoisomerase_inhibitor),
-            CHEBI_ROLE_lichen_metabolite: toBoolean(row.CHEBI_ROLE_lichen_metabolite),
-            CHEBI_ROLE_copper_chelator: toBoolean(row.CHEBI_ROLE_copper_chelator),
-            CHEBI_ROLE_EC_2_7_1_105_6_phosphofructo_2_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_105_6_phosphofructo_2_kinase_inhibitor),
-            CHEBI_ROLE_anti_anaemic_agent: toBoolean(row.CHEBI_ROLE_anti_anaemic_agent),
-            CHEBI_ROLE_EC_6_2_1_3_long_chain_fatty_acid_CoA_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_2_1_3_long_chain_fatty_acid_CoA_ligase_inhibitor),
-            CHEBI_ROLE_EC_6_2_C_S_bond_forming_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_2_C_S_bond_forming_ligase_inhibitor),
-            CHEBI_ROLE_EC_6_2_1_acid_thiol_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_2_1_acid_thiol_ligase_inhibitor),
-            CHEBI_ROLE_EC_3_1_1_64_retinoid_isomerohydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_1_64_retinoid_isomerohydrolase_inhibitor),
-            CHEBI_ROLE_parasympatholytic: toBoolean(row.CHEBI_ROLE_parasympatholytic),
-            CHEBI_ROLE_biological_pigment: toBoolean(row.CHEBI_ROLE_biological_pigment),
-            CHEBI_ROLE_C5a_receptor_antagonist: toBoolean(row.CHEBI_ROLE_C5a_receptor_antagonist),
-            CHEBI_ROLE_G_protein_coupled_receptor_antagonist: toBoolean(row.CHEBI_ROLE_G_protein_coupled_receptor_antagonist),
-            CHEBI_ROLE_sphingosine_1_phosphate_receptor_antagonist: toBoolean(row.CHEBI_ROLE_sphingosine_1_phosphate_receptor_antagonist),
-            CHEBI_ROLE_sphingosine_1_phosphate_receptor_3_antagonist: toBoolean(row.CHEBI_ROLE_sphingosine_1_phosphate_receptor_3_antagonist),
-            CHEBI_ROLE_sphingosine_1_phosphate_receptor_1_antagonist: toBoolean(row.CHEBI_ROLE_sphingosine_1_phosphate_receptor_1_antagonist),
-            CHEBI_ROLE_EC_3_6_5_2_small_monomeric_GTPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_5_2_small_monomeric_GTPase_inhibitor),
-            CHEBI_ROLE_sweetening_agent: toBoolean(row.CHEBI_ROLE_sweetening_agent),
-            CHEBI_ROLE_antispermatogenic_agent: toBoolean(row.CHEBI_ROLE_antispermatogenic_agent),
-            CHEBI_ROLE_EC_2_6_1_19_4_aminobutyrate_2_oxoglutarate_transaminase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_6_1_19_4_aminobutyrate_2_oxoglutarate_transaminase_inhibitor),
-            CHEBI_ROLE_allelochemical: toBoolean(row.CHEBI_ROLE_allelochemical),
-            CHEBI_ROLE_hyaluronan_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_hyaluronan_synthesis_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_42_isocitrate_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_42_isocitrate_dehydrogenase_inhibitor),
-            CHEBI_ROLE_tubulin_modulator: toBoolean(row.CHEBI_ROLE_tubulin_modulator),
-            CHEBI_ROLE_microtubule_destabilising_agent: toBoolean(row.CHEBI_ROLE_microtubule_destabilising_agent),
-            CHEBI_ROLE_EC_2_7_11_21_polo_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_21_polo_kinase_inhibitor),
-            CHEBI_ROLE_SMO_receptor_antagonist: toBoolean(row.CHEBI_ROLE_SMO_receptor_antagonist),
-            CHEBI_ROLE_prohormone: toBoolean(row.CHEBI_ROLE_prohormone),
-            CHEBI_ROLE_H2_receptor_antagonist: toBoolean(row.CHEBI_ROLE_H2_receptor_antagonist),
-            CHEBI_ROLE_antihypotensive_agent: toBoolean(row.CHEBI_ROLE_antihypotensive_agent),
-            CHEBI_ROLE_protein_kinase_A_agonist: toBoolean(row.CHEBI_ROLE_protein_kinase_A_agonist),
-            CHEBI_ROLE_forkhead_box_protein_O1_inhibitor: toBoolean(row.CHEBI_ROLE_forkhead_box_protein_O1_inhibitor),
-            CHEBI_ROLE_EC_3_4_17_23_angiotensin_converting_enzyme_2_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_17_23_angiotensin_converting_enzyme_2_inhibitor),
-            CHEBI_ROLE_EC_3_4_17__metallocarboxypeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_17__metallocarboxypeptidase_inhibitor),
-            CHEBI_ROLE_EC_3_4_22_69_SARS_coronavirus_main_proteinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_22_69_SARS_coronavirus_main_proteinase_inhibitor),
-            CHEBI_ROLE_emetic: toBoolean(row.CHEBI_ROLE_emetic),
-            CHEBI_ROLE_fixative: toBoolean(row.CHEBI_ROLE_fixative),
-            CHEBI_ROLE_c_Jun_N_terminal_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_c_Jun_N_terminal_kinase_inhibitor),
-            CHEBI_ROLE_CB2_receptor_agonist: toBoolean(row.CHEBI_ROLE_CB2_receptor_agonist),
-            CHEBI_ROLE_CB2_receptor_antagonist: toBoolean(row.CHEBI_ROLE_CB2_receptor_antagonist),
-            CHEBI_ROLE_cannabinoid_receptor_antagonist: toBoolean(row.CHEBI_ROLE_cannabinoid_receptor_antagonist),
-            CHEBI_ROLE_phytoestrogen: toBoolean(row.CHEBI_ROLE_phytoestrogen),
-            CHEBI_ROLE_serotonin_uptake_inhibitor: toBoolean(row.CHEBI_ROLE_serotonin_uptake_inhibitor),
-            CHEBI_ROLE_kappa_opioid_agent: toBoolean(row.CHEBI_ROLE_kappa_opioid_agent),
-            CHEBI_ROLE_kappa_opioid_receptor_agonist: toBoolean(row.CHEBI_ROLE_kappa_opioid_receptor_agonist),
-            CHEBI_ROLE_interferon_inducer: toBoolean(row.CHEBI_ROLE_interferon_inducer),
-            CHEBI_ROLE_histamine_releasing_agent: toBoolean(row.CHEBI_ROLE_histamine_releasing_agent),
-            CHEBI_ROLE_EC_4_1_1_23_orotidine_5__phosphate_decarboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_1_23_orotidine_5__phosphate_decarboxylase_inhibitor),
-            CHEBI_ROLE_bleaching_agent: toBoolean(row.CHEBI_ROLE_bleaching_agent),
-            CHEBI_ROLE_curing_agent: toBoolean(row.CHEBI_ROLE_curing_agent),
-            CHEBI_ROLE_nitrification_inhibitor: toBoolean(row.CHEBI_ROLE_nitrification_inhibitor),
-            CHEBI_ROLE_sequestrant: toBoolean(row.CHEBI_ROLE_sequestrant),
-            CHEBI_ROLE_raising_agent: toBoolean(row.CHEBI_ROLE_raising_agent),
-            CHEBI_ROLE_tocolytic_agent: toBoolean(row.CHEBI_ROLE_tocolytic_agent),
-            CHEBI_ROLE_spin_trapping_reagent: toBoolean(row.CHEBI_ROLE_spin_trapping_reagent),
-            CHEBI_ROLE_nitric_oxide_donor: toBoolean(row.CHEBI_ROLE_nitric_oxide_donor),
-            CHEBI_ROLE_EC_2_3_3_8_ATP_citrate_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_3_8_ATP_citrate_synthase_inhibitor),
-            CHEBI_ROLE_pyrethroid_ether_insecticide: toBoolean(row.CHEBI_ROLE_pyrethroid_ether_insecticide),
-            CHEBI_ROLE_delta_opioid_receptor_antagonist: toBoolean(row.CHEBI_ROLE_delta_opioid_receptor_antagonist),
-            CHEBI_ROLE_delta_opioid_agent: toBoolean(row.CHEBI_ROLE_delta_opioid_agent),
-            CHEBI_ROLE_opioid_receptor_antagonist: toBoolean(row.CHEBI_ROLE_opioid_receptor_antagonist),
-            CHEBI_ROLE_mu_opioid_receptor_antagonist: toBoolean(row.CHEBI_ROLE_mu_opioid_receptor_antagonist),
-            CHEBI_ROLE_EC_3_4_21_36_pancreatic_elastase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_36_pancreatic_elastase_inhibitor),
-            CHEBI_ROLE_chemokine_receptor_5_antagonist: toBoolean(row.CHEBI_ROLE_chemokine_receptor_5_antagonist),
-            CHEBI_ROLE_chemokine_receptor_2_antagonist: toBoolean(row.CHEBI_ROLE_chemokine_receptor_2_antagonist),
-            CHEBI_ROLE_EC_1_3_1_9__enoyl__acyl_carrier_protein__reductase_NADH___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_1_9__enoyl__acyl_carrier_protein__reductase_NADH___inhibitor),
-            CHEBI_ROLE_SERCA_activator: toBoolean(row.CHEBI_ROLE_SERCA_activator),
-            CHEBI_ROLE_cytokinin: toBoolean(row.CHEBI_ROLE_cytokinin),
-            CHEBI_ROLE_chain_carrier: toBoolean(row.CHEBI_ROLE_chain_carrier),
-            CHEBI_ROLE_acceptor: toBoolean(row.CHEBI_ROLE_acceptor),
-            CHEBI_ROLE_EC_3_5_1_4_amidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_1_4_amidase_inhibitor),
-            CHEBI_ROLE_electron_acceptor: toBoolean(row.CHEBI_ROLE_electron_acceptor),
-            CHEBI_ROLE_acyl_donor: toBoolean(row.CHEBI_ROLE_acyl_donor),
-            CHEBI_ROLE_EC_1_1_1_188_prostaglandin_F_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_188_prostaglandin_F_synthase_inhibitor),
-            CHEBI_ROLE_cyclooxygenase_1_inhibitor: toBoolean(row.CHEBI_ROLE_cyclooxygenase_1_inhibitor),
-            CHEBI_ROLE_prostaglandin_antagonist: toBoolean(row.CHEBI_ROLE_prostaglandin_antagonist),
-            CHEBI_ROLE_antimicrobial_food_preservative: toBoolean(row.CHEBI_ROLE_antimicrobial_food_preservative),
-            CHEBI_ROLE_retinoic_acid_receptor_agonist: toBoolean(row.CHEBI_ROLE_retinoic_acid_receptor_agonist),
-            CHEBI_ROLE_retinoid_X_receptor_agonist: toBoolean(row.CHEBI_ROLE_retinoid_X_receptor_agonist),
-            CHEBI_ROLE_AP_1_antagonist: toBoolean(row.CHEBI_ROLE_AP_1_antagonist),
-            CHEBI_ROLE_protophilic_solvent: toBoolean(row.CHEBI_ROLE_protophilic_solvent),
-            CHEBI_ROLE_base: toBoolean(row.CHEBI_ROLE_base),
-            CHEBI_ROLE_Bronsted_base: toBoolean(row.CHEBI_ROLE_Bronsted_base),
-            CHEBI_ROLE_amphiprotic_solvent: toBoolean(row.CHEBI_ROLE_amphiprotic_solvent),
-            CHEBI_ROLE_food_packaging_gas: toBoolean(row.CHEBI_ROLE_food_packaging_gas),
-            CHEBI_ROLE_EC_2_1_2_hydroxymethyl___formyl_and_related_transferases_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_2_hydroxymethyl___formyl_and_related_transferases_inhibitor),
-            CHEBI_ROLE_EC_2_1_2_1_glycine_hydroxymethyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_2_1_glycine_hydroxymethyltransferase_inhibitor),
-            CHEBI_ROLE_nucleophilic_reagent: toBoolean(row.CHEBI_ROLE_nucleophilic_reagent),
-            CHEBI_ROLE_EC_4_2_1_22_cystathionine_beta_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_2_1_22_cystathionine_beta_synthase_inhibitor),
-            CHEBI_ROLE_EC_4_3_C_N_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_3_C_N_lyase_inhibitor),
-            CHEBI_ROLE_EC_4_3_1_ammonia_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_3_1_ammonia_lyase_inhibitor),
-            CHEBI_ROLE_EC_4_3_1_10_serine_sulfate_ammonia_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_3_1_10_serine_sulfate_ammonia_lyase_inhibitor),
-            CHEBI_ROLE_Lewis_base: toBoolean(row.CHEBI_ROLE_Lewis_base),
-            CHEBI_ROLE_EC_1_1_3_13_alcohol_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_3_13_alcohol_oxidase_inhibitor),
-            CHEBI_ROLE_EC_1_1_3_oxidoreductase_acting_on_donor_CH_OH_group__oxygen_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_3_oxidoreductase_acting_on_donor_CH_OH_group__oxygen_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_2_3_1_21_carnitine_O_palmitoyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_21_carnitine_O_palmitoyltransferase_inhibitor),
-            CHEBI_ROLE_EC_4_3_1_15_diaminopropionate_ammonia_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_3_1_15_diaminopropionate_ammonia_lyase_inhibitor),
-            CHEBI_ROLE_glycine_transporter_1_inhibitor: toBoolean(row.CHEBI_ROLE_glycine_transporter_1_inhibitor),
-            CHEBI_ROLE_glycine_transporter_inhibitor: toBoolean(row.CHEBI_ROLE_glycine_transporter_inhibitor),
-            CHEBI_ROLE_glycine_receptor_agonist: toBoolean(row.CHEBI_ROLE_glycine_receptor_agonist),
-            CHEBI_ROLE_MAIT_cell_agonist: toBoolean(row.CHEBI_ROLE_MAIT_cell_agonist),
-            CHEBI_ROLE_endothelin_receptor_antagonist: toBoolean(row.CHEBI_ROLE_endothelin_receptor_antagonist),
-            CHEBI_ROLE_NMR_solvent: toBoolean(row.CHEBI_ROLE_NMR_solvent),
-            CHEBI_ROLE_EC_2_7_7_6_RNA_polymerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_7_6_RNA_polymerase_inhibitor),
-            CHEBI_ROLE_glycine_receptor_antagonist: toBoolean(row.CHEBI_ROLE_glycine_receptor_antagonist),
-            CHEBI_ROLE_EC_3_4_21_75_furin_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_75_furin_inhibitor),
-            CHEBI_ROLE_peptidomimetic: toBoolean(row.CHEBI_ROLE_peptidomimetic),
-            CHEBI_ROLE_microtubule_stabilising_agent: toBoolean(row.CHEBI_ROLE_microtubule_stabilising_agent),
-            CHEBI_ROLE_EC_3_4_24_3_microbial_collagenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_24_3_microbial_collagenase_inhibitor),
-            CHEBI_ROLE_intercalator: toBoolean(row.CHEBI_ROLE_intercalator),
-            CHEBI_ROLE_nucleoside_antibiotic: toBoolean(row.CHEBI_ROLE_nucleoside_antibiotic),
-            CHEBI_ROLE_EC_2_3_2_aminoacyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_2_aminoacyltransferase_inhibitor),
-            CHEBI_ROLE_EC_4_2_1_20_tryptophan_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_2_1_20_tryptophan_synthase_inhibitor),
-            CHEBI_ROLE_insect_growth_regulator: toBoolean(row.CHEBI_ROLE_insect_growth_regulator),
-            CHEBI_ROLE_food_colouring: toBoolean(row.CHEBI_ROLE_food_colouring),
-            CHEBI_ROLE_EC_1_2_1_12__glyceraldehyde_3_phosphate_dehydrogenase_phosphorylating___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_2_1_12__glyceraldehyde_3_phosphate_dehydrogenase_phosphorylating___inhibitor),
-            CHEBI_ROLE_EC_1_2_1_oxidoreductase_acting_on_donor_aldehyde_oxo_group_with_NAD___or_NADP___as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_2_1_oxidoreductase_acting_on_donor_aldehyde_oxo_group_with_NAD___or_NADP___as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_2_4_1_109_dolichyl_phosphate_mannose_protein_mannosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_109_dolichyl_phosphate_mannose_protein_mannosyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_7_11_17_Ca_2___calmodulin_dependent_protein_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_17_Ca_2___calmodulin_dependent_protein_kinase_inhibitor),
-            CHEBI_ROLE_anticholesteremic_drug: toBoolean(row.CHEBI_ROLE_anticholesteremic_drug),
-            CHEBI_ROLE_retinoic_acid_receptor_alpha_beta_agonist: toBoolean(row.CHEBI_ROLE_retinoic_acid_receptor_alpha_beta_agonist),
-            CHEBI_ROLE_EC_2_5_1_7_UDP_N_acetylglucosamine_1_carboxyvinyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_7_UDP_N_acetylglucosamine_1_carboxyvinyltransferase_inhibitor),
-            CHEBI_ROLE_osmolyte: toBoolean(row.CHEBI_ROLE_osmolyte),
-            CHEBI_ROLE_EC_2_7_7_7_DNA_directed_DNA_polymerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_7_7_DNA_directed_DNA_polymerase_inhibitor),
-            CHEBI_ROLE_mydriatic_agent: toBoolean(row.CHEBI_ROLE_mydriatic_agent),
-            CHEBI_ROLE_mimotope: toBoolean(row.CHEBI_ROLE_mimotope),
-            CHEBI_ROLE_refrigerant: toBoolean(row.CHEBI_ROLE_refrigerant),
-            CHEBI_ROLE_lipid_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_lipid_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_7_1_137_phosphatidylinositol_3_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_137_phosphatidylinositol_3_kinase_inhibitor),
-            CHEBI_ROLE_reactive_oxygen_species_generator: toBoolean(row.CHEBI_ROLE_reactive_oxygen_species_generator),
-            CHEBI_ROLE_EC_1_4_7_1__glutamate_synthase_ferredoxin___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_7_1__glutamate_synthase_ferredoxin___inhibitor),
-            CHEBI_ROLE_EC_2_5_1_49_O_acetylhomoserine_aminocarboxypropyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_49_O_acetylhomoserine_aminocarboxypropyltransferase_inhibitor),
-            CHEBI_ROLE_EC_3_4_21_26_prolyl_oligopeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_26_prolyl_oligopeptidase_inhibitor),
-            CHEBI_ROLE_Daphnia_galeata_metabolite: toBoolean(row.CHEBI_ROLE_Daphnia_galeata_metabolite),
-            CHEBI_ROLE_EC_3_1_1_1_carboxylesterase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_1_1_carboxylesterase_inhibitor),
-            CHEBI_ROLE_vascular_endothelial_growth_factor_receptor_antagonist: toBoolean(row.CHEBI_ROLE_vascular_endothelial_growth_factor_receptor_antagonist),
-            CHEBI_ROLE_EC_3_2_1_18_exo_alpha_sialidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_18_exo_alpha_sialidase_inhibitor),
-            CHEBI_ROLE_uncoupling_protein_inhibitor: toBoolean(row.CHEBI_ROLE_uncoupling_protein_inhibitor),
-            CHEBI_ROLE_EC_3_1_3_11_fructose_bisphosphatase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_3_11_fructose_bisphosphatase_inhibitor),
-            CHEBI_ROLE_EC_3_1_3_1_alkaline_phosphatase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_3_1_alkaline_phosphatase_inhibitor),
-            CHEBI_ROLE_adenosine_A1_receptor_agonist: toBoolean(row.CHEBI_ROLE_adenosine_A1_receptor_agonist),
-            CHEBI_ROLE_hepatotoxic_agent: toBoolean(row.CHEBI_ROLE_hepatotoxic_agent),
-            CHEBI_ROLE_EC_1_21_oxidoreductase_acting_on_X_H_and_Y_H_to_form_an_X_Y_bond_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_21_oxidoreductase_acting_on_X_H_and_Y_H_to_form_an_X_Y_bond_inhibitor),
-            CHEBI_ROLE_EC_2_7_11_10_IkappaB_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_10_IkappaB_kinase_inhibitor),
-            CHEBI_ROLE_EC_1_13_11_52_indoleamine_2_3_dioxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_13_11_52_indoleamine_2_3_dioxygenase_inhibitor),
-            CHEBI_ROLE_EC_2_1_1_116__3__hydroxy_N_methyl_S_coclaurine_4__O_methyltransferase__inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_116__3__hydroxy_N_methyl_S_coclaurine_4__O_methyltransferase__inhibitor),
-            CHEBI_ROLE_EC_2_1_1_122___S_tetrahydroprotoberberine_N_methyltransferase__inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_122___S_tetrahydroprotoberberine_N_methyltransferase__inhibitor),
-            CHEBI_ROLE_EC_1_21_3_3_reticuline_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_21_3_3_reticuline_oxidase_inhibitor),
-            CHEBI_ROLE_EC_3_4_14_dipeptidyl_and_tripeptidyl_peptidases_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_14_dipeptidyl_and_tripeptidyl_peptidases_inhibitor),
-            CHEBI_ROLE_EC_3_4_14_5_dipeptidyl_peptidase_IV_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_14_5_dipeptidyl_peptidase_IV_inhibitor),
-            CHEBI_ROLE_EC_1_21_3_oxidoreductase_acting_on_X_H_and_Y_H_to_form_an_X_Y_bond__with_oxygen_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_21_3_oxidoreductase_acting_on_X_H_and_Y_H_to_form_an_X_Y_bond__with_oxygen_as_acceptor_inhibitor),
-            CHEBI_ROLE_bridged_diphenyl_acaricide: toBoolean(row.CHEBI_ROLE_bridged_diphenyl_acaricide),
-            CHEBI_ROLE_mucolytic: toBoolean(row.CHEBI_ROLE_mucolytic),
-            CHEBI_ROLE_fuel: toBoolean(row.CHEBI_ROLE_fuel),
-            CHEBI_ROLE_fossil_fuel: toBoolean(row.CHEBI_ROLE_fossil_fuel),
-            CHEBI_ROLE_kairomone: toBoolean(row.CHEBI_ROLE_kairomone),
-            CHEBI_ROLE_flour_treatment_agent: toBoolean(row.CHEBI_ROLE_flour_treatment_agent),
-            CHEBI_ROLE_EC_3_5_4_4_adenosine_deaminase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_4_4_adenosine_deaminase_inhibitor),
-            CHEBI_ROLE_EC_3_5_4_non_peptide_cyclic_amidine_C_N_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_4_non_peptide_cyclic_amidine_C_N_hydrolase_inhibitor),
-            CHEBI_ROLE_archaeal_metabolite: toBoolean(row.CHEBI_ROLE_archaeal_metabolite),
-            CHEBI_ROLE_EC_1_10_oxidoreductase_acting_on_diphenols_and_related_substances_as_donors_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_10_oxidoreductase_acting_on_diphenols_and_related_substances_as_donors_inhibitor),
-            CHEBI_ROLE_EC_1_10_99_2__ribosyldihydronicotinamide_dehydrogenase_quinone___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_10_99_2__ribosyldihydronicotinamide_dehydrogenase_quinone___inhibitor),
-            CHEBI_ROLE_EC_1_10_99_oxidoreductases_acting_on_diphenols_and_related_substances_as_donors__other_acceptors_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_10_99_oxidoreductases_acting_on_diphenols_and_related_substances_as_donors__other_acceptors_inhibitor),
-            CHEBI_ROLE_EC_2_3_1_97_glycylpeptide_N_tetradecanoyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_97_glycylpeptide_N_tetradecanoyltransferase_inhibitor),
-            CHEBI_ROLE_elicitor: toBoolean(row.CHEBI_ROLE_elicitor),
-            CHEBI_ROLE_water_soluble_vitamin_role_: toBoolean(row.CHEBI_ROLE_water_soluble_vitamin_role_),
-            CHEBI_ROLE_propellant: toBoolean(row.CHEBI_ROLE_propellant),
-            CHEBI_ROLE_food_propellant: toBoolean(row.CHEBI_ROLE_food_propellant),
-            CHEBI_ROLE_inhalation_anaesthetic: toBoolean(row.CHEBI_ROLE_inhalation_anaesthetic),
-            CHEBI_ROLE_antidote_to_paracetamol_poisoning: toBoolean(row.CHEBI_ROLE_antidote_to_paracetamol_poisoning),
-            CHEBI_ROLE_EC_2_1_1_79_cyclopropane_fatty_acyl_phospholipid_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_79_cyclopropane_fatty_acyl_phospholipid_synthase_inhibitor),
-            CHEBI_ROLE_EC_2_1_1_72__site_specific_DNA_methyltransferase_adenine_specific___inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_72__site_specific_DNA_methyltransferase_adenine_specific___inhibitor),
-            CHEBI_ROLE_neuropilin_receptor_antagonist: toBoolean(row.CHEBI_ROLE_neuropilin_receptor_antagonist),
-            CHEBI_ROLE_cardiotonic_drug: toBoolean(row.CHEBI_ROLE_cardiotonic_drug),
-            CHEBI_ROLE_adenylate_cyclase_agonist: toBoolean(row.CHEBI_ROLE_adenylate_cyclase_agonist),
-            CHEBI_ROLE_antidote_to_sarin_poisoning: toBoolean(row.CHEBI_ROLE_antidote_to_sarin_poisoning),
-            CHEBI_ROLE_oneirogen: toBoolean(row.CHEBI_ROLE_oneirogen),
-            CHEBI_ROLE_anaesthesia_adjuvant: toBoolean(row.CHEBI_ROLE_anaesthesia_adjuvant),
-            CHEBI_ROLE_impurity: toBoolean(row.CHEBI_ROLE_impurity),
-            CHEBI_ROLE_EC_1_2_1_3__aldehyde_dehydrogenase_NAD_____inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_2_1_3__aldehyde_dehydrogenase_NAD_____inhibitor),
-            CHEBI_ROLE_non_polar_solvent: toBoolean(row.CHEBI_ROLE_non_polar_solvent),
-            CHEBI_ROLE_EC_4_3_1_24_phenylalanine_ammonia_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_3_1_24_phenylalanine_ammonia_lyase_inhibitor),
-            CHEBI_ROLE_voltage_gated_sodium_channel_blocker: toBoolean(row.CHEBI_ROLE_voltage_gated_sodium_channel_blocker),
-            CHEBI_ROLE_cyanotoxin: toBoolean(row.CHEBI_ROLE_cyanotoxin),
-            CHEBI_ROLE_glucagon_like_peptide_1_receptor_agonist: toBoolean(row.CHEBI_ROLE_glucagon_like_peptide_1_receptor_agonist),
-            CHEBI_ROLE_appetite_depressant: toBoolean(row.CHEBI_ROLE_appetite_depressant),
-            CHEBI_ROLE_appetite_regulator: toBoolean(row.CHEBI_ROLE_appetite_regulator),
-            CHEBI_ROLE_antiseborrheic: toBoolean(row.CHEBI_ROLE_antiseborrheic),
-            CHEBI_ROLE_antiemetic: toBoolean(row.CHEBI_ROLE_antiemetic),
-            CHEBI_ROLE_nonionic_surfactant: toBoolean(row.CHEBI_ROLE_nonionic_surfactant),
-            CHEBI_ROLE_CPSF3_inhibitor: toBoolean(row.CHEBI_ROLE_CPSF3_inhibitor),
-            CHEBI_ROLE_EC_6_1_C_O_bond_forming_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_1_C_O_bond_forming_ligase_inhibitor),
-            CHEBI_ROLE_EC_6_1_1_ligases_forming_aminoacyl_tRNA_and_related_compounds_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_1_1_ligases_forming_aminoacyl_tRNA_and_related_compounds_inhibitor),
-            CHEBI_ROLE_EC_6_1_1_6_lysine_tRNA_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_1_1_6_lysine_tRNA_ligase_inhibitor),
-            CHEBI_ROLE_tau_aggregation_inhibitor: toBoolean(row.CHEBI_ROLE_tau_aggregation_inhibitor),
-            CHEBI_ROLE_fibroblast_growth_factor_receptor_antagonist: toBoolean(row.CHEBI_ROLE_fibroblast_growth_factor_receptor_antagonist),
-            CHEBI_ROLE_EC_2_7_12_2_mitogen_activated_protein_kinase_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_12_2_mitogen_activated_protein_kinase_kinase_inhibitor),
-            CHEBI_ROLE_necroptosis_inhibitor: toBoolean(row.CHEBI_ROLE_necroptosis_inhibitor),
-            CHEBI_ROLE_EC_1_3_5_2__dihydroorotate_dehydrogenase_quinone___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_5_2__dihydroorotate_dehydrogenase_quinone___inhibitor),
-            CHEBI_ROLE_EC_2_7_1_33_pantothenate_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_33_pantothenate_kinase_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_34_EC_1_1_1_88_hydroxymethylglutaryl_CoA_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_34_EC_1_1_1_88_hydroxymethylglutaryl_CoA_reductase_inhibitor),
-            CHEBI_ROLE_skin_lightening_agent: toBoolean(row.CHEBI_ROLE_skin_lightening_agent),
-            CHEBI_ROLE_food_anticaking_agent: toBoolean(row.CHEBI_ROLE_food_anticaking_agent),
-            CHEBI_ROLE_food_humectant: toBoolean(row.CHEBI_ROLE_food_humectant),
-            CHEBI_ROLE_anticaking_agent: toBoolean(row.CHEBI_ROLE_anticaking_agent),
-            CHEBI_ROLE_compatible_osmolytes: toBoolean(row.CHEBI_ROLE_compatible_osmolytes),
-            CHEBI_ROLE_humectant: toBoolean(row.CHEBI_ROLE_humectant),
-            CHEBI_ROLE_osmotic_diuretic: toBoolean(row.CHEBI_ROLE_osmotic_diuretic),
-            CHEBI_ROLE_food_bulking_agent: toBoolean(row.CHEBI_ROLE_food_bulking_agent),
-            CHEBI_ROLE_progesterone_receptor_agonist: toBoolean(row.CHEBI_ROLE_progesterone_receptor_agonist),
-            CHEBI_ROLE_progestin: toBoolean(row.CHEBI_ROLE_progestin),
-            CHEBI_ROLE_progestogen: toBoolean(row.CHEBI_ROLE_progestogen),
-            CHEBI_ROLE_environmental_food_contaminant: toBoolean(row.CHEBI_ROLE_environmental_food_contaminant),
-            CHEBI_ROLE_EC_2_3_1_50_serine_C_palmitoyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_50_serine_C_palmitoyltransferase_inhibitor),
-            CHEBI_ROLE_Sir2_inhibitor: toBoolean(row.CHEBI_ROLE_Sir2_inhibitor),
-            CHEBI_ROLE_antiamoebic_agent: toBoolean(row.CHEBI_ROLE_antiamoebic_agent),
-            CHEBI_ROLE_EC_3_5_5_hydrolase_acting_on_C_N_bonds_in_nitriles_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_5_hydrolase_acting_on_C_N_bonds_in_nitriles_inhibitor),
-            CHEBI_ROLE_odorant_receptor_agonist: toBoolean(row.CHEBI_ROLE_odorant_receptor_agonist),
-            CHEBI_ROLE_EC_3_1_1_3_triacylglycerol_lipase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_1_3_triacylglycerol_lipase_inhibitor),
-            CHEBI_ROLE_EC_3_5_5_1_nitrilase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_5_1_nitrilase_inhibitor),
-            CHEBI_ROLE_anabolic_agent: toBoolean(row.CHEBI_ROLE_anabolic_agent),
-            CHEBI_ROLE_hyaluronic_acid_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_hyaluronic_acid_synthesis_inhibitor),
-            CHEBI_ROLE_anti_HBV_agent: toBoolean(row.CHEBI_ROLE_anti_HBV_agent),
-            CHEBI_ROLE_serine_proteinase_inhibitor: toBoolean(row.CHEBI_ROLE_serine_proteinase_inhibitor),
-            CHEBI_ROLE_EC_2_1_1_348_mRNA_m6A_methyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_348_mRNA_m6A_methyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_6_1_11_acetylornithine_transaminase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_6_1_11_acetylornithine_transaminase_inhibitor),
-            CHEBI_ROLE_EC_1_9_3_1_cytochrome_c_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_9_3_1_cytochrome_c_oxidase_inhibitor),
-            CHEBI_ROLE_EC_1_9_3_oxidoreductase_acting_on_donor_heme_group__oxygen_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_9_3_oxidoreductase_acting_on_donor_heme_group__oxygen_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_9_oxidoreductase_acting_on_donor_heme_group_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_9_oxidoreductase_acting_on_donor_heme_group_inhibitor),
-            CHEBI_ROLE_EC_3_1_4_11_phosphoinositide_phospholipase_C_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_4_11_phosphoinositide_phospholipase_C_inhibitor),
-            CHEBI_ROLE_antimicrobial_cosmetic_preservative: toBoolean(row.CHEBI_ROLE_antimicrobial_cosmetic_preservative),
-            CHEBI_ROLE_antiatherogenic_agent: toBoolean(row.CHEBI_ROLE_antiatherogenic_agent),
-            CHEBI_ROLE_thioredoxin_inhibitor: toBoolean(row.CHEBI_ROLE_thioredoxin_inhibitor),
-            CHEBI_ROLE_EC_1_11_1_9_glutathione_peroxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_11_1_9_glutathione_peroxidase_inhibitor),
-            CHEBI_ROLE_EC_1_11_1_peroxidases_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_11_1_peroxidases_inhibitor),
-            CHEBI_ROLE_antiplatyhelmintic_drug: toBoolean(row.CHEBI_ROLE_antiplatyhelmintic_drug),
-            CHEBI_ROLE_schistosomicide_drug: toBoolean(row.CHEBI_ROLE_schistosomicide_drug),
-            CHEBI_ROLE_melanin_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_melanin_synthesis_inhibitor),
-            CHEBI_ROLE_depigmentation_drug: toBoolean(row.CHEBI_ROLE_depigmentation_drug),
-            CHEBI_ROLE_EC_1_1_1_184__carbonyl_reductase_NADPH___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_184__carbonyl_reductase_NADPH___inhibitor),
-            CHEBI_ROLE_EC_1_17_oxidoreductase_acting_on_CH_or_CH2_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_17_oxidoreductase_acting_on_CH_or_CH2_inhibitor),
-            CHEBI_ROLE_EC_1_17_4_1_ribonucleoside_diphosphate_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_17_4_1_ribonucleoside_diphosphate_reductase_inhibitor),
-            CHEBI_ROLE_EC_1_17_4_oxidoreductase_acting_on_CH_or_CH2_with_a_disulfide_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_17_4_oxidoreductase_acting_on_CH_or_CH2_with_a_disulfide_as_acceptor_inhibitor),
-            CHEBI_ROLE_voltage_dependent_anion_channel_inhibitor: toBoolean(row.CHEBI_ROLE_voltage_dependent_anion_channel_inhibitor),
-            CHEBI_ROLE_ion_transport_inhibitor: toBoolean(row.CHEBI_ROLE_ion_transport_inhibitor),
-            CHEBI_ROLE_ferroptosis_suppressor_protein_1_inhibitor: toBoolean(row.CHEBI_ROLE_ferroptosis_suppressor_protein_1_inhibitor),
-            CHEBI_ROLE_EC_6_3_2_2_glutamate_cysteine_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_2_2_glutamate_cysteine_ligase_inhibitor),
-            CHEBI_ROLE_EC_6_3_2_acid_D_amino_acid_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_2_acid_D_amino_acid_ligase_inhibitor),
-            CHEBI_ROLE_nicotinic_antagonist: toBoolean(row.CHEBI_ROLE_nicotinic_antagonist),
-            CHEBI_ROLE_somatostatin_receptor_agonist: toBoolean(row.CHEBI_ROLE_somatostatin_receptor_agonist),
-            CHEBI_ROLE_pyrimidine_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_pyrimidine_synthesis_inhibitor),
-            CHEBI_ROLE_monolignol: toBoolean(row.CHEBI_ROLE_monolignol),
-            CHEBI_ROLE_androstane_receptor_agonist: toBoolean(row.CHEBI_ROLE_androstane_receptor_agonist),
-            CHEBI_ROLE_xenoantigen: toBoolean(row.CHEBI_ROLE_xenoantigen),
-            CHEBI_ROLE_expectorant: toBoolean(row.CHEBI_ROLE_expectorant),
-            CHEBI_ROLE_EC_1_3_1_43_arogenate_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_1_43_arogenate_dehydrogenase_inhibitor),
-            CHEBI_ROLE_EC_3_4_11_14_cytosol_alanyl_aminopeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_11_14_cytosol_alanyl_aminopeptidase_inhibitor),
-            CHEBI_ROLE_EC_3_4_14_2_dipeptidyl_peptidase_II_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_14_2_dipeptidyl_peptidase_II_inhibitor),
-            CHEBI_ROLE_EC_3_4_11_aminopeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_11_aminopeptidase_inhibitor),
-            CHEBI_ROLE_macronutrient: toBoolean(row.CHEBI_ROLE_macronutrient),
-            CHEBI_ROLE_chromogenic_compound: toBoolean(row.CHEBI_ROLE_chromogenic_compound),
-            CHEBI_ROLE_colour_indicator: toBoolean(row.CHEBI_ROLE_colour_indicator),
-            CHEBI_ROLE_one_colour_indicator: toBoolean(row.CHEBI_ROLE_one_colour_indicator),
-            CHEBI_ROLE_visual_indicator: toBoolean(row.CHEBI_ROLE_visual_indicator),
-            CHEBI_ROLE_EC_1_3_1_22__3_oxo_5alpha_steroid_4_dehydrogenase_NADP_____inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_1_22__3_oxo_5alpha_steroid_4_dehydrogenase_NADP_____inhibitor),
-            CHEBI_ROLE_juvenile_hormone_antagonists: toBoolean(row.CHEBI_ROLE_juvenile_hormone_antagonists),
-            CHEBI_ROLE_precocenes: toBoolean(row.CHEBI_ROLE_precocenes),
-            CHEBI_ROLE_first_generation_antipsychotic: toBoolean(row.CHEBI_ROLE_first_generation_antipsychotic),
-            CHEBI_ROLE_antidote_to_organophosphate_poisoning: toBoolean(row.CHEBI_ROLE_antidote_to_organophosphate_poisoning),
-            CHEBI_ROLE_spin_label: toBoolean(row.CHEBI_ROLE_spin_label),
-            CHEBI_ROLE_label: toBoolean(row.CHEBI_ROLE_label),
-            CHEBI_ROLE_spin_probe: toBoolean(row.CHEBI_ROLE_spin_probe),
-            CHEBI_ROLE_polymerisation_monomer: toBoolean(row.CHEBI_ROLE_polymerisation_monomer),
-            CHEBI_ROLE_inorganic_acid: toBoolean(row.CHEBI_ROLE_inorganic_acid),
-            CHEBI_ROLE_histamine_agonist: toBoolean(row.CHEBI_ROLE_histamine_agonist),
-            CHEBI_ROLE_neoantigen: toBoolean(row.CHEBI_ROLE_neoantigen),
-            CHEBI_ROLE_immunogen: toBoolean(row.CHEBI_ROLE_immunogen),
-            CHEBI_ROLE_antithyroid_drug: toBoolean(row.CHEBI_ROLE_antithyroid_drug),
-            CHEBI_ROLE_cross_linking_reagent: toBoolean(row.CHEBI_ROLE_cross_linking_reagent),
-            CHEBI_ROLE_food_bleaching_agent: toBoolean(row.CHEBI_ROLE_food_bleaching_agent),
-            CHEBI_ROLE_blood_substitute: toBoolean(row.CHEBI_ROLE_blood_substitute),
-            CHEBI_ROLE_plant_growth_stimulator: toBoolean(row.CHEBI_ROLE_plant_growth_stimulator),
-            CHEBI_ROLE_retinoic_acid_receptor_gamma_agonist: toBoolean(row.CHEBI_ROLE_retinoic_acid_receptor_gamma_agonist),
-            CHEBI_ROLE_protease_activated_receptor_2_antagonist: toBoolean(row.CHEBI_ROLE_protease_activated_receptor_2_antagonist),
-            CHEBI_ROLE_PAR2_negative_allosteric_modulator: toBoolean(row.CHEBI_ROLE_PAR2_negative_allosteric_modulator),
-            CHEBI_ROLE_sigma_receptor_modulator: toBoolean(row.CHEBI_ROLE_sigma_receptor_modulator),
-            CHEBI_ROLE_sigma_2_receptor_agonist: toBoolean(row.CHEBI_ROLE_sigma_2_receptor_agonist),
-            CHEBI_ROLE_EC_3_4_21_61_kexin_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_61_kexin_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_146_11beta_hydroxysteroid_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_146_11beta_hydroxysteroid_dehydrogenase_inhibitor),
-            CHEBI_ROLE_delta_opioid_receptor_agonist: toBoolean(row.CHEBI_ROLE_delta_opioid_receptor_agonist),
-            CHEBI_ROLE_ceramide_mimetic: toBoolean(row.CHEBI_ROLE_ceramide_mimetic),
-            CHEBI_ROLE_antacid: toBoolean(row.CHEBI_ROLE_antacid),
-            CHEBI_ROLE_EC_1_3_1_72_Delta_24_sterol_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_1_72_Delta_24_sterol_reductase_inhibitor),
-            CHEBI_ROLE_c_Met_tyrosine_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_c_Met_tyrosine_kinase_inhibitor),
-            CHEBI_ROLE_EC_3_2_1_24_alpha_mannosidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_24_alpha_mannosidase_inhibitor),
-            CHEBI_ROLE_EC_3_2_1_114_mannosyl_oligosaccharide_1_3_1_6_alpha_mannosidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_114_mannosyl_oligosaccharide_1_3_1_6_alpha_mannosidase_inhibitor),
-            CHEBI_ROLE_CB1_receptor_agonist: toBoolean(row.CHEBI_ROLE_CB1_receptor_agonist),
-            CHEBI_ROLE_EC_6_2_1_45_E1_ubiquitin_activating_enzyme_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_2_1_45_E1_ubiquitin_activating_enzyme_inhibitor),
-            CHEBI_ROLE_Lewis_acid: toBoolean(row.CHEBI_ROLE_Lewis_acid),
-            CHEBI_ROLE_cytochrome_b6f_complex_inhibitor: toBoolean(row.CHEBI_ROLE_cytochrome_b6f_complex_inhibitor),
-            CHEBI_ROLE_glycine_transporter_2_inhibitor: toBoolean(row.CHEBI_ROLE_glycine_transporter_2_inhibitor),
-            CHEBI_ROLE_piezo1_agonist: toBoolean(row.CHEBI_ROLE_piezo1_agonist),
-            CHEBI_ROLE_mitochondrial_calcium_uniporter_inhibitor: toBoolean(row.CHEBI_ROLE_mitochondrial_calcium_uniporter_inhibitor),
-            CHEBI_ROLE_topoisomerase_IV_inhibitor: toBoolean(row.CHEBI_ROLE_topoisomerase_IV_inhibitor),
-            CHEBI_ROLE_nephrotoxin: toBoolean(row.CHEBI_ROLE_nephrotoxin),
-            CHEBI_ROLE_incretin_mimetic: toBoolean(row.CHEBI_ROLE_incretin_mimetic),
-            CHEBI_ROLE_gastric_inhibitory_polypeptide_receptor_agonist: toBoolean(row.CHEBI_ROLE_gastric_inhibitory_polypeptide_receptor_agonist),
-            CHEBI_ROLE_bradykinin_receptor_antagonist: toBoolean(row.CHEBI_ROLE_bradykinin_receptor_antagonist),
-            CHEBI_ROLE_venom: toBoolean(row.CHEBI_ROLE_venom),
-            CHEBI_ROLE_farnesoid_X_receptor_agonist: toBoolean(row.CHEBI_ROLE_farnesoid_X_receptor_agonist),
-            CHEBI_ROLE_vasopressin_receptor_antagonist: toBoolean(row.CHEBI_ROLE_vasopressin_receptor_antagonist),
-            CHEBI_ROLE_antimyopathic_agent: toBoolean(row.CHEBI_ROLE_antimyopathic_agent),
-            CHEBI_ROLE_NMR_chemical_shift_reference_compound: toBoolean(row.CHEBI_ROLE_NMR_chemical_shift_reference_compound),
-            CHEBI_ROLE_calmodulin_antagonist: toBoolean(row.CHEBI_ROLE_calmodulin_antagonist),
-            CHEBI_ROLE_EC_2_6_1_13_ornithine_aminotransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_6_1_13_ornithine_aminotransferase_inhibitor),
-            CHEBI_ROLE_EC_2_7_12_1_dual_specificity_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_12_1_dual_specificity_kinase_inhibitor),
-            CHEBI_ROLE_insulin_like_growth_factor_binding_protein_inhibitor: toBoolean(row.CHEBI_ROLE_insulin_like_growth_factor_binding_protein_inhibitor),
-            CHEBI_ROLE_PCNA_inhibitor: toBoolean(row.CHEBI_ROLE_PCNA_inhibitor),
-            CHEBI_ROLE_sphingosine_1_phosphate_receptor_2_antagonist: toBoolean(row.CHEBI_ROLE_sphingosine_1_phosphate_receptor_2_antagonist),
-            CHEBI_ROLE_EC_3_5_3_1_arginase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_3_1_arginase_inhibitor),
-            CHEBI_ROLE_EC_3_5_3_non_peptide_linear_amidine_C_N_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_3_non_peptide_linear_amidine_C_N_hydrolase_inhibitor),
-            CHEBI_ROLE_EC_1_13_11_31_arachidonate_12_lipoxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_13_11_31_arachidonate_12_lipoxygenase_inhibitor),
-            CHEBI_ROLE_aryl_hydrocarbon_receptor_antagonist: toBoolean(row.CHEBI_ROLE_aryl_hydrocarbon_receptor_antagonist),
-            CHEBI_ROLE_calcitonin_gene_related_peptide_receptor_antagonist: toBoolean(row.CHEBI_ROLE_calcitonin_gene_related_peptide_receptor_antagonist),
-            CHEBI_ROLE_Rac1_inhibitor: toBoolean(row.CHEBI_ROLE_Rac1_inhibitor),
-            CHEBI_ROLE_histological_dye: toBoolean(row.CHEBI_ROLE_histological_dye),
-            CHEBI_ROLE_antinociceptive_agent: toBoolean(row.CHEBI_ROLE_antinociceptive_agent),
-            CHEBI_ROLE_EC_1_3_1_6_fumarate_reductase_NADH_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_1_6_fumarate_reductase_NADH_inhibitor),
-            CHEBI_ROLE_affinity_label: toBoolean(row.CHEBI_ROLE_affinity_label),
-            CHEBI_ROLE_EC_1_1_5_3_glycerol_3_phosphate_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_5_3_glycerol_3_phosphate_dehydrogenase_inhibitor),
-            CHEBI_ROLE_EC_1_1_5_oxidoreductase_acting_on_donor_CH_OH_group__quinone_or_similar_compound_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_5_oxidoreductase_acting_on_donor_CH_OH_group__quinone_or_similar_compound_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_2_1_1_4_acetylserotonin_O_methyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_4_acetylserotonin_O_methyltransferase_inhibitor),
-            CHEBI_ROLE_nodulation_factor: toBoolean(row.CHEBI_ROLE_nodulation_factor),
-            CHEBI_ROLE_abscisic_acid_receptor_agonist: toBoolean(row.CHEBI_ROLE_abscisic_acid_receptor_agonist),
-            CHEBI_ROLE_EC_3_6_3_10_H____K___exchanging_ATPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_3_10_H____K___exchanging_ATPase_inhibitor),
-            CHEBI_ROLE_potassium_ionophore: toBoolean(row.CHEBI_ROLE_potassium_ionophore),
-            CHEBI_ROLE_EC_3_6_3_14_H___transporting_two_sector_ATPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_3_14_H___transporting_two_sector_ATPase_inhibitor),
-            CHEBI_ROLE_sigma_1_receptor_agonist: toBoolean(row.CHEBI_ROLE_sigma_1_receptor_agonist),
-            CHEBI_ROLE_EC_2_1_1_354__histone_H3__lysine_4_N_trimethyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_354__histone_H3__lysine_4_N_trimethyltransferase_inhibitor),
-            CHEBI_ROLE_WNK_signaling_inhibitor: toBoolean(row.CHEBI_ROLE_WNK_signaling_inhibitor),
-            CHEBI_ROLE_EC_1_14_99_9_steroid_17alpha_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_99_9_steroid_17alpha_monooxygenase_inhibitor),
-            CHEBI_ROLE_AMPA_receptor_antagonist: toBoolean(row.CHEBI_ROLE_AMPA_receptor_antagonist),
-            CHEBI_ROLE_trace_amine_associated_receptor_1_agonist: toBoolean(row.CHEBI_ROLE_trace_amine_associated_receptor_1_agonist),
-            CHEBI_ROLE_heat_shock_factor_1_inhibitor: toBoolean(row.CHEBI_ROLE_heat_shock_factor_1_inhibitor),
-            CHEBI_ROLE_sodium_glucose_transport_protein_subtype_2_inhibitor: toBoolean(row.CHEBI_ROLE_sodium_glucose_transport_protein_subtype_2_inhibitor),
-            CHEBI_ROLE_sodium_glucose_transport_protein_subtype_1_inhibitor: toBoolean(row.CHEBI_ROLE_sodium_glucose_transport_protein_subtype_1_inhibitor),
-            CHEBI_ROLE_endothelin_A_receptor_antagonist: toBoolean(row.CHEBI_ROLE_endothelin_A_receptor_antagonist),
-            CHEBI_ROLE_EC_2_7_1_153_phosphatidylinositol_4_5_bisphosphate_3_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_153_phosphatidylinositol_4_5_bisphosphate_3_kinase_inhibitor),
-            CHEBI_ROLE_complement_factor_B_inhibitor: toBoolean(row.CHEBI_ROLE_complement_factor_B_inhibitor),
-            CHEBI_ROLE_ectoparasiticide: toBoolean(row.CHEBI_ROLE_ectoparasiticide),
-            CHEBI_ROLE_complement_component_5_inhibitor: toBoolean(row.CHEBI_ROLE_complement_component_5_inhibitor),
-            CHEBI_ROLE_exportin_1_inhibitor: toBoolean(row.CHEBI_ROLE_exportin_1_inhibitor),
-            CHEBI_ROLE_glucose_transporter_inhibitor: toBoolean(row.CHEBI_ROLE_glucose_transporter_inhibitor),
-            CHEBI_ROLE_glucose_transporter_1_inhibitor: toBoolean(row.CHEBI_ROLE_glucose_transporter_1_inhibitor),
-            CHEBI_ROLE_p53_inhibitor: toBoolean(row.CHEBI_ROLE_p53_inhibitor),
-            CHEBI_ROLE_EC_2_1_1_37__DNA_cytosine_5_methyltransferase__inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_37__DNA_cytosine_5_methyltransferase__inhibitor),
-            CHEBI_ROLE_EC_3_4_22_36_caspase_1_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_22_36_caspase_1_inhibitor),
-            CHEBI_ROLE_convulsant: toBoolean(row.CHEBI_ROLE_convulsant),
-            CHEBI_ROLE_EC_6_3_2_19_ubiquitin_protein_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_3_2_19_ubiquitin_protein_ligase_inhibitor),
-            CHEBI_ROLE_EC_5_2_cis_trans_isomerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_2_cis_trans_isomerase_inhibitor),
-            CHEBI_ROLE_chromatographic_reagent: toBoolean(row.CHEBI_ROLE_chromatographic_reagent),
-            CHEBI_ROLE_CB1_receptor_antagonist: toBoolean(row.CHEBI_ROLE_CB1_receptor_antagonist),
-            CHEBI_ROLE_EC_2_7_11_31___hydroxymethylglutaryl_CoA_reductase_NADPH___kinase__activator: toBoolean(row.CHEBI_ROLE_EC_2_7_11_31___hydroxymethylglutaryl_CoA_reductase_NADPH___kinase__activator),
-            CHEBI_ROLE_renoprotective_agent: toBoolean(row.CHEBI_ROLE_renoprotective_agent),
-            CHEBI_ROLE_NLRP3_inhibitor: toBoolean(row.CHEBI_ROLE_NLRP3_inhibitor),
-            CHEBI_ROLE_alicyclic_antibiotics: toBoolean(row.CHEBI_ROLE_alicyclic_antibiotics),
-            CHEBI_ROLE_actin_polymerisation_inhibitor: toBoolean(row.CHEBI_ROLE_actin_polymerisation_inhibitor),
-            CHEBI_ROLE_EC_3_2_1_1_alpha_amylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_1_alpha_amylase_inhibitor),
-            CHEBI_ROLE_phenothiazine_antipsychotic_drug: toBoolean(row.CHEBI_ROLE_phenothiazine_antipsychotic_drug),
-            CHEBI_ROLE_nitric_oxide_synthase_activator: toBoolean(row.CHEBI_ROLE_nitric_oxide_synthase_activator),
-            CHEBI_ROLE_insect_sterilant: toBoolean(row.CHEBI_ROLE_insect_sterilant),
-            CHEBI_ROLE_chemosterilant: toBoolean(row.CHEBI_ROLE_chemosterilant),
-            CHEBI_ROLE_GABAA_receptor_antagonist: toBoolean(row.CHEBI_ROLE_GABAA_receptor_antagonist),
-            CHEBI_ROLE_phytosiderophore: toBoolean(row.CHEBI_ROLE_phytosiderophore),
-            CHEBI_ROLE_vesicant: toBoolean(row.CHEBI_ROLE_vesicant),
-            CHEBI_ROLE_carbamate_insecticide: toBoolean(row.CHEBI_ROLE_carbamate_insecticide),
-            CHEBI_ROLE_EC_2_5_1_1_dimethylallyltranstransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_1_dimethylallyltranstransferase_inhibitor),
-            CHEBI_ROLE_ATP_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_ATP_synthase_inhibitor),
-            CHEBI_ROLE_electrophilic_reagent: toBoolean(row.CHEBI_ROLE_electrophilic_reagent),
-            CHEBI_ROLE_phytochrome_chromophore: toBoolean(row.CHEBI_ROLE_phytochrome_chromophore),
-            CHEBI_ROLE_EC_2_4_1_16_chitin_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_16_chitin_synthase_inhibitor),
-            CHEBI_ROLE_molluscicide: toBoolean(row.CHEBI_ROLE_molluscicide),
-            CHEBI_ROLE_food_colour_retention_agent: toBoolean(row.CHEBI_ROLE_food_colour_retention_agent),
-            CHEBI_ROLE_EC_2_1_1_8_histamine_N_methyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_8_histamine_N_methyltransferase_inhibitor),
-            CHEBI_ROLE_collagen_cross_linking_inhibitor: toBoolean(row.CHEBI_ROLE_collagen_cross_linking_inhibitor),
-            CHEBI_ROLE_EC_2_5_1_9_riboflavin_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_9_riboflavin_synthase_inhibitor),
-            CHEBI_ROLE_antimutagen: toBoolean(row.CHEBI_ROLE_antimutagen),
-            CHEBI_ROLE_coccidiostat: toBoolean(row.CHEBI_ROLE_coccidiostat),
-            CHEBI_ROLE_piscicide: toBoolean(row.CHEBI_ROLE_piscicide),
-            CHEBI_ROLE_calcium_ionophore: toBoolean(row.CHEBI_ROLE_calcium_ionophore),
-            CHEBI_ROLE_EC_2_5_1_19_3_phosphoshikimate_1_carboxyvinyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_19_3_phosphoshikimate_1_carboxyvinyltransferase_inhibitor),
-            CHEBI_ROLE_EC_3_4_19_omega_peptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_19_omega_peptidase_inhibitor),
-            CHEBI_ROLE_EC_3_4_19_3_pyroglutamyl_peptidase_I_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_19_3_pyroglutamyl_peptidase_I_inhibitor),
-            CHEBI_ROLE_EC_3_5_1_5_urease_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_1_5_urease_inhibitor),
-            CHEBI_ROLE_P2Y2_receptor_agonist: toBoolean(row.CHEBI_ROLE_P2Y2_receptor_agonist),
-            CHEBI_ROLE_EC_1_6_3_oxidoreductase_acting_on_NADH_or_NADPH_with_oxygen_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_6_3_oxidoreductase_acting_on_NADH_or_NADPH_with_oxygen_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_6_3_1___NAD_P_H_oxidase_H2O2_forming___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_6_3_1___NAD_P_H_oxidase_H2O2_forming___inhibitor),
-            CHEBI_ROLE_erythropoietin_inhibitor: toBoolean(row.CHEBI_ROLE_erythropoietin_inhibitor),
-            CHEBI_ROLE_EC_1_14_16_2_tyrosine_3_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_16_2_tyrosine_3_monooxygenase_inhibitor),
-            CHEBI_ROLE_EC_1_14_16_oxidoreductase_acting_on_paired_donors__reduced_pteridine_as_one_donor__incorporating_1_atom_of_oxygen_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_16_oxidoreductase_acting_on_paired_donors__reduced_pteridine_as_one_donor__incorporating_1_atom_of_oxygen_inhibitor),
-            CHEBI_ROLE_gout_suppressant: toBoolean(row.CHEBI_ROLE_gout_suppressant),
-            CHEBI_ROLE_defoliant: toBoolean(row.CHEBI_ROLE_defoliant),
-            CHEBI_ROLE_avicide: toBoolean(row.CHEBI_ROLE_avicide),
-            CHEBI_ROLE_miotic: toBoolean(row.CHEBI_ROLE_miotic),
-            CHEBI_ROLE_antidote_to_curare_poisoning: toBoolean(row.CHEBI_ROLE_antidote_to_curare_poisoning),
-            CHEBI_ROLE_H3_receptor_antagonist: toBoolean(row.CHEBI_ROLE_H3_receptor_antagonist),
-            CHEBI_ROLE_insulin_secretagogue: toBoolean(row.CHEBI_ROLE_insulin_secretagogue),
-            CHEBI_ROLE_secretagogue: toBoolean(row.CHEBI_ROLE_secretagogue),
-            CHEBI_ROLE_elastin_laminin_receptor_agonist: toBoolean(row.CHEBI_ROLE_elastin_laminin_receptor_agonist),
-            CHEBI_ROLE_radioactive_label: toBoolean(row.CHEBI_ROLE_radioactive_label),
-            CHEBI_ROLE_leprostatic_drug: toBoolean(row.CHEBI_ROLE_leprostatic_drug),
-            CHEBI_ROLE_pregnane_X_receptor_agonist: toBoolean(row.CHEBI_ROLE_pregnane_X_receptor_agonist),
-            CHEBI_ROLE_Daphnia_tenebrosa_metabolite: toBoolean(row.CHEBI_ROLE_Daphnia_tenebrosa_metabolite),
-            CHEBI_ROLE_mitochondrial_NADH_ubiquinone_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_mitochondrial_NADH_ubiquinone_reductase_inhibitor),
-            CHEBI_ROLE_EC_1_17_3_2_xanthine_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_17_3_2_xanthine_oxidase_inhibitor),
-            CHEBI_ROLE_EC_1_17_3_oxidoreductase_acting_on_CH_or_CH2_with_oxygen_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_17_3_oxidoreductase_acting_on_CH_or_CH2_with_oxygen_as_acceptor_inhibitor),
-            CHEBI_ROLE_metabotropic_glutamate_receptor_antagonist: toBoolean(row.CHEBI_ROLE_metabotropic_glutamate_receptor_antagonist),
-            CHEBI_ROLE_EC_5_3_intramolecular_oxidoreductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_3_intramolecular_oxidoreductase_inhibitor),
-            CHEBI_ROLE_EC_5_3_1_intramolecular_oxidoreductase_interconverting_aldoses_and_ketoses_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_3_1_intramolecular_oxidoreductase_interconverting_aldoses_and_ketoses_inhibitor),
-            CHEBI_ROLE_EC_5_3_1_1_triose_phosphate_isomerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_3_1_1_triose_phosphate_isomerase_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_25_shikimate_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_25_shikimate_dehydrogenase_inhibitor),
-            definition: row.definition,
-            CHEBI_ROLE_photosystem_I_inhibitor: toBoolean(row.CHEBI_ROLE_photosystem_I_inhibitor),
-            CHEBI_ROLE_EC_6_1_1_4_leucine_tRNA_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_1_1_4_leucine_tRNA_ligase_inhibitor),
-            CHEBI_ROLE_TRPM4_channel_inhibitor: toBoolean(row.CHEBI_ROLE_TRPM4_channel_inhibitor),
-            CHEBI_ROLE_sympatholytic_agent: toBoolean(row.CHEBI_ROLE_sympatholytic_agent),
-            CHEBI_ROLE_EC_1_8_1_9_thioredoxin_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_8_1_9_thioredoxin_reductase_inhibitor),
-            CHEBI_ROLE_EC_2_7_8_15_UDP_N_acetylglucosamine_dolichyl_phosphate_N_acetylglucosaminephosphotransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_8_15_UDP_N_acetylglucosamine_dolichyl_phosphate_N_acetylglucosaminephosphotransferase_inhibitor),
-            CHEBI_ROLE_EC_2_7_8_transferases_for_other_substituted_phosphate_groups_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_8_transferases_for_other_substituted_phosphate_groups_inhibitor),
-            CHEBI_ROLE_EC_2_4_1_64_alpha_alpha_trehalose_phosphorylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_64_alpha_alpha_trehalose_phosphorylase_inhibitor),
-            CHEBI_ROLE_EC_2_4_1_231__alpha_alpha_trehalose_phosphorylase_configuration_retaining___inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_231__alpha_alpha_trehalose_phosphorylase_configuration_retaining___inhibitor),
-            CHEBI_ROLE_uricosuric_drug: toBoolean(row.CHEBI_ROLE_uricosuric_drug),
-            CHEBI_ROLE_renal_agent: toBoolean(row.CHEBI_ROLE_renal_agent),
-            CHEBI_ROLE_triazine_insecticide: toBoolean(row.CHEBI_ROLE_triazine_insecticide),
-            CHEBI_ROLE_EC_6_4_1_1_pyruvate_carboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_4_1_1_pyruvate_carboxylase_inhibitor),
-            CHEBI_ROLE_EC_4_2_1_3_aconitate_hydratase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_2_1_3_aconitate_hydratase_inhibitor),
-            CHEBI_ROLE_GHB_receptor_agonist: toBoolean(row.CHEBI_ROLE_GHB_receptor_agonist),
-            CHEBI_ROLE_pyrethroid_ester_acaricide: toBoolean(row.CHEBI_ROLE_pyrethroid_ester_acaricide),
-            CHEBI_ROLE_cyclooxygenase_3_inhibitor: toBoolean(row.CHEBI_ROLE_cyclooxygenase_3_inhibitor),
-            CHEBI_ROLE_loop_diuretic: toBoolean(row.CHEBI_ROLE_loop_diuretic),
-            CHEBI_ROLE_EC_4_1_1_28_aromatic_L_amino_acid_decarboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_1_28_aromatic_L_amino_acid_decarboxylase_inhibitor),
-            CHEBI_ROLE_EC_3_6_3_8_Ca_2__transporting_ATPase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_3_8_Ca_2__transporting_ATPase_inhibitor),
-            CHEBI_ROLE_amphiphile: toBoolean(row.CHEBI_ROLE_amphiphile),
-            CHEBI_ROLE_insulin_sensitizing_drug: toBoolean(row.CHEBI_ROLE_insulin_sensitizing_drug),
-            CHEBI_ROLE_GnRH_antagonist: toBoolean(row.CHEBI_ROLE_GnRH_antagonist),
-            CHEBI_ROLE_EC_3_1_4_17_3__5__cyclic_nucleotide_phosphodiesterase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_4_17_3__5__cyclic_nucleotide_phosphodiesterase_inhibitor),
-            CHEBI_ROLE_aldosterone_antagonist: toBoolean(row.CHEBI_ROLE_aldosterone_antagonist),
-            CHEBI_ROLE_antimineralocorticoid: toBoolean(row.CHEBI_ROLE_antimineralocorticoid),
-            CHEBI_ROLE_synthetic_oral_contraceptive: toBoolean(row.CHEBI_ROLE_synthetic_oral_contraceptive),
-            CHEBI_ROLE_estrogen_receptor_modulator: toBoolean(row.CHEBI_ROLE_estrogen_receptor_modulator),
-            CHEBI_ROLE_estrogen_antagonist: toBoolean(row.CHEBI_ROLE_estrogen_antagonist),
-            CHEBI_ROLE_two_colour_indicator: toBoolean(row.CHEBI_ROLE_two_colour_indicator),
-            CHEBI_ROLE_eugeroic: toBoolean(row.CHEBI_ROLE_eugeroic),
-            CHEBI_ROLE_TRPV1_agonist: toBoolean(row.CHEBI_ROLE_TRPV1_agonist),
-            CHEBI_ROLE_acid_base_indicator: toBoolean(row.CHEBI_ROLE_acid_base_indicator),
-            CHEBI_ROLE_cholinesterase_reactivator: toBoolean(row.CHEBI_ROLE_cholinesterase_reactivator),
-            CHEBI_ROLE_enzyme_reactivator: toBoolean(row.CHEBI_ROLE_enzyme_reactivator),
-            CHEBI_ROLE_cholecystokinin_antagonist: toBoolean(row.CHEBI_ROLE_cholecystokinin_antagonist),
-            CHEBI_ROLE_EC_1_4_3_22_diamine_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_3_22_diamine_oxidase_inhibitor),
-            CHEBI_ROLE_thromboxane_A2_antagonist: toBoolean(row.CHEBI_ROLE_thromboxane_A2_antagonist),
-            CHEBI_ROLE_quinol_oxidation_site_inhibitor: toBoolean(row.CHEBI_ROLE_quinol_oxidation_site_inhibitor),
-            CHEBI_ROLE_kappa_opioid_receptor_antagonist: toBoolean(row.CHEBI_ROLE_kappa_opioid_receptor_antagonist),
-            CHEBI_ROLE_abortifacient: toBoolean(row.CHEBI_ROLE_abortifacient),
-            CHEBI_ROLE_EC_1_1_1_210__3beta_or_20alpha_hydroxysteroid_dehydrogenase__inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_210__3beta_or_20alpha_hydroxysteroid_dehydrogenase__inhibitor),
-            CHEBI_ROLE_EC_1_14_13_132_squalene_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_13_132_squalene_monooxygenase_inhibitor),
-            CHEBI_ROLE_phase_transfer_catalyst: toBoolean(row.CHEBI_ROLE_phase_transfer_catalyst),
-            CHEBI_ROLE_pesticide_synergist: toBoolean(row.CHEBI_ROLE_pesticide_synergist),
-            CHEBI_ROLE_protein_denaturant: toBoolean(row.CHEBI_ROLE_protein_denaturant),
-            CHEBI_ROLE_food_firming_agent: toBoolean(row.CHEBI_ROLE_food_firming_agent),
-            CHEBI_ROLE_EC_1_15_oxidoreductase_acting_on_superoxide_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_15_oxidoreductase_acting_on_superoxide_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_15_1_1_superoxide_dismutase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_15_1_1_superoxide_dismutase_inhibitor),
-            CHEBI_ROLE_glutamate_transporter_activator: toBoolean(row.CHEBI_ROLE_glutamate_transporter_activator),
-            CHEBI_ROLE_neurotransmitter_transporter_modulator: toBoolean(row.CHEBI_ROLE_neurotransmitter_transporter_modulator),
-            CHEBI_ROLE_antimanic_drug: toBoolean(row.CHEBI_ROLE_antimanic_drug),
-            CHEBI_ROLE_hydrogen_donor: toBoolean(row.CHEBI_ROLE_hydrogen_donor),
-            CHEBI_ROLE_EC_4_2_1_94_scytalone_dehydratase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_2_1_94_scytalone_dehydratase_inhibitor),
-            CHEBI_ROLE_orphan_drug: toBoolean(row.CHEBI_ROLE_orphan_drug),
-            CHEBI_ROLE_juvenile_hormone_mimic: toBoolean(row.CHEBI_ROLE_juvenile_hormone_mimic),
-            CHEBI_ROLE_purinergic_receptor_P2X_antagonist: toBoolean(row.CHEBI_ROLE_purinergic_receptor_P2X_antagonist),
-            CHEBI_ROLE_purinergic_receptor_P2_antagonist: toBoolean(row.CHEBI_ROLE_purinergic_receptor_P2_antagonist),
-            CHEBI_ROLE_EC_2_4_1_129_peptidoglycan_glycosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_129_peptidoglycan_glycosyltransferase_inhibitor),
-            CHEBI_ROLE_EC_1_2_1_11_aspartate_semialdehyde_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_2_1_11_aspartate_semialdehyde_dehydrogenase_inhibitor),
-            CHEBI_ROLE_H1_receptor_agonist: toBoolean(row.CHEBI_ROLE_H1_receptor_agonist),
-            CHEBI_ROLE_antisyphilitic_drug: toBoolean(row.CHEBI_ROLE_antisyphilitic_drug),
-            CHEBI_ROLE_antitreponemal_drug: toBoolean(row.CHEBI_ROLE_antitreponemal_drug),
-            CHEBI_ROLE_radioactive_tracer: toBoolean(row.CHEBI_ROLE_radioactive_tracer),
-            CHEBI_ROLE_EC_3_4_13_dipeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_13_dipeptidase_inhibitor),
-            CHEBI_ROLE_EC_3_4_13_19_membrane_dipeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_13_19_membrane_dipeptidase_inhibitor),
-            CHEBI_ROLE_EC_2_7_7_49_RNA_directed_DNA_polymerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_7_49_RNA_directed_DNA_polymerase_inhibitor),
-            CHEBI_ROLE_sphingosine_1_phosphate_receptor_agonist: toBoolean(row.CHEBI_ROLE_sphingosine_1_phosphate_receptor_agonist),
-            CHEBI_ROLE_T_cell_proliferation_inhibitor: toBoolean(row.CHEBI_ROLE_T_cell_proliferation_inhibitor),
-            CHEBI_ROLE_P2Y12_receptor_antagonist: toBoolean(row.CHEBI_ROLE_P2Y12_receptor_antagonist),
-            CHEBI_ROLE_EC_1_14_13_78_ent_kaurene_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_13_78_ent_kaurene_oxidase_inhibitor),
-            CHEBI_ROLE_ecdysone_agonist: toBoolean(row.CHEBI_ROLE_ecdysone_agonist),
-            CHEBI_ROLE_chitin_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_chitin_synthesis_inhibitor),
-            CHEBI_ROLE_lepidopteran_inhibitor_of_chitin_biosynthesis: toBoolean(row.CHEBI_ROLE_lepidopteran_inhibitor_of_chitin_biosynthesis),
-            CHEBI_ROLE_CETP_inhibitor: toBoolean(row.CHEBI_ROLE_CETP_inhibitor),
-            CHEBI_ROLE_Good_s_buffer_substance: toBoolean(row.CHEBI_ROLE_Good_s_buffer_substance),
-            CHEBI_ROLE_neonicotinoid_insectide: toBoolean(row.CHEBI_ROLE_neonicotinoid_insectide),
-            CHEBI_ROLE_antibiotic_nematicide: toBoolean(row.CHEBI_ROLE_antibiotic_nematicide),
-            CHEBI_ROLE_antibiotic_acaricide: toBoolean(row.CHEBI_ROLE_antibiotic_acaricide),
-            CHEBI_ROLE_sulfite_ester_acaricide: toBoolean(row.CHEBI_ROLE_sulfite_ester_acaricide),
-            CHEBI_ROLE_tetrazine_acaricide: toBoolean(row.CHEBI_ROLE_tetrazine_acaricide),
-            CHEBI_ROLE_mite_growth_regulator: toBoolean(row.CHEBI_ROLE_mite_growth_regulator),
-            CHEBI_ROLE_dinitrophenol_insecticide: toBoolean(row.CHEBI_ROLE_dinitrophenol_insecticide),
-            CHEBI_ROLE_pyrethroid_ether_acaricide: toBoolean(row.CHEBI_ROLE_pyrethroid_ether_acaricide),
-            CHEBI_ROLE_homopteran_inhibitor_of_chitin_biosynthesis: toBoolean(row.CHEBI_ROLE_homopteran_inhibitor_of_chitin_biosynthesis),
-            CHEBI_ROLE_EC_3_4_21_37_leukocyte_elastase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_37_leukocyte_elastase_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_205_IMP_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_205_IMP_dehydrogenase_inhibitor),
-            CHEBI_ROLE_nerve_growth_factor_stimulator: toBoolean(row.CHEBI_ROLE_nerve_growth_factor_stimulator),
-            CHEBI_ROLE_reaction_intermediate: toBoolean(row.CHEBI_ROLE_reaction_intermediate),
-            CHEBI_ROLE_EC_1_11_1_6_catalase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_11_1_6_catalase_inhibitor),
-            CHEBI_ROLE_EC_2_4_2_1_purine_nucleoside_phosphorylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_2_1_purine_nucleoside_phosphorylase_inhibitor),
-            CHEBI_ROLE_EC_2_5_1_6_methionine_adenosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_6_methionine_adenosyltransferase_inhibitor),
-            CHEBI_ROLE_autoinducer: toBoolean(row.CHEBI_ROLE_autoinducer),
-            CHEBI_ROLE_provitamin_B1: toBoolean(row.CHEBI_ROLE_provitamin_B1),
-            CHEBI_ROLE_liver_X_receptor_agonist: toBoolean(row.CHEBI_ROLE_liver_X_receptor_agonist),
-            CHEBI_ROLE_AMPA_receptor_agonist: toBoolean(row.CHEBI_ROLE_AMPA_receptor_agonist),
-            CHEBI_ROLE_EC_2_3_2_52_beta_N_acetylhexosaminidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_2_52_beta_N_acetylhexosaminidase_inhibitor),
-            CHEBI_ROLE_gap_junctional_intercellular_communication_inhibitor: toBoolean(row.CHEBI_ROLE_gap_junctional_intercellular_communication_inhibitor),
-            CHEBI_ROLE_ryanodine_receptor_antagonist: toBoolean(row.CHEBI_ROLE_ryanodine_receptor_antagonist),
-            CHEBI_ROLE_EC_1_4_3_3_D_amino_acid_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_3_3_D_amino_acid_oxidase_inhibitor),
-            CHEBI_ROLE_EC_1_13_11_24_quercetin_2_3_dioxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_13_11_24_quercetin_2_3_dioxygenase_inhibitor),
-            CHEBI_ROLE_EC_1_10_3_oxidoreductase_acting_on_diphenols_and_related_substances_as_donors_with_oxygen_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_10_3_oxidoreductase_acting_on_diphenols_and_related_substances_as_donors_with_oxygen_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_10_3_2_laccase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_10_3_2_laccase_inhibitor),
-            CHEBI_ROLE_EC_1_10_3_1_catechol_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_10_3_1_catechol_oxidase_inhibitor),
-            CHEBI_ROLE_EC_1_4_3_2_L_amino_acid_oxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_3_2_L_amino_acid_oxidase_inhibitor),
-            CHEBI_ROLE_EC_2_6_1_2_alanine_transaminase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_6_1_2_alanine_transaminase_inhibitor),
-            CHEBI_ROLE_EC_4_4_1_14_1_aminocyclopropane_1_carboxylate_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_4_1_14_1_aminocyclopropane_1_carboxylate_synthase_inhibitor),
-            CHEBI_ROLE_EC_4_4_1_C_S_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_4_1_C_S_lyase_inhibitor),
-            CHEBI_ROLE_EC_4_4_C_S_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_4_C_S_lyase_inhibitor),
-            CHEBI_ROLE_EC_4_1_1_50_adenosylmethionine_decarboxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_1_50_adenosylmethionine_decarboxylase_inhibitor),
-            CHEBI_ROLE_EC_1_14_15_4_steroid_11beta_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_15_4_steroid_11beta_monooxygenase_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_267_1_deoxy_D_xylulose_5_phosphate_reductoisomerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_267_1_deoxy_D_xylulose_5_phosphate_reductoisomerase_inhibitor),
-            CHEBI_ROLE_EC_2_7_1_1_hexokinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_1_hexokinase_inhibitor),
-            CHEBI_ROLE_EC_1_3_1_8__acyl_CoA_dehydrogenase_NADP_____inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_1_8__acyl_CoA_dehydrogenase_NADP_____inhibitor),
-            CHEBI_ROLE_vasopressin_receptor_agonist: toBoolean(row.CHEBI_ROLE_vasopressin_receptor_agonist),
-            CHEBI_ROLE_EC_3_6_1_3_adenosinetriphosphatase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_1_3_adenosinetriphosphatase_inhibitor),
-            CHEBI_ROLE_EC_3_6_1_hydrolases_acting_on_acid_anhydrides_in_P_containing_anhydrides_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_6_1_hydrolases_acting_on_acid_anhydrides_in_P_containing_anhydrides_inhibitor),
-            CHEBI_ROLE_K_ATP_channel_agonist: toBoolean(row.CHEBI_ROLE_K_ATP_channel_agonist),
-            CHEBI_ROLE_fluorescence_quencher: toBoolean(row.CHEBI_ROLE_fluorescence_quencher),
-            CHEBI_ROLE_EC_3_4_24_71_endothelin_converting_enzyme_1_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_24_71_endothelin_converting_enzyme_1_inhibitor),
-            CHEBI_ROLE_EC_3_4_24_11_neprilysin_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_24_11_neprilysin_inhibitor),
-            CHEBI_ROLE_EC_1_14_13_97_taurochenodeoxycholate_6alpha_hydroxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_13_97_taurochenodeoxycholate_6alpha_hydroxylase_inhibitor),
-            CHEBI_ROLE_EC_5_3_3_5_cholestenol_Delta_isomerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_3_3_5_cholestenol_Delta_isomerase_inhibitor),
-            CHEBI_ROLE_EC_5_3_3_intramolecular_oxidase_transposing_C_C_bonds_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_3_3_intramolecular_oxidase_transposing_C_C_bonds_inhibitor),
-            CHEBI_ROLE_EC_1_3_99_oxidoreductase_acting_on_donor_CH_CH_group__with_other_acceptors_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_99_oxidoreductase_acting_on_donor_CH_CH_group__with_other_acceptors_inhibitor),
-            CHEBI_ROLE_EC_1_3_99_29__phytoene_desaturase_zeta_carotene_forming___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_99_29__phytoene_desaturase_zeta_carotene_forming___inhibitor),
-            CHEBI_ROLE_carotogenesis_inhibitor: toBoolean(row.CHEBI_ROLE_carotogenesis_inhibitor),
-            CHEBI_ROLE_EC_3_1_3_41_4_nitrophenylphosphatase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_3_41_4_nitrophenylphosphatase_inhibitor),
-            CHEBI_ROLE_adenosine_phosphodiesterase_inhibitor: toBoolean(row.CHEBI_ROLE_adenosine_phosphodiesterase_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_1_alcohol_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_1_alcohol_dehydrogenase_inhibitor),
-            CHEBI_ROLE_sclerotherapy_agent: toBoolean(row.CHEBI_ROLE_sclerotherapy_agent),
-            CHEBI_ROLE_lachrymator: toBoolean(row.CHEBI_ROLE_lachrymator),
-            CHEBI_ROLE_antihyperplasia_drug: toBoolean(row.CHEBI_ROLE_antihyperplasia_drug),
-            CHEBI_ROLE_EC_2_7_1_127_inositol_trisphosphate_3_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_127_inositol_trisphosphate_3_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_7_4_6_nucleoside_diphosphate_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_4_6_nucleoside_diphosphate_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_7_1_151_inositol_polyphosphate_multikinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_1_151_inositol_polyphosphate_multikinase_inhibitor),
-            CHEBI_ROLE_EC_2_4_1_1_glycogen_phosphorylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_1_glycogen_phosphorylase_inhibitor),
-            CHEBI_ROLE_EC_2_3_1_5_arylamine_N_acetyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_5_arylamine_N_acetyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_7_4_phosphotransferases_with_a_phosphate_group_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_4_phosphotransferases_with_a_phosphate_group_as_acceptor_inhibitor),
-            CHEBI_ROLE_IAP_antagonist: toBoolean(row.CHEBI_ROLE_IAP_antagonist),
-            CHEBI_ROLE_EC_2_1_1_6_catechol_O_methyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_6_catechol_O_methyltransferase_inhibitor),
-            CHEBI_ROLE_calcimimetic: toBoolean(row.CHEBI_ROLE_calcimimetic),
-            CHEBI_ROLE_methionine_aminopeptidase_2_inhibitor: toBoolean(row.CHEBI_ROLE_methionine_aminopeptidase_2_inhibitor),
-            CHEBI_ROLE_EC_3_4_11_18_methionyl_aminopeptidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_11_18_methionyl_aminopeptidase_inhibitor),
-            CHEBI_ROLE_EC_2_7_11_2__pyruvate_dehydrogenase_acetyl_transferring___kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_2__pyruvate_dehydrogenase_acetyl_transferring___kinase_inhibitor),
-            CHEBI_ROLE_EC_5_4_3_intramolecular_transferase_transferring_amino_groups_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_4_3_intramolecular_transferase_transferring_amino_groups_inhibitor),
-            CHEBI_ROLE_EC_5_4_3_2_lysine_2_3_aminomutase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_4_3_2_lysine_2_3_aminomutase_inhibitor),
-            CHEBI_ROLE_substance_P_receptor_antagonist: toBoolean(row.CHEBI_ROLE_substance_P_receptor_antagonist),
-            CHEBI_ROLE_EC_2_4_1_80_ceramide_glucosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_1_80_ceramide_glucosyltransferase_inhibitor),
-            CHEBI_ROLE_antitrichomonal_drug: toBoolean(row.CHEBI_ROLE_antitrichomonal_drug),
-            CHEBI_ROLE_antidote_to_benzodiazepine_poisoning: toBoolean(row.CHEBI_ROLE_antidote_to_benzodiazepine_poisoning),
-            CHEBI_ROLE_Grignard_reagent: toBoolean(row.CHEBI_ROLE_Grignard_reagent),
-            CHEBI_ROLE_partial_prostacyclin_agonist: toBoolean(row.CHEBI_ROLE_partial_prostacyclin_agonist),
-            CHEBI_ROLE_CFTR_potentiator: toBoolean(row.CHEBI_ROLE_CFTR_potentiator),
-            CHEBI_ROLE_EC_2_3_2_13_protein_glutamine_gamma_glutamyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_2_13_protein_glutamine_gamma_glutamyltransferase_inhibitor),
-            CHEBI_ROLE_squaraine_dye: toBoolean(row.CHEBI_ROLE_squaraine_dye),
-            CHEBI_ROLE_phosphate_protecting_group: toBoolean(row.CHEBI_ROLE_phosphate_protecting_group),
-            CHEBI_ROLE_protein_sequencing_agent: toBoolean(row.CHEBI_ROLE_protein_sequencing_agent),
-            CHEBI_ROLE_EC_2_7_3_2_creatine_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_3_2_creatine_kinase_inhibitor),
-            CHEBI_ROLE_spectrophotometric_reagent: toBoolean(row.CHEBI_ROLE_spectrophotometric_reagent),
-            CHEBI_ROLE_EC_2_7_3_phosphotransferases_with_a_nitrogenous_group_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_3_phosphotransferases_with_a_nitrogenous_group_as_acceptor_inhibitor),
-            CHEBI_ROLE_tolerogen: toBoolean(row.CHEBI_ROLE_tolerogen),
-            CHEBI_ROLE_peptide_coupling_reagent: toBoolean(row.CHEBI_ROLE_peptide_coupling_reagent),
-            CHEBI_ROLE_corrosion_inhibitor: toBoolean(row.CHEBI_ROLE_corrosion_inhibitor),
-            CHEBI_ROLE_gonadotropin_releasing_hormone_agonist: toBoolean(row.CHEBI_ROLE_gonadotropin_releasing_hormone_agonist),
-            CHEBI_ROLE_GABA_reuptake_inhibitor: toBoolean(row.CHEBI_ROLE_GABA_reuptake_inhibitor),
-            CHEBI_ROLE_hydrogen_acceptor: toBoolean(row.CHEBI_ROLE_hydrogen_acceptor),
-            CHEBI_ROLE_EC_1_10_2_oxidoreductase_acting_on_diphenols_and_related_substances_as_donors_with_a_cytochrome_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_10_2_oxidoreductase_acting_on_diphenols_and_related_substances_as_donors_with_a_cytochrome_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_10_2_2_quinol_cytochrome_c_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_10_2_2_quinol_cytochrome_c_reductase_inhibitor),
-            CHEBI_ROLE_EC_3_11_1_hydrolases_acting_on_C_P_bonds_of_phosphono_acetaldehyde__acetate__or_pyruvate_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_11_1_hydrolases_acting_on_C_P_bonds_of_phosphono_acetaldehyde__acetate__or_pyruvate_inhibitor),
-            CHEBI_ROLE_EC_3_11_hydrolases_acting_on_C_P_bonds_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_11_hydrolases_acting_on_C_P_bonds_inhibitor),
-            CHEBI_ROLE_EC_3_11_1_3_phosphonopyruvate_hydrolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_11_1_3_phosphonopyruvate_hydrolase_inhibitor),
-            CHEBI_ROLE_NOD1_agonist: toBoolean(row.CHEBI_ROLE_NOD1_agonist),
-            CHEBI_ROLE_bolaamphiphile: toBoolean(row.CHEBI_ROLE_bolaamphiphile),
-            CHEBI_ROLE_chiral_reagent: toBoolean(row.CHEBI_ROLE_chiral_reagent),
-            CHEBI_ROLE_platelet_glycoprotein_IIb_IIIa_receptor_antagonist: toBoolean(row.CHEBI_ROLE_platelet_glycoprotein_IIb_IIIa_receptor_antagonist),
-            CHEBI_ROLE_glucagon_receptor_antagonist: toBoolean(row.CHEBI_ROLE_glucagon_receptor_antagonist),
-            CHEBI_ROLE_HIV_fusion_inhibitor: toBoolean(row.CHEBI_ROLE_HIV_fusion_inhibitor),
-            CHEBI_ROLE_antifoaming_agent: toBoolean(row.CHEBI_ROLE_antifoaming_agent),
-            CHEBI_ROLE_food_antifoaming_agent: toBoolean(row.CHEBI_ROLE_food_antifoaming_agent),
-            CHEBI_ROLE_inositol_phosphorylceramide_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_inositol_phosphorylceramide_synthase_inhibitor),
-            CHEBI_ROLE_Chaetomium_metabolite: toBoolean(row.CHEBI_ROLE_Chaetomium_metabolite),
-            CHEBI_ROLE_tankyrase_inhibitor: toBoolean(row.CHEBI_ROLE_tankyrase_inhibitor),
-            CHEBI_ROLE_axin_stabilizer: toBoolean(row.CHEBI_ROLE_axin_stabilizer),
-            CHEBI_ROLE_crystallisation_adjutant: toBoolean(row.CHEBI_ROLE_crystallisation_adjutant),
-            CHEBI_ROLE_ceramide_allergen: toBoolean(row.CHEBI_ROLE_ceramide_allergen),
-            CHEBI_ROLE_insulin_release_inhibitor: toBoolean(row.CHEBI_ROLE_insulin_release_inhibitor),
-            CHEBI_ROLE_EC_2_1_2_2_phosphoribosylglycinamide_formyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_2_2_phosphoribosylglycinamide_formyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_1_1_45_thymidylate_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_1_45_thymidylate_synthase_inhibitor),
-            CHEBI_ROLE_film_forming_compound: toBoolean(row.CHEBI_ROLE_film_forming_compound),
-            CHEBI_ROLE_alpha1B_adrenoceptor_antagonist: toBoolean(row.CHEBI_ROLE_alpha1B_adrenoceptor_antagonist),
-            CHEBI_ROLE_EC_1_3_98_1__dihydroorotate_oxidase_fumarate___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_98_1__dihydroorotate_oxidase_fumarate___inhibitor),
-            CHEBI_ROLE_EC_1_3_98_oxidoreductase_acting_on_donor_CH_CH_group__with_other__known__acceptors_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_3_98_oxidoreductase_acting_on_donor_CH_CH_group__with_other__known__acceptors_inhibitor),
-            CHEBI_ROLE_protein_kinase_G_agonist: toBoolean(row.CHEBI_ROLE_protein_kinase_G_agonist),
-            CHEBI_ROLE_H3_receptor_agonist: toBoolean(row.CHEBI_ROLE_H3_receptor_agonist),
-            CHEBI_ROLE_H4_receptor_agonist: toBoolean(row.CHEBI_ROLE_H4_receptor_agonist),
-            CHEBI_ROLE_EC_3_4_21_4_trypsin_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_4_trypsin_inhibitor),
-            CHEBI_ROLE_EC_3_4_22_38_cathepsin_K_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_22_38_cathepsin_K_inhibitor),
-            CHEBI_ROLE_EC_2_5_1_29_geranylgeranyl_diphosphate_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_29_geranylgeranyl_diphosphate_synthase_inhibitor),
-            CHEBI_ROLE_LRH_1_agonist: toBoolean(row.CHEBI_ROLE_LRH_1_agonist),
-            CHEBI_ROLE_EC_2_3_1_24_sphingosine_N_acyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_24_sphingosine_N_acyltransferase_inhibitor),
-            CHEBI_ROLE_HIV_1_maturation_inhibitor: toBoolean(row.CHEBI_ROLE_HIV_1_maturation_inhibitor),
-            CHEBI_ROLE_EC_3_5_1_88_peptide_deformylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_1_88_peptide_deformylase_inhibitor),
-            CHEBI_ROLE_anti_HIV_2_agent: toBoolean(row.CHEBI_ROLE_anti_HIV_2_agent),
-            CHEBI_ROLE_EC_3_4_21_1_chymotrypsin_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_1_chymotrypsin_inhibitor),
-            CHEBI_ROLE_actin_polymerisation_inducer: toBoolean(row.CHEBI_ROLE_actin_polymerisation_inducer),
-            CHEBI_ROLE_EC_3_4_22_2_papain_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_22_2_papain_inhibitor),
-            CHEBI_ROLE_EC_3_2_1_166_heparanase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_166_heparanase_inhibitor),
-            CHEBI_ROLE_EC_2_3_1_20_diacylglycerol_O_acyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_1_20_diacylglycerol_O_acyltransferase_inhibitor),
-            CHEBI_ROLE_EC_4_4_1_11_methionine_gamma_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_4_1_11_methionine_gamma_lyase_inhibitor),
-            CHEBI_ROLE_EC_3_2_1_31_beta_glucuronidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_31_beta_glucuronidase_inhibitor),
-            CHEBI_ROLE_EC_3_4_21_39_chymase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_39_chymase_inhibitor),
-            CHEBI_ROLE_EC_6_5_phosphoric_ester_bond_forming_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_5_phosphoric_ester_bond_forming_ligase_inhibitor),
-            CHEBI_ROLE_EC_6_5_1_1__DNA_ligase_ATP___inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_5_1_1__DNA_ligase_ATP___inhibitor),
-            CHEBI_ROLE_EC_6_5_1_DNA_RNA_repair_enzymes_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_5_1_DNA_RNA_repair_enzymes_inhibitor),
-            CHEBI_ROLE_anti_HSV_2_agent: toBoolean(row.CHEBI_ROLE_anti_HSV_2_agent),
-            CHEBI_ROLE_erythropeotin_receptor_agonist: toBoolean(row.CHEBI_ROLE_erythropeotin_receptor_agonist),
-            CHEBI_ROLE_NMR_shift_reagent: toBoolean(row.CHEBI_ROLE_NMR_shift_reagent),
-            CHEBI_ROLE_appetite_enhancer: toBoolean(row.CHEBI_ROLE_appetite_enhancer),
-            CHEBI_ROLE_EC_3_2_1_45_glucosylceramidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_2_1_45_glucosylceramidase_inhibitor),
-            CHEBI_ROLE_glutathione_depleting_agent: toBoolean(row.CHEBI_ROLE_glutathione_depleting_agent),
-            CHEBI_ROLE_Streptococcus_pneumoniae_metabolite: toBoolean(row.CHEBI_ROLE_Streptococcus_pneumoniae_metabolite),
-            CHEBI_ROLE_guanylate_cyclase_2C_agonist: toBoolean(row.CHEBI_ROLE_guanylate_cyclase_2C_agonist),
-            CHEBI_ROLE_physical_tracer: toBoolean(row.CHEBI_ROLE_physical_tracer),
-            CHEBI_ROLE_EC_4_6_1_2_guanylate_cyclase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_6_1_2_guanylate_cyclase_inhibitor),
-            CHEBI_ROLE_EC_4_6_P_O_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_6_P_O_lyase_inhibitor),
-            CHEBI_ROLE_glucocorticoid_receptor_antagonist: toBoolean(row.CHEBI_ROLE_glucocorticoid_receptor_antagonist),
-            CHEBI_ROLE_breast_cancer_resistance_protein_inhibitor: toBoolean(row.CHEBI_ROLE_breast_cancer_resistance_protein_inhibitor),
-            CHEBI_ROLE_cell_dedifferentiation_agent: toBoolean(row.CHEBI_ROLE_cell_dedifferentiation_agent),
-            CHEBI_ROLE_adenosine_A3_receptor_antagonist: toBoolean(row.CHEBI_ROLE_adenosine_A3_receptor_antagonist),
-            CHEBI_ROLE_progesterone_receptor_modulator: toBoolean(row.CHEBI_ROLE_progesterone_receptor_modulator),
-            CHEBI_ROLE_carbamylphosphate_synthetase_I_activator: toBoolean(row.CHEBI_ROLE_carbamylphosphate_synthetase_I_activator),
-            CHEBI_ROLE_EC_3_5_1_23_ceramidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_1_23_ceramidase_inhibitor),
-            CHEBI_ROLE_MTP_inhibitor: toBoolean(row.CHEBI_ROLE_MTP_inhibitor),
-            CHEBI_ROLE_glucagon_like_peptide_2_receptor_agonist: toBoolean(row.CHEBI_ROLE_glucagon_like_peptide_2_receptor_agonist),
-            CHEBI_ROLE_antiauxins: toBoolean(row.CHEBI_ROLE_antiauxins),
-            CHEBI_ROLE_brassinosteroid_biosynthesis_inhibitor: toBoolean(row.CHEBI_ROLE_brassinosteroid_biosynthesis_inhibitor),
-            CHEBI_ROLE_EC_1_11_1_11_L_ascorbate_peroxidase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_11_1_11_L_ascorbate_peroxidase_inhibitor),
-            CHEBI_ROLE_adenosine_A2A_receptor_agonist: toBoolean(row.CHEBI_ROLE_adenosine_A2A_receptor_agonist),
-            CHEBI_ROLE_adenosine_A3_receptor_agonist: toBoolean(row.CHEBI_ROLE_adenosine_A3_receptor_agonist),
-            CHEBI_ROLE_PPARbeta_delta_agonist: toBoolean(row.CHEBI_ROLE_PPARbeta_delta_agonist),
-            CHEBI_ROLE_microarray_analysis_reagent: toBoolean(row.CHEBI_ROLE_microarray_analysis_reagent),
-            CHEBI_ROLE_vibriostatic_agent: toBoolean(row.CHEBI_ROLE_vibriostatic_agent),
-            CHEBI_ROLE_EC_1_1_1_44_NADP___dependent_decarboxylating_phosphogluconate_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_44_NADP___dependent_decarboxylating_phosphogluconate_dehydrogenase_inhibitor),
-            CHEBI_ROLE_EC_2_3_2_2_gamma_glutamyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_3_2_2_gamma_glutamyltransferase_inhibitor),
-            CHEBI_ROLE_antidote_to_opioid_poisoning: toBoolean(row.CHEBI_ROLE_antidote_to_opioid_poisoning),
-            CHEBI_ROLE_neoglycolipid_probe: toBoolean(row.CHEBI_ROLE_neoglycolipid_probe),
-            CHEBI_ROLE_EC_3_1_27_endoribonucleases_producing_other_than_5__phosphomonoesters_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_27_endoribonucleases_producing_other_than_5__phosphomonoesters_inhibitor),
-            CHEBI_ROLE_EC_3_1_27_3_ribonuclease_T1_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_27_3_ribonuclease_T1_inhibitor),
-            CHEBI_ROLE_EC_2_7_11_18_myosin_light_chain_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_18_myosin_light_chain_kinase_inhibitor),
-            CHEBI_ROLE_EC_2_5_1_21_squalene_synthase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_21_squalene_synthase_inhibitor),
-            CHEBI_ROLE_platelet_activating_factor_receptor_agonist: toBoolean(row.CHEBI_ROLE_platelet_activating_factor_receptor_agonist),
-            CHEBI_ROLE_insulin_like_growth_factor_receptor_1_antagonist: toBoolean(row.CHEBI_ROLE_insulin_like_growth_factor_receptor_1_antagonist),
-            CHEBI_ROLE_EC_1_4_4_oxidoreductase_acting_on_donor_CH_NH2_group__a_disulfide_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_4_oxidoreductase_acting_on_donor_CH_NH2_group__a_disulfide_as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_1_4_4_2__glycine_dehydrogenase_aminomethyl_transferring___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_4_2__glycine_dehydrogenase_aminomethyl_transferring___inhibitor),
-            CHEBI_ROLE_EC_6_1_1_11_serine_tRNA_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_1_1_11_serine_tRNA_ligase_inhibitor),
-            CHEBI_ROLE_fluorogen: toBoolean(row.CHEBI_ROLE_fluorogen),
-            CHEBI_ROLE_odorant_receptor_antagonist: toBoolean(row.CHEBI_ROLE_odorant_receptor_antagonist),
-            CHEBI_ROLE_hyperglycemic_agent: toBoolean(row.CHEBI_ROLE_hyperglycemic_agent),
-            CHEBI_ROLE_antisense_oligonucleotide: toBoolean(row.CHEBI_ROLE_antisense_oligonucleotide),
-            CHEBI_ROLE_UDP_glucuronosyltransferase_activator: toBoolean(row.CHEBI_ROLE_UDP_glucuronosyltransferase_activator),
-            CHEBI_ROLE_EC_5_1_3_racemases_acting_on_carbohydrates_and_derivatives_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_1_3_racemases_acting_on_carbohydrates_and_derivatives_inhibitor),
-            CHEBI_ROLE_EC_5_1_3_2_UDP_glucose_4_epimerase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_5_1_3_2_UDP_glucose_4_epimerase_inhibitor),
-            CHEBI_ROLE_enzyme_mimic: toBoolean(row.CHEBI_ROLE_enzyme_mimic),
-            CHEBI_ROLE_EC_3_5_4_1_cytosine_deaminase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_5_4_1_cytosine_deaminase_inhibitor),
-            CHEBI_ROLE_EC_3_1_3_25_inositol_phosphate_phosphatase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_3_25_inositol_phosphate_phosphatase_inhibitor),
-            CHEBI_ROLE_EC_4_3_1_3_histidine_ammonia_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_3_1_3_histidine_ammonia_lyase_inhibitor),
-            CHEBI_ROLE_ATP_ADP_translocase_inhibitor: toBoolean(row.CHEBI_ROLE_ATP_ADP_translocase_inhibitor),
-            CHEBI_ROLE_EC_1_2_1_88_L_glutamate_gamma_semialdehyde_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_2_1_88_L_glutamate_gamma_semialdehyde_dehydrogenase_inhibitor),
-            CHEBI_ROLE_EC_1_14_13_181_13_deoxydaunorubicin_hydroxylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_13_181_13_deoxydaunorubicin_hydroxylase_inhibitor),
-            CHEBI_ROLE_EC_1_14_13_67_quinine_3_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_13_67_quinine_3_monooxygenase_inhibitor),
-            CHEBI_ROLE_Wiskott_Aldrich_syndrome_protein_inhibitor: toBoolean(row.CHEBI_ROLE_Wiskott_Aldrich_syndrome_protein_inhibitor),
-            CHEBI_ROLE_vitamin_B1_antagonist: toBoolean(row.CHEBI_ROLE_vitamin_B1_antagonist),
-            CHEBI_ROLE_EC_3_1_1_5_lysophospholipase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_1_1_5_lysophospholipase_inhibitor),
-            CHEBI_ROLE_EC_2_7_11_31___hydroxymethylglutaryl_CoA_reductase_NADPH___kinase__inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_31___hydroxymethylglutaryl_CoA_reductase_NADPH___kinase__inhibitor),
-            CHEBI_ROLE_bone_morphogenetic_protein_receptor_antagonist: toBoolean(row.CHEBI_ROLE_bone_morphogenetic_protein_receptor_antagonist),
-            CHEBI_ROLE_survivin_dimerisation_modulator: toBoolean(row.CHEBI_ROLE_survivin_dimerisation_modulator),
-            CHEBI_ROLE_melatonin_receptor_agonist: toBoolean(row.CHEBI_ROLE_melatonin_receptor_agonist),
-            CHEBI_ROLE_EC_4_1_2_aldehyde_lyase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_2_aldehyde_lyase_inhibitor),
-            CHEBI_ROLE_EC_4_1_2_27_sphinganine_1_phosphate_aldolase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_1_2_27_sphinganine_1_phosphate_aldolase_inhibitor),
-            CHEBI_ROLE_antiparathyroid_drug: toBoolean(row.CHEBI_ROLE_antiparathyroid_drug),
-            CHEBI_ROLE_glycerophosphoinositol_synthesis_inhibitor: toBoolean(row.CHEBI_ROLE_glycerophosphoinositol_synthesis_inhibitor),
-            CHEBI_ROLE_EC_6_1_1_2_tryptophan_tRNA_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_1_1_2_tryptophan_tRNA_ligase_inhibitor),
-            CHEBI_ROLE_neurokinin_1_receptor_agonist: toBoolean(row.CHEBI_ROLE_neurokinin_1_receptor_agonist),
-            CHEBI_ROLE_EC_2_1_3_3_ornithine_carbamoyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_3_3_ornithine_carbamoyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_1_3_carboxy_and_carbamoyltransferases_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_1_3_carboxy_and_carbamoyltransferases_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_159_7alpha_hydroxysteroid_dehydrogenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_159_7alpha_hydroxysteroid_dehydrogenase_inhibitor),
-            CHEBI_ROLE_EC_1_14_13_72_methylsterol_monooxygenase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_14_13_72_methylsterol_monooxygenase_inhibitor),
-            CHEBI_ROLE_acaricide_drug: toBoolean(row.CHEBI_ROLE_acaricide_drug),
-            CHEBI_ROLE_orexin_receptor_antagonist: toBoolean(row.CHEBI_ROLE_orexin_receptor_antagonist),
-            CHEBI_ROLE_protease_activated_receptor_1_antagonist: toBoolean(row.CHEBI_ROLE_protease_activated_receptor_1_antagonist),
-            CHEBI_ROLE_EC_6_1_1_12_aspartate_tRNA_ligase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_6_1_1_12_aspartate_tRNA_ligase_inhibitor),
-            CHEBI_ROLE_nonstructural_protein_5A_inhibitor: toBoolean(row.CHEBI_ROLE_nonstructural_protein_5A_inhibitor),
-            CHEBI_ROLE_Daphnia_pulex_metabolite: toBoolean(row.CHEBI_ROLE_Daphnia_pulex_metabolite),
-            CHEBI_ROLE_steatosis_inducing_agent: toBoolean(row.CHEBI_ROLE_steatosis_inducing_agent),
-            CHEBI_ROLE_hepatic_steatosis_inducing_agent: toBoolean(row.CHEBI_ROLE_hepatic_steatosis_inducing_agent),
-            CHEBI_ROLE_EC_3_4_21_64_peptidase_K_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_64_peptidase_K_inhibitor),
-            CHEBI_ROLE_EC_2_6_1_16_glutamine_fructose_6_phosphate_transaminase_isomerizing_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_6_1_16_glutamine_fructose_6_phosphate_transaminase_isomerizing_inhibitor),
-            CHEBI_ROLE_thrombopoietin_receptor_agonist: toBoolean(row.CHEBI_ROLE_thrombopoietin_receptor_agonist),
-            CHEBI_ROLE_EC_2_7_11_12_cGMP_dependent_protein_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_7_11_12_cGMP_dependent_protein_kinase_inhibitor),
-            CHEBI_ROLE_nonnucleoside_hepatitis_C_virus_polymerase_inhibitor: toBoolean(row.CHEBI_ROLE_nonnucleoside_hepatitis_C_virus_polymerase_inhibitor),
-            CHEBI_ROLE_EC_2_5_1_31__ditrans_polycis_undecaprenyl_diphosphate_synthase___2E_6E_farnesyl_diphosphate_specific___inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_5_1_31__ditrans_polycis_undecaprenyl_diphosphate_synthase___2E_6E_farnesyl_diphosphate_specific___inhibitor),
-            CHEBI_ROLE_EC_1_4_1_3__glutamate_dehydrogenase__NAD_P______inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_1_3__glutamate_dehydrogenase__NAD_P______inhibitor),
-            CHEBI_ROLE_EC_1_4_1_oxidoreductase_acting_on_donor_CH_NH2_group__NAD___or_NADP___as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_4_1_oxidoreductase_acting_on_donor_CH_NH2_group__NAD___or_NADP___as_acceptor_inhibitor),
-            CHEBI_ROLE_EC_3_4_21_92_endopeptidase_Clp_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_21_92_endopeptidase_Clp_inhibitor),
-            CHEBI_ROLE_Smad3_inhibitor: toBoolean(row.CHEBI_ROLE_Smad3_inhibitor),
-            CHEBI_ROLE_signal_transducer_and_activator_of_transcription_5_protein_inhibitor: toBoolean(row.CHEBI_ROLE_signal_transducer_and_activator_of_transcription_5_protein_inhibitor),
-            CHEBI_ROLE_EC_3_4_23_15_renin_inhibitor: toBoolean(row.CHEBI_ROLE_EC_3_4_23_15_renin_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_170__3beta_hydroxysteroid_4alpha_carboxylate_3_dehydrogenase_decarboxylating___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_170__3beta_hydroxysteroid_4alpha_carboxylate_3_dehydrogenase_decarboxylating___inhibitor),
-            CHEBI_ROLE_Sir1_inhibitor: toBoolean(row.CHEBI_ROLE_Sir1_inhibitor),
-            CHEBI_ROLE_histone_acetyltransferase_activator: toBoolean(row.CHEBI_ROLE_histone_acetyltransferase_activator),
-            CHEBI_ROLE_EC_4_6_1_1_adenylate_cyclase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_4_6_1_1_adenylate_cyclase_inhibitor),
-            CHEBI_ROLE_AKT1_kinase_inhibitor: toBoolean(row.CHEBI_ROLE_AKT1_kinase_inhibitor),
-            CHEBI_ROLE_eukaryotic_translation_elongation_factor_1alpha_1_inhibitor: toBoolean(row.CHEBI_ROLE_eukaryotic_translation_elongation_factor_1alpha_1_inhibitor),
-            CHEBI_ROLE_retinoic_acid_receptor_beta_agonist: toBoolean(row.CHEBI_ROLE_retinoic_acid_receptor_beta_agonist),
-            CHEBI_ROLE_retinoic_acid_receptor_gamma_antagonist: toBoolean(row.CHEBI_ROLE_retinoic_acid_receptor_gamma_antagonist),
-            CHEBI_ROLE_liver_X_receptor_inverse_agonist: toBoolean(row.CHEBI_ROLE_liver_X_receptor_inverse_agonist),
-            CHEBI_ROLE_prostacyclin_receptor_agonist: toBoolean(row.CHEBI_ROLE_prostacyclin_receptor_agonist),
-            CHEBI_ROLE_EC_2_4_2_4_thymidine_phosphorylase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_2_4_thymidine_phosphorylase_inhibitor),
-            CHEBI_ROLE_EC_1_8_5_4_sulfide_quinone_reductase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_8_5_4_sulfide_quinone_reductase_inhibitor),
-            CHEBI_ROLE_EC_1_8_5_oxidoreductase_acting_on_sulfur_group_donors__quinone_or_similar_as_acceptor_inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_8_5_oxidoreductase_acting_on_sulfur_group_donors__quinone_or_similar_as_acceptor_inhibitor),
-            CHEBI_ROLE_ERK_dimerisation_inhibitor: toBoolean(row.CHEBI_ROLE_ERK_dimerisation_inhibitor),
-            CHEBI_ROLE_steroid_receptor_coactivator_stimulator: toBoolean(row.CHEBI_ROLE_steroid_receptor_coactivator_stimulator),
-            CHEBI_ROLE_VEGF_activator: toBoolean(row.CHEBI_ROLE_VEGF_activator),
-            CHEBI_ROLE_lysophosphatidic_acid_receptor_antagonist: toBoolean(row.CHEBI_ROLE_lysophosphatidic_acid_receptor_antagonist),
-            CHEBI_ROLE_macrophage_migration_inhibitory_factor_inhibitor: toBoolean(row.CHEBI_ROLE_macrophage_migration_inhibitory_factor_inhibitor),
-            CHEBI_ROLE_EC_1_1_1_153__sepiapterin_reductase_L_erythro_7_8_dihydrobiopterin_forming___inhibitor: toBoolean(row.CHEBI_ROLE_EC_1_1_1_153__sepiapterin_reductase_L_erythro_7_8_dihydrobiopterin_forming___inhibitor),
-            CHEBI_ROLE_sialyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_sialyltransferase_inhibitor),
-            CHEBI_ROLE_EC_2_4_99_glycosyltransferases_transferring_other_glycosyl_groups_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_99_glycosyltransferases_transferring_other_glycosyl_groups_inhibitor),
-            CHEBI_ROLE_hypoxia_inducible_factor_pathway_activator: toBoolean(row.CHEBI_ROLE_hypoxia_inducible_factor_pathway_activator),
-            CHEBI_ROLE_CXCR2_antagonist: toBoolean(row.CHEBI_ROLE_CXCR2_antagonist),
-            CHEBI_ROLE_EC_2_4_2_12_nicotinamide_phosphoribosyltransferase_inhibitor: toBoolean(row.CHEBI_ROLE_EC_2_4_2_12_nicotinamide_phosphoribosyltransferase_inhibitor),
-            CHEBI_ROLE_food_additive_carrier: toBoolean(row.CHEBI_ROLE_food_additive_carrier),
-            CHEBI_ROLE_ovicide: toBoolean(row.CHEBI_ROLE_ovicide),
-            url: row.url,
-            locus_group: row.locus_group,
-            symbol: row.symbol,
-            location: row.location,
-            MONDO_SUPERCLASS_disease: toBoolean(row.MONDO_SUPERCLASS_disease),
-            MONDO_SUPERCLASS_endocrine_system_disorder: toBoolean(row.MONDO_SUPERCLASS_endocrine_system_disorder),
-            MONDO_SUPERCLASS_adrenal_gland_disorder: toBoolean(row.MONDO_SUPERCLASS_adrenal_gland_disorder),
-            MONDO_SUPERCLASS_human_disease: toBoolean(row.MONDO_SUPERCLASS_human_disease),
-            MONDO_SUPERCLASS_integumentary_system_disorder: toBoolean(row.MONDO_SUPERCLASS_integumentary_system_disorder),
-            MONDO_SUPERCLASS_disorder_of_pilosebaceous_unit: toBoolean(row.MONDO_SUPERCLASS_disorder_of_pilosebaceous_unit),
-            MONDO_SUPERCLASS_hereditary_disease: toBoolean(row.MONDO_SUPERCLASS_hereditary_disease),
-            MONDO_SUPERCLASS_skin_disorder: toBoolean(row.MONDO_SUPERCLASS_skin_disorder),
-            MONDO_SUPERCLASS_skin_appendage_disorder: toBoolean(row.MONDO_SUPERCLASS_skin_appendage_disorder),
-            MONDO_SUPERCLASS_hereditary_skin_disorder: toBoolean(row.MONDO_SUPERCLASS_hereditary_skin_disorder),
-            MONDO_SUPERCLASS_hemorrhagic_disease: toBoolean(row.MONDO_SUPERCLASS_hemorrhagic_disease),
-            MONDO_SUPERCLASS_blood_platelet_disease: toBoolean(row.MONDO_SUPERCLASS_blood_platelet_disease),
-            MONDO_SUPERCLASS_hematologic_disorder: toBoolean(row.MONDO_SUPERCLASS_hematologic_disorder),
-            MONDO_SUPERCLASS_psychiatric_disorder: toBoolean(row.MONDO_SUPERCLASS_psychiatric_disorder),
-            MONDO_SUPERCLASS_perceptual_disorders: toBoolean(row.MONDO_SUPERCLASS_perceptual_disorders),
-            MONDO_SUPERCLASS_disorder_of_visual_system: toBoolean(row.MONDO_SUPERCLASS_disorder_of_visual_system),
-            MONDO_SUPERCLASS_nervous_system_disorder: toBoolean(row.MONDO_SUPERCLASS_nervous_system_disorder),
-            MONDO_SUPERCLASS_inborn_error_of_immunity: toBoolean(row.MONDO_SUPERCLASS_inborn_error_of_immunity),
-            MONDO_SUPERCLASS_immune_system_disorder: toBoolean(row.MONDO_SUPERCLASS_immune_system_disorder),
-            MONDO_SUPERCLASS_immune_deficiency_disease: toBoolean(row.MONDO_SUPERCLASS_immune_deficiency_disease),
-            MONDO_SUPERCLASS_immunodeficiency_disease: toBoolean(row.MONDO_SUPERCLASS_immunodeficiency_disease),
-            MONDO_SUPERCLASS_digestive_system_disorder: toBoolean(row.MONDO_SUPERCLASS_digestive_system_disorder),
-            MONDO_SUPERCLASS_liver_disorder: toBoolean(row.MONDO_SUPERCLASS_liver_disorder),
-            MONDO_SUPERCLASS_hepatobiliary_disorder: toBoolean(row.MONDO_SUPERCLASS_hepatobiliary_disorder),
-            MONDO_SUPERCLASS_central_nervous_system_disorder: toBoolean(row.MONDO_SUPERCLASS_central_nervous_system_disorder),
-            MONDO_SUPERCLASS_epilepsy: toBoolean(row.MONDO_SUPERCLASS_epilepsy),
-            MONDO_SUPERCLASS_brain_disorder: toBoolean(row.MONDO_SUPERCLASS_brain_disorder),
-            MONDO_SUPERCLASS_hereditary_neurological_disease: toBoolean(row.MONDO_SUPERCLASS_hereditary_neurological_disease),
-            MONDO_SUPERCLASS_epilepsy_syndrome: toBoolean(row.MONDO_SUPERCLASS_epilepsy_syndrome),
-            MONDO_SUPERCLASS_bone_remodeling_disease: toBoolean(row.MONDO_SUPERCLASS_bone_remodeling_disease),
-            MONDO_SUPERCLASS_musculoskeletal_system_disorder: toBoolean(row.MONDO_SUPERCLASS_musculoskeletal_system_disorder),
-            MONDO_SUPERCLASS_skeletal_system_disorder: toBoolean(row.MONDO_SUPERCLASS_skeletal_system_disorder),
-            MONDO_SUPERCLASS_bone_disorder: toBoolean(row.MONDO_SUPERCLASS_bone_disorder),
-            MONDO_SUPERCLASS_thyroid_gland_disorder: toBoolean(row.MONDO_SUPERCLASS_thyroid_gland_disorder),
-            MONDO_SUPERCLASS_gonadal_disorder: toBoolean(row.MONDO_SUPERCLASS_gonadal_disorder),
-            MONDO_SUPERCLASS_congenital_nervous_system_disorder: toBoolean(row.MONDO_SUPERCLASS_congenital_nervous_system_disorder),
-            MONDO_SUPERCLASS_reproductive_system_disorder: toBoolean(row.MONDO_SUPERCLASS_reproductive_system_disorder),
-            MONDO_SUPERCLASS_hypogonadism: toBoolean(row.MONDO_SUPERCLASS_hypogonadism),
-            MONDO_SUPERCLASS_pituitary_gland_disorder: toBoolean(row.MONDO_SUPERCLASS_pituitary_gland_disorder),
-            MONDO_SUPERCLASS_hereditary_endocrine_growth_disease: toBoolean(row.MONDO_SUPERCLASS_hereditary_endocrine_growth_disease),
-            MONDO_SUPERCLASS_pituitary_deficiency: toBoolean(row.MONDO_SUPERCLASS_pituitary_deficiency),
-            MONDO_SUPERCLASS_disorder_of_development_or_morphogenesis: toBoolean(row.MONDO_SUPERCLASS_disorder_of_development_or_morphogenesis),
-            MONDO_SUPERCLASS_neurodevelopmental_disorder: toBoolean(row.MONDO_SUPERCLASS_neurodevelopmental_disorder),
-            MONDO_SUPERCLASS_disorder_of_orbital_region: toBoolean(row.MONDO_SUPERCLASS_disorder_of_orbital_region),
-            MONDO_SUPERCLASS_eye_disorder: toBoolean(row.MONDO_SUPERCLASS_eye_disorder),
-            MONDO_SUPERCLASS_inherited_disease_susceptibility: toBoolean(row.MONDO_SUPERCLASS_inherited_disease_susceptibility),
-            MONDO_SUPERCLASS_disease_susceptibility: toBoolean(row.MONDO_SUPERCLASS_disease_susceptibility),
-            MONDO_SUPERCLASS_inborn_mitochondrial_metabolism_disorder: toBoolean(row.MONDO_SUPERCLASS_inborn_mitochondrial_metabolism_disorder),
-            MONDO_SUPERCLASS_metabolic_disease: toBoolean(row.MONDO_SUPERCLASS_metabolic_disease),
-            MONDO_SUPERCLASS_developmental_anomaly_of_metabolic_origin: toBoolean(row.MONDO_SUPERCLASS_developmental_anomaly_of_metabolic_origin),
-            MONDO_SUPERCLASS_inborn_errors_of_metabolism: toBoolean(row.MONDO_SUPERCLASS_inborn_errors_of_metabolism),
-            MONDO_SUPERCLASS_inborn_disorder_of_energy_metabolism: toBoolean(row.MONDO_SUPERCLASS_inborn_disorder_of_energy_metabolism),
-            MONDO_SUPERCLASS_developmental_defect_during_embryogenesis: toBoolean(row.MONDO_SUPERCLASS_developmental_defect_during_embryogenesis),
-            MONDO_SUPERCLASS_mitochondrial_disease: toBoolean(row.MONDO_SUPERCLASS_mitochondrial_disease),
-            MONDO_SUPERCLASS_synostosis: toBoolean(row.MONDO_SUPERCLASS_synostosis),
-            MONDO_SUPERCLASS_syndromic_disease: toBoolean(row.MONDO_SUPERCLASS_syndromic_disease),
-            MONDO_SUPERCLASS_bone_development_disease: toBoolean(row.MONDO_SUPERCLASS_bone_development_disease),
-            MONDO_SUPERCLASS_dysostosis: toBoolean(row.MONDO_SUPERCLASS_dysostosis),
-            MONDO_SUPERCLASS_craniosynostosis: toBoolean(row.MONDO_SUPERCLASS_craniosynostosis),
-            MONDO_SUPERCLASS_skeletal_dysplasia: toBoolean(row.MONDO_SUPERCLASS_skeletal_dysplasia),
-            MONDO_SUPERCLASS_congenital_limb_malformation: toBoolean(row.MONDO_SUPERCLASS_congenital_limb_malformation),
-            MONDO_SUPERCLASS_osteochondrodysplasia: toBoolean(row.MONDO_SUPERCLASS_osteochondrodysplasia),
-            MONDO_SUPERCLASS_syndromic_intellectual_disability: toBoolean(row.MONDO_SUPERCLASS_syndromic_intellectual_disability),
-            MONDO_SUPERCLASS_muscle_tissue_disorder: toBoolean(row.MONDO_SUPERCLASS_muscle_tissue_disorder),
-            MONDO_SUPERCLASS_myopathy: toBoolean(row.MONDO_SUPERCLASS_myopathy),
-            MONDO_SUPERCLASS_palsy: toBoolean(row.MONDO_SUPERCLASS_palsy),
-            MONDO_SUPERCLASS_congenital_myopathy: toBoolean(row.MONDO_SUPERCLASS_congenital_myopathy),
-            MONDO_SUPERCLASS_skeletal_muscle_disorder: toBoolean(row.MONDO_SUPERCLASS_skeletal_muscle_disorder),
-            MONDO_SUPERCLASS_hereditary_skeletal_muscle_disorder: toBoolean(row.MONDO_SUPERCLASS_hereditary_skeletal_muscle_disorder),
-            MONDO_SUPERCLASS_congenital_structural_myopathy: toBoolean(row.MONDO_SUPERCLASS_congenital_structural_myopathy),
-            MONDO_SUPERCLASS_cranial_nerve_neuropathy: toBoolean(row.MONDO_SUPERCLASS_cranial_nerve_neuropathy),
-            MONDO_SUPERCLASS_anemia: toBoolean(row.MONDO_SUPERCLASS_anemia),
-            MONDO_SUPERCLASS_congenital_hematological_disorder: toBoolean(row.MONDO_SUPERCLASS_congenital_hematological_disorder),
-            MONDO_SUPERCLASS_disorder_of_facial_skeleton: toBoolean(row.MONDO_SUPERCLASS_disorder_of_facial_skeleton),
-            MONDO_SUPERCLASS_otorhinolaryngologic_disease: toBoolean(row.MONDO_SUPERCLASS_otorhinolaryngologic_disease),
-            MONDO_SUPERCLASS_skull_disorder: toBoolean(row.MONDO_SUPERCLASS_skull_disorder),
-            MONDO_SUPERCLASS_skin_pigmentation_disorder: toBoolean(row.MONDO_SUPERCLASS_skin_pigmentation_disorder),
-            MONDO_SUPERCLASS_cardiovascular_disorder: toBoolean(row.MONDO_SUPERCLASS_cardiovascular_disorder),
-            MONDO_SUPERCLASS_heart_disorder: toBoolean(row.MONDO_SUPERCLASS_heart_disorder),
-            MONDO_SUPERCLASS_congenital_heart_disease: toBoolean(row.MONDO_SUPERCLASS_congenital_heart_disease),
-            MONDO_SUPERCLASS_congenital_anomaly_of_cardiovascular_system: toBoolean(row.MONDO_SUPERCLASS_congenital_anomaly_of_cardiovascular_system),
-            MONDO_SUPERCLASS_peripheral_nervous_system_disorder: toBoolean(row.MONDO_SUPERCLASS_peripheral_nervous_system_disorder),
-            MONDO_SUPERCLASS_peripheral_neuropathy: toBoolean(row.MONDO_SUPERCLASS_peripheral_neuropathy),
-            MONDO_SUPERCLASS_neuromuscular_disease: toBoolean(row.MONDO_SUPERCLASS_neuromuscular_disease),
-            MONDO_SUPERCLASS_hereditary_peripheral_neuropathy: toBoolean(row.MONDO_SUPERCLASS_hereditary_peripheral_neuropathy),
-            MONDO_SUPERCLASS_hereditary_neuromuscular_disease: toBoolean(row.MONDO_SUPERCLASS_hereditary_neuromuscular_disease),
-            MONDO_SUPERCLASS_autosomal_genetic_disease: toBoolean(row.MONDO_SUPERCLASS_autosomal_genetic_disease),
-            MONDO_SUPERCLASS_autosomal_recessive_disease: toBoolean(row.MONDO_SUPERCLASS_autosomal_recessive_disease),
-            MONDO_SUPERCLASS_keratosis: toBoolean(row.MONDO_SUPERCLASS_keratosis),
-            MONDO_SUPERCLASS_epidermal_disease: toBoolean(row.MONDO_SUPERCLASS_epidermal_disease),
-            MONDO_SUPERCLASS_keratinization_disease: toBoolean(row.MONDO_SUPERCLASS_keratinization_disease),
-            MONDO_SUPERCLASS_hereditary_neoplastic_syndrome: toBoolean(row.MONDO_SUPERCLASS_hereditary_neoplastic_syndrome),
-            MONDO_SUPERCLASS_chromosomal_disorder: toBoolean(row.MONDO_SUPERCLASS_chromosomal_disorder),
-            MONDO_SUPERCLASS_neoplastic_syndrome: toBoolean(row.MONDO_SUPERCLASS_neoplastic_syndrome),
-            MONDO_SUPERCLASS_neoplastic_disease_or_syndrome: toBoolean(row.MONDO_SUPERCLASS_neoplastic_disease_or_syndrome),
-            MONDO_SUPERCLASS_cancer_or_benign_tumor: toBoolean(row.MONDO_SUPERCLASS_cancer_or_benign_tumor),
-            MONDO_SUPERCLASS_lower_respiratory_tract_disorder: toBoolean(row.MONDO_SUPERCLASS_lower_respiratory_tract_disorder),
-            MONDO_SUPERCLASS_respiratory_system_disorder: toBoolean(row.MONDO_SUPERCLASS_respiratory_system_disorder),
-            MONDO_SUPERCLASS_lung_disorder: toBoolean(row.MONDO_SUPERCLASS_lung_disorder),
-            MONDO_SUPERCLASS_disorder_of_metabolite_absorption_and_transport: toBoolean(row.MONDO_SUPERCLASS_disorder_of_metabolite_absorption_and_transport),
-            MONDO_SUPERCLASS_congenital_heart_malformation: toBoolean(row.MONDO_SUPERCLASS_congenital_heart_malformation),
-            MONDO_SUPERCLASS_inherited_lipid_metabolism_disorder: toBoolean(row.MONDO_SUPERCLASS_inherited_lipid_metabolism_disorder),
-            MONDO_SUPERCLASS_lysosomal_storage_disease: toBoolean(row.MONDO_SUPERCLASS_lysosomal_storage_disease),
-            MONDO_SUPERCLASS_bone_marrow_disorder: toBoolean(row.MONDO_SUPERCLASS_bone_marrow_disorder),
-            MONDO_SUPERCLASS_neonatal_infantile_epilepsy_syndrome: toBoolean(row.MONDO_SUPERCLASS_neonatal_infantile_epilepsy_syndrome),
-            MONDO_SUPERCLASS_acute_disease: toBoolean(row.MONDO_SUPERCLASS_acute_disease),
-            MONDO_SUPERCLASS_post_infectious_disorder: toBoolean(row.MONDO_SUPERCLASS_post_infectious_disorder),
-            MONDO_SUPERCLASS_neurodegenerative_disease: toBoolean(row.MONDO_SUPERCLASS_neurodegenerative_disease),
-            MONDO_SUPERCLASS_inherited_neurodegenerative_disorder: toBoolean(row.MONDO_SUPERCLASS_inherited_neurodegenerative_disorder),
-            MONDO_SUPERCLASS_muscular_dystrophy: toBoolean(row.MONDO_SUPERCLASS_muscular_dystrophy),
-            MONDO_SUPERCLASS_inborn_disorder_of_amino_acid_metabolism: toBoolean(row.MONDO_SUPERCLASS_inborn_disorder_of_amino_acid_metabolism),
-            MONDO_SUPERCLASS_multiple_congenital_anomalies_dysmorphic_syndrome_intellectual_disability: toBoolean(row.MONDO_SUPERCLASS_multiple_congenital_anomalies_dysmorphic_syndrome_intellectual_disability),
-            MONDO_SUPERCLASS_inborn_disorder_of_amino_acid_and_other_organic_acid_metabolism: toBoolean(row.MONDO_SUPERCLASS_inborn_disorder_of_amino_acid_and_other_organic_acid_metabolism),
-            MONDO_SUPERCLASS_disorder_of_organic_acid_metabolism: toBoolean(row.MONDO_SUPERCLASS_disorder_of_organic_acid_metabolism),
-            MONDO_SUPERCLASS_amino_acid_metabolism_disease: toBoolean(row.MONDO_SUPERCLASS_amino_acid_metabolism_disease),
-            MONDO_SUPERCLASS_multiple_congenital_anomalies_dysmorphic_syndrome: toBoolean(row.MONDO_SUPERCLASS_multiple_congenital_anomalies_dysmorphic_syndrome),
-            MONDO_SUPERCLASS_inflammatory_disease: toBoolean(row.MONDO_SUPERCLASS_inflammatory_disease),
-            MONDO_SUPERCLASS_Mendelian_neurodevelopmental_disorder: toBoolean(row.MONDO_SUPERCLASS_Mendelian_neurodevelopmental_disorder),
-            MONDO_SUPERCLASS_uveal_disorder: toBoolean(row.MONDO_SUPERCLASS_uveal_disorder),
-            MONDO_SUPERCLASS_inborn_carbohydrate_metabolic_disorder: toBoolean(row.MONDO_SUPERCLASS_inborn_carbohydrate_metabolic_disorder),
-            MONDO_SUPERCLASS_carbohydrate_metabolism_disease: toBoolean(row.MONDO_SUPERCLASS_carbohydrate_metabolism_disease),
-            MONDO_SUPERCLASS_hereditary_motor_neuron_disease: toBoolean(row.MONDO_SUPERCLASS_hereditary_motor_neuron_disease),
-            MONDO_SUPERCLASS_motor_neuron_disorder: toBoolean(row.MONDO_SUPERCLASS_motor_neuron_disorder),
-            MONDO_SUPERCLASS_movement_disorder: toBoolean(row.MONDO_SUPERCLASS_movement_disorder),
-            MONDO_SUPERCLASS_mineral_metabolism_disease: toBoolean(row.MONDO_SUPERCLASS_mineral_metabolism_disease),
-            MONDO_SUPERCLASS_autoimmune_disease: toBoolean(row.MONDO_SUPERCLASS_autoimmune_disease),
-            MONDO_SUPERCLASS_primary_bacterial_infectious_disease: toBoolean(row.MONDO_SUPERCLASS_primary_bacterial_infectious_disease),
-            MONDO_SUPERCLASS_male_reproductive_system_disorder: toBoolean(row.MONDO_SUPERCLASS_male_reproductive_system_disorder),
-            MONDO_SUPERCLASS_bacterial_infectious_disease: toBoolean(row.MONDO_SUPERCLASS_bacterial_infectious_disease),
-            MONDO_SUPERCLASS_infectious_disease: toBoolean(row.MONDO_SUPERCLASS_infectious_disease),
-            MONDO_SUPERCLASS_leukocyte_disorder: toBoolean(row.MONDO_SUPERCLASS_leukocyte_disorder),
-            MONDO_SUPERCLASS_vector_borne_disease: toBoolean(row.MONDO_SUPERCLASS_vector_borne_disease),
-            MONDO_SUPERCLASS_gram_negative_bacterial_infections: toBoolean(row.MONDO_SUPERCLASS_gram_negative_bacterial_infections),
-            MONDO_SUPERCLASS_digestive_system_infectious_disorder: toBoolean(row.MONDO_SUPERCLASS_digestive_system_infectious_disorder),
-            MONDO_SUPERCLASS_fungal_infectious_disease: toBoolean(row.MONDO_SUPERCLASS_fungal_infectious_disease),
-            MONDO_SUPERCLASS_cardiomyopathy: toBoolean(row.MONDO_SUPERCLASS_cardiomyopathy),
-            MONDO_SUPERCLASS_viral_infectious_disease: toBoolean(row.MONDO_SUPERCLASS_viral_infectious_disease),
-            MONDO_SUPERCLASS_nutritional_disorder: toBoolean(row.MONDO_SUPERCLASS_nutritional_disorder),
-            MONDO_SUPERCLASS_primary_viral_infectious_disease: toBoolean(row.MONDO_SUPERCLASS_primary_viral_infectious_disease),
-            MONDO_SUPERCLASS_dermatitis: toBoolean(row.MONDO_SUPERCLASS_dermatitis),
-            MONDO_SUPERCLASS_skin_disorder_caused_by_infection: toBoolean(row.MONDO_SUPERCLASS_skin_disorder_caused_by_infection),
-            MONDO_SUPERCLASS_diarrheal_disease: toBoolean(row.MONDO_SUPERCLASS_diarrheal_disease),
-            MONDO_SUPERCLASS_inflammatory_diarrhea: toBoolean(row.MONDO_SUPERCLASS_inflammatory_diarrhea),
-            MONDO_SUPERCLASS_gastrointestinal_mucositis: toBoolean(row.MONDO_SUPERCLASS_gastrointestinal_mucositis),
-            MONDO_SUPERCLASS_gastroenteritis: toBoolean(row.MONDO_SUPERCLASS_gastroenteritis),
-            MONDO_SUPERCLASS_intestinal_disorder: toBoolean(row.MONDO_SUPERCLASS_intestinal_disorder),
-            MONDO_SUPERCLASS_mucositis: toBoolean(row.MONDO_SUPERCLASS_mucositis),
-            MONDO_SUPERCLASS_acute_diarrhea: toBoolean(row.MONDO_SUPERCLASS_acute_diarrhea),
-            MONDO_SUPERCLASS_upper_respiratory_tract_disorder: toBoolean(row.MONDO_SUPERCLASS_upper_respiratory_tract_disorder),
-            MONDO_SUPERCLASS_lymphoid_system_disorder: toBoolean(row.MONDO_SUPERCLASS_lymphoid_system_disorder),
-            MONDO_SUPERCLASS_auditory_system_disorder: toBoolean(row.MONDO_SUPERCLASS_auditory_system_disorder),
-            MONDO_SUPERCLASS_disorder_of_ear: toBoolean(row.MONDO_SUPERCLASS_disorder_of_ear),
-            MONDO_SUPERCLASS_female_reproductive_system_disorder: toBoolean(row.MONDO_SUPERCLASS_female_reproductive_system_disorder),
-            MONDO_SUPERCLASS_infectious_disorder_of_the_nervous_system: toBoolean(row.MONDO_SUPERCLASS_infectious_disorder_of_the_nervous_system),
-            MONDO_SUPERCLASS_central_nervous_system_infectious_disorder: toBoolean(row.MONDO_SUPERCLASS_central_nervous_system_infectious_disorder),
-            MONDO_SUPERCLASS_encephalomyelitis: toBoolean(row.MONDO_SUPERCLASS_encephalomyelitis),
-            MONDO_SUPERCLASS_kidney_disorder: toBoolean(row.MONDO_SUPERCLASS_kidney_disorder),
-            MONDO_SUPERCLASS_urinary_system_disorder: toBoolean(row.MONDO_SUPERCLASS_urinary_system_disorder),
-            MONDO_SUPERCLASS_parasitic_infectious_disease: toBoolean(row.MONDO_SUPERCLASS_parasitic_infectious_disease),
-            MONDO_SUPERCLASS_lymphatic_system_disorder: toBoolean(row.MONDO_SUPERCLASS_lymphatic_system_disorder),
-            MONDO_SUPERCLASS_spinal_cord_disorder: toBoolean(row.MONDO_SUPERCLASS_spinal_cord_disorder),
-            MONDO_SUPERCLASS_anterior_horn_disorder: toBoolean(row.MONDO_SUPERCLASS_anterior_horn_disorder),
-            MONDO_SUPERCLASS_digestive_system_cancer: toBoolean(row.MONDO_SUPERCLASS_digestive_system_cancer),
-            MONDO_SUPERCLASS_cancer: toBoolean(row.MONDO_SUPERCLASS_cancer),
-            MONDO_SUPERCLASS_carcinoma: toBoolean(row.MONDO_SUPERCLASS_carcinoma),
-            MONDO_SUPERCLASS_neoplasm: toBoolean(row.MONDO_SUPERCLASS_neoplasm),
-            MONDO_SUPERCLASS_head_and_neck_cancer: toBoolean(row.MONDO_SUPERCLASS_head_and_neck_cancer),
-            MONDO_SUPERCLASS_mouth_disorder: toBoolean(row.MONDO_SUPERCLASS_mouth_disorder),
-            MONDO_SUPERCLASS_digestive_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_digestive_system_neoplasm),
-            MONDO_SUPERCLASS_head_and_neck_carcinoma: toBoolean(row.MONDO_SUPERCLASS_head_and_neck_carcinoma),
-            MONDO_SUPERCLASS_head_and_neck_neoplasm: toBoolean(row.MONDO_SUPERCLASS_head_and_neck_neoplasm),
-            MONDO_SUPERCLASS_epithelial_neoplasm: toBoolean(row.MONDO_SUPERCLASS_epithelial_neoplasm),
-            MONDO_SUPERCLASS_digestive_system_carcinoma: toBoolean(row.MONDO_SUPERCLASS_digestive_system_carcinoma),
-            MONDO_SUPERCLASS_high_grade_malignant_neoplasm: toBoolean(row.MONDO_SUPERCLASS_high_grade_malignant_neoplasm),
-            MONDO_SUPERCLASS_hepatobiliary_neoplasm: toBoolean(row.MONDO_SUPERCLASS_hepatobiliary_neoplasm),
-            MONDO_SUPERCLASS_endocrine_gland_neoplasm: toBoolean(row.MONDO_SUPERCLASS_endocrine_gland_neoplasm),
-            MONDO_SUPERCLASS_liver_and_intrahepatic_bile_duct_neoplasm: toBoolean(row.MONDO_SUPERCLASS_liver_and_intrahepatic_bile_duct_neoplasm),
-            MONDO_SUPERCLASS_bile_duct_disorder: toBoolean(row.MONDO_SUPERCLASS_bile_duct_disorder),
-            MONDO_SUPERCLASS_biliary_tract_disorder: toBoolean(row.MONDO_SUPERCLASS_biliary_tract_disorder),
-            MONDO_SUPERCLASS_malignant_endocrine_neoplasm: toBoolean(row.MONDO_SUPERCLASS_malignant_endocrine_neoplasm),
-            MONDO_SUPERCLASS_respiratory_system_cancer: toBoolean(row.MONDO_SUPERCLASS_respiratory_system_cancer),
-            MONDO_SUPERCLASS_thoracic_cancer: toBoolean(row.MONDO_SUPERCLASS_thoracic_cancer),
-            MONDO_SUPERCLASS_neoplasm_of_thorax: toBoolean(row.MONDO_SUPERCLASS_neoplasm_of_thorax),
-            MONDO_SUPERCLASS_respiratory_tract_neoplasm: toBoolean(row.MONDO_SUPERCLASS_respiratory_tract_neoplasm),
-            MONDO_SUPERCLASS_reproductive_system_cancer: toBoolean(row.MONDO_SUPERCLASS_reproductive_system_cancer),
-            MONDO_SUPERCLASS_reproductive_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_reproductive_system_neoplasm),
-            MONDO_SUPERCLASS_male_reproductive_organ_cancer: toBoolean(row.MONDO_SUPERCLASS_male_reproductive_organ_cancer),
-            MONDO_SUPERCLASS_male_reproductive_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_male_reproductive_system_neoplasm),
-            MONDO_SUPERCLASS_musculoskeletal_system_cancer: toBoolean(row.MONDO_SUPERCLASS_musculoskeletal_system_cancer),
-            MONDO_SUPERCLASS_sensory_system_cancer: toBoolean(row.MONDO_SUPERCLASS_sensory_system_cancer),
-            MONDO_SUPERCLASS_bone_cancer: toBoolean(row.MONDO_SUPERCLASS_bone_cancer),
-            MONDO_SUPERCLASS_connective_tissue_disorder: toBoolean(row.MONDO_SUPERCLASS_connective_tissue_disorder),
-            MONDO_SUPERCLASS_nervous_system_cancer: toBoolean(row.MONDO_SUPERCLASS_nervous_system_cancer),
-            MONDO_SUPERCLASS_bone_neoplasm: toBoolean(row.MONDO_SUPERCLASS_bone_neoplasm),
-            MONDO_SUPERCLASS_nervous_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_nervous_system_neoplasm),
-            MONDO_SUPERCLASS_connective_tissue_neoplasm: toBoolean(row.MONDO_SUPERCLASS_connective_tissue_neoplasm),
-            MONDO_SUPERCLASS_skull_neoplasm: toBoolean(row.MONDO_SUPERCLASS_skull_neoplasm),
-            MONDO_SUPERCLASS_malignant_urinary_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_malignant_urinary_system_neoplasm),
-            MONDO_SUPERCLASS_urinary_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_urinary_system_neoplasm),
-            MONDO_SUPERCLASS_kidney_neoplasm: toBoolean(row.MONDO_SUPERCLASS_kidney_neoplasm),
-            MONDO_SUPERCLASS_benign_neoplasm: toBoolean(row.MONDO_SUPERCLASS_benign_neoplasm),
-            MONDO_SUPERCLASS_benign_reproductive_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_benign_reproductive_system_neoplasm),
-            MONDO_SUPERCLASS_urinary_bladder_disorder: toBoolean(row.MONDO_SUPERCLASS_urinary_bladder_disorder),
-            MONDO_SUPERCLASS_neuroendocrine_neoplasm: toBoolean(row.MONDO_SUPERCLASS_neuroendocrine_neoplasm),
-            MONDO_SUPERCLASS_retinal_degeneration: toBoolean(row.MONDO_SUPERCLASS_retinal_degeneration),
-            MONDO_SUPERCLASS_retinal_disorder: toBoolean(row.MONDO_SUPERCLASS_retinal_disorder),
-            MONDO_SUPERCLASS_inherited_retinal_dystrophy: toBoolean(row.MONDO_SUPERCLASS_inherited_retinal_dystrophy),
-            MONDO_SUPERCLASS_mental_disorder: toBoolean(row.MONDO_SUPERCLASS_mental_disorder),
-            MONDO_SUPERCLASS_developmental_disorder_of_mental_health: toBoolean(row.MONDO_SUPERCLASS_developmental_disorder_of_mental_health),
-            MONDO_SUPERCLASS_intestinal_cancer: toBoolean(row.MONDO_SUPERCLASS_intestinal_cancer),
-            MONDO_SUPERCLASS_large_intestine_disorder: toBoolean(row.MONDO_SUPERCLASS_large_intestine_disorder),
-            MONDO_SUPERCLASS_intestinal_neoplasm: toBoolean(row.MONDO_SUPERCLASS_intestinal_neoplasm),
-            MONDO_SUPERCLASS_mesenchymal_cell_neoplasm: toBoolean(row.MONDO_SUPERCLASS_mesenchymal_cell_neoplasm),
-            MONDO_SUPERCLASS_uterine_disorder: toBoolean(row.MONDO_SUPERCLASS_uterine_disorder),
-            MONDO_SUPERCLASS_X_linked_disease: toBoolean(row.MONDO_SUPERCLASS_X_linked_disease),
-            MONDO_SUPERCLASS_autosomal_dominant_disease: toBoolean(row.MONDO_SUPERCLASS_autosomal_dominant_disease),
-            MONDO_SUPERCLASS_lymphoma: toBoolean(row.MONDO_SUPERCLASS_lymphoma),
-            MONDO_SUPERCLASS_non_Hodgkin_lymphoma: toBoolean(row.MONDO_SUPERCLASS_non_Hodgkin_lymphoma),
-            MONDO_SUPERCLASS_hematopoietic_and_lymphoid_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_hematopoietic_and_lymphoid_system_neoplasm),
-            MONDO_SUPERCLASS_lymphoid_neoplasm: toBoolean(row.MONDO_SUPERCLASS_lymphoid_neoplasm),
-            MONDO_SUPERCLASS_lymphoid_hemopathy: toBoolean(row.MONDO_SUPERCLASS_lymphoid_hemopathy),
-            MONDO_SUPERCLASS_hematopoietic_and_lymphoid_cell_neoplasm: toBoolean(row.MONDO_SUPERCLASS_hematopoietic_and_lymphoid_cell_neoplasm),
-            MONDO_SUPERCLASS_B_cell_neoplasm: toBoolean(row.MONDO_SUPERCLASS_B_cell_neoplasm),
-            MONDO_SUPERCLASS_cerebellar_ataxia: toBoolean(row.MONDO_SUPERCLASS_cerebellar_ataxia),
-            MONDO_SUPERCLASS_cerebellar_disorder: toBoolean(row.MONDO_SUPERCLASS_cerebellar_disorder),
-            MONDO_SUPERCLASS_atactic_disorder: toBoolean(row.MONDO_SUPERCLASS_atactic_disorder),
-            MONDO_SUPERCLASS_peripheral_nervous_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_peripheral_nervous_system_neoplasm),
-            MONDO_SUPERCLASS_central_nervous_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_central_nervous_system_neoplasm),
-            MONDO_SUPERCLASS_neurocristopathy: toBoolean(row.MONDO_SUPERCLASS_neurocristopathy),
-            MONDO_SUPERCLASS_cardiogenetic_disease: toBoolean(row.MONDO_SUPERCLASS_cardiogenetic_disease),
-            MONDO_SUPERCLASS_central_nervous_system_cancer: toBoolean(row.MONDO_SUPERCLASS_central_nervous_system_cancer),
-            MONDO_SUPERCLASS_glioma: toBoolean(row.MONDO_SUPERCLASS_glioma),
-            MONDO_SUPERCLASS_neuroepithelial_neoplasm: toBoolean(row.MONDO_SUPERCLASS_neuroepithelial_neoplasm),
-            MONDO_SUPERCLASS_malignant_glioma: toBoolean(row.MONDO_SUPERCLASS_malignant_glioma),
-            MONDO_SUPERCLASS_eye_adnexa_disorder: toBoolean(row.MONDO_SUPERCLASS_eye_adnexa_disorder),
-            MONDO_SUPERCLASS_arterial_disorder: toBoolean(row.MONDO_SUPERCLASS_arterial_disorder),
-            MONDO_SUPERCLASS_vascular_disorder: toBoolean(row.MONDO_SUPERCLASS_vascular_disorder),
-            MONDO_SUPERCLASS_dystonic_disorder: toBoolean(row.MONDO_SUPERCLASS_dystonic_disorder),
-            MONDO_SUPERCLASS_extrapyramidal_and_movement_disease: toBoolean(row.MONDO_SUPERCLASS_extrapyramidal_and_movement_disease),
-            MONDO_SUPERCLASS_adenoma: toBoolean(row.MONDO_SUPERCLASS_adenoma),
-            MONDO_SUPERCLASS_small_intestine_disorder: toBoolean(row.MONDO_SUPERCLASS_small_intestine_disorder),
-            MONDO_SUPERCLASS_neurovascular_disorder: toBoolean(row.MONDO_SUPERCLASS_neurovascular_disorder),
-            MONDO_SUPERCLASS_squamous_cell_carcinoma: toBoolean(row.MONDO_SUPERCLASS_squamous_cell_carcinoma),
-            MONDO_SUPERCLASS_squamous_cell_neoplasm: toBoolean(row.MONDO_SUPERCLASS_squamous_cell_neoplasm),
-            MONDO_SUPERCLASS_glandular_cell_neoplasm: toBoolean(row.MONDO_SUPERCLASS_glandular_cell_neoplasm),
-            MONDO_SUPERCLASS_adenocarcinoma: toBoolean(row.MONDO_SUPERCLASS_adenocarcinoma),
-            MONDO_SUPERCLASS_cognitive_disorder: toBoolean(row.MONDO_SUPERCLASS_cognitive_disorder),
-            MONDO_SUPERCLASS_dementia: toBoolean(row.MONDO_SUPERCLASS_dementia),
-            MONDO_SUPERCLASS_hereditary_dementia: toBoolean(row.MONDO_SUPERCLASS_hereditary_dementia),
-            MONDO_SUPERCLASS_intellectual_disability: toBoolean(row.MONDO_SUPERCLASS_intellectual_disability),
-            MONDO_SUPERCLASS_non_syndromic_intellectual_disability: toBoolean(row.MONDO_SUPERCLASS_non_syndromic_intellectual_disability),
-            MONDO_SUPERCLASS_musculoskeletal_system_benign_neoplasm: toBoolean(row.MONDO_SUPERCLASS_musculoskeletal_system_benign_neoplasm),
-            MONDO_SUPERCLASS_benign_connective_and_soft_tissue_neoplasm: toBoolean(row.MONDO_SUPERCLASS_benign_connective_and_soft_tissue_neoplasm),
-            MONDO_SUPERCLASS_tooth_disorder: toBoolean(row.MONDO_SUPERCLASS_tooth_disorder),
-            MONDO_SUPERCLASS_connective_and_soft_tissue_neoplasm: toBoolean(row.MONDO_SUPERCLASS_connective_and_soft_tissue_neoplasm),
-            MONDO_SUPERCLASS_benign_epithelial_neoplasm: toBoolean(row.MONDO_SUPERCLASS_benign_epithelial_neoplasm),
-            MONDO_SUPERCLASS_sarcoma: toBoolean(row.MONDO_SUPERCLASS_sarcoma),
-            MONDO_SUPERCLASS_hereditary_disorder_of_connective_tissue: toBoolean(row.MONDO_SUPERCLASS_hereditary_disorder_of_connective_tissue),
-            MONDO_SUPERCLASS_embryonal_neoplasm: toBoolean(row.MONDO_SUPERCLASS_embryonal_neoplasm),
-            MONDO_SUPERCLASS_brain_neoplasm: toBoolean(row.MONDO_SUPERCLASS_brain_neoplasm),
-            MONDO_SUPERCLASS_germ_cell_tumor: toBoolean(row.MONDO_SUPERCLASS_germ_cell_tumor),
-            MONDO_SUPERCLASS_malignant_germ_cell_tumor: toBoolean(row.MONDO_SUPERCLASS_malignant_germ_cell_tumor),
-            MONDO_SUPERCLASS_extragonadal_germ_cell_tumor: toBoolean(row.MONDO_SUPERCLASS_extragonadal_germ_cell_tumor),
-            MONDO_SUPERCLASS_colonic_disorder: toBoolean(row.MONDO_SUPERCLASS_colonic_disorder),
-            MONDO_SUPERCLASS_colorectal_neoplasm: toBoolean(row.MONDO_SUPERCLASS_colorectal_neoplasm),
-            MONDO_SUPERCLASS_soft_tissue_sarcoma: toBoolean(row.MONDO_SUPERCLASS_soft_tissue_sarcoma),
-            MONDO_SUPERCLASS_soft_tissue_neoplasm: toBoolean(row.MONDO_SUPERCLASS_soft_tissue_neoplasm),
-            MONDO_SUPERCLASS_malignant_soft_tissue_neoplasm: toBoolean(row.MONDO_SUPERCLASS_malignant_soft_tissue_neoplasm),
-            MONDO_SUPERCLASS_ovarian_neoplasm: toBoolean(row.MONDO_SUPERCLASS_ovarian_neoplasm),
-            MONDO_SUPERCLASS_female_reproductive_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_female_reproductive_system_neoplasm),
-            MONDO_SUPERCLASS_ovarian_disorder: toBoolean(row.MONDO_SUPERCLASS_ovarian_disorder),
-            MONDO_SUPERCLASS_melanocytic_neoplasm: toBoolean(row.MONDO_SUPERCLASS_melanocytic_neoplasm),
-            MONDO_SUPERCLASS_female_reproductive_organ_cancer: toBoolean(row.MONDO_SUPERCLASS_female_reproductive_organ_cancer),
-            MONDO_SUPERCLASS_integumentary_system_cancer: toBoolean(row.MONDO_SUPERCLASS_integumentary_system_cancer),
-            MONDO_SUPERCLASS_breast_disorder: toBoolean(row.MONDO_SUPERCLASS_breast_disorder),
-            MONDO_SUPERCLASS_breast_cancer: toBoolean(row.MONDO_SUPERCLASS_breast_cancer),
-            MONDO_SUPERCLASS_breast_neoplasm: toBoolean(row.MONDO_SUPERCLASS_breast_neoplasm),
-            MONDO_SUPERCLASS_uterine_cancer: toBoolean(row.MONDO_SUPERCLASS_uterine_cancer),
-            MONDO_SUPERCLASS_tumor_of_uterus: toBoolean(row.MONDO_SUPERCLASS_tumor_of_uterus),
-            MONDO_SUPERCLASS_hereditary_ataxia: toBoolean(row.MONDO_SUPERCLASS_hereditary_ataxia),
-            MONDO_SUPERCLASS_hereditary_cerebellar_ataxia: toBoolean(row.MONDO_SUPERCLASS_hereditary_cerebellar_ataxia),
-            MONDO_SUPERCLASS_intrinsic_cardiomyopathy: toBoolean(row.MONDO_SUPERCLASS_intrinsic_cardiomyopathy),
-            MONDO_SUPERCLASS_complex_neurodevelopmental_disorder: toBoolean(row.MONDO_SUPERCLASS_complex_neurodevelopmental_disorder),
-            MONDO_SUPERCLASS_skin_cancer: toBoolean(row.MONDO_SUPERCLASS_skin_cancer),
-            MONDO_SUPERCLASS_skin_neoplasm: toBoolean(row.MONDO_SUPERCLASS_skin_neoplasm),
-            MONDO_SUPERCLASS_inherited_kidney_disorder: toBoolean(row.MONDO_SUPERCLASS_inherited_kidney_disorder),
-            MONDO_SUPERCLASS_blood_coagulation_disease: toBoolean(row.MONDO_SUPERCLASS_blood_coagulation_disease),
-            MONDO_SUPERCLASS_immune_system_cancer: toBoolean(row.MONDO_SUPERCLASS_immune_system_cancer),
-            MONDO_SUPERCLASS_benign_female_reproductive_system_neoplasm: toBoolean(row.MONDO_SUPERCLASS_benign_female_reproductive_system_neoplasm),
-            MONDO_SUPERCLASS_nervous_system_benign_neoplasm: toBoolean(row.MONDO_SUPERCLASS_nervous_system_benign_neoplasm),
-            MONDO_SUPERCLASS_cardiovascular_organ_benign_neoplasm: toBoolean(row.MONDO_SUPERCLASS_cardiovascular_organ_benign_neoplasm),
-            MONDO_SUPERCLASS_cardiovascular_neoplasm: toBoolean(row.MONDO_SUPERCLASS_cardiovascular_neoplasm),
-            MONDO_SUPERCLASS_integumentary_system_benign_neoplasm: toBoolean(row.MONDO_SUPERCLASS_integumentary_system_benign_neoplasm),
-            MONDO_SUPERCLASS_hearing_disorder: toBoolean(row.MONDO_SUPERCLASS_hearing_disorder),
-            MONDO_SUPERCLASS_stomach_disorder: toBoolean(row.MONDO_SUPERCLASS_stomach_disorder),
-            MONDO_SUPERCLASS_idiopathic_disease: toBoolean(row.MONDO_SUPERCLASS_idiopathic_disease),
-            MONDO_SUPERCLASS_progressive_muscular_dystrophy: toBoolean(row.MONDO_SUPERCLASS_progressive_muscular_dystrophy),
-            MONDO_SUPERCLASS_familial_cardiomyopathy: toBoolean(row.MONDO_SUPERCLASS_familial_cardiomyopathy),
-            MONDO_SUPERCLASS_mitochondrial_oxidative_phosphorylation_disorder: toBoolean(row.MONDO_SUPERCLASS_mitochondrial_oxidative_phosphorylation_disorder),
-            MONDO_SUPERCLASS_corneal_disorder: toBoolean(row.MONDO_SUPERCLASS_corneal_disorder),
-            MONDO_SUPERCLASS_post_viral_disorder: toBoolean(row.MONDO_SUPERCLASS_post_viral_disorder),
-            MONDO_SUPERCLASS_benign_neoplasm_of_skin: toBoolean(row.MONDO_SUPERCLASS_benign_neoplasm_of_skin),
-            MONDO_SUPERCLASS_blood_vessel_neoplasm: toBoolean(row.MONDO_SUPERCLASS_blood_vessel_neoplasm),
-            MONDO_SUPERCLASS_benign_blood_vessel_neoplasm: toBoolean(row.MONDO_SUPERCLASS_benign_blood_vessel_neoplasm),
-            MONDO_SUPERCLASS_vascular_neoplasm: toBoolean(row.MONDO_SUPERCLASS_vascular_neoplasm),
-            MONDO_SUPERCLASS_syndrome_caused_by_partial_chromosomal_deletion: toBoolean(row.MONDO_SUPERCLASS_syndrome_caused_by_partial_chromosomal_deletion),
-            MONDO_SUPERCLASS_syndrome_caused_by_partial_chromosomal_duplication: toBoolean(row.MONDO_SUPERCLASS_syndrome_caused_by_partial_chromosomal_duplication),
-            MONDO_SUPERCLASS_leukemia: toBoolean(row.MONDO_SUPERCLASS_leukemia),
-            MONDO_SUPERCLASS_acute_leukemia: toBoolean(row.MONDO_SUPERCLASS_acute_leukemia),
-            MONDO_SUPERCLASS_B_cell_non_Hodgkin_lymphoma: toBoolean(row.MONDO_SUPERCLASS_B_cell_non_Hodgkin_lymphoma),
-            MONDO_SUPERCLASS_childhood_neoplasm: toBoolean(row.MONDO_SUPERCLASS_childhood_neoplasm),
-            MONDO_SUPERCLASS_myeloid_leukemia: toBoolean(row.MONDO_SUPERCLASS_myeloid_leukemia),
-            MONDO_SUPERCLASS_myeloid_neoplasm: toBoolean(row.MONDO_SUPERCLASS_myeloid_neoplasm),
-            MONDO_SUPERCLASS_bone_marrow_neoplasm: toBoolean(row.MONDO_SUPERCLASS_bone_marrow_neoplasm),
-            MONDO_SUPERCLASS_acute_myeloid_leukemia: toBoolean(row.MONDO_SUPERCLASS_acute_myeloid_leukemia),
-            MONDO_SUPERCLASS_myeloproliferative_neoplasm: toBoolean(row.MONDO_SUPERCLASS_myeloproliferative_neoplasm),
-            MONDO_SUPERCLASS_myeloid_hemopathy: toBoolean(row.MONDO_SUPERCLASS_myeloid_hemopathy),
-            MONDO_SUPERCLASS_bone_marrow_cancer: toBoolean(row.MONDO_SUPERCLASS_bone_marrow_cancer),
-            MONDO_SUPERCLASS_colorectal_cancer: toBoolean(row.MONDO_SUPERCLASS_colorectal_cancer),
-            MONDO_SUPERCLASS_renal_tubule_disorder: toBoolean(row.MONDO_SUPERCLASS_renal_tubule_disorder),
-            MONDO_SUPERCLASS_inherited_renal_tubular_disease: toBoolean(row.MONDO_SUPERCLASS_inherited_renal_tubular_disease),
-            MONDO_SUPERCLASS_retinitis_pigmentosa: toBoolean(row.MONDO_SUPERCLASS_retinitis_pigmentosa),
-            MONDO_SUPERCLASS_inborn_disorder_of_amino_acid_transport: toBoolean(row.MONDO_SUPERCLASS_inborn_disorder_of_amino_acid_transport),
-            MONDO_SUPERCLASS_hearing_loss__autosomal_recessive: toBoolean(row.MONDO_SUPERCLASS_hearing_loss__autosomal_recessive),
-            MONDO_SUPERCLASS_hearing_loss_disorder: toBoolean(row.MONDO_SUPERCLASS_hearing_loss_disorder),
-            MONDO_SUPERCLASS_inherited_auditory_system_disease: toBoolean(row.MONDO_SUPERCLASS_inherited_auditory_system_disease),
-            MONDO_SUPERCLASS_nonsyndromic_genetic_hearing_loss: toBoolean(row.MONDO_SUPERCLASS_nonsyndromic_genetic_hearing_loss),
-            MONDO_SUPERCLASS_intestinal_infectious_disease: toBoolean(row.MONDO_SUPERCLASS_intestinal_infectious_disease),
-            MONDO_SUPERCLASS_eyelid_disorder: toBoolean(row.MONDO_SUPERCLASS_eyelid_disorder),
-            MONDO_SUPERCLASS_eye_neoplasm: toBoolean(row.MONDO_SUPERCLASS_eye_neoplasm),
-            MONDO_SUPERCLASS_myomatous_neoplasm: toBoolean(row.MONDO_SUPERCLASS_myomatous_neoplasm),
-            MONDO_SUPERCLASS_papillary_epithelial_neoplasm: toBoolean(row.MONDO_SUPERCLASS_papillary_epithelial_neoplasm),
-            MONDO_SUPERCLASS_glucose_metabolism_disease: toBoolean(row.MONDO_SUPERCLASS_glucose_metabolism_disease),
-            MONDO_SUPERCLASS_pancreas_disorder: toBoolean(row.MONDO_SUPERCLASS_pancreas_disorder),
-            MONDO_SUPERCLASS_lens_disorder: toBoolean(row.MONDO_SUPERCLASS_lens_disorder),
-            MONDO_SUPERCLASS_epithelial_skin_neoplasm: toBoolean(row.MONDO_SUPERCLASS_epithelial_skin_neoplasm),
-            MONDO_SUPERCLASS_arthropathy: toBoolean(row.MONDO_SUPERCLASS_arthropathy),
-            MONDO_SUPERCLASS_rheumatic_disorder: toBoolean(row.MONDO_SUPERCLASS_rheumatic_disorder),
-            MONDO_SUPERCLASS_dysentery: toBoolean(row.MONDO_SUPERCLASS_dysentery),
-            MONDO_SUPERCLASS_autoinflammatory_syndrome: toBoolean(row.MONDO_SUPERCLASS_autoinflammatory_syndrome),
-            MONDO_SUPERCLASS_infertility_disorder: toBoolean(row.MONDO_SUPERCLASS_infertility_disorder),
-            MONDO_SUPERCLASS_endocrine_pancreas_disorder: toBoolean(row.MONDO_SUPERCLASS_endocrine_pancreas_disorder),
-            MONDO_SUPERCLASS_nongerminomatous_germ_cell_tumor: toBoolean(row.MONDO_SUPERCLASS_nongerminomatous_germ_cell_tumor),
-            MONDO_SUPERCLASS_male_infertility: toBoolean(row.MONDO_SUPERCLASS_male_infertility),
-            MONDO_SUPERCLASS_virus_associated_tumor: toBoolean(row.MONDO_SUPERCLASS_virus_associated_tumor),
-            MONDO_SUPERCLASS_multiple_congenital_anomalies_dysmorphic_syndrome_without_intellectual_disability: toBoolean(row.MONDO_SUPERCLASS_multiple_congenital_anomalies_dysmorphic_syndrome_without_intellectual_disability),
-            MONDO_SUPERCLASS_ectodermal_dysplasia_syndrome: toBoolean(row.MONDO_SUPERCLASS_ectodermal_dysplasia_syndrome),
-            MONDO_SUPERCLASS_hereditary_epidermal_appendage_anomaly: toBoolean(row.MONDO_SUPERCLASS_hereditary_epidermal_appendage_anomaly),
-            MONDO_SUPERCLASS_nervous_system_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_nervous_system_disorder__non_human_animal),
-            MONDO_SUPERCLASS_non_human_animal_disease: toBoolean(row.MONDO_SUPERCLASS_non_human_animal_disease),
-            MONDO_SUPERCLASS_paraplegia: toBoolean(row.MONDO_SUPERCLASS_paraplegia),
-            MONDO_SUPERCLASS_spermatogenic_failure: toBoolean(row.MONDO_SUPERCLASS_spermatogenic_failure),
-            MONDO_SUPERCLASS_hypertrophic_cardiomyopathy: toBoolean(row.MONDO_SUPERCLASS_hypertrophic_cardiomyopathy),
-            MONDO_SUPERCLASS_vesiculobullous_skin_disease: toBoolean(row.MONDO_SUPERCLASS_vesiculobullous_skin_disease),
-            MONDO_SUPERCLASS_ciliopathy: toBoolean(row.MONDO_SUPERCLASS_ciliopathy),
-            MONDO_SUPERCLASS_congenital_disorder_of_glycosylation: toBoolean(row.MONDO_SUPERCLASS_congenital_disorder_of_glycosylation),
-            MONDO_SUPERCLASS_disorder_of_glycosylation: toBoolean(row.MONDO_SUPERCLASS_disorder_of_glycosylation),
-            MONDO_SUPERCLASS_bird_disease: toBoolean(row.MONDO_SUPERCLASS_bird_disease),
-            MONDO_SUPERCLASS_neoplasm__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_neoplasm__non_human_animal),
-            MONDO_SUPERCLASS_cancer_or_benign_tumor__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_cancer_or_benign_tumor__non_human_animal),
-            MONDO_SUPERCLASS_hematologic_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_hematologic_disorder__non_human_animal),
-            MONDO_SUPERCLASS_developmental_defect_during_embryogenesis__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_developmental_defect_during_embryogenesis__non_human_animal),
-            MONDO_SUPERCLASS_disorder_of_development_or_morphogenesis__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_disorder_of_development_or_morphogenesis__non_human_animal),
-            MONDO_SUPERCLASS_endocrine_system_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_endocrine_system_disorder__non_human_animal),
-            MONDO_SUPERCLASS_multiple_congenital_anomalies_dysmorphic_syndrome_variable_intellectual_disability_syndrome: toBoolean(row.MONDO_SUPERCLASS_multiple_congenital_anomalies_dysmorphic_syndrome_variable_intellectual_disability_syndrome),
-            MONDO_SUPERCLASS_leukodystrophy: toBoolean(row.MONDO_SUPERCLASS_leukodystrophy),
-            MONDO_SUPERCLASS_familial_hypertrophic_cardiomyopathy: toBoolean(row.MONDO_SUPERCLASS_familial_hypertrophic_cardiomyopathy),
-            MONDO_SUPERCLASS_qualitative_or_quantitative_protein_defects_in_neuromuscular_diseases: toBoolean(row.MONDO_SUPERCLASS_qualitative_or_quantitative_protein_defects_in_neuromuscular_diseases),
-            MONDO_SUPERCLASS_Charcot_Marie_Tooth_disease: toBoolean(row.MONDO_SUPERCLASS_Charcot_Marie_Tooth_disease),
-            MONDO_SUPERCLASS_autosomal_anomaly: toBoolean(row.MONDO_SUPERCLASS_autosomal_anomaly),
-            MONDO_SUPERCLASS_central_nervous_system_malformation: toBoolean(row.MONDO_SUPERCLASS_central_nervous_system_malformation),
-            MONDO_SUPERCLASS_inherited_blood_coagulation_disorder: toBoolean(row.MONDO_SUPERCLASS_inherited_blood_coagulation_disorder),
-            MONDO_SUPERCLASS_X_linked_syndromic_intellectual_disability: toBoolean(row.MONDO_SUPERCLASS_X_linked_syndromic_intellectual_disability),
-            MONDO_SUPERCLASS_hereditary_spastic_paraplegia: toBoolean(row.MONDO_SUPERCLASS_hereditary_spastic_paraplegia),
-            MONDO_SUPERCLASS_X_linked_intellectual_disability: toBoolean(row.MONDO_SUPERCLASS_X_linked_intellectual_disability),
-            MONDO_SUPERCLASS_developmental_and_epileptic_encephalopathy: toBoolean(row.MONDO_SUPERCLASS_developmental_and_epileptic_encephalopathy),
-            MONDO_SUPERCLASS_acquired: toBoolean(row.MONDO_SUPERCLASS_acquired),
-            MONDO_SUPERCLASS_digestive_system_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_digestive_system_disorder__non_human_animal),
-            MONDO_SUPERCLASS_hereditary_disease__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_hereditary_disease__non_human_animal),
-            MONDO_SUPERCLASS_musculoskeletal_system_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_musculoskeletal_system_disorder__non_human_animal),
-            MONDO_SUPERCLASS_hereditary_neurological_disease__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_hereditary_neurological_disease__non_human_animal),
-            MONDO_SUPERCLASS_integumentary_system_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_integumentary_system_disorder__non_human_animal),
-            MONDO_SUPERCLASS_disorder_of_orbital_region__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_disorder_of_orbital_region__non_human_animal),
-            MONDO_SUPERCLASS_disorder_of_visual_system__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_disorder_of_visual_system__non_human_animal),
-            MONDO_SUPERCLASS_immune_system_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_immune_system_disorder__non_human_animal),
-            MONDO_SUPERCLASS_cardiovascular_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_cardiovascular_disorder__non_human_animal),
-            MONDO_SUPERCLASS_metabolic_disease__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_metabolic_disease__non_human_animal),
-            MONDO_SUPERCLASS_inborn_errors_of_metabolism__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_inborn_errors_of_metabolism__non_human_animal),
-            MONDO_SUPERCLASS_psychiatric_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_psychiatric_disorder__non_human_animal),
-            MONDO_SUPERCLASS_syndromic_disease__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_syndromic_disease__non_human_animal),
-            MONDO_SUPERCLASS_heart_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_heart_disorder__non_human_animal),
-            MONDO_SUPERCLASS_urinary_system_disorder__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_urinary_system_disorder__non_human_animal),
-            MONDO_SUPERCLASS_renal_disease__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_renal_disease__non_human_animal),
-            MONDO_SUPERCLASS_perceptual_disorders__non_human_animal: toBoolean(row.MONDO_SUPERCLASS_perceptual_disorders__non_human_animal),
-            taxon: row.taxon,
-            NCBITaxon: row.NCBITaxon
-        }
-        )
-        """
+        cypher = get_node_load_query(file_name, infer_csv_schema(local_file_name, NODE_TYPE_HINTS))
     elif 'rk-edges' in file_prefix:
-        cypher = """
-        load csv from "$$$" with header as row
-          with row
-            match (a: Node {id: row.subject}), (b: Node {id: row.object})
-            create (a)-
-              [e: row.predicate
-                {   
-                    subject: row.subject,
-                    predicate: row.predicate,
-                    object: row.object,
-                    primary_knowledge_source: row.primary_knowledge_source,
-                    knowledge_level: row.knowledge_level,
-                    agent_type: row.agent_type,
-                    snpeff_effect: row.snpeff_effect,
-                    distance_to_feature: toInteger(row.distance_to_feature),
-                    publications: split(row.publications, ';'),
-                    p_value: split(row.p_value, ';'),
-                    ligand: row.ligand,
-                    protein: row.protein,
-                    affinity_parameter: row.affinity_parameter,
-                    supporting_affinities: split(row.supporting_affinities, ';'),
-                    affinity: toFloat(row.affinity),
-                    object_aspect_qualifier: row.object_aspect_qualifier,
-                    object_direction_qualifier: row.object_direction_qualifier,
-                    qualified_predicate: row.qualified_predicate,
-                    Coexpression: row.Coexpression,
-                    Coexpression_transferred: row.Coexpression_transferred,
-                    Experiments: row.Experiments,
-                    Experiments_transferred: row.Experiments_transferred,
-                    Database: row.Database,
-                    Database_transferred: row.Database_transferred,
-                    Textmining: row.Textmining,
-                    Textmining_transferred: row.Textmining_transferred,
-                    Cooccurance: row.Cooccurance,
-                    Combined_score: row.Combined_score,
-                    species_context_qualifier: row.species_context_qualifier,
-                    hetio_source: split(row.hetio_source, ';'),
-                    tmkp_confidence_score: toFloat(row.tmkp_confidence_score),
-                    sentences: row.sentences,
-                    tmkp_ids: split(row.tmkp_ids, ';'),
-                    detection_method: row.detection_method,
-                    Homology: row.Homology,
-                    expressed_in: split(row.expressed_in, ';'),
-                    slope: split(row.slope, ';'),
-                    pubchem_assay_ids: split(row.pubchem_assay_ids, ';'),
-                    patent_ids: split(row.patent_ids, ';'),
-                    aggregator_knowledge_source: split(row.aggregator_knowledge_source, ';'),
-                    id: row.id,
-                    original_subject: row.original_subject,
-                    category: split(row.category, ';'),
-                    provided_by: split(row.provided_by, ';'),
-                    disease_context_qualifier: row.disease_context_qualifier,
-                    frequency_qualifier: row.frequency_qualifier,
-                    has_evidence: split(row.has_evidence, ';'),
-                    negated: row.negated,
-                    original_object: row.original_object,
-                    score: toFloat(row.score),
-                    FAERS_llr: toFloat(row.FAERS_llr),
-                    description: split(row.description, ';'),
-                    NCBITaxon: row.NCBITaxon,
-                    Fusion: row.Fusion,
-                    has_count: row.has_count,
-                    has_percentage: row.has_percentage,
-                    has_quotient: row.has_quotient,
-                    has_total: row.has_total,
-                    qualifiers: split(row.qualifiers, ';'),
-                    stage_qualifier: row.stage_qualifier,
-                    primaryTarget: toBoolean(row.primaryTarget),
-                    endogenous: toBoolean(row.endogenous),
-                    anatomical_context_qualifier: row.anatomical_context_qualifier,
-                    phosphorylation_sites: split(row.phosphorylation_sites, ';'),
-                    onset_qualifier: row.onset_qualifier,
-                    object_specialization_qualifier: row.object_specialization_qualifier,
-                    drugmechdb_path_id: split(row.drugmechdb_path_id, ';'),
-                    complex_context: split(row.complex_context, ';'),
-                    sex_qualifier: row.sex_qualifier,
-                    object_part_qualifier: row.object_part_qualifier,
-                    subject_part_qualifier: row.subject_part_qualifier
-                }
-              ]->(b);        
-        """
+        cypher = get_edge_load_query(file_name, infer_csv_schema(local_file_name, EDGE_TYPE_HINTS))
 
-    return cypher.replace('$$$', file_name)
+    return cypher
@@ -0,0 +1,83 @@
+"""
+    Tests for the chunk finding, planning and re-chunking.
+"""
+
+import polars as pl
+
+from src.common.chunk_planner import find_chunks, plan_chunks, rechunk_files
+
+
+def write_nodes(file_name: str, start: int, count: int, extra: bool = False):
+    """
+    writes a node chunk.
+
+    :param file_name:
+    :param start: the first node number
+    :param count:
+    :param extra: add a column the other chunks don't have
+    :return:
+    """
+    columns: dict = {'id': [f'n{i}' for i in range(start, start + count)], 'name': [f'node {i}' for i in range(start, start + count)]}
+
+    if extra:
+        columns['score'] = ['1.5'] * count
+
+    pl.DataFrame(columns).write_csv(file_name)
+
+
+def test_find_chunks(tmp_path):
+    """
+    checks the chunks of a prefix are found in counter order and nothing else is picked up.
+    """
+    for name in ['rk-nodes-pt10.csv', 'rk-nodes-pt2.csv', 'rk-nodes.csv', 'rk-nodes-x.csv', 'rk-nodes-pt1.parquet', 'rk-edges-pt1.csv']:
+        (tmp_path / name).write_text('id\n')
+
+    assert [name.rsplit('/', 1)[-1] for name in find_chunks(str(tmp_path), 'rk-nodes')] == ['rk-nodes.csv', 'rk-nodes-pt2.csv', 'rk-nodes-pt10.csv']
+
+
+def test_plan_limits(tmp_path):
+    """
+    checks the chunk count follows the tightest limit, rounded up to a multiple of the workers.
+    """
+    file_name: str = str(tmp_path / 'rk-nodes.csv')
+
+    write_nodes(file_name, 0, 100)
+
+    # one chunk per worker when nothing else limits it
+    plan: dict = plan_chunks([file_name], 4, memory_budget=10**12, exact_rows=True)
+
+    assert plan['chunks'] == 4 and plan['limited_by'] == 'workers' and plan['total_rows'] == 100
+
+    # 100 rows at 15 per chunk needs 7, rounded up to 8
+    plan = plan_chunks([file_name], 4, max_chunk_rows=15, memory_budget=10**12, exact_rows=True)
+
+    assert plan['chunks'] == 8 and plan['limited_by'] == 'max_chunk_rows' and plan['rows_per_chunk'] == 13
+
+    # each worker can hold the whole file once, but a parsed chunk takes 4 times its size
+    plan = plan_chunks([file_name], 2, memory_budget=plan['total_bytes'] * 2, exact_rows=True)
+
+    assert plan['limited_by'] == 'memory_budget' and plan['chunks'] == 4
+
+    # never more chunks than rows
+    assert plan_chunks([file_name], 500, memory_budget=10**12, exact_rows=True)['chunks'] == 100
+
+
+def test_rechunk_files(tmp_path):
+    """
+    checks the files are rewritten as balanced chunks holding every row, with the columns lined up.
+    """
+    first: str = str(tmp_path / 'rk-nodes-pt1.csv')
+    second: str = str(tmp_path / 'rk-nodes-pt2.csv')
+
+    write_nodes(first, 0, 23)
+    write_nodes(second, 23, 12, extra=True)
+
+    chunks: list = rechunk_files([first, second], str(tmp_path / 'out'), 'rk-nodes', 10)
+
+    assert [rows for _, rows in chunks] == [10, 10, 10, 5]
+
+    # read the chunks back
+    frame: pl.DataFrame = pl.concat([pl.read_csv(name, infer_schema_length=0) for name, _ in chunks], how='diagonal')
+
+    assert frame['id'].to_list() == [f'n{i}' for i in range(35)]
+    assert frame['score'].null_count() == 23
@@ -0,0 +1,172 @@
+"""
+    Tests for the server-side cursor expiry, eviction and result guards.
+"""
+
+import time
+import asyncio
+
+import pytest
+
+from src.common.cursor_store import CursorStore, CursorStoreFullError, ResultTooLargeError
+
+
+class FakeResult:
+    """
+        Stands in for a Kuzu query result
+    """
+    def __init__(self, rows: list):
+        """
+        creates the result
+
+        :param rows:
+        """
+        self.rows: list = rows
+        self.position: int = 0
+        self.closed: bool = False
+
+    def get_column_names(self) -> list:
+        """
+        gets the column names
+
+        :return:
+        """
+        # return to the caller
+        return ['x']
+
+    def get_num_tuples(self) -> int:
+        """
+        gets the row count
+
+        :return:
+        """
+        # return to the caller
+        return len(self.rows)
+
+    def has_next(self) -> bool:
+        """
+        checks for more rows
+
+        :return:
+        """
+        # return to the caller
+        return self.position < len(self.rows)
+
+    def get_next(self) -> list:
+        """
+        gets the next row
+
+        :return:
+        """
+        self.position += 1
+
+        # return to the caller
+        return self.rows[self.position - 1]
+
+    def close(self):
+        """
+        closes the result
+
+        :return:
+        """
+        self.closed = True
+
+
+def test_idle_cursors_expire():
+    """
+    checks a cursor left idle past the timeout is closed.
+    """
+    store: CursorStore = CursorStore(idle_timeout=60)
+
+    result: FakeResult = FakeResult([[1]])
+
+    cursor_id: str = store.open(result)
+
+    assert store.get(cursor_id) is not None
+
+    # age the cursor past the timeout
+    store.cursors[cursor_id].last_used = time.monotonic() - 61
+
+    assert store.get(cursor_id) is None
+    assert result.closed and store.expired == 1
+
+
+def test_least_recently_used_cursor_is_evicted():
+    """
+    checks the oldest idle cursor is closed to make room for a new one.
+    """
+    store: CursorStore = CursorStore(max_cursors=2)
+
+    results: list = [FakeResult([[i]]) for i in range(3)]
+
+    first: str = store.open(results[0])
+    second: str = store.open(results[1])
+
+    # use the first so the second is the oldest
+    store.cursors[first].last_used = time.monotonic() + 1
+
+    store.open(results[2])
+
+    assert store.get(second) is None and store.get(first) is not None
+    assert results[1].closed and store.evicted == 1
+
+
+def test_full_store_with_busy_cursors():
+    """
+    checks a new cursor is refused, and its result closed, when every cursor is reading a page.
+    """
+    async def run():
+        """
+        holds the only cursor's lock while another is opened
+        """
+        store: CursorStore = CursorStore(max_cursors=1)
+
+        busy: str = store.open(FakeResult([[1]]))
+
+        async with store.cursors[busy].lock:
+            result: FakeResult = FakeResult([[2]])
+
+            with pytest.raises(CursorStoreFullError):
+                store.open(result)
+
+            assert result.closed and store.get(busy) is not None
+
+    asyncio.run(run())
+
+
+def test_fetch_page_limits():
+    """
+    checks a page stops at the limit, the row guard or the byte guard.
+    """
+    store: CursorStore = CursorStore(max_rows=3, max_bytes=20)
+
+    cursor_id: str = store.open(FakeResult([[i] for i in range(10)]))
+    cursor = store.get(cursor_id)
+
+    assert store.fetch_page(cursor, 2) == [[0], [1]]
+    assert store.fetch_page(cursor, 100) == [[2], [3], [4]]
+    assert cursor.rows_sent == 5
+
+    # each row is 10 bytes as JSON, so the page stops once 20 are read
+    cursor_id = store.open(FakeResult([['x' * 6]] * 5))
+
+    assert len(store.fetch_page(store.get(cursor_id), 100)) == 2
+
+
+def test_fetch_all_guards():
+    """
+    checks a whole result is refused once it is over the row or byte limits.
+    """
+    store: CursorStore = CursorStore(max_rows=3, max_bytes=25)
+
+    assert store.fetch_all(FakeResult([[1], [2]])) == [[1], [2]]
+
+    with pytest.raises(ResultTooLargeError):
+        store.fetch_all(FakeResult([[i] for i in range(4)]))
+
+    # each row is 10 bytes as JSON, so the third row trips the byte guard
+    result: FakeResult = FakeResult([['x' * 6]] * 3)
+
+    with pytest.raises(ResultTooLargeError):
+        store.fetch_all(result)
+
+    assert result.position == 3
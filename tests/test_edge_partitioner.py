@@ -0,0 +1,68 @@
+"""
+    Tests for the edge partitioning by subject and the load retries.
+"""
+
+import polars as pl
+import pytest
+from neo4j.exceptions import TransientError
+
+from src.common.edge_partitioner import partition_edge_chunks, run_with_retry
+
+
+def test_edges_of_a_subject_share_a_partition(tmp_path):
+    """
+    checks every edge lands in exactly one partition, all of a subject's edges in the same one.
+    """
+    # the chunks don't have the same columns
+    first: str = str(tmp_path / 'rk-edges-1.csv')
+    second: str = str(tmp_path / 'rk-edges-2.csv')
+
+    pl.DataFrame({'subject': [f's{i % 7}' for i in range(50)], 'predicate': ['p'] * 50, 'object': [f'o{i}' for i in range(50)]}).write_csv(first)
+    pl.DataFrame({'subject': [f's{i % 5}' for i in range(30)], 'predicate': ['q'] * 30, 'object': [f'o{i}' for i in range(30)],
+                  'score': ['1.5'] * 30}).write_csv(second)
+
+    parts: list = partition_edge_chunks([first, second], str(tmp_path), 'rk-edges-pt', 3, batch_size=8)
+
+    assert len(parts) == 3 and sum(rows for _, rows in parts) == 80
+
+    # get the partitions each subject ended up in
+    partitions_of: dict = {}
+
+    for i, (part_name, rows) in enumerate(parts):
+        frame: pl.DataFrame = pl.read_csv(part_name, infer_schema_length=0)
+
+        assert frame.height == rows
+        assert frame.columns == ['subject', 'predicate', 'object', 'score']
+
+        for subject in frame['subject'].unique():
+            partitions_of.setdefault(subject, set()).add(i)
+
+    assert all(len(partitions) == 1 for partitions in partitions_of.values())
+
+
+def test_retry_transient_errors():
+    """
+    checks transient errors are retried until the call works or the retries run out.
+    """
+    calls: list = []
+
+    def flaky(fail_count: int) -> str:
+        """
+        fails the first fail_count calls
+        """
+        calls.append(1)
+
+        if len(calls) <= fail_count:
+            raise TransientError('conflict')
+
+        # return to the caller
+        return 'done'
+
+    assert run_with_retry(flaky, 2, retries=3, base_delay=0) == ('done', 2)
+
+    calls.clear()
+
+    with pytest.raises(TransientError):
+        run_with_retry(flaky, 5, retries=2, base_delay=0)
+
+    assert len(calls) == 3
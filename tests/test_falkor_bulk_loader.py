@@ -0,0 +1,77 @@
+"""
+    Tests for the FalkorDB bulk loader binary format and node positions.
+"""
+
+import struct
+
+from falkordb_bulk_loader.entity_file import Type
+
+from src.common.falkor_bulk_loader import FalkorBulkLoader, pack_value, pack_header
+
+
+def write_csv(path, text: str) -> str:
+    """
+    writes a chunk and returns its name.
+
+    :param path:
+    :param text:
+    :return:
+    """
+    path.write_text(text)
+
+    # return to the caller
+    return str(path)
+
+
+def test_pack_value():
+    """
+    checks each property type is packed with its type marker.
+    """
+    assert pack_value(None) == struct.pack('=B', 0)
+    assert pack_value(True) == struct.pack('=B?', Type.BOOL.value, True)
+    assert pack_value(7) == struct.pack('=Bq', Type.LONG.value, 7)
+    assert pack_value(1.5) == struct.pack('=Bd', Type.DOUBLE.value, 1.5)
+    assert pack_value('ab') == struct.pack('=B3s', Type.STRING.value, b'ab')
+    assert pack_value([1, 'a']) == struct.pack('=Bq', Type.ARRAY.value, 2) + pack_value(1) + pack_value('a')
+
+
+def test_pack_header():
+    """
+    checks the token header holds the name, property count and null terminated property names.
+    """
+    assert pack_header('Node', ['id', 'name']) == b'Node\x00' + struct.pack('=I', 2) + b'id\x00name\x00'
+    assert pack_header('Node', []) == b'Node\x00' + struct.pack('=I', 0)
+
+
+def test_node_positions(tmp_path):
+    """
+    checks the nodes get their position in the load, across chunks and batches.
+    """
+    loader: FalkorBulkLoader = FalkorBulkLoader(batch_size=2)
+
+    # nothing is sent until the buffer fills up so no connection is needed
+    assert loader.load_nodes(None, None, write_csv(tmp_path / 'rk-nodes.csv', 'id,name\na,A\nb,B\nc,C\n')) == 3
+    assert loader.load_nodes(None, None, write_csv(tmp_path / 'rk-nodes-pt1.csv', 'id,name\nd,D\n')) == 1
+
+    assert loader.node_ids == {'a': 0, 'b': 1, 'c': 2, 'd': 3}
+    assert loader.node_count == 4
+
+
+def test_duplicate_node_ids(tmp_path):
+    """
+    checks a duplicate node ID is skipped rather than shifting the positions of the nodes after it.
+    """
+    loader: FalkorBulkLoader = FalkorBulkLoader()
+
+    loader.load_nodes(None, None, write_csv(tmp_path / 'rk-nodes.csv', 'id,name\na,A\nb,B\na,A2\nc,C\n'))
+
+    # one node is packed per ID, so the positions line up with the nodes GRAPH.BULK creates
+    assert loader.node_ids == {'a': 0, 'b': 1, 'c': 2}
+    assert loader.node_count == 3
+    assert loader.skipped_nodes == 1
+
+    # the edges point at the right nodes
+    loader.load_edges(None, None, write_csv(tmp_path / 'rk-edges.csv', 'subject,predicate,object\nb,biolink:related_to,c\n'))
+
+    assert loader.relation_count == 1
+    assert struct.pack('=QQ', 1, 2) in loader.tokens[-1][1]
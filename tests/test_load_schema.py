@@ -0,0 +1,77 @@
+"""
+    Tests for the chunk schema inference, the generated LOAD CSV Cypher and the batch casts.
+"""
+
+import polars as pl
+
+from src.common.load_schema import (NODE_TYPE_HINTS, get_chunk_file_name, infer_csv_schema, infer_parquet_schema, get_node_load_query,
+                                    get_edge_load_query, cast_frame)
+
+
+def test_get_chunk_file_name():
+    """
+    checks counter 0 is the unnumbered chunk.
+    """
+    assert get_chunk_file_name('/data', 'rk-nodes', 0) == '/data/rk-nodes.csv'
+    assert get_chunk_file_name('/data', 'rk-nodes', 3, 'parquet') == '/data/rk-nodes-pt3.parquet'
+
+
+def test_infer_csv_schema(tmp_path):
+    """
+    checks the types are inferred from the values, the hints win and the empty columns are left out.
+    """
+    file_name: str = str(tmp_path / 'rk-nodes.csv')
+
+    (tmp_path / 'rk-nodes.csv').write_text('id,flag,count,weight,label,empty,category\n'
+                                           '1,true,3,1.5,a,,biolink:Gene\n'
+                                           '2,FALSE,-4,2,b,,biolink:Gene;biolink:NamedThing\n'
+                                           '3,,,,,,\n')
+
+    # the id looks numeric but is hinted as text
+    assert infer_csv_schema(file_name, NODE_TYPE_HINTS) == [('id', 'string'), ('flag', 'boolean'), ('count', 'integer'), ('weight', 'float'),
+                                                            ('label', 'string'), ('category', 'list')]
+
+
+def test_infer_parquet_schema(tmp_path):
+    """
+    checks a Parquet chunk's own types are used and the empty columns are left out.
+    """
+    file_name: str = str(tmp_path / 'rk-nodes.parquet')
+
+    pl.DataFrame({'id': ['a', 'b'], 'count': [1, 2], 'weight': [0.5, None], 'flag': [True, False], 'category': [['x'], ['y', 'z']],
+                  'empty': pl.Series([None, None], dtype=pl.String)}).write_parquet(file_name)
+
+    assert infer_parquet_schema(file_name) == [('id', 'string'), ('count', 'integer'), ('weight', 'float'), ('flag', 'boolean'),
+                                               ('category', 'list')]
+
+
+def test_load_queries():
+    """
+    checks the LOAD CSV Cypher casts each column and quotes the names that aren't identifiers.
+    """
+    schema: list = [('id', 'string'), ('category', 'list'), ('weight', 'float'), ('my-score', 'integer')]
+
+    query: str = get_node_load_query('/data/rk-nodes.csv', schema)
+
+    assert 'LOAD CSV WITH HEADERS FROM "/data/rk-nodes.csv" AS row' in query
+    assert "category: split(row.category, ';')" in query
+    assert 'weight: toFloat(row.weight)' in query
+    assert '`my-score`: toInteger(row.`my-score`)' in query
+
+    query = get_edge_load_query('/data/rk-edges.csv', [('subject', 'string'), ('primaryTarget', 'boolean')])
+
+    assert 'match (a: Node {id: row.subject}), (b: Node {id: row.object})' in query
+    assert 'primaryTarget: toBoolean(row.primaryTarget)' in query
+
+
+def test_cast_frame():
+    """
+    checks a text batch is cast the same way the LOAD CSV casts do.
+    """
+    frame: pl.DataFrame = pl.DataFrame({'id': ['1', '2'], 'flag': ['TRUE', 'false'], 'count': ['3', 'x'], 'weight': ['1.5', None],
+                                        'category': ['a;b', 'c'], 'unused': ['u', 'v']})
+
+    cast: pl.DataFrame = cast_frame(frame, [('id', 'string'), ('flag', 'boolean'), ('count', 'integer'), ('weight', 'float'), ('category', 'list')])
+
+    assert cast.columns == ['id', 'flag', 'count', 'weight', 'category']
+    assert cast.rows() == [('1', True, 3, 1.5, ['a', 'b']), ('2', False, None, None, ['c'])]
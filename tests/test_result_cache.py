@@ -0,0 +1,154 @@
+"""
+    Tests for the query result cache write detection, keys and invalidation.
+"""
+
+import asyncio
+
+import pytest
+
+from src.common.result_cache import ResultCache, cache_stream, invalidate_after_stream
+
+
+async def stream_chunks(chunks: list):
+    """
+    async generator that sends the chunks as a result stream.
+
+    :param chunks:
+    :return:
+    """
+    for chunk in chunks:
+        yield chunk
+
+
+async def drain_stream(stream) -> list:
+    """
+    reads a stream to the end.
+
+    :param stream:
+    :return:
+    """
+    # return to the caller
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.parametrize('query', ['MATCH (n) RETURN n.id LIMIT 10',
+                                   'MATCH (n) WHERE n.name = "CREATE (x)" RETURN n',
+                                   "MATCH (n) WHERE n.note = 'a; DROP TABLE Node' RETURN n",
+                                   'MATCH (n) RETURN n.set, n.delete',
+                                   'RETURN {set: 1, create: 2}',
+                                   'MATCH (n) RETURN n.`merge`',
+                                   'MATCH (n) WHERE n.id STARTS WITH "x" RETURN count(*) AS created'])
+def test_read_queries_are_cacheable(query: str):
+    """
+    checks reads are cached, even with write words in literals, property names and map keys.
+    """
+    assert ResultCache.is_cacheable(query)
+
+
+@pytest.mark.parametrize('query', ['CREATE (n:Node {id: "a"})',
+                                   'MATCH (n) SET n.name = "x"',
+                                   'MATCH (n) DETACH DELETE n',
+                                   'match (n) remove n.name',
+                                   'MERGE (n:Node {id: "a"}) RETURN n',
+                                   "LOAD CSV FROM 'x.csv' RETURN *",
+                                   'LOAD FROM "x.parquet" RETURN *',
+                                   'DROP TABLE Node',
+                                   '  copy Node FROM "x.csv"',
+                                   'INSTALL json',
+                                   'MATCH (n) RETURN n; DROP TABLE Node',
+                                   'MATCH (n) RETURN n UNION CALL { CREATE (x) }'])
+def test_write_queries_are_not_cacheable(query: str):
+    """
+    checks writes and DB statements are never cached, wherever the clause is.
+    """
+    assert not ResultCache.is_cacheable(query)
+
+
+def test_make_key():
+    """
+    checks whitespace is normalized outside the literals only.
+    """
+    key: str = ResultCache.make_key('MATCH (n)\n   WHERE n.id = "a  b"  RETURN n;', {'b': 2, 'a': 1}, 'csv')
+
+    assert key == ResultCache.make_key('MATCH (n) WHERE n.id = "a  b" RETURN n', {'a': 1, 'b': 2}, 'csv')
+    assert key != ResultCache.make_key('MATCH (n) WHERE n.id = "a b" RETURN n', {'a': 1, 'b': 2}, 'csv')
+    assert key != ResultCache.make_key('MATCH (n) WHERE n.id = "a  b" RETURN n', {'a': 1, 'b': 2}, 'ndjson')
+
+
+def test_lru_eviction_and_ttl():
+    """
+    checks the least recently used results are evicted and expired ones are dropped.
+    """
+    cache: ResultCache = ResultCache(max_bytes=10, ttl=300, max_entry_bytes=10)
+
+    cache.put('a', [b'aaaa'], 4, cache.generation)
+    cache.put('b', [b'bbbb'], 4, cache.generation)
+
+    # use a so b is the oldest
+    assert cache.get('a') == [b'aaaa']
+
+    cache.put('c', [b'cccc'], 4, cache.generation)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.size == 8 and cache.evictions == 1
+
+    # results over the entry limit are never saved
+    cache.put('d', [b'd' * 11], 11, cache.generation)
+
+    assert cache.get('d') is None
+
+    # expire the results
+    cache.ttl = -1
+    cache.put('e', [b'e'], 1, cache.generation)
+
+    assert cache.get('e') is None and cache.expirations == 1
+
+
+def test_invalidation_generation():
+    """
+    checks a result started before an invalidation is not saved after it.
+    """
+    cache: ResultCache = ResultCache()
+
+    cache.put('a', [b'a'], 1, cache.generation)
+
+    # a query starts, then a load clears the cache
+    started: int = cache.generation
+
+    cache.invalidate()
+
+    assert cache.get('a') is None and cache.size == 0
+
+    cache.put('b', [b'b'], 1, started)
+
+    assert cache.get('b') is None
+
+    cache.put('b', [b'b'], 1, cache.generation)
+
+    assert cache.get('b') == [b'b']
+
+
+def test_cache_stream():
+    """
+    checks a completed stream is saved, unless it is too big or the cache was invalidated while it ran.
+    """
+    cache: ResultCache = ResultCache(max_bytes=100, ttl=300, max_entry_bytes=10)
+
+    assert asyncio.run(drain_stream(cache_stream(cache, 'a', cache.generation, stream_chunks([b'ab', b'cd'])))) == [b'ab', b'cd']
+    assert cache.get('a') == [b'ab', b'cd']
+
+    # too big to cache, but still sent
+    assert len(asyncio.run(drain_stream(cache_stream(cache, 'b', cache.generation, stream_chunks([b'x' * 6, b'y' * 6]))))) == 2
+    assert cache.get('b') is None
+
+    # a write finishing while the read streamed
+    started: int = cache.generation
+
+    asyncio.run(drain_stream(invalidate_after_stream(cache, stream_chunks([b'w']))))
+
+    assert cache.get('a') is None
+
+    asyncio.run(drain_stream(cache_stream(cache, 'c', started, stream_chunks([b'c']))))
+
+    assert cache.get('c') is None and cache.invalidations == 1
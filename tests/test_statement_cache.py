@@ -0,0 +1,51 @@
+"""
+    Tests for the per-connection prepared statement cache.
+"""
+
+from src.common.statement_cache import PreparedStatementCache
+
+
+def test_statements_are_per_connection():
+    """
+    checks a statement is only handed back to the connection that prepared it.
+    """
+    cache: PreparedStatementCache = PreparedStatementCache()
+
+    conn_a, conn_b = object(), object()
+
+    cache.put(conn_a, 'MATCH (n) WHERE n.id = $id RETURN n', 'statement a')
+
+    assert cache.get(conn_a, 'MATCH (n) WHERE n.id = $id RETURN n') == 'statement a'
+    assert cache.get(conn_b, 'MATCH (n) WHERE n.id = $id RETURN n') is None
+
+    cache.put(conn_b, 'MATCH (n) WHERE n.id = $id RETURN n', 'statement b')
+
+    # both connections share the one template entry
+    assert cache.get(conn_b, 'MATCH (n) WHERE n.id = $id RETURN n') == 'statement b'
+    assert cache.get_stats()['templates'] == 1
+    assert cache.get_stats()['hits'] == 2 and cache.get_stats()['misses'] == 1
+
+
+def test_lru_eviction():
+    """
+    checks the least recently used template is dropped once the cache is full.
+    """
+    cache: PreparedStatementCache = PreparedStatementCache(max_size=2)
+
+    conn = object()
+
+    cache.put(conn, 'a', 1)
+    cache.put(conn, 'b', 2)
+
+    # use a so b is the oldest
+    assert cache.get(conn, 'a') == 1
+
+    cache.put(conn, 'c', 3)
+
+    assert cache.get(conn, 'b') is None
+    assert cache.get(conn, 'a') == 1 and cache.get(conn, 'c') == 3
+    assert cache.evictions == 1
+
+    cache.clear()
+
+    assert cache.get(conn, 'a') is None and cache.get_stats()['templates'] == 0